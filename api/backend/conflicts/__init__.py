@@ -0,0 +1,234 @@
+#------------------------------------------------------------
+# Scheduling conflict detection: a team, a location or a stat
+# keeper booked for two games at overlapping times.
+#
+# A game occupies [date_played + start_time, + game_length)
+# where game_length (minutes) comes from the Rules of the
+# league's sport, DEFAULT_GAME_LENGTH when the sport has none.
+# Back-to-back games (one ends as the next starts) do not
+# conflict; games without a start_time are never checked.
+#
+# ScheduleIndex keeps one IntervalIndex per resource (each
+# team, location and keeper), the resource's games sorted by
+# start. Every interval in an index is at most max_length
+# long, so the games overlapping [start, end) are those
+# starting in (start - max_length, end): two bisects and a
+# scan of just those games, O(log n) plus the handful of games
+# in that window per check. Adding a game keeps the index
+# sorted, so a generated schedule is checked game by game
+# against the stored games and the games before it
+# (check_schedule).
+#
+# ScheduleIndex.load() reads the stored games of a date range
+# with one query (plus one for their keepers and one for the
+# game lengths of every league). find_game_conflicts() is the
+# single-game check behind the game create / update and keeper
+# assignment routes, which answer 409 with the conflicts unless
+# the request sets allow_conflicts.
+#------------------------------------------------------------
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+
+DEFAULT_GAME_LENGTH = 60
+
+RESOURCES = ("team", "location", "keeper")
+
+MAX_CHECKED_GAMES = 20000
+
+GAME_KEEPERS_QUERY = "SELECT keeper_id FROM Games_Keepers WHERE game_id = %s"
+
+
+class IntervalIndex:
+    """One resource's bookings as (start, end, ref) sorted by start"""
+
+    def __init__(self):
+        self.starts = []
+        self.entries = []
+        self.max_length = timedelta(0)
+
+    def add(self, start, end, ref):
+        position = bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.entries.insert(position, (start, end, ref))
+        self.max_length = max(self.max_length, end - start)
+
+    def overlapping(self, start, end):
+        """The (start, end, ref) entries overlapping [start, end)"""
+        low = bisect_right(self.starts, start - self.max_length)
+        high = bisect_left(self.starts, end)
+        return [entry for entry in self.entries[low:high] if entry[1] > start]
+
+
+def parse_game_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"Invalid date_played: {value} (expected YYYY-MM-DD)")
+
+
+def parse_start_time(value):
+    """A TIME column (timedelta), time or "HH:MM[:SS]" as a time"""
+    if isinstance(value, time):
+        return value
+    if isinstance(value, timedelta):
+        return (datetime.min + value).time()
+    try:
+        return time.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"Invalid start_time: {value} (expected HH:MM)")
+
+
+def _location_key(location):
+    return " ".join(str(location).split()).lower()
+
+
+class ScheduleIndex:
+    """Per-team, per-location and per-keeper interval indexes over a set of games"""
+
+    def __init__(self, game_lengths=None, default_length=DEFAULT_GAME_LENGTH):
+        # {league_id: minutes}
+        self.game_lengths = game_lengths or {}
+        self.default_length = default_length
+        self.indexes = {}
+        self.games = {}
+
+    @classmethod
+    def load(cls, cursor, date_from, date_to, default_length=DEFAULT_GAME_LENGTH):
+        """An index of the stored games that can overlap games played from date_from to date_to"""
+        cursor.execute("""
+            SELECT l.league_id, MAX(r.game_length) AS game_length
+            FROM Leagues l
+            LEFT JOIN Rules r ON r.sports_id = l.sport_played
+            GROUP BY l.league_id
+        """)
+        index = cls({row["league_id"]: row["game_length"] for row in cursor.fetchall() if row["game_length"]},
+                    default_length)
+
+        # Games can run past midnight into the next day
+        date_from, date_to = date_from - timedelta(days=1), date_to + timedelta(days=1)
+        cursor.execute("""
+            SELECT game_id, league_played, date_played, start_time, location, home_team_id, away_team_id
+            FROM Games
+            WHERE date_played BETWEEN %s AND %s AND start_time IS NOT NULL
+        """, (date_from, date_to))
+        games = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT gk.game_id, gk.keeper_id
+            FROM Games_Keepers gk
+            JOIN Games g ON gk.game_id = g.game_id
+            WHERE g.date_played BETWEEN %s AND %s AND g.start_time IS NOT NULL
+        """, (date_from, date_to))
+        keeper_ids = {}
+        for row in cursor.fetchall():
+            keeper_ids.setdefault(row["game_id"], []).append(row["keeper_id"])
+
+        for game in games:
+            index.add(dict(game, keeper_ids=keeper_ids.get(game["game_id"], [])))
+        return index
+
+    def interval(self, game):
+        """(start, end) datetimes of a game, or None without a date or start time"""
+        if not game.get("date_played") or game.get("start_time") in (None, ""):
+            return None
+        start = datetime.combine(parse_game_date(game["date_played"]), parse_start_time(game["start_time"]))
+        minutes = self.game_lengths.get(game.get("league_played")) or self.default_length
+        return start, start + timedelta(minutes=minutes)
+
+    def resources(self, game, kinds=RESOURCES):
+        """(kind, id) of every resource the game books"""
+        keys = []
+        if "team" in kinds:
+            keys += [("team", game[side]) for side in ("home_team_id", "away_team_id") if game.get(side)]
+        if "location" in kinds and game.get("location") and str(game["location"]).strip():
+            keys.append(("location", _location_key(game["location"])))
+        if "keeper" in kinds:
+            keys += [("keeper", keeper_id) for keeper_id in game.get("keeper_ids") or []]
+        return keys
+
+    def add(self, game, ref=None, span=None, kinds=RESOURCES):
+        """Book a game's resources; ref (default: its game_id) identifies it in conflicts"""
+        ref = game.get("game_id") if ref is None else ref
+        span = span or self.interval(game)
+        if span is None:
+            return
+        self.games[ref] = game
+        for key in self.resources(game, kinds):
+            index = self.indexes.get(key)
+            if index is None:
+                index = self.indexes[key] = IntervalIndex()
+            index.add(span[0], span[1], ref)
+
+    def check(self, game, ignore=(), kinds=RESOURCES, span=None):
+        """The conflicts of a proposed game with the indexed games, except those in ignore"""
+        span = span or self.interval(game)
+        if span is None:
+            return []
+        conflicts = []
+        for kind, resource_id in self.resources(game, kinds):
+            index = self.indexes.get((kind, resource_id))
+            if index is None:
+                continue
+            for start, end, ref in index.overlapping(*span):
+                if ref in ignore:
+                    continue
+                conflict = {
+                    "resource": kind,
+                    "resource_id": self.games[ref]["location"] if kind == "location" else resource_id,
+                    "start": start.isoformat(sep=" "),
+                    "end": end.isoformat(sep=" "),
+                }
+                if isinstance(ref, tuple):
+                    conflict["schedule_index"] = ref[1]
+                else:
+                    conflict["game_id"] = ref
+                conflicts.append(conflict)
+        return conflicts
+
+    def check_schedule(self, games, kinds=RESOURCES):
+        """Check games against the index and each other, adding each as it is checked.
+
+        Returns the conflicts of every game, each with the position ("index") of
+        the game in games. A conflict is with a stored game ("game_id") or an
+        earlier game of the list ("schedule_index"). Games with a game_id are
+        moves of that stored game, which is then no longer checked against.
+        """
+        moved = {game["game_id"] for game in games if game.get("game_id")}
+        conflicts = []
+        for position, game in enumerate(games):
+            span = self.interval(game)
+            if span is None:
+                continue
+            for conflict in self.check(game, moved, kinds, span):
+                conflict["index"] = position
+                conflicts.append(conflict)
+            self.add(game, ("schedule", position), span)
+        return conflicts
+
+
+def game_keeper_ids(cursor, game_id):
+    cursor.execute(GAME_KEEPERS_QUERY, (game_id,))
+    return [row["keeper_id"] for row in cursor.fetchall()]
+
+
+def find_game_conflicts(cursor, game, ignore_game_id=None, kinds=RESOURCES):
+    """Conflicts of one proposed or edited game with the stored games.
+
+    game has league_played, date_played, start_time, location, home_team_id,
+    away_team_id and keeper_ids (any may be missing). ignore_game_id is the
+    game being edited. Raises ValueError for an unreadable date or time.
+    """
+    if not game.get("date_played") or game.get("start_time") in (None, ""):
+        return []
+    played = parse_game_date(game["date_played"])
+    parse_start_time(game["start_time"])
+    index = ScheduleIndex.load(cursor, played, played)
+    return index.check(game, {ignore_game_id}, kinds)
+
+
+def conflict_error(conflicts):
+    return f"Scheduling conflict: {len(conflicts)} overlapping booking(s); set allow_conflicts to save anyway"
@@ -1,10 +1,85 @@
 #------------------------------------------------------------
 # This file creates a shared DB connection resource
+#
+# PooledMySQL keeps the flaskext.mysql configuration and the
+# db.get_db() API, but hands each app context a connection
+# from a bounded pool (see pool.py) instead of opening a new
+# one, and returns it to the pool when the context ends.
+#
+# Pool settings (app.config, all optional):
+#   MYSQL_POOL_MIN_SIZE            connections kept open (1)
+#   MYSQL_POOL_MAX_SIZE            hard cap on connections (10)
+#   MYSQL_POOL_MAX_LIFETIME        seconds before a connection is recycled (1800)
+#   MYSQL_POOL_TIMEOUT             seconds to wait for a free connection (10)
+#   MYSQL_POOL_HEALTH_CHECK_AFTER  idle seconds before a checkout pings (2)
+#
+# db.schema is the process-wide SchemaRegistry (see schema.py):
+# db.schema.has_column("Players", "search_text") instead of an
+# INFORMATION_SCHEMA query per request.
 #------------------------------------------------------------
+import threading
+
+from flask import g
 from flaskext.mysql import MySQL
 from pymysql import cursors
 
+from backend.db_connection.pool import ConnectionPool, PoolTimeoutError
+from backend.db_connection.schema import SchemaRegistry
+
+
+class PooledMySQL(MySQL):
+    def __init__(self, app=None, prefix="mysql", **connect_args):
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.schema = SchemaRegistry(connect=self.get_db)
+        super().__init__(app, prefix, **connect_args)
+
+    def init_app(self, app):
+        super().init_app(app)
+        app.config.setdefault('MYSQL_POOL_MIN_SIZE', 1)
+        app.config.setdefault('MYSQL_POOL_MAX_SIZE', 10)
+        app.config.setdefault('MYSQL_POOL_MAX_LIFETIME', 1800)
+        app.config.setdefault('MYSQL_POOL_TIMEOUT', 10)
+        app.config.setdefault('MYSQL_POOL_HEALTH_CHECK_AFTER', 2)
+        app.teardown_appcontext(self.release_db)
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    config = self.app.config
+                    pool = ConnectionPool(
+                        self.connect,
+                        min_size=int(config['MYSQL_POOL_MIN_SIZE']),
+                        max_size=int(config['MYSQL_POOL_MAX_SIZE']),
+                        max_lifetime=float(config['MYSQL_POOL_MAX_LIFETIME']),
+                        timeout=float(config['MYSQL_POOL_TIMEOUT']),
+                        health_check_after=float(config['MYSQL_POOL_HEALTH_CHECK_AFTER']),
+                    )
+                    pool.fill()
+                    self._pool = pool
+        return self._pool
+
+    def get_db(self):
+        """Return this app context's connection, checking one out of the pool on first use"""
+        key = f"_{self.prefix}_connection"
+        connection = g.get(key)
+        if connection is None:
+            connection = self.pool.acquire()
+            setattr(g, key, connection)
+        return connection
+
+    def release_db(self, exception=None):
+        """Return the app context's connection to the pool (teardown_appcontext)"""
+        connection = g.pop(f"_{self.prefix}_connection", None)
+        if connection is not None:
+            self.pool.release(connection)
+
+    def pool_stats(self):
+        return self._pool.stats() if self._pool is not None else None
+
 
 # the parameter instructs the connection to return data 
 # as a dictionary object. 
-db = MySQL(cursorclass=cursors.DictCursor)
\ No newline at end of file
+db = PooledMySQL(cursorclass=cursors.DictCursor)
@@ -0,0 +1,204 @@
+#------------------------------------------------------------
+# A small bounded pool of PyMySQL connections.
+#
+# Connections are handed out LIFO (the most recently used one
+# first, so idle extras age out via max_lifetime), pinged on
+# checkout when they have been idle for a while, recycled once
+# they reach max_lifetime, and rolled back when they are
+# returned so no transaction or snapshot leaks between
+# requests. When every connection is in use, acquire() waits
+# up to `timeout` seconds for one to be returned.
+#------------------------------------------------------------
+import collections
+import logging
+import threading
+import time
+
+import pymysql
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(pymysql.err.OperationalError):
+    """No connection became available within the pool timeout"""
+
+
+class ConnectionPool:
+    def __init__(self, connect, min_size=1, max_size=10, max_lifetime=1800,
+                 timeout=10.0, health_check_after=2.0):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+
+        self._cond = threading.Condition()
+        self._idle = collections.deque()    # (connection, created_at, last_used)
+        self._in_use = {}                   # id(connection) -> created_at
+        self._size = 0                      # open connections, idle + in use
+        self._closed = False
+
+        self._stats = {
+            "checkouts": 0,
+            "connections_created": 0,
+            "connections_closed": 0,
+            "health_check_failures": 0,
+            "waits": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "timeouts": 0,
+        }
+
+    def fill(self):
+        """Open connections until the pool holds min_size of them"""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                connection = self._open()
+            except Exception:
+                self._forget_slot()
+                raise
+            with self._cond:
+                now = time.monotonic()
+                self._idle.append((connection, now, now))
+                self._cond.notify()
+
+    def acquire(self):
+        """Check out a healthy connection, waiting up to `timeout` seconds for one"""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        entry = None
+        waited = False
+
+        with self._cond:
+            if self._closed:
+                raise pymysql.err.InterfaceError("Connection pool is closed")
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available after {self.timeout}s "
+                        f"({self.max_size} in use)"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+            waited_for = time.monotonic() - started
+            self._stats["checkouts"] += 1
+            if waited:
+                self._stats["waits"] += 1
+                self._stats["wait_time_total"] += waited_for
+                self._stats["wait_time_max"] = max(self._stats["wait_time_max"], waited_for)
+
+        connection, created_at = self._checkout(entry)
+        with self._cond:
+            self._in_use[id(connection)] = created_at
+        return connection
+
+    def release(self, connection, discard=False):
+        """Return a checked-out connection (discard=True closes it instead)"""
+        with self._cond:
+            created_at = self._in_use.pop(id(connection), None)
+        if created_at is None:
+            return
+
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+
+        expired = time.monotonic() - created_at >= self.max_lifetime
+        if discard or self._closed or expired or not connection.open:
+            self._close(connection)
+            self._forget_slot()
+            return
+
+        with self._cond:
+            self._idle.append((connection, created_at, time.monotonic()))
+            self._cond.notify()
+
+    def close(self):
+        """Close idle connections and stop handing out new ones"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for connection, _, _ in idle:
+            self._close(connection)
+
+    def stats(self):
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "wait_time_avg": stats["wait_time_total"] / stats["waits"] if stats["waits"] else 0.0,
+            })
+        return stats
+
+    def _checkout(self, entry):
+        """Validate an idle entry (or open a fresh connection when there is none)"""
+        if entry is not None:
+            connection, created_at, last_used = entry
+            now = time.monotonic()
+            if now - created_at >= self.max_lifetime:
+                self._close(connection)
+            elif now - last_used >= self.health_check_after and not self._ping(connection):
+                self._close(connection)
+            else:
+                return connection, created_at
+
+        try:
+            return self._open(), time.monotonic()
+        except Exception:
+            self._forget_slot()
+            raise
+
+    def _ping(self, connection):
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception as e:
+            with self._cond:
+                self._stats["health_check_failures"] += 1
+            logger.warning(f"Discarding pooled connection that failed its health check: {e}")
+            return False
+
+    def _open(self):
+        connection = self._connect()
+        with self._cond:
+            self._stats["connections_created"] += 1
+        return connection
+
+    def _close(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._stats["connections_closed"] += 1
+
+    def _forget_slot(self):
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
@@ -0,0 +1,74 @@
+#------------------------------------------------------------
+# Process-wide cache of which tables and columns the connected
+# database has.
+#
+# Routes that must work against databases built from older
+# database-files/ used to probe INFORMATION_SCHEMA on every
+# request. The registry reads every table/column of the
+# current database with a single INFORMATION_SCHEMA query when
+# the app starts (after migrations) and answers has_table() /
+# has_column() from memory until it is refreshed again.
+#------------------------------------------------------------
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaRegistry:
+    """Table -> column names of the current database; names compare case-insensitively"""
+
+    def __init__(self, connect=None):
+        # connect() returns a connection to load from on first use, if
+        # the registry was never refreshed explicitly
+        self._connect = connect
+        self._tables = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._tables is not None
+
+    def refresh(self, connection):
+        """Reload every table and column of the current database"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute("""
+                SELECT TABLE_NAME, COLUMN_NAME
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+            """)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        tables = {}
+        for row in rows:
+            table, column = (row["TABLE_NAME"], row["COLUMN_NAME"]) if isinstance(row, dict) else row
+            tables.setdefault(table.lower(), set()).add(column.lower())
+
+        with self._lock:
+            self._tables = {table: frozenset(columns) for table, columns in tables.items()}
+        logger.info(f"Schema registry loaded {len(tables)} tables")
+        return len(tables)
+
+    def invalidate(self):
+        """Forget the cached schema; it is reloaded on the next lookup"""
+        with self._lock:
+            self._tables = None
+
+    def _get_tables(self):
+        tables = self._tables
+        if tables is None and self._connect is not None:
+            self.refresh(self._connect())
+            tables = self._tables
+        return tables or {}
+
+    def has_table(self, table):
+        return table.lower() in self._get_tables()
+
+    def has_column(self, table, column):
+        return column.lower() in self._get_tables().get(table.lower(), ())
+
+    def columns(self, table):
+        return self._get_tables().get(table.lower(), frozenset())
@@ -0,0 +1,160 @@
+#------------------------------------------------------------
+# One composable query for every "list of games" route.
+#
+# All blueprints list games with the same shape: the game row,
+# its home/away team (Games.home_team_id / away_team_id), league
+# and sport. GameQuery builds that single join and lets each
+# route add its filters, extra columns, sort and pagination:
+# nothing is filtered or paginated unless the route asks for it.
+# Teams are LEFT JOINed, so a game still missing a team is
+# listed with NULL team columns and has_both_teams = FALSE.
+#
+#   games = (GameQuery()
+#            .for_team(team_id)
+#            .upcoming(True)
+#            .order_by("g.date_played ASC", "g.start_time ASC")
+#            .fetch_all(cursor))
+#
+# Every listing therefore hits the same indexes:
+# idx_games_home_team / idx_games_away_team for team filters,
+# idx_games_league_date for league filters, idx_games_date for
+# date ranges, and the Players_Games / Games_Keepers keys for
+# player and keeper schedules.
+#------------------------------------------------------------
+GAME_COLUMNS = [
+    "g.game_id", "g.date_played", "g.start_time", "g.location",
+    "g.home_score", "g.away_score", "g.league_played",
+    "home_t.name AS home_team", "g.home_team_id",
+    "away_t.name AS away_team", "g.away_team_id",
+    "l.name AS league_name", "s.name AS sport_name",
+]
+
+NEWEST_FIRST = ("g.date_played DESC", "g.start_time DESC")
+OLDEST_FIRST = ("g.date_played ASC", "g.start_time ASC")
+
+
+class GameQuery:
+    """SELECT over Games + home/away Teams + Leagues + Sports with optional filters"""
+
+    def __init__(self):
+        self._source = "FROM Games g"
+        self._columns = list(GAME_COLUMNS)
+        self._where = []
+        self._params = []
+        self._order_by = list(NEWEST_FIRST)
+        self._limit = None
+        self._offset = None
+
+    # -- sources ----------------------------------------------------------
+
+    def for_player(self, player_id):
+        """Games the player is in the lineup of, with their lineup columns"""
+        self._source = "FROM Players_Games pg\n        JOIN Games g ON pg.game_id = g.game_id"
+        self._columns += ["pg.is_starter", "pg.position"]
+        return self.where("pg.player_id = %s", player_id)
+
+    def for_keeper(self, keeper_id):
+        """Games assigned to the stat keeper, with the assignment date"""
+        self._source = "FROM Games_Keepers gk\n        JOIN Games g ON gk.game_id = g.game_id"
+        self._columns += ["gk.assignment_date"]
+        return self.where("gk.keeper_id = %s", keeper_id)
+
+    # -- filters ----------------------------------------------------------
+
+    def where(self, condition, *params):
+        self._where.append(condition)
+        self._params.extend(params)
+        return self
+
+    def for_game(self, game_id):
+        return self.where("g.game_id = %s", game_id)
+
+    def for_team(self, team_id):
+        return self.where("(g.home_team_id = %s OR g.away_team_id = %s)", team_id, team_id)
+
+    def for_league(self, league_id):
+        return self.where("g.league_played = %s", league_id)
+
+    def between(self, min_date=None, max_date=None):
+        if min_date:
+            self.where("g.date_played >= %s", min_date)
+        if max_date:
+            self.where("g.date_played <= %s", max_date)
+        return self
+
+    def upcoming(self, upcoming=True, finalized_is_past=False):
+        """Games from today on (upcoming=True) or before today (False).
+
+        With finalized_is_past, a finalized game counts as past whatever
+        its date, so it drops out of the upcoming list.
+        """
+        if upcoming:
+            self.where("g.date_played >= CURDATE()")
+            if finalized_is_past:
+                self.where("COALESCE(g.is_finalized, FALSE) = FALSE")
+        elif finalized_is_past:
+            self.where("(g.date_played < CURDATE() OR COALESCE(g.is_finalized, FALSE) = TRUE)")
+        else:
+            self.where("g.date_played < CURDATE()")
+        return self
+
+    # -- projection, sort, pagination ---------------------------------------
+
+    def columns(self, *columns):
+        self._columns += list(columns)
+        return self
+
+    def order_by(self, *clauses):
+        self._order_by = list(clauses)
+        return self
+
+    def paginate(self, limit=None, offset=None):
+        self._limit = limit
+        self._offset = offset
+        return self
+
+    def apply_args(self, args):
+        """Apply the /games filters from a query string: min_date, max_date,
+        league_id and team_id. Pagination is left to the route."""
+        self.between(args.get("min_date"), args.get("max_date"))
+        if args.get("league_id"):
+            self.for_league(args.get("league_id"))
+        if args.get("team_id"):
+            self.for_team(args.get("team_id"))
+        return self
+
+    # -- execution ----------------------------------------------------------
+
+    def build(self):
+        """Return (sql, params)"""
+        columns = self._columns + [
+            "COALESCE(g.is_finalized, FALSE) AS is_finalized",
+            "(g.home_team_id IS NOT NULL AND g.away_team_id IS NOT NULL) AS has_both_teams",
+        ]
+
+        sql = f"""
+        SELECT {', '.join(columns)}
+        {self._source}
+        LEFT JOIN Teams home_t ON g.home_team_id = home_t.team_id
+        LEFT JOIN Teams away_t ON g.away_team_id = away_t.team_id
+        JOIN Leagues l ON g.league_played = l.league_id
+        JOIN Sports s ON l.sport_played = s.sport_id
+        """
+        params = list(self._params)
+
+        if self._where:
+            sql += "WHERE " + "\n          AND ".join(self._where) + "\n"
+        if self._order_by:
+            sql += f"        ORDER BY {', '.join(self._order_by)}\n"
+        if self._limit is not None:
+            sql += "        LIMIT %s OFFSET %s\n"
+            params += [self._limit, self._offset or 0]
+        return sql, params
+
+    def fetch_all(self, cursor):
+        cursor.execute(*self.build())
+        return cursor.fetchall()
+
+    def fetch_one(self, cursor):
+        cursor.execute(*self.build())
+        return cursor.fetchone()
@@ -0,0 +1,37 @@
+#------------------------------------------------------------
+# Games.home_team_id / Games.away_team_id mirror the home and
+# away rows of Teams_Games, so game listings can join Teams
+# directly instead of looking both sides up in Teams_Games
+# with correlated subqueries for every row.
+#
+# Teams_Games stays the source of truth: every route that
+# inserts, updates or deletes Teams_Games rows calls
+# sync_game_teams() for the affected game(s) on the same
+# cursor before committing. sync_game_teams(cursor) with no
+# game ids re-syncs every game (used by the backfill
+# migration).
+#------------------------------------------------------------
+
+
+def sync_game_teams(cursor, game_ids=None):
+    """Copy the home/away team of the given games (all games if None) from Teams_Games"""
+    query = """
+        UPDATE Games g
+        LEFT JOIN Teams_Games home_tg ON home_tg.game_id = g.game_id AND home_tg.is_home_team = TRUE
+        LEFT JOIN Teams_Games away_tg ON away_tg.game_id = g.game_id AND away_tg.is_home_team = FALSE
+        SET g.home_team_id = home_tg.team_id,
+            g.away_team_id = away_tg.team_id
+    """
+    if game_ids is None:
+        cursor.execute(query)
+        return cursor.rowcount
+
+    if isinstance(game_ids, int):
+        game_ids = [game_ids]
+    game_ids = [game_id for game_id in game_ids if game_id is not None]
+    if not game_ids:
+        return 0
+
+    placeholders = ", ".join(["%s"] * len(game_ids))
+    cursor.execute(query + f" WHERE g.game_id IN ({placeholders})", game_ids)
+    return cursor.rowcount
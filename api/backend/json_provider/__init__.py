@@ -0,0 +1,81 @@
+#------------------------------------------------------------
+# The app's JSON provider (app.json).
+#
+# Rows come back from MySQL holding date, datetime, time,
+# timedelta (TIME columns) and Decimal values. Instead of every
+# route walking its rows through a convert_datetime_for_json
+# pre-pass before jsonify walks them again, the provider encodes
+# those types itself while serializing, in one pass:
+#
+#   date / datetime  ISO 8601 ("2025-03-01", "2025-03-01T18:30:00")
+#   time             "HH:MM:SS"
+#   timedelta        "HH:MM:SS" (MySQL TIME)
+#   Decimal          string, as Flask's default provider does
+#
+# When orjson is installed it does the encoding (and request
+# body decoding); otherwise the standard library json module is
+# used with the same output. Keys are sorted either way, as with
+# Flask's default provider, and debug mode keeps the indented
+# standard library output.
+#------------------------------------------------------------
+import decimal
+import json
+from datetime import date, time, timedelta
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def json_default(value):
+    """Encode the MySQL value types json cannot serialize natively"""
+    if isinstance(value, timedelta):
+        total_seconds = int(value.total_seconds())
+        hours = total_seconds // 3600
+        minutes = (total_seconds % 3600) // 60
+        seconds = total_seconds % 60
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    if isinstance(value, time):
+        return value.strftime('%H:%M:%S')
+    if isinstance(value, date):
+        # datetime is a date subclass
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return DefaultJSONProvider.default(value)
+
+
+def dumps(obj):
+    """Compact, key-sorted JSON text"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(obj, default=json_default, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+class IMLeaguesJSONProvider(DefaultJSONProvider):
+    default = staticmethod(json_default)
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return dumps(obj)
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        compact = self.compact if self.compact is not None else not self._app.debug
+        if orjson is None or not compact:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
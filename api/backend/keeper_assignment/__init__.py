@@ -0,0 +1,125 @@
+#------------------------------------------------------------
+# Automatic stat keeper assignment.
+#
+# assign_keepers() gives every unassigned game one stat keeper
+# in a single greedy pass: games are taken in start order and
+# each goes to the least-loaded keeper who is free at that
+# time. A keeper's load starts as Stat_Keepers.total_games_tracked
+# plus the unfinalized games they are already assigned to and
+# grows by one with every game they are given, so a season's
+# games spread evenly and the keepers with the fewest games
+# tracked catch up first.
+#
+# Keepers sit in a heap ordered by (load, keeper_id). Those
+# already booked at a game's time (a keeper lookup in the
+# conflict index, see backend/conflicts) are set aside and
+# pushed back afterwards, so a game costs O(log k) for k
+# keepers plus the keepers busy at that time. Games no keeper
+# is free for are reported, not assigned.
+#
+# insert_assignments() writes the result with one multi-row
+# INSERT into Games_Keepers.
+#------------------------------------------------------------
+import heapq
+
+KEEPER = ("keeper",)
+
+
+def unassigned_games(cursor, game_ids=None, league_id=None, min_date=None, max_date=None):
+    """Unfinalized games without a stat keeper, in start order.
+
+    Without game_ids or min_date, only games from today on are selected.
+    """
+    conditions = [
+        "g.is_finalized = FALSE",
+        "NOT EXISTS (SELECT 1 FROM Games_Keepers gk WHERE gk.game_id = g.game_id)",
+    ]
+    params = []
+    if game_ids:
+        conditions.append(f"g.game_id IN ({', '.join(['%s'] * len(game_ids))})")
+        params += game_ids
+    if league_id is not None:
+        conditions.append("g.league_played = %s")
+        params.append(league_id)
+    if min_date is not None:
+        conditions.append("g.date_played >= %s")
+        params.append(min_date)
+    elif not game_ids:
+        conditions.append("g.date_played >= CURDATE()")
+    if max_date is not None:
+        conditions.append("g.date_played <= %s")
+        params.append(max_date)
+
+    cursor.execute(f"""
+        SELECT g.game_id, g.league_played, g.date_played, g.start_time, g.location, g.home_team_id, g.away_team_id
+        FROM Games g
+        WHERE {' AND '.join(conditions)}
+        ORDER BY g.date_played, g.start_time, g.game_id
+    """, params)
+    return cursor.fetchall()
+
+
+def keeper_loads(cursor, keeper_ids=None):
+    """{keeper_id: total_games_tracked + unfinalized games already assigned}"""
+    where = ""
+    params = []
+    if keeper_ids:
+        where = f"WHERE sk.keeper_id IN ({', '.join(['%s'] * len(keeper_ids))})"
+        params = list(keeper_ids)
+    cursor.execute(f"""
+        SELECT sk.keeper_id, COALESCE(sk.total_games_tracked, 0) + COUNT(g.game_id) AS games_load
+        FROM Stat_Keepers sk
+        LEFT JOIN Games_Keepers gk ON gk.keeper_id = sk.keeper_id
+        LEFT JOIN Games g ON g.game_id = gk.game_id AND g.is_finalized = FALSE
+        {where}
+        GROUP BY sk.keeper_id, sk.total_games_tracked
+    """, params)
+    return {row["keeper_id"]: int(row["games_load"]) for row in cursor.fetchall()}
+
+
+def assign_keepers(games, loads, index):
+    """Assign one keeper to each game; returns (assignments, unassigned game ids).
+
+    games are in start order, loads is {keeper_id: load} and index a
+    ScheduleIndex holding the keepers' other bookings; each assignment is
+    booked into it as it is made.
+    """
+    heap = [(load, keeper_id) for keeper_id, load in loads.items()]
+    heapq.heapify(heap)
+
+    assignments = []
+    unassigned = []
+    for game in games:
+        span = index.interval(game)
+        busy = []
+        chosen = None
+        while heap:
+            load, keeper_id = heapq.heappop(heap)
+            booking = dict(game, keeper_ids=[keeper_id])
+            if span is None or not index.check(booking, kinds=KEEPER, span=span):
+                chosen = load, keeper_id
+                break
+            busy.append((load, keeper_id))
+        for entry in busy:
+            heapq.heappush(heap, entry)
+
+        if chosen is None:
+            unassigned.append(game["game_id"])
+            continue
+        load, keeper_id = chosen
+        index.add(booking, span=span, kinds=KEEPER)
+        heapq.heappush(heap, (load + 1, keeper_id))
+        assignments.append({"game_id": game["game_id"], "keeper_id": keeper_id})
+    return assignments, unassigned
+
+
+def insert_assignments(cursor, assignments):
+    """Write the assignments with one multi-row INSERT into Games_Keepers"""
+    if not assignments:
+        return
+    placeholders = ", ".join(["(%s, %s, CURDATE())"] * len(assignments))
+    cursor.execute(f"""
+        INSERT INTO Games_Keepers (keeper_id, game_id, assignment_date)
+        VALUES {placeholders}
+        ON DUPLICATE KEY UPDATE assignment_date = CURDATE()
+    """, [value for assignment in assignments for value in (assignment["keeper_id"], assignment["game_id"])])
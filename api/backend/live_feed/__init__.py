@@ -0,0 +1,265 @@
+#------------------------------------------------------------
+# Live game feed: stat event and score changes pushed to
+# spectators as they are committed.
+#
+# Every viewer of an in-progress game used to refetch the game,
+# its players and all of its stat events on each rerun. Instead,
+# the write routes publish what they changed to an in-process
+# hub (publish_game_changes, called after the commit) and
+# viewers follow one of two endpoints per game:
+#
+#   .../games/<game_id>/live/stream   server-sent events
+#   .../games/<game_id>/live?since=N  long-poll JSON
+#
+# Each message has a feed id, increasing across all games, that
+# a client passes back (?since= or the SSE Last-Event-ID header)
+# to resume where it left off. The hub keeps the last
+# FEED_HISTORY messages per game; a client further behind than
+# that (or resuming after an API restart) gets a "reset" and
+# should reload the snapshot, which the endpoints send with
+# one query per connecting viewer rather than per rerun.
+#
+# Message events:
+#   stat_event_created / stat_event_updated   data: the StatEvent row
+#   stat_event_deleted                        data: {"event_id": ...}
+#   score                                     data: home/away scores
+#
+# A game's feed is created by its first message or viewer and
+# dropped once nobody is watching and its newest message is
+# older than FEED_RETENTION, so the hub holds only the games
+# watched or played recently. A client resuming from a dropped
+# feed gets a reset like any client that fell behind. The
+# endpoints answer 404 for an unknown game before they touch
+# the hub.
+#
+# The hub lives in the API process, so it only sees writes
+# served by the same process (the single Flask server this app
+# runs as). Waiting viewers hold a thread, not a database
+# connection.
+#------------------------------------------------------------
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+
+from backend.json_provider import dumps
+
+logger = logging.getLogger(__name__)
+
+FEED_HISTORY = 500
+
+# Seconds an unwatched feed is kept after its newest message,
+# and the least time between sweeps for such feeds
+FEED_RETENTION = 15 * 60
+SWEEP_INTERVAL = 60
+
+# Long-poll and SSE keepalive wait, in seconds
+DEFAULT_WAIT = 25
+MAX_WAIT = 55
+
+STAT_EVENT_COLUMNS = "event_id, performed_by, scored_during, description, stat_type_id, points, time_entered"
+
+
+class GameFeed:
+    """One game's recent messages and the condition its viewers wait on"""
+
+    def __init__(self, history, lock, now):
+        self.messages = deque(maxlen=history)
+        self.condition = threading.Condition(lock)
+        # id of the newest message pushed out of the history
+        self.dropped_id = 0
+        # viewers currently waiting on or streaming the feed
+        self.subscribers = 0
+        # clock time of the newest message (or of the feed's creation)
+        self.updated_at = now
+
+    @property
+    def last_id(self):
+        return self.messages[-1]["id"] if self.messages else 0
+
+    def since(self, since):
+        """(messages after since, complete); complete is False if the client missed some"""
+        # A since past the newest message comes from before an API restart
+        complete = self.dropped_id <= since <= self.last_id
+        return [message for message in self.messages if message["id"] > since], complete
+
+
+class LiveFeedHub:
+    """Per-game message history with blocking waits for new messages"""
+
+    def __init__(self, history=FEED_HISTORY, retention=FEED_RETENTION, clock=time.monotonic):
+        self.history = history
+        self.retention = retention
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._feeds = {}
+        self._swept_at = clock()
+
+    def _feed(self, game_id):
+        # Callers hold self._lock
+        now = self._clock()
+        if now - self._swept_at >= SWEEP_INTERVAL:
+            self._sweep(now)
+        if game_id not in self._feeds:
+            self._feeds[game_id] = GameFeed(self.history, self._lock, now)
+        return self._feeds[game_id]
+
+    def _sweep(self, now):
+        """Drop the feeds nobody watches whose newest message is older than retention"""
+        idle = [game_id for game_id, feed in self._feeds.items()
+                if not feed.subscribers and now - feed.updated_at > self.retention]
+        for game_id in idle:
+            del self._feeds[game_id]
+        self._swept_at = now
+        if idle:
+            logger.debug(f"Dropped {len(idle)} idle live feed(s), {len(self._feeds)} left")
+
+    def publish(self, game_id, event, data):
+        """Append a message to a game's feed and wake its waiting viewers"""
+        with self._lock:
+            feed = self._feed(game_id)
+            if len(feed.messages) == self.history:
+                feed.dropped_id = feed.messages[0]["id"]
+            message = {"id": next(self._ids), "game_id": game_id, "event": event, "data": data}
+            feed.messages.append(message)
+            feed.updated_at = self._clock()
+            feed.condition.notify_all()
+        return message
+
+    def last_id(self, game_id):
+        """The id of the game's newest message (0 if it has none)"""
+        with self._lock:
+            feed = self._feeds.get(game_id)
+            return feed.last_id if feed else 0
+
+    def can_resume(self, game_id, since):
+        """True if every message after since is still in the game's history"""
+        with self._lock:
+            feed = self._feeds.get(game_id)
+            return feed.since(since)[1] if feed else since == 0
+
+    def subscribe(self, game_id):
+        """Count a viewer of the game's feed (which is then kept); pair with unsubscribe()"""
+        with self._lock:
+            self._feed(game_id).subscribers += 1
+
+    def unsubscribe(self, game_id):
+        with self._lock:
+            feed = self._feeds.get(game_id)
+            if feed:
+                feed.subscribers -= 1
+
+    def wait(self, game_id, since, timeout=DEFAULT_WAIT):
+        """Messages after since, blocking up to timeout seconds until there are any.
+
+        Returns (messages, complete); complete is False when the client missed
+        messages and has to reload the game's snapshot.
+        """
+        with self._lock:
+            feed = self._feed(game_id)
+            feed.subscribers += 1
+            try:
+                feed.condition.wait_for(lambda: feed.last_id != since, timeout)
+            finally:
+                feed.subscribers -= 1
+            return feed.since(since)
+
+
+hub = LiveFeedHub()
+
+
+def game_exists(cursor, game_id):
+    cursor.execute("SELECT game_id FROM Games WHERE game_id = %s", (game_id,))
+    return cursor.fetchone() is not None
+
+
+def game_snapshot(cursor, game_id):
+    """The score and every stat event of a game, or None if it does not exist"""
+    cursor.execute(
+        "SELECT game_id, home_team_id, away_team_id, home_score, away_score FROM Games WHERE game_id = %s",
+        (game_id,)
+    )
+    score = cursor.fetchone()
+    if not score:
+        return None
+
+    cursor.execute(
+        f"SELECT {STAT_EVENT_COLUMNS} FROM StatEvent WHERE scored_during = %s ORDER BY time_entered, event_id",
+        (game_id,)
+    )
+    return {"score": score, "stat_events": cursor.fetchall()}
+
+
+def publish_game_changes(cursor, game_id, created=(), updated=(), deleted=(), score=True):
+    """Publish committed changes to a game's stat events (by event id) and its score.
+
+    Call after the commit. Reads the changed rows back in one query (and the
+    score in another); a failure is logged, never raised, so the write that
+    was already committed still succeeds.
+    """
+    try:
+        changed = list(created) + list(updated)
+        rows = {}
+        if changed:
+            placeholders = ", ".join(["%s"] * len(changed))
+            cursor.execute(f"SELECT {STAT_EVENT_COLUMNS} FROM StatEvent WHERE event_id IN ({placeholders})", changed)
+            rows = {row["event_id"]: row for row in cursor.fetchall()}
+
+        for event_id in created:
+            if event_id in rows:
+                hub.publish(game_id, "stat_event_created", rows[event_id])
+        for event_id in updated:
+            if event_id in rows:
+                hub.publish(game_id, "stat_event_updated", rows[event_id])
+        for event_id in deleted:
+            hub.publish(game_id, "stat_event_deleted", {"event_id": event_id})
+
+        if score:
+            cursor.execute(
+                "SELECT game_id, home_team_id, away_team_id, home_score, away_score FROM Games WHERE game_id = %s",
+                (game_id,)
+            )
+            row = cursor.fetchone()
+            if row:
+                hub.publish(game_id, "score", row)
+    except Exception as e:
+        logger.warning(f"Game {game_id}: could not publish live feed changes: {e}")
+
+
+def _sse(event, data, message_id=None):
+    lines = [] if message_id is None else [f"id: {message_id}"]
+    lines += [f"event: {event}", f"data: {dumps(data)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+def sse_stream(game_id, since, snapshot=None, keepalive=DEFAULT_WAIT):
+    """Server-sent events for a game's feed, after message since.
+
+    Starts with a "snapshot" event when one is given. A client that falls
+    behind the history gets a "reset" event (reload the snapshot) and the
+    stream continues from the newest message. Runs until the client
+    disconnects; a comment line every keepalive seconds keeps proxies from
+    closing the idle connection.
+    """
+    # Subscribed for the whole stream, so the feed is kept while the
+    # viewer is between waits too (closing the generator unsubscribes)
+    hub.subscribe(game_id)
+    try:
+        if snapshot is not None:
+            yield _sse("snapshot", snapshot, since)
+        while True:
+            messages, complete = hub.wait(game_id, since, keepalive)
+            if not complete:
+                since = hub.last_id(game_id)
+                yield _sse("reset", {"game_id": game_id}, since)
+                continue
+            if not messages:
+                yield ": keepalive\n\n"
+                continue
+            for message in messages:
+                yield _sse(message["event"], message["data"], message["id"])
+            since = messages[-1]["id"]
+    finally:
+        hub.unsubscribe(game_id)
@@ -0,0 +1,194 @@
+#------------------------------------------------------------
+# Versioned schema migrations for databases created before a
+# schema change was added to database-files/.
+#
+# Each migration is a module in migrations/versions/ named
+# NNNN_description.py with an upgrade(cursor) function. The
+# runner records applied versions in schema_migrations and
+# applies the pending ones in order, either on API startup
+# (create_app) or from the command line:
+#
+#   python -m backend.migrations status|upgrade|check
+#
+# MySQL commits DDL implicitly, so migrations use the helpers
+# below to stay idempotent: a migration that stopped half way,
+# or that runs against a fresh database already built from
+# 01_imleagues_schema.sql, can simply be run again.
+#------------------------------------------------------------
+import importlib
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_TABLE = "schema_migrations"
+
+_VERSIONS_DIR = os.path.join(os.path.dirname(__file__), "versions")
+_MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.py$")
+
+
+def discover_migrations():
+    """Return every migration as a (version, name, module) tuple, in version order"""
+    migrations = []
+    for filename in sorted(os.listdir(_VERSIONS_DIR)):
+        match = _MIGRATION_FILE.match(filename)
+        if not match:
+            continue
+        module = importlib.import_module(f"{__name__}.versions.{filename[:-3]}")
+        migrations.append((int(match.group(1)), match.group(2), module))
+    return migrations
+
+
+def ensure_migrations_table(cursor):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} (
+            version INT PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def get_applied_versions(cursor):
+    ensure_migrations_table(cursor)
+    cursor.execute(f"SELECT version FROM {MIGRATIONS_TABLE}")
+    return {row['version'] for row in cursor.fetchall()}
+
+
+def get_migration_status(connection):
+    """List every known migration with whether it has been applied"""
+    cursor = connection.cursor()
+    applied = get_applied_versions(cursor)
+    cursor.close()
+    return [
+        {"version": version, "name": name, "applied": version in applied}
+        for version, name, _ in discover_migrations()
+    ]
+
+
+def run_migrations(connection):
+    """Apply every pending migration in order and return the versions applied.
+
+    Each migration is committed (and recorded) on its own, so a failure leaves
+    the earlier ones in place and the failed one pending for the next run.
+    """
+    cursor = connection.cursor()
+    applied = get_applied_versions(cursor)
+    connection.commit()
+
+    newly_applied = []
+    try:
+        for version, name, module in discover_migrations():
+            if version in applied:
+                continue
+
+            logger.info(f"Applying migration {version:04d}_{name}")
+            module.upgrade(cursor)
+            cursor.execute(
+                f"INSERT INTO {MIGRATIONS_TABLE} (version, name) VALUES (%s, %s)",
+                (version, name)
+            )
+            connection.commit()
+            newly_applied.append(version)
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    if newly_applied:
+        logger.info(f"Applied {len(newly_applied)} migration(s): {newly_applied}")
+    return newly_applied
+
+
+#------------------------------------------------------------
+# Idempotent DDL helpers for use inside upgrade(cursor)
+#------------------------------------------------------------
+
+def table_exists(cursor, table):
+    cursor.execute("""
+        SELECT 1 FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (table,))
+    return cursor.fetchone() is not None
+
+
+def column_exists(cursor, table, column):
+    cursor.execute("""
+        SELECT 1 FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table, column))
+    return cursor.fetchone() is not None
+
+
+def index_exists(cursor, table, index_name):
+    cursor.execute("""
+        SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+        LIMIT 1
+    """, (table, index_name))
+    return cursor.fetchone() is not None
+
+
+def foreign_key_exists(cursor, table, column, referenced_table):
+    cursor.execute("""
+        SELECT 1 FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+          AND REFERENCED_TABLE_NAME = %s
+        LIMIT 1
+    """, (table, column, referenced_table))
+    return cursor.fetchone() is not None
+
+
+def add_column(cursor, table, column, definition):
+    """ALTER TABLE ... ADD COLUMN unless the column is already there"""
+    if column_exists(cursor, table, column):
+        return False
+    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    return True
+
+
+def create_index(cursor, table, index_name, columns):
+    """CREATE INDEX unless an index with this name is already there"""
+    if index_exists(cursor, table, index_name):
+        return False
+    cursor.execute(f"CREATE INDEX {index_name} ON {table} ({', '.join(columns)})")
+    return True
+
+
+def add_foreign_key(cursor, table, column, referenced_table, referenced_column, on_delete="CASCADE"):
+    """ALTER TABLE ... ADD FOREIGN KEY unless the column already references the table"""
+    if foreign_key_exists(cursor, table, column, referenced_table):
+        return False
+    cursor.execute(f"""
+        ALTER TABLE {table}
+        ADD FOREIGN KEY ({column}) REFERENCES {referenced_table}({referenced_column})
+            ON DELETE {on_delete}
+            ON UPDATE CASCADE
+    """)
+    return True
+
+
+def create_ngram_fulltext_index(cursor, table, index_name, columns, rebuild=False):
+    """CREATE FULLTEXT INDEX ... WITH PARSER ngram, built without InnoDB's stopword list.
+
+    The ngram parser drops every token that contains a stopword ("a", "i",
+    "in", "on", "to", ...), so with the default list most bigrams of ordinary
+    names ("maria", "smith") would never be indexed. The stopword setting in
+    effect when the index is created stays with the index; rebuild=True drops
+    and recreates an existing one.
+    """
+    if index_exists(cursor, table, index_name):
+        if not rebuild:
+            return False
+        cursor.execute(f"DROP INDEX {index_name} ON {table}")
+
+    cursor.execute("SELECT @@SESSION.innodb_ft_enable_stopword AS enabled")
+    enabled = cursor.fetchone()["enabled"]
+    cursor.execute("SET SESSION innodb_ft_enable_stopword = OFF")
+    try:
+        cursor.execute(f"CREATE FULLTEXT INDEX {index_name} ON {table} ({', '.join(columns)}) WITH PARSER ngram")
+    finally:
+        cursor.execute("SET SESSION innodb_ft_enable_stopword = %s", ("ON" if enabled else "OFF",))
+    return True
@@ -0,0 +1,54 @@
+#------------------------------------------------------------
+# Command line entry point for the migration runner. Run from
+# the api/ directory (inside the web-api container: /apicode):
+#
+#   python -m backend.migrations status    list migrations
+#   python -m backend.migrations upgrade   apply pending ones
+#   python -m backend.migrations check     EXPLAIN hot queries
+#   python -m backend.migrations check --strict
+#------------------------------------------------------------
+import os
+import sys
+
+from backend.migrations import get_migration_status, run_migrations
+from backend.migrations.explain_check import check_hot_queries, hot_queries
+
+
+def main(argv):
+    command = argv[0] if argv else "status"
+    if command not in ("status", "upgrade", "check"):
+        print(f"Unknown command '{command}'. Use: status, upgrade or check")
+        return 2
+
+    # The CLI applies migrations itself, so don't run them during app startup
+    os.environ["RUN_MIGRATIONS"] = "false"
+    from backend.rest_entry import create_app
+    from backend.db_connection import db
+
+    app = create_app()
+    with app.app_context():
+        connection = db.get_db()
+
+        if command == "upgrade":
+            applied = run_migrations(connection)
+            print(f"Applied {len(applied)} migration(s)" + (f": {applied}" if applied else ""))
+            command = "status"
+
+        if command == "status":
+            for migration in get_migration_status(connection):
+                state = "applied" if migration["applied"] else "pending"
+                print(f"{migration['version']:04d}_{migration['name']}: {state}")
+            return 0
+
+        queries = hot_queries()
+        failures = check_hot_queries(connection, strict="--strict" in argv, queries=queries)
+        if failures:
+            for failure in failures:
+                print(f"FAIL {failure['query']}: {failure['reason']}")
+            return 1
+        print(f"{len(queries)} hot queries checked, each can use its index")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,119 @@
+#------------------------------------------------------------
+# EXPLAIN-based guard for the index packs (versions/0003 and
+# later).
+#
+# hot_queries() builds the queries the blueprints run most
+# from the same SQL constants and builders the routes use
+# (GameQuery, the players keyset page, ...), each with the
+# table it guards and the indexes that table should be read
+# through. check_hot_queries() EXPLAINs each one and reports a
+# regression when the guarded table is neither read through
+# one of those indexes nor could be (none of them is in
+# possible_keys), i.e. the index was dropped or the query
+# changed so it can no longer use it.
+#
+# With strict=True the guarded table must actually be read
+# through one of its indexes. On the tiny sample data set
+# MySQL often prefers a full scan or another key, so strict
+# mode is meant for season-sized data.
+#------------------------------------------------------------
+import logging
+from datetime import date
+
+logger = logging.getLogger(__name__)
+
+
+def hot_queries():
+    """[{name, alias, indexes, sql, params}] for the hot route queries"""
+    from backend.conflicts import GAME_KEEPERS_QUERY
+    from backend.game_queries import OLDEST_FIRST, GameQuery
+    from backend.pagination import Page
+    from backend.player.player_routes import (LEAGUE_STANDINGS_QUERY, LEAGUE_TEAMS_QUERY, PLAYER_STAT_TOTALS_QUERY,
+                                              TEAM_PLAYERS_QUERY)
+    from backend.stat_keeper.stat_keeper_routes import GAME_STAT_EVENTS_QUERY, TEAM_LEADERS_QUERY
+    from backend.system_admin.system_admin_routes import PLAYERS_KEYSET, players_list_query
+    from backend.team_captain.team_captain_routes import TEAM_REMINDERS_QUERY
+
+    def query(name, alias, indexes, sql, params):
+        return {"name": name, "alias": alias, "indexes": indexes, "sql": sql, "params": tuple(params)}
+
+    return [
+        query("stat_keeper.get_game_stat_events", "se",
+              # every StatEvent index leading with scored_during serves the feed
+              ("idx_statevent_game_time", "idx_statevent_game_seq", "uq_statevent_client_event"),
+              GAME_STAT_EVENTS_QUERY.format(condition=""), (1, 1)),
+        query("player.get_player_stats (aggregated_stats)", "se", ("idx_statevent_player_type",),
+              PLAYER_STAT_TOTALS_QUERY, (1,)),
+        query("stat_keeper.get_game_summary (team leaders)", "se", ("idx_statevent_player_game",),
+              TEAM_LEADERS_QUERY, (1, 1)),
+        query("player.get_league_games", "g", ("idx_games_league_date",),
+              *GameQuery().for_league(1).upcoming(True).order_by(*OLDEST_FIRST).build()),
+        query("player.get_team_games", "g", ("idx_games_home_team", "idx_games_away_team"),
+              *GameQuery().for_team(1).build()),
+        query("system_admin.export_games (min_date)", "g", ("idx_games_date",),
+              *GameQuery().between(date.today().isoformat()).order_by(*OLDEST_FIRST).build()),
+        query("player.get_player_games", "pg", ("PRIMARY",),
+              *GameQuery().for_player(1).build()),
+        query("stat_keeper.get_stat_keeper_games (upcoming)", "gk", ("PRIMARY",),
+              *GameQuery().for_keeper(1)
+              .upcoming(True, finalized_is_past=True).order_by(*OLDEST_FIRST).build()),
+        query("player.get_league_teams", "t", ("idx_teams_league_record",),
+              LEAGUE_TEAMS_QUERY, (1,)),
+        query("player.get_team_players", "tp", ("idx_teams_players_team_role",),
+              TEAM_PLAYERS_QUERY, (1,)),
+        query("conflicts.game_keeper_ids", "Games_Keepers", ("idx_games_keepers_game",),
+              GAME_KEEPERS_QUERY, (1,)),
+        query("team_captain.get_team_reminders", "r", ("idx_reminders_team_time",),
+              TEAM_REMINDERS_QUERY, (1,)),
+        query("player.get_league_standings", "ls", ("PRIMARY", "idx_standings_league_rank"),
+              LEAGUE_STANDINGS_QUERY, (1,)),
+        query("system_admin.get_all_players (keyset page)", "p", ("idx_players_name",),
+              *Page(limit=50, after=["M", "A", 0]).paginate_sql(*players_list_query({}), PLAYERS_KEYSET)),
+    ]
+
+
+def explain_query(cursor, sql, params=()):
+    cursor.execute("EXPLAIN " + sql, params)
+    return cursor.fetchall()
+
+
+def _key_names(value):
+    """Index names of an EXPLAIN key / possible_keys value ("a,b" for an index merge)"""
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+def check_hot_queries(connection, strict=False, queries=None):
+    """EXPLAIN every hot query and return a list of regressions (empty if all good)"""
+    cursor = connection.cursor()
+    failures = []
+
+    try:
+        for query in hot_queries() if queries is None else queries:
+            plan = explain_query(cursor, query["sql"], query["params"])
+            rows = [row for row in plan if row.get("table") == query["alias"]]
+            if not rows:
+                failures.append({"query": query["name"], "reason": f"table {query['alias']} not in plan"})
+                continue
+
+            expected = set(query["indexes"])
+            for row in rows:
+                if _key_names(row.get("key")) & expected:
+                    continue
+                if strict:
+                    reason = f"{query['alias']} read via {row.get('key') or 'a full scan'}"
+                elif _key_names(row.get("possible_keys")) & expected:
+                    continue
+                else:
+                    reason = f"{query['alias']} cannot use {', '.join(query['indexes'])}"
+                failures.append({
+                    "query": query["name"],
+                    "reason": reason,
+                    "key": row.get("key"),
+                    "possible_keys": row.get("possible_keys"),
+                    "rows": row.get("rows"),
+                })
+            logger.debug(f"EXPLAIN {query['name']}: {rows}")
+    finally:
+        cursor.close()
+
+    return failures
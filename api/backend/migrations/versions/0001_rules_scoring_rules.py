@@ -0,0 +1,6 @@
+"""Rules.scoring_rules: per-sport JSON scoring rules (see backend.scoring)"""
+from backend.migrations import add_column
+
+
+def upgrade(cursor):
+    add_column(cursor, "Rules", "scoring_rules", "TEXT")
@@ -0,0 +1,81 @@
+"""StatType catalog plus StatEvent.stat_type_id / StatEvent.points.
+
+Seeds a default catalog for sports that have none and backfills every
+existing stat event with the current scoring rules.
+"""
+from backend.migrations import add_column, add_foreign_key
+from backend.scoring import backfill_stat_events, default_rules_family
+
+# Keyed by scoring rules family; matches database-files/17_stat_types.sql for the
+# sample sports
+DEFAULT_STAT_TYPES = {
+    'basketball': [
+        ('two_pointer', '2 Pointer', 2),
+        ('three_pointer', '3 Pointer', 3),
+        ('free_throw', 'Free Throw', 1),
+        ('rebound', 'Rebound', 0),
+        ('assist', 'Assist', 0),
+        ('steal', 'Steal', 0),
+        ('block', 'Block', 0),
+        ('turnover', 'Turnover', 0),
+        ('foul', 'Foul', 0),
+    ],
+    'soccer': [
+        ('goal', 'Goal', 1),
+        ('assist', 'Assist', 0),
+        ('save', 'Save', 0),
+        ('yellow_card', 'Yellow Card', 0),
+        ('red_card', 'Red Card', 0),
+        ('corner_kick', 'Corner Kick', 0),
+        ('offside', 'Offside', 0),
+    ],
+    'volleyball': [
+        ('point', 'Point', 1),
+        ('kill', 'Kill', 0),
+        ('block', 'Block', 0),
+        ('dig', 'Dig', 0),
+        ('assist', 'Assist', 0),
+    ],
+    'generic': [
+        ('point', 'Point', 1),
+        ('assist', 'Assist', 0),
+        ('save', 'Save', 0),
+    ],
+}
+
+
+def upgrade(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS StatType (
+            stat_type_id INT AUTO_INCREMENT PRIMARY KEY,
+            sport_id INT NOT NULL,
+            code VARCHAR(50) NOT NULL,
+            label VARCHAR(100) NOT NULL,
+            points INT NOT NULL DEFAULT 0,
+            UNIQUE (sport_id, code),
+            FOREIGN KEY (sport_id) REFERENCES Sports(sport_id)
+                ON DELETE CASCADE
+                ON UPDATE CASCADE
+        )
+    """)
+
+    add_column(cursor, "StatEvent", "stat_type_id", "INT AFTER description")
+    add_column(cursor, "StatEvent", "points", "INT NOT NULL DEFAULT 0 AFTER stat_type_id")
+    add_foreign_key(cursor, "StatEvent", "stat_type_id", "StatType", "stat_type_id", on_delete="SET NULL")
+
+    cursor.execute("""
+        SELECT s.sport_id, s.name
+        FROM Sports s
+        WHERE NOT EXISTS (SELECT 1 FROM StatType st WHERE st.sport_id = s.sport_id)
+    """)
+    rows = []
+    for sport in cursor.fetchall():
+        for code, label, points in DEFAULT_STAT_TYPES[default_rules_family(sport['name'])]:
+            rows.append((sport['sport_id'], code, label, points))
+    if rows:
+        cursor.executemany(
+            "INSERT INTO StatType (sport_id, code, label, points) VALUES (%s, %s, %s, %s)",
+            rows
+        )
+
+    backfill_stat_events(cursor, only_missing=True)
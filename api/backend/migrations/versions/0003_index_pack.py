@@ -0,0 +1,39 @@
+"""Secondary indexes for the filters and joins the blueprints run most.
+
+Every index here is also declared in database-files/01_imleagues_schema.sql,
+and the queries they serve are listed in backend.migrations.explain_check.
+"""
+from backend.migrations import create_index
+
+# (table, index name, columns)
+INDEXES = [
+    # Game stat event feeds: WHERE scored_during = ? ORDER BY time_entered
+    ("StatEvent", "idx_statevent_game_time", ["scored_during", "time_entered"]),
+    # Player stat breakdowns: WHERE performed_by = ? GROUP BY stat_type_id, SUM(points)
+    ("StatEvent", "idx_statevent_player_type", ["performed_by", "stat_type_id", "points"]),
+    # Player-in-game joins: performed_by = p.player_id AND scored_during = ?
+    ("StatEvent", "idx_statevent_player_game", ["performed_by", "scored_during"]),
+    # League schedules: WHERE league_played = ? ORDER BY date_played, start_time
+    ("Games", "idx_games_league_date", ["league_played", "date_played", "start_time"]),
+    # Upcoming / past game lists across leagues: date_played ranges
+    ("Games", "idx_games_date", ["date_played", "start_time"]),
+    # Home/away team lookups: WHERE game_id = ? AND is_home_team = ?
+    ("Teams_Games", "idx_teams_games_game_side", ["game_id", "is_home_team", "team_id"]),
+    # League tables: WHERE league_played = ? ORDER BY wins DESC
+    ("Teams", "idx_teams_league_record", ["league_played", "wins", "losses"]),
+    # Team rosters: WHERE team_id = ? (optionally AND role = ?)
+    ("Teams_Players", "idx_teams_players_team_role", ["team_id", "role", "player_id"]),
+    # Keepers assigned to a game
+    ("Games_Keepers", "idx_games_keepers_game", ["game_id", "keeper_id"]),
+    # Game lineups
+    ("Players_Games", "idx_players_games_game", ["game_id", "player_id"]),
+    # Team reminder feeds: WHERE team_id = ? ORDER BY time_sent DESC
+    ("Reminders", "idx_reminders_team_time", ["team_id", "time_sent"]),
+    # League filters: WHERE sport_played = ? AND year >= ?
+    ("Leagues", "idx_leagues_sport_year", ["sport_played", "year"]),
+]
+
+
+def upgrade(cursor):
+    for table, index_name, columns in INDEXES:
+        create_index(cursor, table, index_name, columns)
@@ -0,0 +1,41 @@
+"""LeagueStandings materialization, built from every finalized game.
+
+Databases from before this migration track Teams.wins/losses by hand and
+have no finalized games yet, so the rebuild leaves those columns alone for
+teams without a finalized game instead of mirroring a 0-0 record over
+them. A team's first finalized game then replaces the seeded record with
+the one built from its games.
+"""
+from backend.migrations import add_column
+from backend.standings import rebuild_standings
+
+
+def upgrade(cursor):
+    add_column(cursor, "Games", "is_finalized", "BOOLEAN DEFAULT FALSE")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS LeagueStandings (
+            league_id INT NOT NULL,
+            team_id INT NOT NULL,
+            games_played INT NOT NULL DEFAULT 0,
+            wins INT NOT NULL DEFAULT 0,
+            losses INT NOT NULL DEFAULT 0,
+            ties INT NOT NULL DEFAULT 0,
+            points_for INT NOT NULL DEFAULT 0,
+            points_against INT NOT NULL DEFAULT 0,
+            win_percentage DECIMAL(5,2) NOT NULL DEFAULT 0,
+            streak VARCHAR(10),
+            last_game_date DATE,
+            standing_rank INT,
+            PRIMARY KEY (league_id, team_id),
+            INDEX idx_standings_league_rank (league_id, standing_rank),
+            FOREIGN KEY (league_id) REFERENCES Leagues(league_id)
+                ON DELETE CASCADE
+                ON UPDATE CASCADE,
+            FOREIGN KEY (team_id) REFERENCES Teams(team_id)
+                ON DELETE CASCADE
+                ON UPDATE CASCADE
+        )
+    """)
+
+    rebuild_standings(cursor, keep_unplayed_records=True)
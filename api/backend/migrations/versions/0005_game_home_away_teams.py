@@ -0,0 +1,16 @@
+"""Games.home_team_id / away_team_id, mirrored from Teams_Games and backfilled"""
+from backend.game_teams import sync_game_teams
+from backend.migrations import add_column, add_foreign_key, create_index
+
+
+def upgrade(cursor):
+    add_column(cursor, "Games", "home_team_id", "INT")
+    add_column(cursor, "Games", "away_team_id", "INT")
+
+    create_index(cursor, "Games", "idx_games_home_team", ["home_team_id", "date_played"])
+    create_index(cursor, "Games", "idx_games_away_team", ["away_team_id", "date_played"])
+
+    add_foreign_key(cursor, "Games", "home_team_id", "Teams", "team_id", on_delete="SET NULL")
+    add_foreign_key(cursor, "Games", "away_team_id", "Teams", "team_id", on_delete="SET NULL")
+
+    sync_game_teams(cursor)
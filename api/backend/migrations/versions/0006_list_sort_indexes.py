@@ -0,0 +1,15 @@
+"""Indexes on the sort keys of the keyset-paginated admin list endpoints."""
+from backend.migrations import create_index
+
+# (table, index name, columns)
+INDEXES = [
+    # /system-admin/players: ORDER BY last_name, first_name, player_id
+    ("Players", "idx_players_name", ["last_name", "first_name", "player_id"]),
+    # /system-admin/teams: ORDER BY name, team_id
+    ("Teams", "idx_teams_name", ["name", "team_id"]),
+]
+
+
+def upgrade(cursor):
+    for table, index_name, columns in INDEXES:
+        create_index(cursor, table, index_name, columns)
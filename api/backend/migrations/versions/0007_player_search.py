@@ -0,0 +1,12 @@
+"""Players.search_text with ngram full-text and prefix indexes for player search."""
+from backend.migrations import add_column, create_index, create_ngram_fulltext_index
+
+
+def upgrade(cursor):
+    add_column(
+        cursor, "Players", "search_text",
+        "VARCHAR(210) GENERATED ALWAYS AS (LOWER(CONCAT_WS(' ', first_name, last_name, email))) STORED",
+    )
+    create_index(cursor, "Players", "idx_players_search_prefix", ["search_text"])
+    # Built without stopwords, or the ngrams of most names are never indexed
+    create_ngram_fulltext_index(cursor, "Players", "ft_players_search", ["search_text"])
@@ -0,0 +1,12 @@
+"""EntityVersion counters behind the API's ETags"""
+
+
+def upgrade(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS EntityVersion (
+            entity_type VARCHAR(20) NOT NULL,
+            entity_id INT NOT NULL,
+            version BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (entity_type, entity_id)
+        )
+    """)
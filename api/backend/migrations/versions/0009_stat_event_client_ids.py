@@ -0,0 +1,8 @@
+"""StatEvent.client_event_id, the idempotency key of buffered stat entries"""
+from backend.migrations import add_column, index_exists
+
+
+def upgrade(cursor):
+    add_column(cursor, "StatEvent", "client_event_id", "VARCHAR(64)")
+    if not index_exists(cursor, "StatEvent", "uq_statevent_client_event"):
+        cursor.execute("CREATE UNIQUE INDEX uq_statevent_client_event ON StatEvent (scored_during, client_event_id)")
@@ -0,0 +1,22 @@
+"""Per-game stat event change sequence and tombstones for delta sync"""
+from backend.migrations import add_column, create_index
+
+
+def upgrade(cursor):
+    add_column(cursor, "Games", "stat_seq", "INT NOT NULL DEFAULT 0")
+    add_column(cursor, "StatEvent", "change_seq", "INT NOT NULL DEFAULT 0")
+    create_index(cursor, "StatEvent", "idx_statevent_game_seq", ["scored_during", "change_seq"])
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS StatEventTombstone (
+            event_id INT PRIMARY KEY,
+            game_id INT NOT NULL,
+            performed_by INT,
+            change_seq INT NOT NULL,
+            deleted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_tombstone_game_seq (game_id, change_seq),
+            FOREIGN KEY (game_id) REFERENCES Games(game_id)
+                ON DELETE CASCADE
+                ON UPDATE CASCADE
+        )
+    """)
@@ -0,0 +1,9 @@
+"""Rebuild the player search full-text index without InnoDB's stopword list."""
+from backend.migrations import column_exists, create_ngram_fulltext_index
+
+
+def upgrade(cursor):
+    # Databases that ran 0007 before it disabled stopwords hold an index that
+    # skips every ngram containing one ("ma", "ri", "ia" of "maria" ...)
+    if column_exists(cursor, "Players", "search_text"):
+        create_ngram_fulltext_index(cursor, "Players", "ft_players_search", ["search_text"], rebuild=True)
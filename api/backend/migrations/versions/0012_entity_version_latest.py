@@ -0,0 +1,7 @@
+"""Index EntityVersion.version for MAX(version) and drop the global ("all", 0) counter"""
+from backend.migrations import create_index
+
+
+def upgrade(cursor):
+    create_index(cursor, "EntityVersion", "idx_entity_version_version", ["version"])
+    cursor.execute("DELETE FROM EntityVersion WHERE entity_type = 'all'")
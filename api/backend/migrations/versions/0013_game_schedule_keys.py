@@ -0,0 +1,8 @@
+"""Games.schedule_key, the key a generated schedule reads its new game ids back by"""
+from backend.migrations import add_column, index_exists
+
+
+def upgrade(cursor):
+    add_column(cursor, "Games", "schedule_key", "VARCHAR(64)")
+    if not index_exists(cursor, "Games", "uq_games_schedule_key"):
+        cursor.execute("CREATE UNIQUE INDEX uq_games_schedule_key ON Games (schedule_key)")
@@ -0,0 +1,242 @@
+#------------------------------------------------------------
+# Keyset (cursor) pagination and field projection for list
+# endpoints.
+#
+# A paginated request passes ?limit=N and, for every page after
+# the first, ?after=<token> where the token is the next_after
+# value of the previous page. The token encodes the sort key of
+# the last row returned, so the next page is read with
+#
+#   WHERE (sort key) > (last row's sort key) ORDER BY sort key LIMIT N + 1
+#
+# which an index on the sort key can serve directly, however
+# deep the page, instead of an OFFSET that reads and discards
+# every earlier row. The extra row tells whether a next page
+# exists.
+#
+# ?fields=a,b,c trims each row to the listed keys before it is
+# serialized. Requests without limit/after get the full list as
+# before, so existing callers keep working.
+#------------------------------------------------------------
+import base64
+import decimal
+import json
+from datetime import date, datetime, time, timedelta
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class PaginationError(ValueError):
+    """Invalid limit / after / fields parameter (reported as a 400)"""
+
+
+class SortKey:
+    """One ORDER BY column of a keyset: SQL expression, row key and direction.
+
+    A nullable column must say so: NULL never compares greater or smaller
+    than the cursor value, so its NULLs are ordered by an explicit
+    "(column IS NULL)" term ahead of the column itself (after every value,
+    in either direction) and the column is still compared as itself, which
+    its index can serve.
+    """
+
+    def __init__(self, column, row_key, descending=False, nullable=False):
+        self.column = column
+        self.row_key = row_key
+        self.descending = descending
+        self.nullable = nullable
+
+    def order_by(self):
+        direction = "DESC" if self.descending else "ASC"
+        if self.nullable:
+            return [f"({self.column} IS NULL) ASC", f"{self.column} {direction}"]
+        return [f"{self.column} {direction}"]
+
+    def after(self, value):
+        """(condition, params) for rows after value on this key, (condition, params) for rows equal to it"""
+        op = "<" if self.descending else ">"
+        if value is None:
+            if not self.nullable:
+                raise PaginationError("Invalid after token")
+            # Nothing sorts after a NULL but the other NULLs
+            return None, (f"{self.column} IS NULL", [])
+        after = f"{self.column} {op} %s"
+        if self.nullable:
+            after = f"({after} OR {self.column} IS NULL)"
+        return (after, [value]), (f"{self.column} = %s", [value])
+
+    def value(self, row):
+        return row[self.row_key]
+
+
+class Keyset:
+    """Ordered sort keys; the last one must be unique (normally the primary key)"""
+
+    def __init__(self, *keys):
+        self.keys = keys
+
+    def order_by(self):
+        """ORDER BY expressions, for "ORDER BY " + ", ".join(...)"""
+        return [expression for key in self.keys for expression in key.order_by()]
+
+    def after(self, values):
+        """(condition, params) selecting the rows after the given sort key values.
+
+        Mixed ASC/DESC keys rule out a row constructor comparison, so the
+        condition is expanded to a < x OR (a = x AND (b > y OR (b = y AND ...))).
+        """
+        if len(values) != len(self.keys):
+            raise PaginationError("Invalid after token")
+
+        condition, params = None, []
+        for key, value in reversed(list(zip(self.keys, values))):
+            after, (equal, equal_params) = key.after(value)
+            if condition is None:
+                if after is None:
+                    # The unique last key is NULL: no row follows it
+                    return "1 = 0", []
+                condition, params = after
+            elif after is None:
+                condition = f"({equal} AND {condition})"
+                params = equal_params + params
+            else:
+                condition = f"({after[0]} OR ({equal} AND {condition}))"
+                params = after[1] + equal_params + params
+        return condition, params
+
+    def cursor_for(self, row):
+        return encode_cursor([key.value(row) for key in self.keys])
+
+
+def _cursor_value(value):
+    """A sort key value as MySQL writes it, so it compares like the column.
+
+    A TIME is written zero-padded, "09:00:00" rather than the "9:00:00"
+    str() gives a timedelta, so it also orders correctly as a string.
+    """
+    if isinstance(value, timedelta):
+        total_seconds = int(value.total_seconds())
+        sign = "-" if total_seconds < 0 else ""
+        hours, rest = divmod(abs(total_seconds), 3600)
+        return f"{sign}{hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def encode_cursor(values):
+    payload = json.dumps(values, default=_cursor_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        raise PaginationError("Invalid after token")
+    if not isinstance(values, list) or not all(
+            value is None or isinstance(value, (str, int, float)) for value in values):
+        raise PaginationError("Invalid after token")
+    return values
+
+
+class Page:
+    """The limit / after / fields of a list request"""
+
+    def __init__(self, limit=None, after=None, fields=None):
+        self.limit = limit
+        self.after = after
+        self.fields = fields
+
+    @property
+    def paginated(self):
+        return self.limit is not None
+
+    @classmethod
+    def from_args(cls, args, fields=None):
+        """Parse ?limit=, ?after= and ?fields= (checked against the allowed fields)"""
+        limit = args.get("limit")
+        after = args.get("after")
+
+        if limit is None and after is None:
+            limit = None
+        elif limit is None:
+            limit = DEFAULT_LIMIT
+        else:
+            try:
+                limit = int(limit)
+            except ValueError:
+                raise PaginationError("limit must be an integer")
+            if limit < 1:
+                raise PaginationError("limit must be at least 1")
+            limit = min(limit, MAX_LIMIT)
+
+        requested = None
+        if args.get("fields"):
+            requested = [field.strip() for field in args.get("fields").split(",") if field.strip()]
+            unknown = [field for field in requested if fields is not None and field not in fields]
+            if unknown:
+                raise PaginationError(f"Unknown fields: {', '.join(unknown)}")
+
+        return cls(limit, decode_cursor(after) if after else None, requested)
+
+    def apply(self, keyset):
+        """(condition or None, params, order_by, fetch_limit) for a query using this page"""
+        condition, params = (None, [])
+        if self.after is not None:
+            condition, params = keyset.after(self.after)
+        fetch_limit = self.limit + 1 if self.paginated else None
+        return condition, params, keyset.order_by(), fetch_limit
+
+    def paginate_sql(self, query, params, keyset):
+        """Append the after condition, ORDER BY and LIMIT to a query that ends in its WHERE clause"""
+        condition, after_params, order_by, fetch_limit = self.apply(keyset)
+        params = list(params)
+        if condition:
+            query += f" AND {condition}"
+            params += after_params
+        query += f" ORDER BY {', '.join(order_by)}"
+        if fetch_limit:
+            query += f" LIMIT {fetch_limit}"
+        return query, params
+
+    def project_row(self, row):
+        if not self.fields:
+            return row
+        return {field: row.get(field) for field in self.fields}
+
+    def project(self, rows):
+        if not self.fields:
+            return rows
+        return [self.project_row(row) for row in rows]
+
+    def result(self, rows, keyset):
+        """The JSON body: the plain list, or a page envelope when paginated.
+
+        Rows must still hold their sort key values (fetched with the
+        fetch_limit from apply()); projection happens afterwards.
+        """
+        if not self.paginated:
+            return self.project(rows)
+
+        next_after = None
+        if len(rows) > self.limit:
+            rows = rows[:self.limit]
+            next_after = keyset.cursor_for(rows[-1])
+        return {
+            "items": self.project(rows),
+            "limit": self.limit,
+            "next_after": next_after,
+        }
+
+
+def count_rows(cursor, query, params=None):
+    """Total rows a list query returns (for the separate /count endpoints)"""
+    cursor.execute(f"SELECT COUNT(*) AS total FROM ({query}) AS counted", params or None)
+    return cursor.fetchone()["total"]
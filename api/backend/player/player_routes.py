@@ -1,34 +1,13 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from backend.db_connection import db
+from backend.game_queries import GameQuery
+from backend.live_feed import DEFAULT_WAIT, MAX_WAIT, game_exists, game_snapshot, hub, sse_stream
+from backend.versions import versioned
 from mysql.connector import Error
-from datetime import datetime, timedelta, date, time
 
 player = Blueprint("player", __name__)
 
 
-def convert_datetime_for_json(data):
-    if isinstance(data, list):
-        for item in data:
-            convert_datetime_for_json(item)
-    elif isinstance(data, dict):
-        for key, value in data.items():
-            if value is None:
-                continue
-            elif isinstance(value, timedelta):
-                total_seconds = int(value.total_seconds())
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                seconds = total_seconds % 60
-                data[key] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            elif isinstance(value, time):
-                data[key] = value.strftime('%H:%M:%S')
-            elif isinstance(value, date):
-                data[key] = value.isoformat()
-            elif isinstance(value, datetime):
-                data[key] = value.isoformat()
-    return data
-
-
 @player.route("/players", methods=["GET"])
 def get_all_players():
     try:
@@ -44,14 +23,13 @@ def get_all_players():
         players = cursor.fetchall()
         cursor.close()
         
-        players = convert_datetime_for_json(players)
-        
         return jsonify(players), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @player.route("/players/<int:player_id>", methods=["GET"])
+@versioned("player")
 def get_player(player_id):
     try:
         cursor = db.get_db().cursor()
@@ -69,14 +47,13 @@ def get_player(player_id):
         if not player_data:
             return jsonify({"error": "Player not found"}), 404
         
-        player_data = convert_datetime_for_json(player_data)
-        
         return jsonify(player_data), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @player.route("/players/<int:player_id>/teams", methods=["GET"])
+@versioned("player")
 def get_player_teams(player_id):
     try:
         cursor = db.get_db().cursor()
@@ -102,14 +79,13 @@ def get_player_teams(player_id):
         teams = cursor.fetchall()
         cursor.close()
         
-        teams = convert_datetime_for_json(teams)
-        
         return jsonify(teams), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @player.route("/players/<int:player_id>/games", methods=["GET"])
+@versioned("player")
 def get_player_games(player_id):
     try:
         cursor = db.get_db().cursor()
@@ -122,45 +98,34 @@ def get_player_games(player_id):
         
         upcoming_only = request.args.get("upcoming_only", "false").lower() == "true"
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name, s.name AS sport_name,
-               pg.is_starter, pg.position
-        FROM Players_Games pg
-        JOIN Games g ON pg.game_id = g.game_id
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE pg.player_id = %s
-        """
-        
-        params = [player_id]
-        
-        if upcoming_only:
-            query += " AND g.date_played >= CURDATE()"
-        else:
-            query += " AND g.date_played < CURDATE()"
-        
-        query += " ORDER BY g.date_played DESC, g.start_time DESC"
-        
-        cursor.execute(query, params)
-        games = cursor.fetchall()
+        query = GameQuery().for_player(player_id).upcoming(upcoming_only)
+        games = query.fetch_all(cursor)
         cursor.close()
         
-        games = convert_datetime_for_json(games)
-        
         return jsonify(games), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
+# A player's stat event count and points per stat type, and per description
+# for events no stat type matched (stat_type_id is NULL)
+PLAYER_STAT_TOTALS_QUERY = """
+        SELECT COALESCE(st.label, agg.description) AS description, agg.stat_type_id, st.code,
+               agg.count, agg.total_points
+        FROM (
+            SELECT se.stat_type_id, IF(se.stat_type_id IS NULL, se.description, NULL) AS description,
+                   COUNT(*) AS count, SUM(se.points) AS total_points
+            FROM StatEvent se
+            WHERE se.performed_by = %s
+            GROUP BY se.stat_type_id, IF(se.stat_type_id IS NULL, se.description, NULL)
+        ) agg
+        LEFT JOIN StatType st ON agg.stat_type_id = st.stat_type_id
+        ORDER BY agg.count DESC
+        """
+
+
 @player.route("/players/<int:player_id>/stats", methods=["GET"])
+@versioned("player")
 def get_player_stats(player_id):
     try:
         cursor = db.get_db().cursor()
@@ -173,16 +138,14 @@ def get_player_stats(player_id):
         
         # Get all stat events for the player with game details
         query = """
-        SELECT se.event_id, se.description, se.time_entered,
+        SELECT se.event_id, se.description, se.stat_type_id, se.points, se.time_entered,
                g.game_id, g.date_played, g.start_time, g.location,
                t1.name AS home_team, t2.name AS away_team,
                l.name AS league_name, s.name AS sport_name
         FROM StatEvent se
         JOIN Games g ON se.scored_during = g.game_id
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
+        JOIN Teams t1 ON g.home_team_id = t1.team_id
+        JOIN Teams t2 ON g.away_team_id = t2.team_id
         JOIN Leagues l ON g.league_played = l.league_id
         JOIN Sports s ON l.sport_played = s.sport_id
         WHERE se.performed_by = %s
@@ -192,22 +155,11 @@ def get_player_stats(player_id):
         cursor.execute(query, (player_id,))
         stat_events = cursor.fetchall()
         
-        # Also get aggregated stats grouped by description
-        agg_query = """
-        SELECT se.description, COUNT(*) AS count
-        FROM StatEvent se
-        WHERE se.performed_by = %s
-        GROUP BY se.description
-        ORDER BY count DESC
-        """
-        
-        cursor.execute(agg_query, (player_id,))
+        # Also get aggregated stats grouped by stat type
+        cursor.execute(PLAYER_STAT_TOTALS_QUERY, (player_id,))
         aggregated_stats = cursor.fetchall()
         cursor.close()
         
-        stat_events = convert_datetime_for_json(stat_events)
-        aggregated_stats = convert_datetime_for_json(aggregated_stats)
-        
         result = {
             "player_id": player_id,
             "total_stat_events": len(stat_events),
@@ -221,73 +173,135 @@ def get_player_stats(player_id):
 
 
 @player.route("/games/<int:game_id>", methods=["GET"])
+@versioned("game")
 def get_game(game_id):
     try:
         cursor = db.get_db().cursor()
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location, 
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name, s.name AS sport_name
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE g.game_id = %s
-        """
-        
-        cursor.execute(query, (game_id,))
-        game = cursor.fetchone()
+        game = GameQuery().for_game(game_id).fetch_one(cursor)
         cursor.close()
         
         if not game:
             return jsonify({"error": "Game not found"}), 404
         
-        game = convert_datetime_for_json(game)
-        
         return jsonify(game), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
-@player.route("/leagues/<int:league_id>/teams", methods=["GET"])
-def get_league_teams(league_id):
+@player.route("/games/<int:game_id>/live", methods=["GET"])
+def get_game_live(game_id):
+    """Long-poll a game's live feed.
+    
+    Without ?since= returns the game's snapshot and the feed id (last_id) to
+    continue from. With ?since=<last_id> waits up to ?wait= seconds for newer
+    messages; reset is true (with a fresh snapshot) if the client missed some.
+    """
     try:
-        cursor = db.get_db().cursor()
+        since = request.args.get("since", type=int)
+        wait = max(0, min(request.args.get("wait", DEFAULT_WAIT, type=int), MAX_WAIT))
         
-        # First check if league exists
-        cursor.execute("SELECT league_id FROM Leagues WHERE league_id = %s", (league_id,))
-        if not cursor.fetchone():
+        if since is not None:
+            cursor = db.get_db().cursor()
+            exists = game_exists(cursor, game_id)
             cursor.close()
-            return jsonify({"error": "League not found"}), 404
+            if not exists:
+                return jsonify({"error": "Game not found"}), 404
+            
+            # Waiting holds a thread, not one of the pool's connections
+            db.release_db()
+            messages, complete = hub.wait(game_id, since, wait)
+            if complete:
+                return jsonify({
+                    "game_id": game_id,
+                    "last_id": messages[-1]["id"] if messages else since,
+                    "reset": False,
+                    "messages": messages
+                }), 200
+        
+        # Read the feed id first: messages published meanwhile are sent again, never lost
+        last_id = hub.last_id(game_id)
+        cursor = db.get_db().cursor()
+        snapshot = game_snapshot(cursor, game_id)
+        cursor.close()
         
-        query = """
+        if snapshot is None:
+            return jsonify({"error": "Game not found"}), 404
+        
+        return jsonify({
+            "game_id": game_id,
+            "last_id": last_id,
+            "reset": since is not None,
+            "snapshot": snapshot,
+            "messages": []
+        }), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@player.route("/games/<int:game_id>/live/stream", methods=["GET"])
+def stream_game_live(game_id):
+    """Server-sent events for a game's live feed (resumes from Last-Event-ID or ?since=)"""
+    try:
+        since = request.headers.get("Last-Event-ID", type=int)
+        if since is None:
+            since = request.args.get("since", type=int)
+        
+        cursor = db.get_db().cursor()
+        if since is None or not hub.can_resume(game_id, since):
+            since = hub.last_id(game_id)
+            snapshot = game_snapshot(cursor, game_id)
+            exists = snapshot is not None
+        else:
+            snapshot, exists = None, game_exists(cursor, game_id)
+        cursor.close()
+        
+        if not exists:
+            return jsonify({"error": "Game not found"}), 404
+        
+        # No stream_with_context: the request's database connection goes back
+        # to the pool now instead of being held for as long as the viewer watches
+        return Response(sse_stream(game_id, since, snapshot), mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+LEAGUE_TEAMS_QUERY = """
         SELECT t.team_id, t.name AS team_name, t.wins, t.losses,
                COUNT(DISTINCT tp.player_id) AS total_players
         FROM Teams t
         LEFT JOIN Teams_Players tp ON t.team_id = tp.team_id
+        LEFT JOIN LeagueStandings ls ON ls.league_id = t.league_played AND ls.team_id = t.team_id
         WHERE t.league_played = %s
-        GROUP BY t.team_id, t.name, t.wins, t.losses
-        ORDER BY t.wins DESC, t.losses ASC, t.name
+        GROUP BY t.team_id, t.name, t.wins, t.losses, ls.standing_rank
+        ORDER BY ls.standing_rank IS NULL, ls.standing_rank, t.name
         """
+
+
+@player.route("/leagues/<int:league_id>/teams", methods=["GET"])
+@versioned("league")
+def get_league_teams(league_id):
+    try:
+        cursor = db.get_db().cursor()
         
-        cursor.execute(query, (league_id,))
+        # First check if league exists
+        cursor.execute("SELECT league_id FROM Leagues WHERE league_id = %s", (league_id,))
+        if not cursor.fetchone():
+            cursor.close()
+            return jsonify({"error": "League not found"}), 404
+        
+        cursor.execute(LEAGUE_TEAMS_QUERY, (league_id,))
         teams = cursor.fetchall()
         cursor.close()
         
-        teams = convert_datetime_for_json(teams)
-        
         return jsonify(teams), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @player.route("/leagues/<int:league_id>/games", methods=["GET"])
+@versioned("league")
 def get_league_games(league_id):
     try:
         cursor = db.get_db().cursor()
@@ -300,40 +314,30 @@ def get_league_games(league_id):
         
         upcoming_only = request.args.get("upcoming_only", "false").lower() == "true"
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        WHERE g.league_played = %s
-        """
-        
-        params = [league_id]
-        
-        if upcoming_only:
-            query += " AND g.date_played >= CURDATE()"
-        else:
-            query += " AND g.date_played < CURDATE()"
-        
-        query += " ORDER BY g.date_played DESC, g.start_time DESC"
-        
-        cursor.execute(query, params)
-        games = cursor.fetchall()
+        query = GameQuery().for_league(league_id).upcoming(upcoming_only)
+        games = query.fetch_all(cursor)
         cursor.close()
         
-        games = convert_datetime_for_json(games)
-        
         return jsonify(games), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
+LEAGUE_STANDINGS_QUERY = """
+        SELECT t.team_id, t.name AS team_name, ls.wins, ls.losses, ls.ties,
+               ls.games_played, ls.win_percentage,
+               ls.points_for, ls.points_against,
+               (ls.points_for - ls.points_against) AS point_differential,
+               ls.streak, ls.last_game_date, ls.standing_rank
+        FROM LeagueStandings ls
+        JOIN Teams t ON ls.team_id = t.team_id
+        WHERE ls.league_id = %s
+        ORDER BY ls.standing_rank, t.name
+        """
+
+
 @player.route("/leagues/<int:league_id>/standings", methods=["GET"])
+@versioned("league")
 def get_league_standings(league_id):
     try:
         cursor = db.get_db().cursor()
@@ -344,31 +348,17 @@ def get_league_standings(league_id):
             cursor.close()
             return jsonify({"error": "League not found"}), 404
         
-        query = """
-        SELECT t.team_id, t.name AS team_name, t.wins, t.losses,
-               (t.wins + t.losses) AS games_played,
-               CASE 
-                   WHEN (t.wins + t.losses) > 0 
-                   THEN ROUND((t.wins / (t.wins + t.losses)) * 100, 2)
-                   ELSE 0 
-               END AS win_percentage
-        FROM Teams t
-        WHERE t.league_played = %s
-        ORDER BY win_percentage DESC, t.wins DESC, t.losses ASC, t.name
-        """
-        
-        cursor.execute(query, (league_id,))
+        cursor.execute(LEAGUE_STANDINGS_QUERY, (league_id,))
         standings = cursor.fetchall()
         cursor.close()
         
-        standings = convert_datetime_for_json(standings)
-        
         return jsonify(standings), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @player.route("/teams/<int:team_id>", methods=["GET"])
+@versioned("team")
 def get_team(team_id):
     try:
         cursor = db.get_db().cursor()
@@ -389,14 +379,23 @@ def get_team(team_id):
         if not team:
             return jsonify({"error": "Team not found"}), 404
         
-        team = convert_datetime_for_json(team)
-        
         return jsonify(team), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
+TEAM_PLAYERS_QUERY = """
+        SELECT p.player_id, p.first_name, p.last_name, p.email,
+               tp.role
+        FROM Teams_Players tp
+        JOIN Players p ON tp.player_id = p.player_id
+        WHERE tp.team_id = %s
+        ORDER BY tp.role, p.last_name, p.first_name
+        """
+
+
 @player.route("/teams/<int:team_id>/players", methods=["GET"])
+@versioned("team")
 def get_team_players(team_id):
     try:
         cursor = db.get_db().cursor()
@@ -407,27 +406,17 @@ def get_team_players(team_id):
             cursor.close()
             return jsonify({"error": "Team not found"}), 404
         
-        query = """
-        SELECT p.player_id, p.first_name, p.last_name, p.email,
-               tp.role
-        FROM Teams_Players tp
-        JOIN Players p ON tp.player_id = p.player_id
-        WHERE tp.team_id = %s
-        ORDER BY tp.role, p.last_name, p.first_name
-        """
-        
-        cursor.execute(query, (team_id,))
+        cursor.execute(TEAM_PLAYERS_QUERY, (team_id,))
         players = cursor.fetchall()
         cursor.close()
         
-        players = convert_datetime_for_json(players)
-        
         return jsonify(players), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @player.route("/teams/<int:team_id>/games", methods=["GET"])
+@versioned("team")
 def get_team_games(team_id):
     try:
         cursor = db.get_db().cursor()
@@ -440,42 +429,17 @@ def get_team_games(team_id):
         
         upcoming_only = request.args.get("upcoming_only", "false").lower() == "true"
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        WHERE (tg1.team_id = %s OR tg2.team_id = %s)
-        """
-        
-        params = [team_id, team_id]
-        
-        if upcoming_only:
-            query += " AND g.date_played >= CURDATE()"
-        else:
-            query += " AND g.date_played < CURDATE()"
-        
-        query += " ORDER BY g.date_played DESC, g.start_time DESC"
-        
-        cursor.execute(query, params)
-        games = cursor.fetchall()
+        query = GameQuery().for_team(team_id).upcoming(upcoming_only)
+        games = query.fetch_all(cursor)
         cursor.close()
         
-        games = convert_datetime_for_json(games)
-        
         return jsonify(games), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @player.route("/teams/<int:team_id>/stats", methods=["GET"])
+@versioned("team")
 def get_team_stats(team_id):
     try:
         cursor = db.get_db().cursor()
@@ -521,8 +485,6 @@ def get_team_stats(team_id):
         if league:
             stats["league_name"] = league["league_name"]
         
-        stats = convert_datetime_for_json(stats)
-        
         return jsonify(stats), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -560,12 +522,13 @@ def get_league_analytics(league_id):
         cursor.execute(query, (league_id,))
         analytics = cursor.fetchone()
         
-        # Get top teams by wins
+        # Get top teams by standing
         top_teams_query = """
-        SELECT t.team_id, t.name AS team_name, t.wins, t.losses
-        FROM Teams t
-        WHERE t.league_played = %s
-        ORDER BY t.wins DESC, t.losses ASC
+        SELECT t.team_id, t.name AS team_name, ls.wins, ls.losses, ls.ties, ls.standing_rank
+        FROM LeagueStandings ls
+        JOIN Teams t ON ls.team_id = t.team_id
+        WHERE ls.league_id = %s
+        ORDER BY ls.standing_rank, t.name
         LIMIT 5
         """
         
@@ -574,9 +537,6 @@ def get_league_analytics(league_id):
         
         cursor.close()
         
-        analytics = convert_datetime_for_json(analytics)
-        top_teams = convert_datetime_for_json(top_teams)
-        
         result = {
             "league_id": league_id,
             "league_name": league["name"],
@@ -620,12 +580,19 @@ def get_player_analytics(player_id):
         
         # Get stat breakdown by type
         stat_breakdown_query = """
-        SELECT se.description, COUNT(*) AS count
-        FROM StatEvent se
-        WHERE se.performed_by = %s
-        GROUP BY se.description
-        ORDER BY count DESC
-        LIMIT 10
+        SELECT COALESCE(st.label, agg.description) AS description, agg.stat_type_id, st.code,
+               agg.count, agg.total_points
+        FROM (
+            SELECT se.stat_type_id, IF(se.stat_type_id IS NULL, se.description, NULL) AS description,
+                   COUNT(*) AS count, SUM(se.points) AS total_points
+            FROM StatEvent se
+            WHERE se.performed_by = %s
+            GROUP BY se.stat_type_id, IF(se.stat_type_id IS NULL, se.description, NULL)
+            ORDER BY count DESC
+            LIMIT 10
+        ) agg
+        LEFT JOIN StatType st ON agg.stat_type_id = st.stat_type_id
+        ORDER BY agg.count DESC
         """
         
         cursor.execute(stat_breakdown_query, (player_id,))
@@ -648,10 +615,6 @@ def get_player_analytics(player_id):
         
         cursor.close()
         
-        analytics = convert_datetime_for_json(analytics)
-        stat_breakdown = convert_datetime_for_json(stat_breakdown)
-        performance_over_time = convert_datetime_for_json(performance_over_time)
-        
         result = {
             "player_id": player_id,
             "player_name": f"{player_info['first_name']} {player_info['last_name']}",
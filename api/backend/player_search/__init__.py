@@ -0,0 +1,146 @@
+#------------------------------------------------------------
+# Indexed player search for the type-ahead player pickers.
+#
+# Players.search_text is a stored generated column holding
+# "first last email" in lower case. It carries two indexes:
+#
+#   ft_players_search         FULLTEXT ... WITH PARSER ngram, so
+#                             any 2+ character fragment of a name
+#                             or email (typos included, since
+#                             overlapping ngrams still score) is
+#                             found without a table scan. It is
+#                             built without InnoDB's stopword
+#                             list, which would drop every ngram
+#                             containing "a", "i", "in", "on" ...
+#   idx_players_search_prefix B-tree, for "first name" and
+#                             "first last" prefixes
+#
+# search_players() unions one indexed lookup per kind of match
+# (exact id, last name / first name / full name / email prefix,
+# ngram full-text) and ranks players by their best match, prefix
+# matches first, full-text relevance after.
+#
+# Databases without search_text (built before migration
+# 0007_player_search) fall back to LIKE '%term%' scans.
+#------------------------------------------------------------
+import re
+
+from backend.db_connection import db
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+# ngram_token_size (MySQL default 2): shorter terms cannot hit the full-text index
+MIN_FULLTEXT_LENGTH = 2
+
+# Scores per kind of match; full-text relevance is added on top
+SCORE_ID = 100
+SCORE_LAST_NAME_PREFIX = 40
+SCORE_NAME_PREFIX = 35
+SCORE_EMAIL_PREFIX = 30
+SCORE_FULLTEXT = 10
+
+PLAYER_COLUMNS = "p.player_id, p.first_name, p.last_name, p.email, p.phone_number"
+
+
+def normalize_query(q):
+    """Lower case, trimmed, single-spaced search text"""
+    return re.sub(r"\s+", " ", (q or "").strip().lower())
+
+
+def _like_prefix(term):
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+
+def _fulltext_phrase(term):
+    # A quoted phrase in BOOLEAN MODE matches the term's ngrams in order,
+    # i.e. the term as a substring; quotes inside the term are dropped
+    return '"' + term.replace('"', " ") + '"'
+
+
+def has_search_index():
+    return db.schema.has_column("Players", "search_text")
+
+
+def search_condition(q):
+    """(condition, params) matching players whose name or email contains q, for list filters"""
+    term = normalize_query(q)
+    if not has_search_index():
+        pattern = f"%{term}%"
+        return ("(LOWER(p.first_name) LIKE %s OR LOWER(p.last_name) LIKE %s OR LOWER(p.email) LIKE %s)",
+                [pattern, pattern, pattern])
+    if len(term) < MIN_FULLTEXT_LENGTH:
+        # Too short for the ngram index: a substring scan, as the filter always matched
+        return "p.search_text LIKE %s", ["%" + _like_prefix(term)]
+    return "MATCH(p.search_text) AGAINST (%s IN BOOLEAN MODE)", [_fulltext_phrase(term)]
+
+
+def search_players(cursor, q, limit=DEFAULT_LIMIT):
+    """Players matching q, best match first, each with its score"""
+    term = normalize_query(q)
+    if not term:
+        return []
+    limit = max(1, min(limit, MAX_LIMIT))
+
+    if not has_search_index():
+        return _search_players_unindexed(cursor, term, limit)
+
+    prefix = _like_prefix(term)
+    candidates = [
+        (f"SELECT player_id, {SCORE_LAST_NAME_PREFIX} AS score FROM Players WHERE last_name LIKE %s", [prefix]),
+        (f"SELECT player_id, {SCORE_NAME_PREFIX} AS score FROM Players WHERE search_text LIKE %s", [prefix]),
+        (f"SELECT player_id, {SCORE_EMAIL_PREFIX} AS score FROM Players WHERE email LIKE %s", [prefix]),
+    ]
+    if term.isdigit():
+        candidates.insert(0, (f"SELECT player_id, {SCORE_ID} AS score FROM Players WHERE player_id = %s", [int(term)]))
+    if len(term) >= MIN_FULLTEXT_LENGTH:
+        candidates.append((
+            f"""SELECT player_id, {SCORE_FULLTEXT} + MATCH(search_text) AGAINST (%s IN NATURAL LANGUAGE MODE) AS score
+                FROM Players
+                WHERE MATCH(search_text) AGAINST (%s IN NATURAL LANGUAGE MODE)""",
+            [term, term],
+        ))
+
+    union = "\n            UNION ALL\n            ".join(sql for sql, _ in candidates)
+    params = [param for _, candidate_params in candidates for param in candidate_params]
+
+    cursor.execute(f"""
+        SELECT {PLAYER_COLUMNS}, MAX(c.score) AS score
+        FROM (
+            {union}
+        ) c
+        JOIN Players p ON p.player_id = c.player_id
+        GROUP BY p.player_id, p.first_name, p.last_name, p.email, p.phone_number
+        ORDER BY score DESC, p.last_name, p.first_name, p.player_id
+        LIMIT %s
+    """, params + [limit])
+    return _with_float_scores(cursor.fetchall())
+
+
+def _search_players_unindexed(cursor, term, limit):
+    pattern = f"%{term}%"
+    prefix = _like_prefix(term)
+    cursor.execute(f"""
+        SELECT {PLAYER_COLUMNS},
+               CASE
+                   WHEN LOWER(p.last_name) LIKE %s THEN {SCORE_LAST_NAME_PREFIX}
+                   WHEN LOWER(CONCAT_WS(' ', p.first_name, p.last_name)) LIKE %s THEN {SCORE_NAME_PREFIX}
+                   WHEN LOWER(p.email) LIKE %s THEN {SCORE_EMAIL_PREFIX}
+                   ELSE {SCORE_FULLTEXT}
+               END AS score
+        FROM Players p
+        WHERE LOWER(p.first_name) LIKE %s
+           OR LOWER(p.last_name) LIKE %s
+           OR LOWER(p.email) LIKE %s
+           OR LOWER(CONCAT_WS(' ', p.first_name, p.last_name)) LIKE %s
+        ORDER BY score DESC, p.last_name, p.first_name, p.player_id
+        LIMIT %s
+    """, (prefix, prefix, prefix, pattern, pattern, pattern, pattern, limit))
+    return _with_float_scores(cursor.fetchall())
+
+
+def _with_float_scores(rows):
+    for row in rows:
+        row["score"] = float(row["score"])
+    return rows
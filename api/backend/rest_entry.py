@@ -5,6 +5,8 @@ import logging
 from logging.handlers import RotatingFileHandler
 
 from backend.db_connection import db
+from backend.json_provider import IMLeaguesJSONProvider
+from backend.migrations import run_migrations
 from backend.team_captain.team_captain_routes import team_captain
 from backend.player.player_routes import player
 from backend.stat_keeper.stat_keeper_routes import stat_keeper
@@ -13,6 +15,9 @@ from backend.system_admin.system_admin_routes import system_admin
 def create_app():
     app = Flask(__name__)
 
+    # Encode dates, times and Decimals from MySQL rows while serializing (see json_provider)
+    app.json = IMLeaguesJSONProvider(app)
+
     app.logger.setLevel(logging.DEBUG)
     app.logger.info('API startup')
 
@@ -30,10 +35,34 @@ def create_app():
         "DB_NAME"
     ).strip()  # Change this to your DB name
 
-    # Initialize the database object with the settings above.
-    app.logger.info("current_app(): starting the database connection")
+    # Optional connection pool settings, e.g. DB_POOL_MAX_SIZE=20 (see db_connection)
+    for setting in ("MIN_SIZE", "MAX_SIZE", "MAX_LIFETIME", "TIMEOUT", "HEALTH_CHECK_AFTER"):
+        value = os.getenv(f"DB_POOL_{setting}")
+        if value:
+            app.config[f"MYSQL_POOL_{setting}"] = value.strip()
+
+    # Initialize the database object (and its connection pool) with the settings above.
+    app.logger.info("current_app(): starting the database connection pool")
     db.init_app(app)
 
+    # Bring databases created from older database-files/ up to date.
+    # Set RUN_MIGRATIONS=false to skip this and use `python -m backend.migrations`.
+    if os.getenv("RUN_MIGRATIONS", "true").strip().lower() != "false":
+        app.logger.info("create_app(): applying pending database migrations")
+        try:
+            with app.app_context():
+                run_migrations(db.get_db())
+        except Exception as e:
+            app.logger.error(f"create_app(): database migrations failed: {e}")
+
+    # Load the table/column registry once, after any migration changed the schema.
+    # If the database is unreachable now it is loaded on first use instead.
+    try:
+        with app.app_context():
+            db.schema.refresh(db.get_db())
+    except Exception as e:
+        app.logger.error(f"create_app(): could not load the schema registry: {e}")
+
     # Register the routes from each Blueprint with the app object
     # and give a url prefix to each
     app.logger.info("create_app(): registering blueprints with Flask app object.")
@@ -0,0 +1,201 @@
+#------------------------------------------------------------
+# Round-robin season schedules.
+#
+# round_robin() pairs a league's teams with the circle method:
+# one team stays put while the others rotate, so every team
+# meets every other team exactly once (twice, mirrored, for a
+# double round robin). With an odd number of teams a None
+# placeholder takes the fixed spot and whoever it meets has a
+# bye that round. The fixed pair alternates home and away by
+# round and the rotating pairs alternate by position, so no
+# team is ever more than one home game ahead of its away games
+# (and a double round robin evens them out exactly).
+#
+# assign_slots() lays the rounds onto the calendar: the game
+# days between start and end (optionally only some weekdays),
+# each offering every time slot at every venue. A round takes
+# one game day, or as many consecutive game days as its games
+# need, and never shares a day with another round, so no team
+# plays twice on one day.
+#
+# insert_schedule() writes the whole season with one
+# multi-row INSERT into Games, each row carrying a schedule_key
+# generated for this batch, reads the new game ids back by those
+# keys with one SELECT, writes one multi-row INSERT into
+# Teams_Games and mirrors the teams onto Games with one
+# sync_game_teams().
+#------------------------------------------------------------
+import uuid
+from datetime import date, datetime, timedelta
+
+from backend.game_teams import sync_game_teams
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+MAX_SCHEDULE_GAMES = 2000
+
+
+def round_robin(team_ids, double=False):
+    """Rounds of (home_team_id, away_team_id) pairs and each round's bye (or None)"""
+    teams = list(team_ids)
+    if len(teams) < 2:
+        raise ValueError("A round robin needs at least 2 teams")
+    if len(set(teams)) != len(teams):
+        raise ValueError("Duplicate team ids")
+    if len(teams) % 2:
+        # The bye is the fixed position, so every real team rotates through
+        # all the home / away positions
+        teams.insert(0, None)
+
+    count = len(teams)
+    rounds = []
+    for round_index in range(count - 1):
+        pairs = []
+        bye = None
+        for i in range(count // 2):
+            first, second = teams[i], teams[count - 1 - i]
+            if i == 0:
+                home, away = (first, second) if round_index % 2 == 0 else (second, first)
+            else:
+                home, away = (first, second) if i % 2 == 1 else (second, first)
+            if home is None or away is None:
+                bye = away if home is None else home
+                continue
+            pairs.append((home, away))
+        rounds.append({"games": pairs, "bye": bye})
+        # Keep teams[0] fixed and rotate everyone else one place clockwise
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+
+    if double:
+        rounds += [{"games": [(away, home) for home, away in r["games"]], "bye": r["bye"]} for r in rounds]
+    return rounds
+
+
+def parse_weekdays(game_days):
+    """Weekday numbers (Monday = 0) from names ("mon", "Tuesday") or numbers"""
+    weekdays = set()
+    for day in game_days or []:
+        if isinstance(day, int) and 0 <= day <= 6:
+            weekdays.add(day)
+        elif isinstance(day, str) and day[:3].lower() in WEEKDAYS:
+            weekdays.add(WEEKDAYS.index(day[:3].lower()))
+        else:
+            raise ValueError(f"Unknown game day: {day}")
+    return weekdays
+
+
+def assign_slots(rounds, start_date, end_date, time_slots, venues, weekdays=None):
+    """Games with date_played, start_time and location for every pair of every round.
+
+    weekdays (Monday = 0) limits the game days; without it every day is one.
+    Raises ValueError if the date range has too few game days.
+    """
+    if not time_slots:
+        raise ValueError("At least one time slot is required")
+    if not venues:
+        raise ValueError("At least one venue is required")
+    if end_date < start_date:
+        raise ValueError("end_date must not be before start_date")
+
+    game_days = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    if weekdays:
+        game_days = [day for day in game_days if day.weekday() in weekdays]
+    slots = [(time_slot, venue) for time_slot in sorted(time_slots) for venue in venues]
+
+    games = []
+    day_index = 0
+    for round_number, round_ in enumerate(rounds, start=1):
+        pairs = round_["games"]
+        days_needed = -(-len(pairs) // len(slots))
+        if day_index + days_needed > len(game_days):
+            raise ValueError(
+                f"Not enough game days between {start_date} and {end_date} for {len(rounds)} rounds "
+                f"({len(slots)} games per day)"
+            )
+        for position, (home_team_id, away_team_id) in enumerate(pairs):
+            time_slot, venue = slots[position % len(slots)]
+            games.append({
+                "round": round_number,
+                "date_played": game_days[day_index + position // len(slots)],
+                "start_time": time_slot,
+                "location": venue,
+                "home_team_id": home_team_id,
+                "away_team_id": away_team_id,
+            })
+        day_index += days_needed
+    return games
+
+
+def insert_schedule(cursor, league_id, games, keyed=True):
+    """Insert the games and their Teams_Games rows in bulk; returns the new game ids.
+
+    keyed=False (a database before migration 0013, without Games.schedule_key)
+    inserts the games one by one instead.
+    """
+    if not games:
+        return []
+
+    columns = "league_played, date_played, start_time, location"
+    if keyed:
+        # A multi-row INSERT's ids need not be consecutive (innodb_autoinc_lock_mode
+        # = 2), so every game is inserted with a key of this batch and the ids are
+        # read back by it
+        batch_key = uuid.uuid4().hex
+        keys = [f"schedule-{batch_key}-{number}" for number in range(len(games))]
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(games))
+        cursor.execute(f"""
+            INSERT INTO Games ({columns}, schedule_key)
+            VALUES {placeholders}
+        """, [value for game, key in zip(games, keys)
+              for value in (league_id, game["date_played"], game["start_time"], game["location"], key)])
+
+        placeholders = ", ".join(["%s"] * len(keys))
+        cursor.execute(f"""
+            SELECT game_id, schedule_key
+            FROM Games
+            WHERE schedule_key IN ({placeholders})
+        """, keys)
+        inserted = {row["schedule_key"]: row["game_id"] for row in cursor.fetchall()}
+        game_ids = [inserted[key] for key in keys]
+    else:
+        game_ids = []
+        for game in games:
+            cursor.execute(f"INSERT INTO Games ({columns}) VALUES (%s, %s, %s, %s)",
+                           (league_id, game["date_played"], game["start_time"], game["location"]))
+            game_ids.append(cursor.lastrowid)
+
+    placeholders = ", ".join(["(%s, %s, %s)"] * (2 * len(games)))
+    cursor.execute(f"""
+        INSERT INTO Teams_Games (team_id, game_id, is_home_team)
+        VALUES {placeholders}
+    """, [value for game_id, game in zip(game_ids, games)
+          for value in (game["home_team_id"], game_id, True, game["away_team_id"], game_id, False)])
+
+    sync_game_teams(cursor, game_ids)
+    return game_ids
+
+
+def team_balance(games):
+    """{team_id: {"home": n, "away": n}} for a schedule"""
+    balance = {}
+    for game in games:
+        balance.setdefault(game["home_team_id"], {"home": 0, "away": 0})["home"] += 1
+        balance.setdefault(game["away_team_id"], {"home": 0, "away": 0})["away"] += 1
+    return balance
+
+
+def parse_date(value, name):
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+
+
+def parse_time_slot(value):
+    """"HH:MM" or "HH:MM:SS" -> "HH:MM:SS" """
+    for fmt in ("%H:%M", "%H:%M:%S"):
+        try:
+            return datetime.strptime(str(value), fmt).strftime("%H:%M:%S")
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid time slot: {value} (expected HH:MM)")
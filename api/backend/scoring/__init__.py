@@ -0,0 +1,480 @@
+#------------------------------------------------------------
+# Game scoring helpers shared by the stat keeper routes.
+#
+# Each sport's scoring rules (Rules.scoring_rules, or the
+# built-in defaults below) are compiled once per process into
+# a ScoringMatcher and cached until the admin rules routes
+# invalidate them.
+#
+# Stat events are classified when they are written: each row
+# links to its sport's StatType catalog entry (if any) and stores
+# the points it is worth in StatEvent.points, so reports can
+# GROUP BY / SUM integers instead of parsing descriptions.
+#
+# Scores are maintained incrementally: every stat event write
+# applies a +/- delta to Games.home_score / Games.away_score in
+# the same transaction. recalculate_game_score() is kept as an
+# explicit repair/verify mode that rebuilds both scores from
+# every StatEvent row of a game. A batch of events applies its
+# per-side totals in one UPDATE (apply_score_totals).
+#------------------------------------------------------------
+import json
+import logging
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# Built-in scoring rules, used for any sport whose Rules row has no
+# scoring_rules configured. Rules are checked in priority order: the first
+# rule in the list that matches anywhere in the description wins. A rule
+# without "points" scores the number found in the matched text.
+DEFAULT_SCORING_RULES = {
+    'basketball': [
+        {"keywords": ["3 points", "3-point", "three point"], "points": 3},
+        {"keywords": ["2 points", "2-point", "two point"], "points": 2},
+        {"keywords": ["1 point", "free throw", "one point"], "points": 1},
+        {"pattern": r"^(?=.*point)(?=.*(?:3|three))", "points": 3},
+        {"pattern": r"^(?=.*point)(?=.*(?:2|two))", "points": 2},
+        {"keywords": ["point"], "points": 1},
+    ],
+    'soccer': [
+        {"keywords": ["goal", "penalty"], "points": 1},
+    ],
+    'volleyball': [
+        {"keywords": ["point"], "points": 1},
+    ],
+    'generic': [
+        {"keywords": ["goal"], "points": 1},
+        {"pattern": r"\d+\s*point"},
+        {"keywords": ["point"], "points": 1},
+    ],
+}
+
+_LEADING_NUMBER = re.compile(r'\d+')
+
+# sport_id -> ScoringMatcher, filled lazily and cleared by invalidate_scoring_rules()
+_matcher_cache = {}
+_matcher_cache_lock = threading.Lock()
+
+# sport_id -> list of StatType rows, cleared together with the matchers
+_stat_type_cache = {}
+
+
+class ScoringMatcher:
+    """A sport's scoring rules compiled into a single regular expression.
+
+    Every rule becomes one named alternative (r0, r1, ...) in rule order, each
+    a lookahead over the whole description anchored at its start. A single
+    match() therefore tries the rules in priority order and stops at the
+    first one found anywhere in the text; a description no rule matches is
+    scanned once per rule.
+    """
+
+    def __init__(self, rules):
+        self.points = []
+        alternatives = []
+
+        for index, rule in enumerate(rules):
+            if not isinstance(rule, dict):
+                raise ValueError(f"Scoring rule {index} must be an object")
+
+            if rule.get("pattern"):
+                pattern = rule["pattern"]
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"Scoring rule {index} has an invalid pattern: {e}")
+            elif rule.get("keywords"):
+                keywords = rule["keywords"]
+                if isinstance(keywords, str):
+                    keywords = [keywords]
+                pattern = "|".join(re.escape(str(k)) for k in keywords)
+            else:
+                raise ValueError(f"Scoring rule {index} needs either 'keywords' or 'pattern'")
+
+            points = rule.get("points")
+            if points is not None:
+                try:
+                    points = int(points)
+                except (TypeError, ValueError):
+                    raise ValueError(f"Scoring rule {index} has non-integer points")
+
+            self.points.append(points)
+            alternatives.append(f"(?=.*?(?P<r{index}>{pattern}))")
+
+        self.regex = re.compile("|".join(alternatives), re.IGNORECASE | re.DOTALL) if alternatives else None
+
+    def points_for(self, description):
+        """Return the points a stat event description is worth (0 if no rule matches)"""
+        if not description or self.regex is None:
+            return 0
+
+        match = self.regex.match(description)
+        if match is None:
+            return 0
+
+        points = self.points[int(match.lastgroup[1:])]
+        if points is None:
+            number = _LEADING_NUMBER.search(match.group(match.lastgroup))
+            points = int(number.group(0)) if number else 1
+        return points
+
+
+def compile_scoring_rules(rules):
+    """Validate and compile a scoring_rules list (raises ValueError if invalid)"""
+    if isinstance(rules, str):
+        try:
+            rules = json.loads(rules)
+        except ValueError:
+            raise ValueError("scoring_rules must be valid JSON")
+    if not isinstance(rules, list):
+        raise ValueError("scoring_rules must be a list of rules")
+    return ScoringMatcher(rules)
+
+
+def default_rules_family(sport_name):
+    """Pick the built-in rule set that matches a sport's name"""
+    sport_lower = (sport_name or '').lower()
+    if 'basketball' in sport_lower:
+        return 'basketball'
+    if 'soccer' in sport_lower or 'football' in sport_lower:
+        return 'soccer'
+    if 'volleyball' in sport_lower:
+        return 'volleyball'
+    return 'generic'
+
+
+_default_matchers = {family: ScoringMatcher(rules) for family, rules in DEFAULT_SCORING_RULES.items()}
+
+
+def calculate_points_from_description(description, sport_name):
+    """Calculate points from a stat event description using the built-in rules for a sport name"""
+    return _default_matchers[default_rules_family(sport_name)].points_for(description)
+
+
+def get_sport_matcher(cursor, sport_id):
+    """Return the compiled scoring matcher for a sport, loading it once per process"""
+    matcher = _matcher_cache.get(sport_id)
+    if matcher is not None:
+        return matcher
+
+    cursor.execute("""
+        SELECT s.name AS sport_name,
+               (SELECT r.scoring_rules FROM Rules r
+                WHERE r.sports_id = s.sport_id AND r.scoring_rules IS NOT NULL
+                ORDER BY r.rules_id
+                LIMIT 1) AS scoring_rules
+        FROM Sports s
+        WHERE s.sport_id = %s
+    """, (sport_id,))
+    row = cursor.fetchone() or {}
+
+    matcher = None
+    if row.get('scoring_rules'):
+        try:
+            matcher = compile_scoring_rules(row['scoring_rules'])
+        except ValueError as e:
+            logger.warning(f"Sport {sport_id}: ignoring invalid scoring_rules ({e}), using built-in rules")
+    if matcher is None:
+        matcher = _default_matchers[default_rules_family(row.get('sport_name'))]
+
+    with _matcher_cache_lock:
+        _matcher_cache[sport_id] = matcher
+    return matcher
+
+
+def invalidate_scoring_rules(sport_id=None):
+    """Drop the cached matcher and stat types for one sport (or every sport)
+    after its rules or stat type catalog change"""
+    with _matcher_cache_lock:
+        if sport_id is None:
+            _matcher_cache.clear()
+            _stat_type_cache.clear()
+        else:
+            _matcher_cache.pop(sport_id, None)
+            _stat_type_cache.pop(sport_id, None)
+
+
+def get_sport_stat_types(cursor, sport_id):
+    """Return the StatType catalog of a sport, loading it once per process"""
+    stat_types = _stat_type_cache.get(sport_id)
+    if stat_types is not None:
+        return stat_types
+
+    cursor.execute("""
+        SELECT stat_type_id, sport_id, code, label, points
+        FROM StatType
+        WHERE sport_id = %s
+        ORDER BY stat_type_id
+    """, (sport_id,))
+    stat_types = list(cursor.fetchall())
+
+    with _matcher_cache_lock:
+        _stat_type_cache[sport_id] = stat_types
+    return stat_types
+
+
+def _normalize_stat_text(text):
+    return " ".join(str(text or "").lower().replace("_", " ").replace("-", " ").split())
+
+
+def match_stat_type(stat_types, description, points):
+    """Find the StatType a free-text description refers to, or None.
+
+    A description naming a stat type's label or code (case-insensitive) links
+    to it; otherwise a scoring description links to the sport's only stat type
+    worth the same number of points (e.g. "2 points scored" -> "2 Pointer").
+    """
+    text = _normalize_stat_text(description)
+    if not text:
+        return None
+
+    for stat_type in stat_types:
+        if text in (_normalize_stat_text(stat_type['label']), _normalize_stat_text(stat_type['code'])):
+            return stat_type
+
+    if points > 0:
+        candidates = [t for t in stat_types if t['points'] == points]
+        if len(candidates) == 1:
+            return candidates[0]
+    return None
+
+
+def classify_stat_event(cursor, sport_id, description=None, stat_type_id=None, stat_type_code=None):
+    """Resolve the StatType and point value of a stat event before it is written.
+
+    When the client names a stat type (by id or code) the catalog's points are
+    used, and a missing description defaults to the stat type's label. Otherwise
+    the description is scored with the sport's scoring rules and linked to a
+    stat type when one matches. Returns (stat_type_id, description, points) and
+    raises ValueError if the named stat type does not belong to the sport.
+    """
+    stat_types = get_sport_stat_types(cursor, sport_id)
+
+    if stat_type_id is not None or stat_type_code:
+        for stat_type in stat_types:
+            if stat_type_id is not None and str(stat_type['stat_type_id']) == str(stat_type_id):
+                break
+            if stat_type_id is None and stat_type['code'] == stat_type_code:
+                break
+        else:
+            raise ValueError(f"Stat type {stat_type_id if stat_type_id is not None else stat_type_code} is not defined for this sport")
+        return stat_type['stat_type_id'], description or stat_type['label'], stat_type['points']
+
+    points = get_sport_matcher(cursor, sport_id).points_for(description)
+    stat_type = match_stat_type(stat_types, description, points)
+    return (stat_type['stat_type_id'] if stat_type else None), description, points
+
+
+def get_game_sport_id(cursor, game_id):
+    """Return the sport_id of a game's league, or None if the game does not exist"""
+    cursor.execute("""
+        SELECT l.sport_played AS sport_id
+        FROM Games g
+        JOIN Leagues l ON g.league_played = l.league_id
+        WHERE g.game_id = %s
+    """, (game_id,))
+
+    row = cursor.fetchone()
+    return row['sport_id'] if row else None
+
+
+def get_player_side(cursor, game_id, player_id):
+    """Return True if the player is on the home team of the game, False if on
+    the away team, or None if none of the player's teams is playing in it"""
+    if not player_id:
+        return None
+
+    cursor.execute("""
+        SELECT tg.is_home_team
+        FROM Teams_Players tp
+        JOIN Teams_Games tg ON tp.team_id = tg.team_id
+        WHERE tp.player_id = %s AND tg.game_id = %s
+        LIMIT 1
+    """, (player_id, game_id))
+
+    row = cursor.fetchone()
+    if not row:
+        return None
+    return bool(row['is_home_team'])
+
+
+def apply_score_delta(cursor, game_id, is_home_team, points):
+    """Add (or with a negative value, remove) points for one side of a game"""
+    if not points or is_home_team is None:
+        return False
+
+    column = "home_score" if is_home_team else "away_score"
+    cursor.execute(
+        f"UPDATE Games SET {column} = COALESCE({column}, 0) + %s WHERE game_id = %s",
+        (points, game_id)
+    )
+    logger.debug(f"Game {game_id}: applied {points:+d} to {column}")
+    return True
+
+
+def apply_score_totals(cursor, game_id, home_points, away_points):
+    """Add points to both sides of a game in one UPDATE (e.g. for a batch of events)"""
+    if not home_points and not away_points:
+        return False
+
+    cursor.execute("""
+        UPDATE Games
+        SET home_score = COALESCE(home_score, 0) + %s,
+            away_score = COALESCE(away_score, 0) + %s
+        WHERE game_id = %s
+    """, (home_points, away_points, game_id))
+    logger.debug(f"Game {game_id}: applied {home_points:+d} home, {away_points:+d} away")
+    return True
+
+
+def apply_event_score(cursor, game_id, player_id, points, sign=1):
+    """Apply the score contribution of a single stat event (its StatEvent.points).
+
+    Use sign=1 when an event is inserted and sign=-1 when it is deleted; an
+    edit is a -1 for the old row followed by a +1 for the new one. Returns
+    True if the score was changed.
+    """
+    if not points or points <= 0:
+        return False
+
+    is_home_team = get_player_side(cursor, game_id, player_id)
+    if is_home_team is None:
+        logger.warning(f"Game {game_id}: could not find team for player {player_id} - score not changed")
+        return False
+    return apply_score_delta(cursor, game_id, is_home_team, sign * points)
+
+
+def backfill_stat_events(cursor, only_missing=True, batch_size=500):
+    """Classify existing stat events and materialize their points.
+
+    Every event without a stat type (or every event, when only_missing is
+    False) is scored with its sport's current scoring rules and linked to a
+    StatType where one matches. Events that already have a stat type take its
+    catalog points, and every updated event is stamped for delta sync. Game
+    scores are left alone; run recalculate_game_score() on the returned game
+    ids to bring them in line. Returns a summary dict.
+    """
+    # stat_sync reads the schema registry of the Flask app's db
+    from backend.stat_sync import mark_events_changed
+
+    query = """
+        SELECT se.event_id, se.scored_during, se.description, se.stat_type_id, se.points,
+               l.sport_played AS sport_id
+        FROM StatEvent se
+        JOIN Games g ON se.scored_during = g.game_id
+        JOIN Leagues l ON g.league_played = l.league_id
+    """
+    if only_missing:
+        query += " WHERE se.stat_type_id IS NULL"
+    cursor.execute(query)
+    events = cursor.fetchall()
+
+    updates = []
+    updated_events = []
+    games_affected = set()
+    for event in events:
+        try:
+            stat_type_id, _, points = classify_stat_event(
+                cursor, event['sport_id'], event['description'], stat_type_id=event['stat_type_id']
+            )
+        except ValueError:
+            # Linked to another sport's stat type - classify from the text instead
+            stat_type_id, _, points = classify_stat_event(cursor, event['sport_id'], event['description'])
+
+        if stat_type_id != event['stat_type_id'] or points != event['points']:
+            updates.append((stat_type_id, points, event['event_id']))
+            updated_events.append(event)
+            if points != event['points']:
+                games_affected.add(event['scored_during'])
+
+    for start in range(0, len(updates), batch_size):
+        cursor.executemany(
+            "UPDATE StatEvent SET stat_type_id = %s, points = %s WHERE event_id = %s",
+            updates[start:start + batch_size]
+        )
+    mark_events_changed(cursor, updated_events)
+
+    logger.info(f"Stat event backfill: scanned {len(events)}, updated {len(updates)}")
+
+    return {
+        "events_scanned": len(events),
+        "events_updated": len(updates),
+        "events_typed": sum(1 for update in updates if update[0] is not None),
+        "games_affected": sorted(games_affected),
+        "games_updated": sorted({event['scored_during'] for event in updated_events})
+    }
+
+
+def recalculate_game_score(cursor, game_id, apply=True):
+    """Recalculate game score from all stat events (repair/verify mode).
+
+    Reads the game's scoring events and its roster sides once, sums their
+    StatEvent.points and, when apply is True, overwrites
+    Games.home_score/away_score.
+    Returns a dict with the stored and calculated scores, or None if the game
+    does not exist or does not have both a home and an away team.
+    """
+    cursor.execute(
+        "SELECT home_score, away_score, home_team_id, away_team_id FROM Games WHERE game_id = %s",
+        (game_id,)
+    )
+
+    game_data = cursor.fetchone()
+    if not game_data:
+        return None
+    if game_data['home_team_id'] is None or game_data['away_team_id'] is None:
+        return None
+
+    # Map every rostered player of the two teams to their side in one query
+    cursor.execute("""
+        SELECT tp.player_id, tg.is_home_team
+        FROM Teams_Games tg
+        JOIN Teams_Players tp ON tg.team_id = tp.team_id
+        WHERE tg.game_id = %s
+    """, (game_id,))
+
+    player_sides = {}
+    for row in cursor.fetchall():
+        player_sides.setdefault(row['player_id'], bool(row['is_home_team']))
+
+    cursor.execute("""
+        SELECT se.event_id, se.performed_by, se.points
+        FROM StatEvent se
+        WHERE se.scored_during = %s AND se.points > 0
+    """, (game_id,))
+
+    stat_events = cursor.fetchall()
+    logger.info(f"Recalculating score for game {game_id}: Found {len(stat_events)} scoring events")
+
+    home_score = 0
+    away_score = 0
+    skipped_events = []
+
+    for event in stat_events:
+        points = event['points']
+        is_home_team = player_sides.get(event.get('performed_by'))
+        if is_home_team is None:
+            skipped_events.append(event['event_id'])
+            logger.warning(f"Event {event['event_id']}: Could not find team for player {event.get('performed_by')} in game {game_id} - event skipped")
+        elif is_home_team:
+            home_score += points
+        else:
+            away_score += points
+
+    logger.info(f"Final calculated scores: Home={home_score}, Away={away_score}")
+
+    if apply:
+        cursor.execute("UPDATE Games SET home_score = %s, away_score = %s WHERE game_id = %s",
+                       (home_score, away_score, game_id))
+
+    return {
+        "stored_home_score": game_data.get('home_score'),
+        "stored_away_score": game_data.get('away_score'),
+        "home_score": home_score,
+        "away_score": away_score,
+        "in_sync": game_data.get('home_score') == home_score and game_data.get('away_score') == away_score,
+        "skipped_events": skipped_events
+    }
@@ -0,0 +1,220 @@
+#------------------------------------------------------------
+# League standings materialized in the LeagueStandings table.
+#
+# One row per (league, team) holds the record built from the
+# team's finalized games in its league: W/L/T, games played,
+# points for/against, win percentage, current streak ("W3",
+# "L1", "T1") and rank within the league.
+#
+# Routes that finalize, edit or delete a game call
+# refresh_game_standings() / refresh_team_standings() on the
+# same cursor before committing, so the standings change in the
+# same transaction as the game. rebuild_standings() regenerates
+# everything from Games, e.g. `python -m backend.standings rebuild`.
+#
+# Teams.wins / Teams.losses are kept as a mirror of the
+# materialized record for older readers. Until a team has a
+# finalized game the mirror is only written by an explicit
+# rebuild; the 0004 migration keeps the records it finds.
+#------------------------------------------------------------
+import logging
+
+logger = logging.getLogger(__name__)
+
+_STANDINGS_FIELDS = [
+    "games_played", "wins", "losses", "ties",
+    "points_for", "points_against", "win_percentage", "streak", "last_game_date",
+]
+
+
+def _empty_record():
+    return {
+        "games_played": 0, "wins": 0, "losses": 0, "ties": 0,
+        "points_for": 0, "points_against": 0, "win_percentage": 0.0,
+        "streak": None, "last_game_date": None,
+    }
+
+
+def _add_game(record, scored, allowed, date_played):
+    """Fold one finalized game (oldest first) into a team's record"""
+    if scored > allowed:
+        result, key = "W", "wins"
+    elif scored < allowed:
+        result, key = "L", "losses"
+    else:
+        result, key = "T", "ties"
+
+    record[key] += 1
+    record["games_played"] += 1
+    record["points_for"] += scored
+    record["points_against"] += allowed
+    record["last_game_date"] = date_played
+
+    streak = record["streak"]
+    if streak and streak[0] == result:
+        record["streak"] = f"{result}{int(streak[1:]) + 1}"
+    else:
+        record["streak"] = f"{result}1"
+
+
+def _finish_record(record):
+    if record["games_played"]:
+        record["win_percentage"] = round(
+            (record["wins"] + 0.5 * record["ties"]) / record["games_played"] * 100, 2
+        )
+    return record
+
+
+def _load_records(cursor, where, params):
+    """Build records for the teams matched by `where` (a condition on t) from their finalized games"""
+    cursor.execute(f"""
+        SELECT t.team_id, t.league_played AS league_id, g.date_played,
+               g.home_score, g.away_score, tg.is_home_team
+        FROM Teams t
+        JOIN Teams_Games tg ON t.team_id = tg.team_id
+        JOIN Games g ON tg.game_id = g.game_id AND g.league_played = t.league_played
+        WHERE {where}
+          AND g.is_finalized = TRUE
+          AND g.home_score IS NOT NULL AND g.away_score IS NOT NULL
+        ORDER BY g.date_played, g.start_time, g.game_id
+    """, params)
+
+    records = {}
+    for row in cursor.fetchall():
+        record = records.setdefault(row["team_id"], _empty_record())
+        if row["is_home_team"]:
+            _add_game(record, row["home_score"], row["away_score"], row["date_played"])
+        else:
+            _add_game(record, row["away_score"], row["home_score"], row["date_played"])
+    return {team_id: _finish_record(record) for team_id, record in records.items()}
+
+
+def _write_records(cursor, teams, records, mirror_unplayed=True):
+    """Insert standings rows for (team_id, league_id) pairs and mirror Teams.wins/losses
+    (with mirror_unplayed=False, only for teams that have a finalized game)"""
+    rows = []
+    mirror = []
+    for team_id, league_id in teams:
+        record = records.get(team_id) or _empty_record()
+        rows.append([league_id, team_id] + [record[field] for field in _STANDINGS_FIELDS])
+        if mirror_unplayed or team_id in records:
+            mirror.append((record["wins"], record["losses"], team_id))
+
+    if not rows:
+        return
+
+    columns = ", ".join(["league_id", "team_id"] + _STANDINGS_FIELDS)
+    placeholders = ", ".join(["%s"] * (len(_STANDINGS_FIELDS) + 2))
+    updates = ", ".join(f"{field} = VALUES({field})" for field in _STANDINGS_FIELDS)
+    cursor.executemany(
+        f"INSERT INTO LeagueStandings ({columns}) VALUES ({placeholders}) "
+        f"ON DUPLICATE KEY UPDATE {updates}",
+        rows
+    )
+    if mirror:
+        cursor.executemany("UPDATE Teams SET wins = %s, losses = %s WHERE team_id = %s", mirror)
+
+
+def rank_league(cursor, league_id):
+    """Re-rank a league: win percentage, then wins, fewest losses, point
+    differential. Teams with identical records share a rank."""
+    cursor.execute("""
+        SELECT ls.team_id, ls.win_percentage, ls.wins, ls.losses,
+               ls.points_for - ls.points_against AS point_differential
+        FROM LeagueStandings ls
+        WHERE ls.league_id = %s
+    """, (league_id,))
+    rows = cursor.fetchall()
+
+    def sort_key(row):
+        return (-float(row["win_percentage"]), -row["wins"], row["losses"], -row["point_differential"])
+
+    rows = sorted(rows, key=sort_key)
+    ranks = []
+    previous_key = None
+    rank = 0
+    for position, row in enumerate(rows, start=1):
+        key = sort_key(row)
+        if key != previous_key:
+            rank, previous_key = position, key
+        ranks.append((rank, league_id, row["team_id"]))
+
+    if ranks:
+        cursor.executemany(
+            "UPDATE LeagueStandings SET standing_rank = %s WHERE league_id = %s AND team_id = %s",
+            ranks
+        )
+
+
+def refresh_team_standings(cursor, team_ids):
+    """Recompute the standings rows of some teams and re-rank the leagues involved"""
+    team_ids = sorted({team_id for team_id in team_ids if team_id is not None})
+    if not team_ids:
+        return
+
+    placeholders = ", ".join(["%s"] * len(team_ids))
+
+    # Rows in a league the team has left must go (and that league re-ranked)
+    cursor.execute(
+        f"SELECT DISTINCT league_id FROM LeagueStandings WHERE team_id IN ({placeholders})",
+        team_ids
+    )
+    leagues = {row["league_id"] for row in cursor.fetchall()}
+    cursor.execute(f"DELETE FROM LeagueStandings WHERE team_id IN ({placeholders})", team_ids)
+
+    cursor.execute(
+        f"SELECT team_id, league_played FROM Teams WHERE team_id IN ({placeholders})",
+        team_ids
+    )
+    teams = [(row["team_id"], row["league_played"]) for row in cursor.fetchall()]
+    leagues.update(league_id for _, league_id in teams)
+
+    records = _load_records(cursor, f"t.team_id IN ({placeholders})", team_ids)
+    _write_records(cursor, teams, records)
+
+    for league_id in leagues:
+        rank_league(cursor, league_id)
+
+
+def refresh_game_standings(cursor, game_id):
+    """Recompute the standings of the teams playing a game (call after finalizing
+    or editing it, before committing)"""
+    cursor.execute("SELECT team_id FROM Teams_Games WHERE game_id = %s", (game_id,))
+    refresh_team_standings(cursor, [row["team_id"] for row in cursor.fetchall()])
+
+
+def get_game_team_ids(cursor, game_id):
+    """Team ids of a game - read these before deleting a game, then pass them
+    to refresh_team_standings() afterwards"""
+    cursor.execute("SELECT team_id FROM Teams_Games WHERE game_id = %s", (game_id,))
+    return [row["team_id"] for row in cursor.fetchall()]
+
+
+def rebuild_standings(cursor, league_id=None, keep_unplayed_records=False):
+    """Regenerate LeagueStandings from Games for one league (or every league).
+    keep_unplayed_records leaves Teams.wins/losses alone for teams without a
+    finalized game. Returns a summary dict."""
+    if league_id is None:
+        cursor.execute("DELETE FROM LeagueStandings")
+        cursor.execute("SELECT team_id, league_played FROM Teams")
+        teams = [(row["team_id"], row["league_played"]) for row in cursor.fetchall()]
+        records = _load_records(cursor, "1 = 1", ())
+    else:
+        cursor.execute("DELETE FROM LeagueStandings WHERE league_id = %s", (league_id,))
+        cursor.execute("SELECT team_id, league_played FROM Teams WHERE league_played = %s", (league_id,))
+        teams = [(row["team_id"], row["league_played"]) for row in cursor.fetchall()]
+        records = _load_records(cursor, "t.league_played = %s", (league_id,))
+
+    _write_records(cursor, teams, records, mirror_unplayed=not keep_unplayed_records)
+
+    leagues = sorted({league for _, league in teams})
+    for league in leagues:
+        rank_league(cursor, league)
+
+    logger.info(f"Rebuilt standings for {len(teams)} teams in {len(leagues)} leagues")
+
+    return {
+        "leagues": len(leagues),
+        "teams": len(teams),
+        "team_games_counted": sum(record["games_played"] for record in records.values()),
+    }
@@ -0,0 +1,37 @@
+#------------------------------------------------------------
+# Rebuild LeagueStandings from Games. Run from the api/
+# directory (inside the web-api container: /apicode):
+#
+#   python -m backend.standings rebuild             every league
+#   python -m backend.standings rebuild <league_id>
+#------------------------------------------------------------
+import os
+import sys
+
+from backend.standings import rebuild_standings
+
+
+def main(argv):
+    if not argv or argv[0] != "rebuild" or len(argv) > 2:
+        print("Usage: python -m backend.standings rebuild [league_id]")
+        return 2
+    league_id = int(argv[1]) if len(argv) == 2 else None
+
+    os.environ["RUN_MIGRATIONS"] = "false"
+    from backend.rest_entry import create_app
+    from backend.db_connection import db
+
+    app = create_app()
+    with app.app_context():
+        connection = db.get_db()
+        cursor = connection.cursor()
+        result = rebuild_standings(cursor, league_id)
+        connection.commit()
+        cursor.close()
+
+    print(f"Rebuilt standings: {result}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
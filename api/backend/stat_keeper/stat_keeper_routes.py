@@ -1,196 +1,44 @@
 from flask import Blueprint, jsonify, request
 from backend.db_connection import db
+from backend.game_queries import OLDEST_FIRST, GameQuery
+from backend.live_feed import publish_game_changes
+from backend.scoring import (apply_event_score, apply_score_totals, classify_stat_event, get_game_sport_id,
+                             get_sport_stat_types, recalculate_game_score)
+from backend.standings import refresh_game_standings
+from backend.stat_sync import SyncCursor, deleted_since, delta_condition, mark_changed, record_deleted
+from backend.versions import bump_versions, game_entities, versioned
 from mysql.connector import Error
-from datetime import datetime, timedelta, date, time
+from datetime import datetime
+import pymysql.err
+import uuid
 
 stat_keeper = Blueprint("stat_keeper", __name__)
 
+MAX_STAT_EVENT_BATCH = 500
 
-def calculate_points_from_description(description, sport_name):
-    """Calculate points from a stat event description based on sport type"""
-    description_lower = description.lower()
-    points = 0
-    
-    # Basketball scoring
-    if 'basketball' in sport_name.lower():
-        if '3 points' in description_lower or '3-point' in description_lower or 'three point' in description_lower:
-            points = 3
-        elif '2 points' in description_lower or '2-point' in description_lower or 'two point' in description_lower:
-            points = 2
-        elif '1 point' in description_lower or 'free throw' in description_lower or 'one point' in description_lower:
-            points = 1
-        elif 'point' in description_lower and ('3' in description_lower or 'three' in description_lower):
-            points = 3
-        elif 'point' in description_lower and ('2' in description_lower or 'two' in description_lower):
-            points = 2
-        elif 'point' in description_lower:
-            points = 1  # Default to 1 point if just "point" is mentioned
-    
-    # Soccer/Football scoring
-    elif 'soccer' in sport_name.lower() or 'football' in sport_name.lower():
-        if 'goal' in description_lower or 'penalty' in description_lower:
-            points = 1
-    
-    # Volleyball scoring
-    elif 'volleyball' in sport_name.lower():
-        if 'point' in description_lower:
-            points = 1
-    
-    # Generic scoring (for other sports)
-    else:
-        if 'goal' in description_lower:
-            points = 1
-        elif 'point' in description_lower:
-            # Try to extract number from description
-            import re
-            point_match = re.search(r'(\d+)\s*point', description_lower)
-            if point_match:
-                points = int(point_match.group(1))
-            else:
-                points = 1  # Default to 1 point
-    
-    return points
 
+def _batch_player_id(item):
+    try:
+        return int(item["performed_by"])
+    except (KeyError, TypeError, ValueError):
+        return None
 
-def recalculate_game_score(cursor, game_id):
-    """Recalculate game score from all stat events"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    # Get game info and all teams playing in this game
-    cursor.execute("""
-        SELECT g.home_score, g.away_score, s.name AS sport_name
-        FROM Games g
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE g.game_id = %s
-    """, (game_id,))
-    
-    game_data = cursor.fetchone()
-    if not game_data:
-        return False
-    
-    sport_name = game_data.get('sport_name', '')
-    
-    # Get all teams playing in this game (home and away)
-    cursor.execute("""
-        SELECT team_id, is_home_team
-        FROM Teams_Games
-        WHERE game_id = %s
-    """, (game_id,))
-    
-    teams_in_game = cursor.fetchall()
-    if not teams_in_game:
-        return False
-    
-    # Separate home and away teams (games can have multiple teams, but we track home_score/away_score)
-    home_team_ids = [t['team_id'] for t in teams_in_game if t.get('is_home_team')]
-    away_team_ids = [t['team_id'] for t in teams_in_game if not t.get('is_home_team')]
-    
-    # For score calculation, use first home/away team if multiple exist
-    home_team_id = home_team_ids[0] if home_team_ids else None
-    away_team_id = away_team_ids[0] if away_team_ids else None
-    
-    if not home_team_id or not away_team_id:
-        return False
-    
-    # Get all stat events for this game
-    cursor.execute("""
-        SELECT se.description, se.performed_by, se.event_id
-        FROM StatEvent se
-        WHERE se.scored_during = %s
-        ORDER BY se.time_entered ASC
-    """, (game_id,))
-    
-    stat_events = cursor.fetchall()
-    logger.info(f"Recalculating score for game {game_id}: Found {len(stat_events)} stat events")
-    
-    # Calculate scores - start from 0 and add all points from stat events
-    home_score = 0
-    away_score = 0
-    
-    for event in stat_events:
-        points = calculate_points_from_description(event['description'], sport_name)
-        player_id = event.get('performed_by')
-        
-        if points > 0 and player_id:
-            # First try: Find team using Teams_Games (team must be in this game)
-            cursor.execute("""
-                SELECT tp.team_id
-                FROM Players p
-                JOIN Teams_Players tp ON p.player_id = tp.player_id
-                JOIN Teams_Games tg ON tp.team_id = tg.team_id
-                WHERE p.player_id = %s AND tg.game_id = %s
-                LIMIT 1
-            """, (player_id, game_id))
-            
-            player_team = cursor.fetchone()
-            team_id = None
-            
-            if player_team:
-                team_id = player_team['team_id']
-            else:
-                # Fallback: Find player's team from Teams_Players, then check if it's in the game
-                cursor.execute("""
-                    SELECT tp.team_id
-                    FROM Players p
-                    JOIN Teams_Players tp ON p.player_id = tp.player_id
-                    WHERE p.player_id = %s
-                    LIMIT 1
-                """, (player_id,))
-                
-                fallback_team = cursor.fetchone()
-                if fallback_team:
-                    fallback_team_id = fallback_team['team_id']
-                    # Check if this team is playing in the game
-                    if fallback_team_id in [t['team_id'] for t in teams_in_game]:
-                        team_id = fallback_team_id
-            
-            if team_id:
-                # Check if team is home or away (handle multiple teams)
-                if team_id in home_team_ids:
-                    home_score += points
-                    logger.debug(f"Event {event.get('event_id')}: Added {points} to home team (player {player_id}, team {team_id})")
-                elif team_id in away_team_ids:
-                    away_score += points
-                    logger.debug(f"Event {event.get('event_id')}: Added {points} to away team (player {player_id}, team {team_id})")
-                else:
-                    logger.warning(f"Event {event.get('event_id')}: Player {player_id} team {team_id} is in game but not classified as home/away")
-            else:
-                logger.warning(f"Event {event.get('event_id')}: Could not find team for player {player_id} in game {game_id} - event skipped")
-        elif points == 0:
-            logger.debug(f"Event {event.get('event_id')}: No points calculated from description '{event.get('description')}'")
-    
-    logger.info(f"Final calculated scores: Home={home_score}, Away={away_score}")
-    
-    # Update game scores - this recalculates from ALL stat events, so it's cumulative
-    cursor.execute("UPDATE Games SET home_score = %s, away_score = %s WHERE game_id = %s", 
-                   (home_score, away_score, game_id))
-    
-    return True
 
+def _batch_client_id(item):
+    client_id = item.get("client_event_id") if isinstance(item, dict) else None
+    if client_id is None or str(client_id).strip() == "":
+        return None
+    return str(client_id).strip()[:64]
 
-def convert_datetime_for_json(data):
-    if isinstance(data, list):
-        for item in data:
-            convert_datetime_for_json(item)
-    elif isinstance(data, dict):
-        for key, value in data.items():
-            if value is None:
-                continue
-            elif isinstance(value, timedelta):
-                total_seconds = int(value.total_seconds())
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                seconds = total_seconds % 60
-                data[key] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            elif isinstance(value, time):
-                data[key] = value.strftime('%H:%M:%S')
-            elif isinstance(value, date):
-                data[key] = value.isoformat()
-            elif isinstance(value, datetime):
-                data[key] = value.isoformat()
-    return data
+
+# A stat event with the game it belongs to (for the score, standings and version bumps)
+STAT_EVENT_WITH_GAME_QUERY = """
+    SELECT se.event_id, se.performed_by, se.points,
+           g.game_id, g.league_played, g.home_team_id, g.away_team_id, g.is_finalized
+    FROM StatEvent se
+    JOIN Games g ON g.game_id = se.scored_during
+    WHERE se.event_id = %s AND se.scored_during = %s
+"""
 
 
 @stat_keeper.route("/stat-keepers/<int:keeper_id>/games", methods=["GET"])
@@ -204,164 +52,51 @@ def get_stat_keeper_games(keeper_id):
             cursor.close()
             return jsonify({"error": "Stat keeper not found"}), 404
         
-        # Check if is_finalized column exists
-        cursor.execute("""
-            SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = DATABASE() 
-            AND TABLE_NAME = 'Games' 
-            AND COLUMN_NAME = 'is_finalized'
-        """)
-        result = cursor.fetchone()
-        has_finalized_column = False
-        if result:
-            # Handle both tuple and dict cursor types
-            count = result[0] if isinstance(result, tuple) else result.get('COUNT(*)', 0)
-            has_finalized_column = count > 0
-        
         # Get parameters from query string
         upcoming_only = request.args.get("upcoming_only", "false").lower() == "true"
         all_games = request.args.get("all", "false").lower() == "true"
         
-        # Build query with or without is_finalized column
-        if has_finalized_column:
-            finalized_select = "COALESCE(g.is_finalized, FALSE) AS is_finalized,"
-            finalized_filter_upcoming = "AND COALESCE(g.is_finalized, FALSE) = FALSE"
-            finalized_filter_past = "OR COALESCE(g.is_finalized, FALSE) = TRUE"
-        else:
-            finalized_select = "FALSE AS is_finalized,"
-            finalized_filter_upcoming = ""
-            finalized_filter_past = ""
-        
-        query = f"""
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score, g.league_played,
-               {finalized_select}
-               (SELECT t.name FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE 
-                LIMIT 1) AS home_team,
-               (SELECT t.team_id FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE 
-                LIMIT 1) AS home_team_id,
-               (SELECT t.name FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE 
-                LIMIT 1) AS away_team,
-               (SELECT t.team_id FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE 
-                LIMIT 1) AS away_team_id,
-               l.name AS league_name, s.name AS sport_name,
-               gk.assignment_date,
-               (EXISTS(SELECT 1 FROM Teams_Games tg 
-                       JOIN Teams t ON tg.team_id = t.team_id 
-                       WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE)
-                AND EXISTS(SELECT 1 FROM Teams_Games tg 
-                          JOIN Teams t ON tg.team_id = t.team_id 
-                          WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE)) AS has_both_teams
-        FROM Games_Keepers gk
-        JOIN Games g ON gk.game_id = g.game_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE gk.keeper_id = %s
-        """
-        
-        params = [keeper_id]
+        # Games missing a team are still listed so the keeper can see the assignment
+        query = GameQuery().for_keeper(keeper_id)
         
-        # Add filtering based on parameters
         if all_games:
             # Return all games, no filtering
-            query += " ORDER BY has_both_teams DESC, g.date_played DESC, g.start_time DESC"
+            query.order_by("has_both_teams DESC", "g.date_played DESC", "g.start_time DESC")
         elif upcoming_only:
             # Upcoming: games on or after today that are NOT finalized
             # Finalized games should appear in past games, not upcoming
-            query += " AND DATE(g.date_played) >= DATE(CURDATE())"
-            if finalized_filter_upcoming:
-                query += f" {finalized_filter_upcoming}"
-            query += " ORDER BY g.date_played ASC, g.start_time ASC"  # Soonest games first
+            query.upcoming(True, finalized_is_past=True).order_by(*OLDEST_FIRST)  # Soonest games first
         else:
             # Past: games before today OR finalized games (regardless of date)
-            if finalized_filter_past:
-                query += f" AND (DATE(g.date_played) < DATE(CURDATE()) {finalized_filter_past})"
-            else:
-                query += " AND DATE(g.date_played) < DATE(CURDATE())"
-            query += " ORDER BY g.date_played DESC, g.start_time DESC"  # Most recent games first
+            query.upcoming(False, finalized_is_past=True)  # Most recent games first
         
-        cursor.execute(query, params)
-        games = cursor.fetchall()
+        games = query.fetch_all(cursor)
         cursor.close()
         
-        games = convert_datetime_for_json(games)
-        
         return jsonify(games), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @stat_keeper.route("/games/<int:game_id>", methods=["GET"])
+@versioned("game")
 def get_game(game_id):
     try:
         cursor = db.get_db().cursor()
         
-        # Check if is_finalized column exists
-        cursor.execute("""
-            SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = DATABASE() 
-            AND TABLE_NAME = 'Games' 
-            AND COLUMN_NAME = 'is_finalized'
-        """)
-        result = cursor.fetchone()
-        has_finalized_column = False
-        if result:
-            # Handle both tuple and dict cursor types
-            count = result[0] if isinstance(result, tuple) else result.get('COUNT(*)', 0)
-            has_finalized_column = count > 0
-        
-        finalized_select = "COALESCE(g.is_finalized, FALSE) AS is_finalized," if has_finalized_column else "FALSE AS is_finalized,"
-        
-        query = f"""
-        SELECT g.game_id, g.date_played, g.start_time, g.location, 
-               g.home_score, g.away_score, g.league_played,
-               {finalized_select}
-               (SELECT t.name FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE 
-                LIMIT 1) AS home_team,
-               (SELECT t.team_id FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE 
-                LIMIT 1) AS home_team_id,
-               (SELECT t.name FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE 
-                LIMIT 1) AS away_team,
-               (SELECT t.team_id FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE 
-                LIMIT 1) AS away_team_id,
-               l.name AS league_name, s.name AS sport_name
-        FROM Games g
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE g.game_id = %s
-        """
-        
-        cursor.execute(query, (game_id,))
-        game = cursor.fetchone()
+        game = GameQuery().for_game(game_id).fetch_one(cursor)
         cursor.close()
         
         if not game:
             return jsonify({"error": "Game not found"}), 404
         
-        game = convert_datetime_for_json(game)
-        
         return jsonify(game), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @stat_keeper.route("/games/<int:game_id>/players", methods=["GET"])
+@versioned("game")
 def get_game_players(game_id):
     try:
         cursor = db.get_db().cursor()
@@ -389,16 +124,41 @@ def get_game_players(game_id):
         players = cursor.fetchall()
         cursor.close()
         
-        players = convert_datetime_for_json(players)
-        
         return jsonify(players), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
+# {condition} takes the stat_sync delta condition (" AND ..."), if any
+GAME_STAT_EVENTS_QUERY = """
+        SELECT se.event_id, se.performed_by, se.description, se.stat_type_id, se.points,
+               se.time_entered,
+               p.first_name, p.last_name, p.player_id,
+               MIN(t.name) AS team_name, MIN(t.team_id) AS team_id
+        FROM StatEvent se
+        JOIN Players p ON se.performed_by = p.player_id
+        JOIN Teams_Players tp ON p.player_id = tp.player_id
+        JOIN Teams_Games tg ON tp.team_id = tg.team_id
+        JOIN Teams t ON tp.team_id = t.team_id
+        WHERE se.scored_during = %s AND tg.game_id = %s{condition}
+        GROUP BY se.event_id, se.performed_by, se.description, se.stat_type_id, se.points,
+                 se.time_entered, p.first_name, p.last_name, p.player_id
+        ORDER BY se.time_entered ASC
+        """
+
+
 @stat_keeper.route("/games/<int:game_id>/stat-events", methods=["GET"])
+@versioned("game")
 def get_game_stat_events(game_id):
+    """A game's stat events; with ?since= only the changes, as {"seq", "events",
+    "deleted_event_ids"} (see stat_sync). since_event_id / since_time return
+    appended events only, never edits or deleted ids."""
     try:
+        try:
+            sync = SyncCursor.from_args(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
         cursor = db.get_db().cursor()
         
         # First check if game exists
@@ -407,73 +167,32 @@ def get_game_stat_events(game_id):
             cursor.close()
             return jsonify({"error": "Game not found"}), 404
         
-        query = """
-        SELECT se.event_id, se.performed_by, se.description, se.time_entered,
-               p.first_name, p.last_name, p.player_id,
-               MIN(t.name) AS team_name, MIN(t.team_id) AS team_id
-        FROM StatEvent se
-        JOIN Players p ON se.performed_by = p.player_id
-        JOIN Teams_Players tp ON p.player_id = tp.player_id
-        JOIN Teams_Games tg ON tp.team_id = tg.team_id
-        JOIN Teams t ON tp.team_id = t.team_id
-        WHERE se.scored_during = %s AND tg.game_id = %s
-        GROUP BY se.event_id, se.performed_by, se.description, se.time_entered,
-                 p.first_name, p.last_name, p.player_id
-        ORDER BY se.time_entered ASC
-        """
+        condition, sync_params, seq, reset = delta_condition(cursor, game_id, sync) if sync else (None, [], None, False)
         
-        cursor.execute(query, (game_id, game_id))
+        query = GAME_STAT_EVENTS_QUERY.format(condition=f" AND {condition}" if condition else "")
+        cursor.execute(query, [game_id, game_id] + sync_params)
         stat_events = cursor.fetchall()
-        cursor.close()
         
-        stat_events = convert_datetime_for_json(stat_events)
+        if sync is None:
+            cursor.close()
+            return jsonify(stat_events), 200
+        
+        deleted_event_ids = [] if reset else deleted_since(cursor, game_id, sync.since)
+        cursor.close()
         
-        return jsonify(stat_events), 200
+        return jsonify({
+            "game_id": game_id,
+            "seq": seq,
+            "reset": reset,
+            "events": stat_events,
+            "deleted_event_ids": deleted_event_ids
+        }), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
-@stat_keeper.route("/games/<int:game_id>/summary", methods=["GET"])
-def get_game_summary(game_id):
-    try:
-        cursor = db.get_db().cursor()
-        
-        # Get game details
-        game_query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score, g.league_played,
-               (SELECT t.name FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE 
-                LIMIT 1) AS home_team,
-               (SELECT t.team_id FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE 
-                LIMIT 1) AS home_team_id,
-               (SELECT t.name FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE 
-                LIMIT 1) AS away_team,
-               (SELECT t.team_id FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE 
-                LIMIT 1) AS away_team_id,
-               l.name AS league_name, s.name AS sport_name
-        FROM Games g
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE g.game_id = %s
-        """
-        
-        cursor.execute(game_query, (game_id,))
-        game = cursor.fetchone()
-        
-        if not game:
-            cursor.close()
-            return jsonify({"error": "Game not found"}), 404
-        
-        # Get team totals and individual leaders
-        home_team_stats_query = """
+# A team's five players with the most stat events in a game
+TEAM_LEADERS_QUERY = """
         SELECT p.player_id, p.first_name, p.last_name,
                COUNT(se.event_id) AS total_stat_events
         FROM Players p
@@ -484,23 +203,26 @@ def get_game_summary(game_id):
         ORDER BY total_stat_events DESC
         LIMIT 5
         """
+
+
+@stat_keeper.route("/games/<int:game_id>/summary", methods=["GET"])
+@versioned("game")
+def get_game_summary(game_id):
+    try:
+        cursor = db.get_db().cursor()
         
-        away_team_stats_query = """
-        SELECT p.player_id, p.first_name, p.last_name,
-               COUNT(se.event_id) AS total_stat_events
-        FROM Players p
-        JOIN Teams_Players tp ON p.player_id = tp.player_id
-        LEFT JOIN StatEvent se ON p.player_id = se.performed_by AND se.scored_during = %s
-        WHERE tp.team_id = %s
-        GROUP BY p.player_id, p.first_name, p.last_name
-        ORDER BY total_stat_events DESC
-        LIMIT 5
-        """
+        # Get game details
+        game = GameQuery().for_game(game_id).fetch_one(cursor)
         
-        cursor.execute(home_team_stats_query, (game_id, game["home_team_id"]))
+        if not game:
+            cursor.close()
+            return jsonify({"error": "Game not found"}), 404
+        
+        # Get team totals and individual leaders
+        cursor.execute(TEAM_LEADERS_QUERY, (game_id, game["home_team_id"]))
         home_team_leaders = cursor.fetchall()
         
-        cursor.execute(away_team_stats_query, (game_id, game["away_team_id"]))
+        cursor.execute(TEAM_LEADERS_QUERY, (game_id, game["away_team_id"]))
         away_team_leaders = cursor.fetchall()
         
         # Get total stat events per team
@@ -522,11 +244,6 @@ def get_game_summary(game_id):
         
         cursor.close()
         
-        game = convert_datetime_for_json(game)
-        home_team_leaders = convert_datetime_for_json(home_team_leaders)
-        away_team_leaders = convert_datetime_for_json(away_team_leaders)
-        team_totals = convert_datetime_for_json(team_totals)
-        
         result = {
             "game": game,
             "team_totals": team_totals,
@@ -539,6 +256,25 @@ def get_game_summary(game_id):
         return jsonify({"error": str(e)}), 500
 
 
+@stat_keeper.route("/games/<int:game_id>/stat-types", methods=["GET"])
+def get_game_stat_types(game_id):
+    """The stat types that can be recorded for a game (its sport's StatType catalog)"""
+    try:
+        cursor = db.get_db().cursor()
+        
+        sport_id = get_game_sport_id(cursor, game_id)
+        if sport_id is None:
+            cursor.close()
+            return jsonify({"error": "Game not found"}), 404
+        
+        stat_types = get_sport_stat_types(cursor, sport_id)
+        cursor.close()
+        
+        return jsonify(stat_types), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @stat_keeper.route("/games/<int:game_id>/stat-events", methods=["POST"])
 def create_stat_event(game_id):
     try:
@@ -548,15 +284,10 @@ def create_stat_event(game_id):
         
         # Check if game exists and get current scores and team info
         cursor.execute("""
-            SELECT g.home_score, g.away_score,
-                   (SELECT tg.team_id FROM Teams_Games tg 
-                    WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE LIMIT 1) AS home_team_id,
-                   (SELECT tg.team_id FROM Teams_Games tg 
-                    WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE LIMIT 1) AS away_team_id,
-                   s.name AS sport_name
+            SELECT g.game_id, g.home_score, g.away_score, g.home_team_id, g.away_team_id,
+                   g.league_played, g.is_finalized, l.sport_played AS sport_id
             FROM Games g
             JOIN Leagues l ON g.league_played = l.league_id
-            JOIN Sports s ON l.sport_played = s.sport_id
             WHERE g.game_id = %s
         """, (game_id,))
         
@@ -566,9 +297,9 @@ def create_stat_event(game_id):
             return jsonify({"error": "Game not found"}), 404
         
         # Validate required fields
-        if "performed_by" not in data or "description" not in data:
+        if "performed_by" not in data or not ("description" in data or "stat_type_id" in data or "stat_type" in data):
             cursor.close()
-            return jsonify({"error": "Missing required fields: performed_by, description"}), 400
+            return jsonify({"error": "Missing required fields: performed_by, and description or stat_type_id"}), 400
         
         # Check if player exists and get their team (must be playing in this game)
         cursor.execute("""
@@ -593,79 +324,258 @@ def create_stat_event(game_id):
                 "error": f"Player {player_name} is not on a team playing in this game. Players must be on a team that is participating in the game to record stats."
             }), 404
         
-        player_team_id = player_team['team_id']
-        home_team_id = game_data.get('home_team_id')
-        away_team_id = game_data.get('away_team_id')
-        sport_name = game_data.get('sport_name', '').lower()
+        # Resolve the stat type and materialize the event's points
+        try:
+            stat_type_id, description, points = classify_stat_event(
+                cursor, game_data['sport_id'], data.get("description"),
+                stat_type_id=data.get("stat_type_id"), stat_type_code=data.get("stat_type")
+            )
+        except ValueError as e:
+            cursor.close()
+            return jsonify({"error": str(e)}), 400
         
         # Insert stat event
         insert_query = """
-        INSERT INTO StatEvent (performed_by, scored_during, description, time_entered)
-        VALUES (%s, %s, %s, NOW())
+        INSERT INTO StatEvent (performed_by, scored_during, description, stat_type_id, points, time_entered)
+        VALUES (%s, %s, %s, %s, %s, NOW())
         """
         
         cursor.execute(insert_query, (
             data["performed_by"],
             game_id,
-            data["description"]
+            description,
+            stat_type_id,
+            points
         ))
         
-        db.get_db().commit()
         event_id = cursor.lastrowid
+        mark_changed(cursor, game_id, [event_id])
         
-        # Calculate points from description
-        points = calculate_points_from_description(data["description"], sport_name)
-        
-        # Recalculate game score from all stat events (including the new one)
-        recalculate_game_score(cursor, game_id)
+        # Apply only this event's points to the score, in the same transaction
+        if apply_event_score(cursor, game_id, data["performed_by"], points) and game_data["is_finalized"]:
+            refresh_game_standings(cursor, game_id)
+        bump_versions(cursor, game_entities(game_data) | {("player", data["performed_by"])}, resolve=False)
         
         db.get_db().commit()
+        publish_game_changes(cursor, game_id, created=[event_id], score=points > 0)
         cursor.close()
         
         return jsonify({
             "message": "Stat event created successfully",
             "event_id": event_id,
+            "stat_type_id": stat_type_id,
             "points_added": points if points > 0 else None
         }), 201
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
-@stat_keeper.route("/games/<int:game_id>", methods=["PUT"])
-def update_game(game_id):
+@stat_keeper.route("/games/<int:game_id>/stat-events/batch", methods=["POST"])
+def create_stat_events_batch(game_id):
+    """Record many stat events at once (e.g. a keeper catching up after a connectivity gap).
+    
+    The body is a list of events shaped like the single-event POST, each with
+    an optional time_entered and client_event_id. Every player is checked
+    against the game's rosters in one query, the valid events are written
+    with one multi-row INSERT (events without a client_event_id get a
+    server-generated one, so every new id can be read back by it), the score
+    with one UPDATE, and everything is committed once. Invalid events are
+    skipped and reported in their item's result. An event whose
+    client_event_id was already recorded for the game is not written again
+    (status "duplicate"), so a client can safely resend a batch it never got
+    an answer for.
+    """
+    cursor = None
     try:
         data = request.get_json()
+        if isinstance(data, dict):
+            data = data.get("events")
+        if not isinstance(data, list) or not data:
+            return jsonify({"error": "Expected a non-empty list of stat events"}), 400
+        if len(data) > MAX_STAT_EVENT_BATCH:
+            return jsonify({"error": f"At most {MAX_STAT_EVENT_BATCH} stat events per batch"}), 400
         
         cursor = db.get_db().cursor()
         
-        # Check if game exists and get current scores and team IDs
         cursor.execute("""
-            SELECT g.home_score, g.away_score,
-                   (SELECT tg.team_id FROM Teams_Games tg 
-                    WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE LIMIT 1) AS home_team_id,
-                   (SELECT tg.team_id FROM Teams_Games tg 
-                    WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE LIMIT 1) AS away_team_id
+            SELECT g.game_id, g.league_played, g.home_team_id, g.away_team_id, g.is_finalized,
+                   l.sport_played AS sport_id
             FROM Games g
+            JOIN Leagues l ON g.league_played = l.league_id
             WHERE g.game_id = %s
         """, (game_id,))
+        game = cursor.fetchone()
+        if not game:
+            cursor.close()
+            return jsonify({"error": "Game not found"}), 404
+        sport_id = game["sport_id"]
+        
+        # Side (home/away) of every player in the batch who is on a team playing this game
+        player_ids = sorted({player_id for player_id in map(_batch_player_id, data) if player_id is not None})
+        player_sides = {}
+        if player_ids:
+            placeholders = ", ".join(["%s"] * len(player_ids))
+            cursor.execute(f"""
+                SELECT tp.player_id, tg.is_home_team
+                FROM Teams_Players tp
+                JOIN Teams_Games tg ON tp.team_id = tg.team_id
+                WHERE tg.game_id = %s AND tp.player_id IN ({placeholders})
+            """, [game_id] + player_ids)
+            for row in cursor.fetchall():
+                player_sides.setdefault(row["player_id"], bool(row["is_home_team"]))
+        
+        # Events of this batch that an earlier (retried) request already recorded
+        has_client_ids = db.schema.has_column("StatEvent", "client_event_id")
+        client_ids = sorted({client_id for client_id in map(_batch_client_id, data) if client_id is not None})
+        recorded = {}
+        if has_client_ids and client_ids:
+            placeholders = ", ".join(["%s"] * len(client_ids))
+            cursor.execute(f"""
+                SELECT event_id, client_event_id
+                FROM StatEvent
+                WHERE scored_during = %s AND client_event_id IN ({placeholders})
+            """, [game_id] + client_ids)
+            recorded = {row["client_event_id"]: row["event_id"] for row in cursor.fetchall()}
+        
+        results = []
+        rows = []
+        created = {}
+        totals = {True: 0, False: 0}
+        for index, item in enumerate(data):
+            client_id = _batch_client_id(item)
+            result = {"index": index, "client_event_id": client_id}
+            results.append(result)
+            
+            if client_id is not None and client_id in recorded:
+                result.update({"status": "duplicate", "event_id": recorded[client_id]})
+                continue
+            if client_id is not None and client_id in created:
+                # Repeated within this batch; gets the first copy's event_id once it is inserted
+                result.update({"status": "duplicate", "duplicate_of": created[client_id]})
+                continue
+            
+            if not isinstance(item, dict) or "performed_by" not in item or not (
+                    "description" in item or "stat_type_id" in item or "stat_type" in item):
+                result.update({"status": "error",
+                               "error": "Missing required fields: performed_by, and description or stat_type_id"})
+                continue
+            
+            player_id = _batch_player_id(item)
+            is_home_team = player_sides.get(player_id)
+            if is_home_team is None:
+                result.update({"status": "error",
+                               "error": f"Player ID {item['performed_by']} is not on a team playing in this game"})
+                continue
+            
+            time_entered = item.get("time_entered")
+            if time_entered is not None:
+                try:
+                    time_entered = datetime.fromisoformat(str(time_entered))
+                except ValueError:
+                    result.update({"status": "error", "error": "time_entered must be an ISO 8601 date and time"})
+                    continue
+            
+            try:
+                stat_type_id, description, points = classify_stat_event(
+                    cursor, sport_id, item.get("description"),
+                    stat_type_id=item.get("stat_type_id"), stat_type_code=item.get("stat_type")
+                )
+            except ValueError as e:
+                result.update({"status": "error", "error": str(e)})
+                continue
+            
+            rows.append((result, [player_id, game_id, description, stat_type_id, points, time_entered]))
+            if client_id is not None:
+                created[client_id] = result
+            if points > 0:
+                totals[is_home_team] += points
+            result.update({"status": "created", "stat_type_id": stat_type_id,
+                           "points_added": points if points > 0 else None})
+        
+        if rows:
+            columns = "performed_by, scored_during, description, stat_type_id, points, time_entered"
+            values = "%s, %s, %s, %s, %s, COALESCE(%s, NOW())"
+            
+            # Auto-increment ids of a multi-row INSERT need not be consecutive
+            # (innodb_autoinc_lock_mode = 2), so every row is inserted with a
+            # client_event_id and the ids are read back by it; rows sent without
+            # one get a key generated for this batch
+            if has_client_ids:
+                batch_key = uuid.uuid4().hex
+                keys = [result["client_event_id"] or f"batch-{batch_key}-{number}"
+                        for number, (result, _) in enumerate(rows)]
+                placeholders = ", ".join([f"({values}, %s)"] * len(rows))
+                cursor.execute(f"""
+                    INSERT INTO StatEvent ({columns}, client_event_id)
+                    VALUES {placeholders}
+                """, [value for (_, row), key in zip(rows, keys) for value in row + [key]])
+                placeholders = ", ".join(["%s"] * len(keys))
+                cursor.execute(f"""
+                    SELECT event_id, client_event_id
+                    FROM StatEvent
+                    WHERE scored_during = %s AND client_event_id IN ({placeholders})
+                """, [game_id] + keys)
+                event_ids = {row["client_event_id"]: row["event_id"] for row in cursor.fetchall()}
+                for (result, _), key in zip(rows, keys):
+                    result["event_id"] = event_ids[key]
+            else:
+                # Databases without client_event_id (before migration 0009) insert one by one
+                for result, row in rows:
+                    cursor.execute(f"INSERT INTO StatEvent ({columns}) VALUES ({values})", row)
+                    result["event_id"] = cursor.lastrowid
+            
+            for result in results:
+                if "duplicate_of" in result:
+                    result["event_id"] = result.pop("duplicate_of")["event_id"]
+            
+            created_ids = [result["event_id"] for result in results if result["status"] == "created"]
+            mark_changed(cursor, game_id, created_ids)
+            if apply_score_totals(cursor, game_id, totals[True], totals[False]) and game["is_finalized"]:
+                refresh_game_standings(cursor, game_id)
+            bump_versions(cursor, game_entities(game) | {("player", row[0]) for _, row in rows}, resolve=False)
+            db.get_db().commit()
+            publish_game_changes(cursor, game_id, created=created_ids, score=bool(totals[True] or totals[False]))
+        cursor.close()
+        
+        duplicates = sum(1 for result in results if result["status"] == "duplicate")
+        return jsonify({
+            "message": f"Created {len(rows)} of {len(data)} stat events",
+            "created": len(rows),
+            "duplicates": duplicates,
+            "failed": len(data) - len(rows) - duplicates,
+            "home_points_added": totals[True],
+            "away_points_added": totals[False],
+            "results": results
+        }), 201 if rows or duplicates else 400
+    except pymysql.err.IntegrityError as e:
+        # A concurrent request recorded one of these client_event_ids first;
+        # nothing was written, and resending the batch reports it as a duplicate
+        db.get_db().rollback()
+        if cursor:
+            cursor.close()
+        return jsonify({"error": f"Conflicting stat events, please retry: {e}"}), 409
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@stat_keeper.route("/games/<int:game_id>", methods=["PUT"])
+def update_game(game_id):
+    try:
+        data = request.get_json()
+        
+        cursor = db.get_db().cursor()
+        
+        # Check if game exists and whether its result is already final
+        cursor.execute("""
+            SELECT game_id, is_finalized, league_played, home_team_id, away_team_id
+            FROM Games WHERE game_id = %s
+        """, (game_id,))
         
         game_data = cursor.fetchone()
         if not game_data:
             cursor.close()
             return jsonify({"error": "Game not found"}), 404
         
-        # Handle both tuple and dict cursor types
-        if isinstance(game_data, tuple):
-            old_home_score = game_data[0] if len(game_data) > 0 else None
-            old_away_score = game_data[1] if len(game_data) > 1 else None
-            home_team_id = game_data[2] if len(game_data) > 2 else None
-            away_team_id = game_data[3] if len(game_data) > 3 else None
-        else:
-            old_home_score = game_data.get('home_score')
-            old_away_score = game_data.get('away_score')
-            home_team_id = game_data.get('home_team_id')
-            away_team_id = game_data.get('away_team_id')
-        
         # Build update query dynamically based on provided fields
         update_fields = []
         params = []
@@ -691,24 +601,9 @@ def update_game(game_id):
             params.append(data["location"])
         
         # Handle finalization flag - if is_finalized is True, mark game as finalized
-        # First check if column exists
         if "is_finalized" in data:
-            cursor.execute("""
-                SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_SCHEMA = DATABASE() 
-                AND TABLE_NAME = 'Games' 
-                AND COLUMN_NAME = 'is_finalized'
-            """)
-            result = cursor.fetchone()
-            has_finalized_column = False
-            if result:
-                count = result[0] if isinstance(result, tuple) else result.get('COUNT(*)', 0)
-                has_finalized_column = count > 0
-            
-            if has_finalized_column:
-                update_fields.append("is_finalized = %s")
-                params.append(data["is_finalized"])
-            # If column doesn't exist, silently skip (column will be added when DB is recreated)
+            update_fields.append("is_finalized = %s")
+            params.append(data["is_finalized"])
         # If scores are being set and not explicitly setting is_finalized, check if we should auto-finalize
         elif "home_score" in data and "away_score" in data:
             # If both scores are provided and non-zero, this is likely a finalization
@@ -731,34 +626,18 @@ def update_game(game_id):
         
         cursor.execute(update_query, params)
         
-        # Update team wins/losses if scores are being updated and teams exist
-        if ("home_score" in data or "away_score" in data) and home_team_id and away_team_id:
-            new_home_score = data.get("home_score", old_home_score)
-            new_away_score = data.get("away_score", old_away_score)
-            
-            # Only proceed if new scores are valid
-            if new_home_score is not None and new_away_score is not None:
-                # If old scores existed, reverse the old result first
-                if old_home_score is not None and old_away_score is not None:
-                    # Reverse old result
-                    if old_home_score > old_away_score:
-                        cursor.execute("UPDATE Teams SET wins = wins - 1 WHERE team_id = %s", (home_team_id,))
-                        cursor.execute("UPDATE Teams SET losses = losses - 1 WHERE team_id = %s", (away_team_id,))
-                    elif old_away_score > old_home_score:
-                        cursor.execute("UPDATE Teams SET wins = wins - 1 WHERE team_id = %s", (away_team_id,))
-                        cursor.execute("UPDATE Teams SET losses = losses - 1 WHERE team_id = %s", (home_team_id,))
-                    # If old was a tie, nothing to reverse
-                
-                # Apply new result
-                if new_home_score > new_away_score:
-                    cursor.execute("UPDATE Teams SET wins = wins + 1 WHERE team_id = %s", (home_team_id,))
-                    cursor.execute("UPDATE Teams SET losses = losses + 1 WHERE team_id = %s", (away_team_id,))
-                elif new_away_score > new_home_score:
-                    cursor.execute("UPDATE Teams SET wins = wins + 1 WHERE team_id = %s", (away_team_id,))
-                    cursor.execute("UPDATE Teams SET losses = losses + 1 WHERE team_id = %s", (home_team_id,))
-                # If tie, no wins/losses are updated
+        # Standings only count finalized games: refresh them when a game is
+        # finalized, un-finalized, or a finalized result is edited
+        was_finalized = bool(game_data["is_finalized"])
+        is_finalized = bool(data["is_finalized"]) if "is_finalized" in data else was_finalized
+        result_changed = any(field in data for field in ("home_score", "away_score", "date_played", "start_time"))
+        if was_finalized != is_finalized or (is_finalized and result_changed):
+            refresh_game_standings(cursor, game_id)
+        bump_versions(cursor, game_entities(game_data), resolve=False)
         
         db.get_db().commit()
+        if "home_score" in data or "away_score" in data:
+            publish_game_changes(cursor, game_id)
         cursor.close()
         
         return jsonify({"message": "Game updated successfully"}), 200
@@ -774,20 +653,27 @@ def update_stat_event(game_id, event_id):
         cursor = db.get_db().cursor()
         
         # Check if stat event exists and belongs to this game
-        cursor.execute(
-            "SELECT event_id FROM StatEvent WHERE event_id = %s AND scored_during = %s",
-            (event_id, game_id)
-        )
-        if not cursor.fetchone():
+        cursor.execute(STAT_EVENT_WITH_GAME_QUERY, (event_id, game_id))
+        old_event = cursor.fetchone()
+        if not old_event:
             cursor.close()
             return jsonify({"error": "Stat event not found or does not belong to this game"}), 404
         
         update_fields = []
         params = []
-        
-        if "description" in data:
-            update_fields.append("description = %s")
-            params.append(data["description"])
+        new_points = old_event["points"]
+        
+        if "description" in data or "stat_type_id" in data or "stat_type" in data:
+            try:
+                stat_type_id, description, new_points = classify_stat_event(
+                    cursor, get_game_sport_id(cursor, game_id), data.get("description"),
+                    stat_type_id=data.get("stat_type_id"), stat_type_code=data.get("stat_type")
+                )
+            except ValueError as e:
+                cursor.close()
+                return jsonify({"error": str(e)}), 400
+            update_fields.extend(["description = %s", "stat_type_id = %s", "points = %s"])
+            params.extend([description, stat_type_id, new_points])
         
         if "performed_by" in data:
             cursor.execute("SELECT player_id FROM Players WHERE player_id = %s", (data["performed_by"],))
@@ -810,12 +696,19 @@ def update_stat_event(game_id, event_id):
         """
         
         cursor.execute(update_query, params)
+        mark_changed(cursor, game_id, [event_id])
         
-        # Recalculate game score if description or player changed
-        if "description" in data or "performed_by" in data:
-            recalculate_game_score(cursor, game_id)
+        # Swap the old event's points for the new event's points
+        score_changed = apply_event_score(cursor, game_id, old_event["performed_by"], old_event["points"], sign=-1)
+        performed_by = data.get("performed_by", old_event["performed_by"])
+        score_changed |= apply_event_score(cursor, game_id, performed_by, new_points)
+        if score_changed and old_event["is_finalized"]:
+            refresh_game_standings(cursor, game_id)
+        bump_versions(cursor, game_entities(old_event) | {("player", old_event["performed_by"]),
+                                                          ("player", data.get("performed_by"))}, resolve=False)
         
         db.get_db().commit()
+        publish_game_changes(cursor, game_id, updated=[event_id])
         cursor.close()
         
         return jsonify({"message": "Stat event updated successfully"}), 200
@@ -829,11 +722,9 @@ def delete_stat_event(game_id, event_id):
         cursor = db.get_db().cursor()
         
         # Check if stat event exists and belongs to this game
-        cursor.execute(
-            "SELECT event_id FROM StatEvent WHERE event_id = %s AND scored_during = %s",
-            (event_id, game_id)
-        )
-        if not cursor.fetchone():
+        cursor.execute(STAT_EVENT_WITH_GAME_QUERY, (event_id, game_id))
+        old_event = cursor.fetchone()
+        if not old_event:
             cursor.close()
             return jsonify({"error": "Stat event not found or does not belong to this game"}), 404
         
@@ -841,14 +732,58 @@ def delete_stat_event(game_id, event_id):
             "DELETE FROM StatEvent WHERE event_id = %s AND scored_during = %s",
             (event_id, game_id)
         )
+        record_deleted(cursor, game_id, [old_event])
         
-        # Recalculate game score after deletion
-        recalculate_game_score(cursor, game_id)
+        # Take the deleted event's points back off the score
+        if apply_event_score(cursor, game_id, old_event["performed_by"], old_event["points"], sign=-1) \
+                and old_event["is_finalized"]:
+            refresh_game_standings(cursor, game_id)
+        bump_versions(cursor, game_entities(old_event) | {("player", old_event["performed_by"])}, resolve=False)
         
         db.get_db().commit()
+        publish_game_changes(cursor, game_id, deleted=[event_id], score=old_event["points"] > 0)
         cursor.close()
         
         return jsonify({"message": "Stat event deleted successfully"}), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
+
+@stat_keeper.route("/games/<int:game_id>/recalculate-score", methods=["POST"])
+def recalculate_score(game_id):
+    """Rebuild a game's score from all of its stat events (repair mode).
+    Pass ?verify=true to only compare the stored score against the rebuilt one."""
+    try:
+        verify_only = request.args.get("verify", "false").lower() == "true"
+        
+        cursor = db.get_db().cursor()
+        
+        cursor.execute("""
+            SELECT game_id, league_played, home_team_id, away_team_id, is_finalized
+            FROM Games WHERE game_id = %s
+        """, (game_id,))
+        game = cursor.fetchone()
+        if not game:
+            cursor.close()
+            return jsonify({"error": "Game not found"}), 404
+        
+        result = recalculate_game_score(cursor, game_id, apply=not verify_only)
+        if result is None:
+            cursor.close()
+            return jsonify({"error": "Game does not have both a home and an away team"}), 400
+        
+        if not verify_only:
+            if not result["in_sync"] and game["is_finalized"]:
+                refresh_game_standings(cursor, game_id)
+            bump_versions(cursor, game_entities(game), resolve=False)
+            db.get_db().commit()
+            publish_game_changes(cursor, game_id)
+        cursor.close()
+        
+        result["game_id"] = game_id
+        result["applied"] = not verify_only
+        
+        return jsonify(result), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
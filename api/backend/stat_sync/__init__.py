@@ -0,0 +1,182 @@
+#------------------------------------------------------------
+# Delta sync for a game's stat event list.
+#
+# Games.stat_seq is a per-game counter advanced by every write to
+# the game's stat events. The write stamps the rows it inserts or
+# updates with the new value (StatEvent.change_seq) and, for rows
+# it deletes, leaves a StatEventTombstone carrying the same value.
+# A client that holds the list as of sequence N then asks for
+#
+#   GET .../games/<game_id>/stat-events?since=N
+#
+# and gets only the events changed after N, the ids deleted
+# after N and the game's current seq to ask from next time;
+# both lookups are served by (game, change_seq) indexes. since=0
+# returns the whole list in the same shape, so a client starts
+# there. A since ahead of the game's seq (the database was
+# reloaded) answers with the whole list and reset = true.
+#
+# Writes that change stat events outside the stat event routes
+# stamp them too: the stat type backfill (mark_events_changed),
+# deleting a stat type, whose events the foreign key turns into
+# free-text events (stamped before the DELETE), and deleting a
+# player, whose events the foreign key cascades away (tombstoned
+# before the DELETE, record_events_deleted). Deleting a game takes
+# its events and tombstones with it; the list then answers 404,
+# which tells a client to drop the game.
+#
+# since_event_id=<id> and since_time=<datetime> are also
+# accepted, for clients that only append: they return events
+# with a larger id / later time_entered and nothing else -
+# neither edited events nor deleted ids (tombstones are not
+# read). A client that needs edits or deletions uses since.
+#
+# Databases without the columns (built before migration
+# 0010_stat_event_sync) keep answering with the whole list.
+#------------------------------------------------------------
+from datetime import datetime
+
+from backend.db_connection import db
+
+SYNC_ARGS = ("since", "since_event_id", "since_time")
+
+
+class SyncCursor:
+    """The since / since_event_id / since_time of a stat event list request"""
+
+    def __init__(self, since=None, since_event_id=None, since_time=None):
+        self.since = since
+        self.since_event_id = since_event_id
+        self.since_time = since_time
+
+    @classmethod
+    def from_args(cls, args):
+        """Parse the request's sync arguments (None if it has none); raises ValueError"""
+        if not any(args.get(arg) not in (None, "") for arg in SYNC_ARGS):
+            return None
+        try:
+            since = int(args["since"]) if args.get("since") else None
+            since_event_id = int(args["since_event_id"]) if args.get("since_event_id") else None
+        except ValueError:
+            raise ValueError("since and since_event_id must be integers")
+        since_time = None
+        if args.get("since_time"):
+            try:
+                since_time = datetime.fromisoformat(args["since_time"])
+            except ValueError:
+                raise ValueError("since_time must be an ISO 8601 date and time")
+        if since is not None and since < 0:
+            raise ValueError("since must be at least 0")
+        return cls(since, since_event_id, since_time)
+
+
+def has_sync_columns():
+    return db.schema.has_column("StatEvent", "change_seq") and db.schema.has_table("StatEventTombstone")
+
+
+def next_change_seq(cursor, game_id):
+    """Advance the game's stat_seq and return the new value (None on older databases).
+
+    The UPDATE locks the game row until the commit, so concurrent writes to
+    one game's stat events take consecutive sequence numbers in commit order.
+    """
+    if not has_sync_columns():
+        return None
+    cursor.execute("UPDATE Games SET stat_seq = stat_seq + 1 WHERE game_id = %s", (game_id,))
+    cursor.execute("SELECT stat_seq FROM Games WHERE game_id = %s", (game_id,))
+    row = cursor.fetchone()
+    return row["stat_seq"] if row else None
+
+
+def mark_changed(cursor, game_id, event_ids):
+    """Stamp inserted or updated stat events with a new change sequence number"""
+    event_ids = list(event_ids)
+    if not event_ids:
+        return None
+    seq = next_change_seq(cursor, game_id)
+    if seq is None:
+        return None
+    placeholders = ", ".join(["%s"] * len(event_ids))
+    cursor.execute(
+        f"UPDATE StatEvent SET change_seq = %s WHERE event_id IN ({placeholders})",
+        [seq] + event_ids
+    )
+    return seq
+
+
+def record_deleted(cursor, game_id, events):
+    """Leave tombstones for stat event rows (with event_id, performed_by) being deleted"""
+    events = list(events)
+    if not events:
+        return None
+    seq = next_change_seq(cursor, game_id)
+    if seq is None:
+        return None
+    cursor.executemany("""
+        INSERT INTO StatEventTombstone (event_id, game_id, performed_by, change_seq)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE game_id = VALUES(game_id), change_seq = VALUES(change_seq),
+                                deleted_at = CURRENT_TIMESTAMP
+    """, [(event["event_id"], game_id, event["performed_by"], seq) for event in events])
+    return seq
+
+
+def _by_game(events):
+    games = {}
+    for event in events:
+        games.setdefault(event["scored_during"], []).append(event)
+    return games
+
+
+def mark_events_changed(cursor, events):
+    """mark_changed() for stat event rows (with event_id, scored_during) of any number of games"""
+    for game_id, game_events in sorted(_by_game(events).items()):
+        mark_changed(cursor, game_id, [event["event_id"] for event in game_events])
+
+
+def record_events_deleted(cursor, events):
+    """record_deleted() for stat event rows (with event_id, scored_during, performed_by) of any number of games"""
+    for game_id, game_events in sorted(_by_game(events).items()):
+        record_deleted(cursor, game_id, game_events)
+
+
+def current_seq(cursor, game_id):
+    if not has_sync_columns():
+        return None
+    cursor.execute("SELECT stat_seq FROM Games WHERE game_id = %s", (game_id,))
+    row = cursor.fetchone()
+    return row["stat_seq"] if row else None
+
+
+def delta_condition(cursor, game_id, sync):
+    """(condition on StatEvent se, params, seq, reset) selecting the events to send.
+
+    condition is None when the whole list is to be sent.
+    """
+    seq = current_seq(cursor, game_id)
+    if sync.since is not None and seq is not None:
+        if sync.since > seq:
+            return None, [], seq, True
+        if sync.since > 0:
+            return "se.change_seq > %s", [sync.since], seq, False
+        return None, [], seq, False
+
+    conditions, params = [], []
+    if sync.since_event_id is not None:
+        conditions.append("se.event_id > %s")
+        params.append(sync.since_event_id)
+    if sync.since_time is not None:
+        conditions.append("se.time_entered > %s")
+        params.append(sync.since_time)
+    return (" AND ".join(conditions) or None), params, seq, False
+
+
+def deleted_since(cursor, game_id, since):
+    """Ids of the game's stat events deleted after change sequence number since"""
+    if not since or not has_sync_columns():
+        return []
+    cursor.execute(
+        "SELECT event_id FROM StatEventTombstone WHERE game_id = %s AND change_seq > %s ORDER BY change_seq, event_id",
+        (game_id, since)
+    )
+    return [row["event_id"] for row in cursor.fetchall()]
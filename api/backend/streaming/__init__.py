@@ -0,0 +1,97 @@
+#------------------------------------------------------------
+# Streaming JSON responses for large result sets.
+#
+# A list route normally holds the result twice at once: the
+# fetchall() rows and the jsonify'd body. For
+# season-wide exports stream_rows() instead runs the query on an
+# unbuffered server-side cursor (pymysql SSDictCursor), reads
+# it in fetchmany() batches and serializes each row as it goes,
+# so memory stays flat whatever the row count.
+#
+# Two output formats:
+#   json    one JSON array, encoded by the app's JSON provider
+#           exactly as jsonify would encode the same list
+#   ndjson  one JSON object per line (application/x-ndjson),
+#           for clients that process rows as they arrive
+#
+# The query is executed before the response starts, so SQL
+# errors still reach the route's error handling as a 500. An
+# error after the first byte can only cut the stream short
+# (json: the array is left unterminated, ndjson: a final
+# {"error": ...} line), and is logged.
+#
+# The server-side cursor keeps the request's pooled connection
+# busy until the stream finishes; stream_with_context keeps the
+# app context (and so the checked-out connection) alive until
+# then.
+#------------------------------------------------------------
+import json
+import logging
+
+from flask import Response, request, stream_with_context
+from pymysql import cursors
+
+from backend.db_connection import db
+from backend.json_provider import dumps
+
+logger = logging.getLogger(__name__)
+
+STREAM_BATCH_SIZE = 500
+
+JSON_MIMETYPE = "application/json"
+NDJSON_MIMETYPE = "application/x-ndjson"
+STREAM_FORMATS = {"json": JSON_MIMETYPE, "ndjson": NDJSON_MIMETYPE}
+
+
+def stream_format(args=None):
+    """"ndjson" or "json", from ?format= or else the Accept header; None if ?format= is unknown"""
+    args = request.args if args is None else args
+    requested = args.get("format")
+    if requested:
+        return requested.lower() if requested.lower() in STREAM_FORMATS else None
+    best = request.accept_mimetypes.best_match([JSON_MIMETYPE, NDJSON_MIMETYPE], default=JSON_MIMETYPE)
+    return "ndjson" if best == NDJSON_MIMETYPE else "json"
+
+
+def stream_rows(query, params=None, fmt="json", transform=None, batch_size=STREAM_BATCH_SIZE):
+    """Run query on a server-side cursor and return a streaming Response of its rows.
+
+    transform(row) may reshape each row (e.g. project fields) before it is
+    serialized.
+    """
+    cursor = db.get_db().cursor(cursors.SSDictCursor)
+    try:
+        cursor.execute(query, params or None)
+    except Exception:
+        cursor.close()
+        raise
+
+    def generate():
+        rows_sent = 0
+        try:
+            if fmt == "json":
+                yield "["
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                chunk = []
+                for row in rows:
+                    if transform is not None:
+                        row = transform(row)
+                    if fmt == "json":
+                        chunk.append(("," if rows_sent else "") + dumps(row))
+                    else:
+                        chunk.append(dumps(row) + "\n")
+                    rows_sent += 1
+                yield "".join(chunk)
+            if fmt == "json":
+                yield "]\n"
+        except Exception as e:
+            logger.error(f"Streaming response failed after {rows_sent} rows: {e}")
+            if fmt == "ndjson":
+                yield json.dumps({"error": str(e)}) + "\n"
+        finally:
+            cursor.close()
+
+    return Response(stream_with_context(generate()), mimetype=STREAM_FORMATS[fmt])
@@ -1,35 +1,27 @@
 from flask import Blueprint, jsonify, request
+from backend.conflicts import (MAX_CHECKED_GAMES, ScheduleIndex, conflict_error, find_game_conflicts, game_keeper_ids,
+                               parse_game_date)
 from backend.db_connection import db
+from backend.game_queries import OLDEST_FIRST, GameQuery
+from backend.game_teams import sync_game_teams
+from backend.keeper_assignment import assign_keepers, insert_assignments, keeper_loads, unassigned_games
+from backend.live_feed import publish_game_changes
+from backend.pagination import Keyset, Page, PaginationError, SortKey, count_rows
+from backend.player_search import DEFAULT_LIMIT as PLAYER_SEARCH_LIMIT, normalize_query, search_condition, search_players
+from backend.schedule import (MAX_SCHEDULE_GAMES, assign_slots, insert_schedule, parse_date, parse_time_slot,
+                              parse_weekdays, round_robin, team_balance)
+from backend.scoring import backfill_stat_events, compile_scoring_rules, invalidate_scoring_rules
+from backend.standings import get_game_team_ids, rebuild_standings, refresh_game_standings, refresh_team_standings
+from backend.stat_sync import mark_events_changed, record_events_deleted
+from backend.streaming import stream_format, stream_rows
+from backend.versions import bump_versions, game_entities, versioned
 from mysql.connector import Error
 import pymysql.err
-from datetime import datetime, timedelta, date, time
+import json
 
 system_admin = Blueprint("system_admin", __name__)
 
 
-def convert_datetime_for_json(data):
-    if isinstance(data, list):
-        for item in data:
-            convert_datetime_for_json(item)
-    elif isinstance(data, dict):
-        for key, value in data.items():
-            if value is None:
-                continue
-            elif isinstance(value, timedelta):
-                total_seconds = int(value.total_seconds())
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                seconds = total_seconds % 60
-                data[key] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            elif isinstance(value, time):
-                data[key] = value.strftime('%H:%M:%S')
-            elif isinstance(value, date):
-                data[key] = value.isoformat()
-            elif isinstance(value, datetime):
-                data[key] = value.isoformat()
-    return data
-
-
 @system_admin.route("/sports", methods=["GET"])
 def get_all_sports():
     try:
@@ -45,8 +37,6 @@ def get_all_sports():
         sports = cursor.fetchall()
         cursor.close()
         
-        sports = convert_datetime_for_json(sports)
-        
         return jsonify(sports), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -70,8 +60,6 @@ def get_sport(sport_id):
         if not sport:
             return jsonify({"error": "Sport not found"}), 404
         
-        sport = convert_datetime_for_json(sport)
-        
         return jsonify(sport), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -97,8 +85,9 @@ def create_sport():
             data.get("description")
         ))
         
-        db.get_db().commit()
         sport_id = cursor.lastrowid
+        bump_versions(cursor, {("sport", sport_id)}, resolve=False)
+        db.get_db().commit()
         cursor.close()
         
         return jsonify({
@@ -145,9 +134,13 @@ def update_sport(sport_id):
         """
         
         cursor.execute(update_query, params)
+        bump_versions(cursor, {("sport", sport_id)})
         db.get_db().commit()
         cursor.close()
         
+        # Built-in scoring rules are picked by sport name
+        invalidate_scoring_rules(sport_id)
+        
         return jsonify({"message": "Sport updated successfully"}), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -162,11 +155,13 @@ def delete_sport(sport_id):
         if not cursor.fetchone():
             cursor.close()
             return jsonify({"error": "Sport not found"}), 404
-        
+        bump_versions(cursor, {("sport", sport_id)})
         cursor.execute("DELETE FROM Sports WHERE sport_id = %s", (sport_id,))
         db.get_db().commit()
         cursor.close()
         
+        invalidate_scoring_rules(sport_id)
+        
         return jsonify({"message": "Sport deleted successfully"}), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -183,7 +178,8 @@ def get_sport_rules(sport_id):
             return jsonify({"error": "Sport not found"}), 404
         
         query = """
-        SELECT rules_id, sports_id, team_size, league_size, season_length, game_length, description
+        SELECT rules_id, sports_id, team_size, league_size, season_length, game_length, description,
+               scoring_rules
         FROM Rules
         WHERE sports_id = %s
         """
@@ -192,7 +188,9 @@ def get_sport_rules(sport_id):
         rules = cursor.fetchall()
         cursor.close()
         
-        rules = convert_datetime_for_json(rules)
+        for rule in rules:
+            if rule.get("scoring_rules"):
+                rule["scoring_rules"] = json.loads(rule["scoring_rules"])
         
         return jsonify(rules), 200
     except Error as e:
@@ -211,9 +209,18 @@ def create_sport_rules(sport_id):
             cursor.close()
             return jsonify({"error": "Sport not found"}), 404
         
+        scoring_rules = None
+        if data.get("scoring_rules") is not None:
+            try:
+                compile_scoring_rules(data["scoring_rules"])
+            except ValueError as e:
+                cursor.close()
+                return jsonify({"error": f"Invalid scoring_rules: {e}"}), 400
+            scoring_rules = json.dumps(data["scoring_rules"])
+        
         insert_query = """
-        INSERT INTO Rules (sports_id, team_size, league_size, season_length, game_length, description)
-        VALUES (%s, %s, %s, %s, %s, %s)
+        INSERT INTO Rules (sports_id, team_size, league_size, season_length, game_length, description, scoring_rules)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
         """
         
         cursor.execute(insert_query, (
@@ -222,13 +229,17 @@ def create_sport_rules(sport_id):
             data.get("league_size"),
             data.get("season_length"),
             data.get("game_length"),
-            data.get("description")
+            data.get("description"),
+            scoring_rules
         ))
         
-        db.get_db().commit()
         rules_id = cursor.lastrowid
+        bump_versions(cursor, {("sport", sport_id)})
+        db.get_db().commit()
         cursor.close()
         
+        invalidate_scoring_rules(sport_id)
+        
         return jsonify({
             "message": "Rules created successfully",
             "rules_id": rules_id
@@ -244,7 +255,7 @@ def update_sport_rules(sport_id):
         
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT rules_id FROM Rules WHERE sports_id = %s LIMIT 1", (sport_id,))
+        cursor.execute("SELECT rules_id FROM Rules WHERE sports_id = %s ORDER BY rules_id LIMIT 1", (sport_id,))
         rule = cursor.fetchone()
         if not rule:
             cursor.close()
@@ -275,6 +286,16 @@ def update_sport_rules(sport_id):
             update_fields.append("description = %s")
             params.append(data["description"])
         
+        if "scoring_rules" in data:
+            if data["scoring_rules"] is not None:
+                try:
+                    compile_scoring_rules(data["scoring_rules"])
+                except ValueError as e:
+                    cursor.close()
+                    return jsonify({"error": f"Invalid scoring_rules: {e}"}), 400
+            update_fields.append("scoring_rules = %s")
+            params.append(json.dumps(data["scoring_rules"]) if data["scoring_rules"] is not None else None)
+        
         if not update_fields:
             cursor.close()
             return jsonify({"error": "No fields to update"}), 400
@@ -288,9 +309,12 @@ def update_sport_rules(sport_id):
         """
         
         cursor.execute(update_query, params)
+        bump_versions(cursor, {("sport", sport_id)})
         db.get_db().commit()
         cursor.close()
         
+        invalidate_scoring_rules(sport_id)
+        
         return jsonify({"message": "Rules updated successfully"}), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -316,14 +340,198 @@ def delete_sport_rules(sport_id):
             return jsonify({"error": "Rules not found for this sport"}), 404
         
         cursor.execute("DELETE FROM Rules WHERE rules_id = %s", (data["rules_id"],))
+        bump_versions(cursor, {("sport", sport_id)})
         db.get_db().commit()
         cursor.close()
         
+        invalidate_scoring_rules(sport_id)
+        
         return jsonify({"message": "Rules deleted successfully"}), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
+@system_admin.route("/sports/<int:sport_id>/stat-types", methods=["GET"])
+def get_sport_stat_types(sport_id):
+    try:
+        cursor = db.get_db().cursor()
+        
+        cursor.execute("SELECT sport_id FROM Sports WHERE sport_id = %s", (sport_id,))
+        if not cursor.fetchone():
+            cursor.close()
+            return jsonify({"error": "Sport not found"}), 404
+        
+        query = """
+        SELECT stat_type_id, sport_id, code, label, points
+        FROM StatType
+        WHERE sport_id = %s
+        ORDER BY stat_type_id
+        """
+        
+        cursor.execute(query, (sport_id,))
+        stat_types = cursor.fetchall()
+        cursor.close()
+        
+        return jsonify(stat_types), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/sports/<int:sport_id>/stat-types", methods=["POST"])
+def create_stat_type(sport_id):
+    cursor = None
+    try:
+        data = request.get_json()
+        
+        if "code" not in data or "label" not in data:
+            return jsonify({"error": "Missing required fields: code, label"}), 400
+        
+        cursor = db.get_db().cursor()
+        
+        cursor.execute("SELECT sport_id FROM Sports WHERE sport_id = %s", (sport_id,))
+        if not cursor.fetchone():
+            cursor.close()
+            return jsonify({"error": "Sport not found"}), 404
+        
+        insert_query = """
+        INSERT INTO StatType (sport_id, code, label, points)
+        VALUES (%s, %s, %s, %s)
+        """
+        
+        cursor.execute(insert_query, (
+            sport_id,
+            data["code"],
+            data["label"],
+            data.get("points", 0)
+        ))
+        
+        stat_type_id = cursor.lastrowid
+        bump_versions(cursor, {("sport", sport_id)})
+        db.get_db().commit()
+        cursor.close()
+        
+        invalidate_scoring_rules(sport_id)
+        
+        return jsonify({
+            "message": "Stat type created successfully",
+            "stat_type_id": stat_type_id
+        }), 201
+    except pymysql.err.IntegrityError as e:
+        if cursor:
+            cursor.close()
+        if e.args[0] == 1062:
+            return jsonify({"error": f"Stat type '{data.get('code', '')}' already exists for this sport"}), 400
+        return jsonify({"error": "Database integrity error. Please check your input."}), 400
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/sports/<int:sport_id>/stat-types/<int:stat_type_id>", methods=["PUT"])
+def update_stat_type(sport_id, stat_type_id):
+    try:
+        data = request.get_json()
+        
+        cursor = db.get_db().cursor()
+        
+        cursor.execute(
+            "SELECT stat_type_id FROM StatType WHERE stat_type_id = %s AND sport_id = %s",
+            (stat_type_id, sport_id)
+        )
+        if not cursor.fetchone():
+            cursor.close()
+            return jsonify({"error": "Stat type not found for this sport"}), 404
+        
+        update_fields = []
+        params = []
+        
+        if "code" in data:
+            update_fields.append("code = %s")
+            params.append(data["code"])
+        
+        if "label" in data:
+            update_fields.append("label = %s")
+            params.append(data["label"])
+        
+        if "points" in data:
+            update_fields.append("points = %s")
+            params.append(data["points"])
+        
+        if not update_fields:
+            cursor.close()
+            return jsonify({"error": "No fields to update"}), 400
+        
+        params.append(stat_type_id)
+        
+        update_query = f"""
+        UPDATE StatType
+        SET {', '.join(update_fields)}
+        WHERE stat_type_id = %s
+        """
+        
+        cursor.execute(update_query, params)
+        bump_versions(cursor, {("sport", sport_id)})
+        db.get_db().commit()
+        cursor.close()
+        
+        invalidate_scoring_rules(sport_id)
+        
+        # Recorded events keep the points they were written with; run the
+        # stat event backfill (with all=true) to re-score them.
+        return jsonify({"message": "Stat type updated successfully"}), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/sports/<int:sport_id>/stat-types/<int:stat_type_id>", methods=["DELETE"])
+def delete_stat_type(sport_id, stat_type_id):
+    try:
+        cursor = db.get_db().cursor()
+        
+        cursor.execute(
+            "SELECT stat_type_id FROM StatType WHERE stat_type_id = %s AND sport_id = %s",
+            (stat_type_id, sport_id)
+        )
+        if not cursor.fetchone():
+            cursor.close()
+            return jsonify({"error": "Stat type not found for this sport"}), 404
+        
+        # Events of this type become free-text events (stat_type_id is SET NULL); the
+        # foreign key bypasses the sync stamps, so stamp them first
+        cursor.execute("SELECT event_id, scored_during FROM StatEvent WHERE stat_type_id = %s", (stat_type_id,))
+        events = cursor.fetchall()
+        mark_events_changed(cursor, events)
+        cursor.execute("DELETE FROM StatType WHERE stat_type_id = %s", (stat_type_id,))
+        bump_versions(cursor, {("sport", sport_id)} | {("game", event["scored_during"]) for event in events})
+        db.get_db().commit()
+        cursor.close()
+        
+        invalidate_scoring_rules(sport_id)
+        
+        return jsonify({"message": "Stat type deleted successfully"}), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/stat-events/backfill", methods=["POST"])
+def backfill_stat_event_types():
+    """Link existing stat events to their StatType and materialize StatEvent.points.
+    Only events without a stat type are processed unless ?all=true is passed."""
+    try:
+        process_all = request.args.get("all", "false").lower() == "true"
+        
+        cursor = db.get_db().cursor()
+        
+        result = backfill_stat_events(cursor, only_missing=not process_all)
+        bump_versions(cursor, {("game", game_id) for game_id in result["games_updated"]})
+        
+        db.get_db().commit()
+        cursor.close()
+        
+        return jsonify(result), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @system_admin.route("/leagues", methods=["GET"])
 def get_all_leagues():
     try:
@@ -367,14 +575,13 @@ def get_all_leagues():
         leagues = cursor.fetchall()
         cursor.close()
         
-        leagues = convert_datetime_for_json(leagues)
-        
         return jsonify(leagues), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @system_admin.route("/leagues/<int:league_id>", methods=["GET"])
+@versioned("league")
 def get_league(league_id):
     try:
         cursor = db.get_db().cursor()
@@ -395,8 +602,6 @@ def get_league(league_id):
         if not league:
             return jsonify({"error": "League not found"}), 404
         
-        league = convert_datetime_for_json(league)
-        
         return jsonify(league), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -433,8 +638,10 @@ def create_league():
             data.get("year")
         ))
         
-        db.get_db().commit()
         league_id = cursor.lastrowid
+        bump_versions(cursor, {("league", league_id)}, resolve=False)
+        
+        db.get_db().commit()
         cursor.close()
         
         return jsonify({
@@ -501,6 +708,7 @@ def update_league(league_id):
         """
         
         cursor.execute(update_query, params)
+        bump_versions(cursor, {("league", league_id)}, resolve=False)
         db.get_db().commit()
         cursor.close()
         
@@ -518,7 +726,7 @@ def delete_league(league_id):
         if not cursor.fetchone():
             cursor.close()
             return jsonify({"error": "League not found"}), 404
-        
+        bump_versions(cursor, {("league", league_id)}, resolve=False)
         cursor.execute("DELETE FROM Leagues WHERE league_id = %s", (league_id,))
         db.get_db().commit()
         cursor.close()
@@ -529,6 +737,7 @@ def delete_league(league_id):
 
 
 @system_admin.route("/leagues/<int:league_id>/teams", methods=["GET"])
+@versioned("league")
 def get_league_teams(league_id):
     try:
         cursor = db.get_db().cursor()
@@ -552,8 +761,6 @@ def get_league_teams(league_id):
         teams = cursor.fetchall()
         cursor.close()
         
-        teams = convert_datetime_for_json(teams)
-        
         return jsonify(teams), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -574,8 +781,9 @@ def add_team_to_league(league_id):
             cursor.close()
             return jsonify({"error": "League not found"}), 404
         
-        cursor.execute("SELECT team_id FROM Teams WHERE team_id = %s", (data["team_id"],))
-        if not cursor.fetchone():
+        cursor.execute("SELECT team_id, league_played FROM Teams WHERE team_id = %s", (data["team_id"],))
+        team = cursor.fetchone()
+        if not team:
             cursor.close()
             return jsonify({"error": "Team not found"}), 404
         
@@ -586,6 +794,9 @@ def add_team_to_league(league_id):
         """
         
         cursor.execute(update_query, (league_id, data["team_id"]))
+        bump_versions(cursor, {("team", data["team_id"]), ("league", team["league_played"]), ("league", league_id)},
+                      resolve=False)
+        
         db.get_db().commit()
         cursor.close()
         
@@ -595,6 +806,7 @@ def add_team_to_league(league_id):
 
 
 @system_admin.route("/leagues/<int:league_id>/games", methods=["GET"])
+@versioned("league")
 def get_league_games(league_id):
     try:
         cursor = db.get_db().cursor()
@@ -604,26 +816,9 @@ def get_league_games(league_id):
             cursor.close()
             return jsonify({"error": "League not found"}), 404
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        WHERE g.league_played = %s
-        ORDER BY g.date_played DESC, g.start_time DESC
-        """
-        
-        cursor.execute(query, (league_id,))
-        games = cursor.fetchall()
+        games = GameQuery().for_league(league_id).fetch_all(cursor)
         cursor.close()
         
-        games = convert_datetime_for_json(games)
-        
         return jsonify(games), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -645,6 +840,15 @@ def create_league_game(league_id):
             cursor.close()
             return jsonify({"error": "Missing required fields: home_team_id, away_team_id"}), 400
         
+        try:
+            conflicts = find_game_conflicts(cursor, dict(data, league_played=league_id))
+        except ValueError as e:
+            cursor.close()
+            return jsonify({"error": str(e)}), 400
+        if conflicts and not data.get("allow_conflicts"):
+            cursor.close()
+            return jsonify({"error": conflict_error(conflicts), "conflicts": conflicts}), 409
+        
         # Insert game
         insert_query = """
         INSERT INTO Games (league_played, date_played, start_time, location, home_score, away_score)
@@ -672,6 +876,11 @@ def create_league_game(league_id):
             INSERT INTO Teams_Games (team_id, game_id, is_home_team)
             VALUES (%s, %s, FALSE)
         """, (data["away_team_id"], game_id))
+        sync_game_teams(cursor, game_id)
+        bump_versions(cursor, game_entities({
+            "game_id": game_id, "league_played": league_id,
+            "home_team_id": data["home_team_id"], "away_team_id": data["away_team_id"],
+        }), resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -684,6 +893,126 @@ def create_league_game(league_id):
         return jsonify({"error": str(e)}), 500
 
 
+@system_admin.route("/leagues/<int:league_id>/schedule", methods=["POST"])
+def generate_league_schedule(league_id):
+    """Generate a round-robin season for a league and insert it in one transaction.
+    
+    Body: start_date, end_date, time_slots (["18:00", ...]), venues, and
+    optionally game_days (["mon", "wed"]), team_ids (default: every team in
+    the league), double_round_robin and dry_run (return the schedule without
+    writing it).
+    """
+    try:
+        data = request.get_json() or {}
+        
+        try:
+            start_date = parse_date(data.get("start_date"), "start_date")
+            end_date = parse_date(data.get("end_date"), "end_date")
+            time_slots = [parse_time_slot(slot) for slot in data.get("time_slots") or []]
+            venues = [str(venue).strip() for venue in data.get("venues") or [] if str(venue).strip()]
+            weekdays = parse_weekdays(data.get("game_days"))
+            requested_team_ids = [int(team_id) for team_id in data.get("team_ids") or []]
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        
+        cursor = db.get_db().cursor()
+        
+        cursor.execute("SELECT league_id FROM Leagues WHERE league_id = %s", (league_id,))
+        if not cursor.fetchone():
+            cursor.close()
+            return jsonify({"error": "League not found"}), 404
+        
+        cursor.execute("SELECT team_id FROM Teams WHERE league_played = %s ORDER BY team_id", (league_id,))
+        league_team_ids = [row["team_id"] for row in cursor.fetchall()]
+        
+        team_ids = requested_team_ids or league_team_ids
+        unknown = [team_id for team_id in team_ids if team_id not in league_team_ids]
+        if unknown:
+            cursor.close()
+            return jsonify({"error": f"Teams not in this league: {', '.join(str(team_id) for team_id in unknown)}"}), 400
+        
+        try:
+            rounds = round_robin(team_ids, double=bool(data.get("double_round_robin")))
+            games = assign_slots(rounds, start_date, end_date, time_slots, venues, weekdays)
+        except ValueError as e:
+            cursor.close()
+            return jsonify({"error": str(e)}), 400
+        
+        if len(games) > MAX_SCHEDULE_GAMES:
+            cursor.close()
+            return jsonify({"error": f"At most {MAX_SCHEDULE_GAMES} games per schedule"}), 400
+        
+        # Other leagues' games can already hold the venues, and the slots can be closer than a game's length
+        index = ScheduleIndex.load(cursor, start_date, end_date)
+        conflicts = index.check_schedule([dict(game, league_played=league_id) for game in games])
+        
+        dry_run = bool(data.get("dry_run"))
+        if conflicts and not dry_run and not data.get("allow_conflicts"):
+            cursor.close()
+            return jsonify({"error": conflict_error(conflicts), "conflicts": conflicts}), 409
+        
+        game_ids = []
+        if not dry_run:
+            game_ids = insert_schedule(cursor, league_id, games, keyed=db.schema.has_column("Games", "schedule_key"))
+            bump_versions(cursor, {("league", league_id)} | {("team", team_id) for team_id in team_ids}, resolve=False)
+            db.get_db().commit()
+        cursor.close()
+        
+        for game_id, game in zip(game_ids, games):
+            game["game_id"] = game_id
+        
+        return jsonify({
+            "message": f"{'Previewed' if dry_run else 'Created'} {len(games)} games in {len(rounds)} rounds",
+            "dry_run": dry_run,
+            "rounds": len(rounds),
+            "games": games,
+            "byes": [{"round": number, "team_id": round_["bye"]}
+                     for number, round_ in enumerate(rounds, start=1) if round_["bye"] is not None],
+            "home_away_balance": [dict(team_id=team_id, **counts) for team_id, counts in team_balance(games).items()],
+            "conflicts": conflicts
+        }), 200 if dry_run else 201
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/schedule/validate", methods=["POST"])
+def validate_schedule():
+    """Check proposed games for conflicts with the stored games and with each other.
+    
+    Body: games, each with league_played, date_played, start_time, location,
+    home_team_id and away_team_id, and optionally keeper_ids and game_id (the
+    stored game it would move).
+    """
+    try:
+        data = request.get_json() or {}
+        games = data.get("games")
+        
+        if not isinstance(games, list) or not all(isinstance(game, dict) for game in games):
+            return jsonify({"error": "games must be a list of games"}), 400
+        if len(games) > MAX_CHECKED_GAMES:
+            return jsonify({"error": f"At most {MAX_CHECKED_GAMES} games per request"}), 400
+        
+        try:
+            dates = [parse_game_date(game["date_played"]) for game in games if game.get("date_played")]
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if not dates:
+            return jsonify({"valid": True, "checked": len(games), "conflicts": []}), 200
+        
+        cursor = db.get_db().cursor()
+        index = ScheduleIndex.load(cursor, min(dates), max(dates))
+        cursor.close()
+        
+        try:
+            conflicts = index.check_schedule(games)
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        
+        return jsonify({"valid": not conflicts, "checked": len(games), "conflicts": conflicts}), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @system_admin.route("/leagues/<int:league_id>/champions", methods=["GET"])
 def get_league_champions(league_id):
     try:
@@ -707,8 +1036,6 @@ def get_league_champions(league_id):
         champions = cursor.fetchall()
         cursor.close()
         
-        champions = convert_datetime_for_json(champions)
-        
         return jsonify(champions), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -745,8 +1072,9 @@ def create_league_champion(league_id):
             data["year"]
         ))
         
-        db.get_db().commit()
         champion_id = cursor.lastrowid
+        bump_versions(cursor, {("league", league_id), ("team", data["winner"])}, resolve=False)
+        db.get_db().commit()
         cursor.close()
         
         return jsonify({
@@ -777,6 +1105,7 @@ def delete_league_champion(league_id):
             return jsonify({"error": "Champion not found for this league"}), 404
         
         cursor.execute("DELETE FROM Champions WHERE champion_id = %s", (data["champion_id"],))
+        bump_versions(cursor, {("league", league_id)}, resolve=False)
         db.get_db().commit()
         cursor.close()
         
@@ -785,15 +1114,16 @@ def delete_league_champion(league_id):
         return jsonify({"error": str(e)}), 500
 
 
-@system_admin.route("/teams", methods=["GET"])
-def get_all_teams():
-    try:
-        cursor = db.get_db().cursor()
-        
-        league_filter = request.args.get("league_id")
-        name_search = request.args.get("name_search")
-        
-        query = """
+TEAM_FIELDS = ["team_id", "name", "wins", "losses", "founded_date", "league_played", "league_name", "sport_name"]
+TEAMS_KEYSET = Keyset(
+    SortKey("t.name", "name"),
+    SortKey("t.team_id", "team_id"),
+)
+
+
+def teams_list_query(args):
+    """Teams query and params for the league_id / name_search filters, without ORDER BY"""
+    query = """
         SELECT t.team_id, t.name, t.wins, t.losses, t.founded_date,
                t.league_played, l.name AS league_name, s.name AS sport_name
         FROM Teams t
@@ -801,31 +1131,56 @@ def get_all_teams():
         LEFT JOIN Sports s ON l.sport_played = s.sport_id
         WHERE 1=1
         """
+    params = []
+    
+    league_filter = args.get("league_id")
+    if league_filter:
+        query += " AND t.league_played = %s"
+        params.append(league_filter)
+    
+    name_search = args.get("name_search")
+    if name_search:
+        query += " AND LOWER(t.name) LIKE LOWER(%s)"
+        params.append(f"%{name_search}%")
+    return query, params
+
+
+@system_admin.route("/teams", methods=["GET"])
+def get_all_teams():
+    try:
+        cursor = db.get_db().cursor()
         
-        params = []
-        
-        if league_filter:
-            query += " AND t.league_played = %s"
-            params.append(league_filter)
-        
-        if name_search:
-            query += " AND LOWER(t.name) LIKE LOWER(%s)"
-            params.append(f"%{name_search}%")
-        
-        query += " ORDER BY t.name"
+        page = Page.from_args(request.args, TEAM_FIELDS)
+        query, params = teams_list_query(request.args)
+        query, params = page.paginate_sql(query, params, TEAMS_KEYSET)
         
         cursor.execute(query, params)
         teams = cursor.fetchall()
         cursor.close()
         
-        teams = convert_datetime_for_json(teams)
+        return jsonify(page.result(teams, TEAMS_KEYSET)), 200
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/teams/count", methods=["GET"])
+def count_teams():
+    try:
+        cursor = db.get_db().cursor()
         
-        return jsonify(teams), 200
+        query, params = teams_list_query(request.args)
+        total = count_rows(cursor, query, params)
+        cursor.close()
+        
+        return jsonify({"total": total}), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @system_admin.route("/teams/<int:team_id>", methods=["GET"])
+@versioned("team")
 def get_team(team_id):
     try:
         cursor = db.get_db().cursor()
@@ -846,8 +1201,6 @@ def get_team(team_id):
         if not team:
             return jsonify({"error": "Team not found"}), 404
         
-        team = convert_datetime_for_json(team)
-        
         return jsonify(team), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -881,8 +1234,11 @@ def create_team():
             data.get("founded_date")
         ))
         
-        db.get_db().commit()
         team_id = cursor.lastrowid
+        refresh_team_standings(cursor, [team_id])
+        bump_versions(cursor, {("team", team_id), ("league", data["league_played"])}, resolve=False)
+        
+        db.get_db().commit()
         cursor.close()
         
         return jsonify({
@@ -900,8 +1256,9 @@ def update_team(team_id):
         
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT team_id FROM Teams WHERE team_id = %s", (team_id,))
-        if not cursor.fetchone():
+        cursor.execute("SELECT team_id, league_played FROM Teams WHERE team_id = %s", (team_id,))
+        team = cursor.fetchone()
+        if not team:
             cursor.close()
             return jsonify({"error": "Team not found"}), 404
         
@@ -941,6 +1298,13 @@ def update_team(team_id):
         """
         
         cursor.execute(update_query, params)
+        
+        # Moving a team to another league moves its standings row
+        if "league_played" in data:
+            refresh_team_standings(cursor, [team_id])
+        bump_versions(cursor, {("team", team_id), ("league", team["league_played"]), ("league", data.get("league_played"))},
+                      resolve=False)
+        
         db.get_db().commit()
         cursor.close()
         
@@ -958,7 +1322,7 @@ def delete_team(team_id):
         if not cursor.fetchone():
             cursor.close()
             return jsonify({"error": "Team not found"}), 404
-        
+        bump_versions(cursor, {("team", team_id)})
         cursor.execute("DELETE FROM Teams WHERE team_id = %s", (team_id,))
         db.get_db().commit()
         cursor.close()
@@ -969,6 +1333,7 @@ def delete_team(team_id):
 
 
 @system_admin.route("/teams/<int:team_id>/players", methods=["GET"])
+@versioned("team")
 def get_team_players(team_id):
     try:
         cursor = db.get_db().cursor()
@@ -991,13 +1356,52 @@ def get_team_players(team_id):
         players = cursor.fetchall()
         cursor.close()
         
-        players = convert_datetime_for_json(players)
-        
         return jsonify(players), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
+@system_admin.route("/rosters", methods=["GET"])
+@versioned()
+def get_rosters():
+    try:
+        cursor = db.get_db().cursor()
+        
+        role_filter = request.args.get("role")
+        league_filter = request.args.get("league_id")
+        
+        # Every team's roster in one query instead of one request per team
+        query = """
+        SELECT t.team_id, t.name AS team_name, t.league_played,
+               p.player_id, p.first_name, p.last_name, p.email,
+               tp.role
+        FROM Teams_Players tp
+        JOIN Teams t ON tp.team_id = t.team_id
+        JOIN Players p ON tp.player_id = p.player_id
+        WHERE 1=1
+        """
+        
+        params = []
+        
+        if role_filter:
+            query += " AND LOWER(tp.role) = LOWER(%s)"
+            params.append(role_filter)
+        
+        if league_filter:
+            query += " AND t.league_played = %s"
+            params.append(league_filter)
+        
+        query += " ORDER BY t.name, t.team_id, tp.role, p.last_name, p.first_name"
+        
+        cursor.execute(query, params)
+        rosters = cursor.fetchall()
+        cursor.close()
+        
+        return jsonify(rosters), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @system_admin.route("/teams/<int:team_id>/players", methods=["POST"])
 def add_player_to_team(team_id):
     try:
@@ -1030,6 +1434,8 @@ def add_player_to_team(team_id):
             data.get("role", "player")
         ))
         
+        bump_versions(cursor, {("team", team_id), ("player", data["player_id"])}, resolve=False)
+        
         db.get_db().commit()
         cursor.close()
         
@@ -1064,6 +1470,7 @@ def update_player_role(team_id):
         """
         
         cursor.execute(update_query, (data["role"], team_id, data["player_id"]))
+        bump_versions(cursor, {("team", team_id), ("player", data["player_id"])}, resolve=False)
         db.get_db().commit()
         cursor.close()
         
@@ -1095,6 +1502,7 @@ def remove_player_from_team(team_id):
             DELETE FROM Teams_Players 
             WHERE team_id = %s AND player_id = %s
         """, (team_id, data["player_id"]))
+        bump_versions(cursor, {("team", team_id), ("player", data["player_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -1105,6 +1513,7 @@ def remove_player_from_team(team_id):
 
 
 @system_admin.route("/teams/<int:team_id>/games", methods=["GET"])
+@versioned("team")
 def get_team_games(team_id):
     try:
         cursor = db.get_db().cursor()
@@ -1114,34 +1523,16 @@ def get_team_games(team_id):
             cursor.close()
             return jsonify({"error": "Team not found"}), 404
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        WHERE (tg1.team_id = %s OR tg2.team_id = %s)
-        ORDER BY g.date_played DESC, g.start_time DESC
-        """
-        
-        cursor.execute(query, (team_id, team_id))
-        games = cursor.fetchall()
+        games = GameQuery().for_team(team_id).fetch_all(cursor)
         cursor.close()
         
-        games = convert_datetime_for_json(games)
-        
         return jsonify(games), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @system_admin.route("/teams/<int:team_id>/stats", methods=["GET"])
+@versioned("team")
 def get_team_stats(team_id):
     try:
         cursor = db.get_db().cursor()
@@ -1186,8 +1577,6 @@ def get_team_stats(team_id):
         if league:
             stats["league_name"] = league["league_name"]
         
-        stats = convert_datetime_for_json(stats)
-        
         return jsonify(stats), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -1218,8 +1607,6 @@ def get_team_awards(team_id):
         awards = cursor.fetchall()
         cursor.close()
         
-        awards = convert_datetime_for_json(awards)
-        
         return jsonify(awards), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -1235,59 +1622,105 @@ def delete_team_award(team_id):
         
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT award_id FROM Player_Awards WHERE award_id = %s", (data["award_id"],))
-        if not cursor.fetchone():
+        cursor.execute("SELECT award_id, recipient FROM Player_Awards WHERE award_id = %s", (data["award_id"],))
+        award = cursor.fetchone()
+        if not award:
             cursor.close()
             return jsonify({"error": "Award not found"}), 404
         
-        cursor.execute("DELETE FROM Player_Awards WHERE award_id = %s", (data["award_id"],))
-        db.get_db().commit()
+        cursor.execute("DELETE FROM Player_Awards WHERE award_id = %s", (data["award_id"],))
+        bump_versions(cursor, {("team", team_id), ("player", award["recipient"])}, resolve=False)
+        db.get_db().commit()
+        cursor.close()
+        
+        return jsonify({"message": "Award deleted successfully"}), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+PLAYER_FIELDS = ["player_id", "phone_number", "first_name", "last_name", "email"]
+PLAYERS_KEYSET = Keyset(
+    SortKey("p.last_name", "last_name"),
+    SortKey("p.first_name", "first_name"),
+    SortKey("p.player_id", "player_id"),
+)
+
+
+def players_list_query(args):
+    """Players query and params for the search parameter, without ORDER BY"""
+    query = """
+        SELECT p.player_id, p.phone_number, p.first_name, p.last_name, p.email
+        FROM Players p
+        WHERE 1=1
+        """
+    params = []
+    
+    # Add search filter if provided (served by the player search index)
+    search = args.get("search", "").strip()
+    if search:
+        condition, params = search_condition(search)
+        query += f" AND {condition}"
+    return query, params
+
+
+@system_admin.route("/players", methods=["GET"])
+def get_all_players():
+    try:
+        page = Page.from_args(request.args, PLAYER_FIELDS)
+        query, params = players_list_query(request.args)
+        query, params = page.paginate_sql(query, params, PLAYERS_KEYSET)
+        
+        # The full list is streamed rather than built in memory
+        if not page.paginated:
+            return stream_rows(query, params, transform=page.project_row)
+        
+        cursor = db.get_db().cursor()
+        cursor.execute(query, params if params else None)
+        players = cursor.fetchall()
         cursor.close()
         
-        return jsonify({"message": "Award deleted successfully"}), 200
+        return jsonify(page.result(players, PLAYERS_KEYSET)), 200
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
-@system_admin.route("/players", methods=["GET"])
-def get_all_players():
+@system_admin.route("/players/count", methods=["GET"])
+def count_players():
     try:
         cursor = db.get_db().cursor()
         
-        # Get search parameter from query string
-        search = request.args.get("search", "").strip()
-        
-        query = """
-        SELECT player_id, phone_number, first_name, last_name, email
-        FROM Players
-        """
-        
-        params = []
+        query, params = players_list_query(request.args)
+        total = count_rows(cursor, query, params)
+        cursor.close()
         
-        # Add WHERE clause if search parameter is provided
-        if search:
-            query += """
-            WHERE LOWER(first_name) LIKE %s 
-               OR LOWER(last_name) LIKE %s 
-               OR LOWER(email) LIKE %s
-            """
-            search_pattern = f"%{search.lower()}%"
-            params = [search_pattern, search_pattern, search_pattern]
+        return jsonify({"total": total}), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/players/search", methods=["GET"])
+def search_all_players():
+    """Ranked player search for type-ahead pickers: ?q=<name, email or id>&limit="""
+    try:
+        q = request.args.get("q", "")
+        if not normalize_query(q):
+            return jsonify({"error": "Missing required parameter: q"}), 400
         
-        query += " ORDER BY last_name, first_name"
+        limit = request.args.get("limit", PLAYER_SEARCH_LIMIT, type=int)
         
-        cursor.execute(query, params if params else None)
-        players = cursor.fetchall()
+        cursor = db.get_db().cursor()
+        players = search_players(cursor, q, limit)
         cursor.close()
         
-        players = convert_datetime_for_json(players)
-        
         return jsonify(players), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @system_admin.route("/players/<int:player_id>", methods=["GET"])
+@versioned("player")
 def get_player(player_id):
     try:
         cursor = db.get_db().cursor()
@@ -1305,8 +1738,6 @@ def get_player(player_id):
         if not player:
             return jsonify({"error": "Player not found"}), 404
         
-        player = convert_datetime_for_json(player)
-        
         return jsonify(player), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -1339,8 +1770,9 @@ def create_player():
             data.get("phone_number")
         ))
         
-        db.get_db().commit()
         player_id = cursor.lastrowid
+        bump_versions(cursor, {("player", player_id)}, resolve=False)
+        db.get_db().commit()
         cursor.close()
         
         return jsonify({
@@ -1414,6 +1846,7 @@ def update_player(player_id):
         """
         
         cursor.execute(update_query, params)
+        bump_versions(cursor, {("player", player_id)})
         db.get_db().commit()
         cursor.close()
         
@@ -1444,7 +1877,13 @@ def delete_player(player_id):
         if not cursor.fetchone():
             cursor.close()
             return jsonify({"error": "Player not found"}), 404
-        
+        # The player's stat events cascade away with them; tombstone them for delta sync first
+        cursor.execute(
+            "SELECT event_id, scored_during, performed_by FROM StatEvent WHERE performed_by = %s", (player_id,)
+        )
+        events = cursor.fetchall()
+        record_events_deleted(cursor, events)
+        bump_versions(cursor, {("player", player_id)} | {("game", event["scored_during"]) for event in events})
         cursor.execute("DELETE FROM Players WHERE player_id = %s", (player_id,))
         db.get_db().commit()
         cursor.close()
@@ -1455,6 +1894,7 @@ def delete_player(player_id):
 
 
 @system_admin.route("/players/<int:player_id>/teams", methods=["GET"])
+@versioned("player")
 def get_player_teams(player_id):
     try:
         cursor = db.get_db().cursor()
@@ -1479,14 +1919,13 @@ def get_player_teams(player_id):
         teams = cursor.fetchall()
         cursor.close()
         
-        teams = convert_datetime_for_json(teams)
-        
         return jsonify(teams), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @system_admin.route("/players/<int:player_id>/games", methods=["GET"])
+@versioned("player")
 def get_player_games(player_id):
     try:
         cursor = db.get_db().cursor()
@@ -1496,31 +1935,9 @@ def get_player_games(player_id):
             cursor.close()
             return jsonify({"error": "Player not found"}), 404
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name, s.name AS sport_name,
-               pg.is_starter, pg.position
-        FROM Players_Games pg
-        JOIN Games g ON pg.game_id = g.game_id
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE pg.player_id = %s
-        ORDER BY g.date_played DESC, g.start_time DESC
-        """
-        
-        cursor.execute(query, (player_id,))
-        games = cursor.fetchall()
+        games = GameQuery().for_player(player_id).fetch_all(cursor)
         cursor.close()
         
-        games = convert_datetime_for_json(games)
-        
         return jsonify(games), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -1559,6 +1976,8 @@ def add_player_to_game(player_id):
             data.get("position")
         ))
         
+        bump_versions(cursor, {("player", player_id), ("game", data["game_id"])}, resolve=False)
+        
         db.get_db().commit()
         cursor.close()
         
@@ -1610,6 +2029,7 @@ def update_player_game_status(player_id):
         """
         
         cursor.execute(update_query, params)
+        bump_versions(cursor, {("player", player_id), ("game", data["game_id"])}, resolve=False)
         db.get_db().commit()
         cursor.close()
         
@@ -1641,6 +2061,7 @@ def remove_player_from_game(player_id):
             DELETE FROM Players_Games 
             WHERE player_id = %s AND game_id = %s
         """, (player_id, data["game_id"]))
+        bump_versions(cursor, {("player", player_id), ("game", data["game_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -1651,6 +2072,7 @@ def remove_player_from_game(player_id):
 
 
 @system_admin.route("/players/<int:player_id>/stats", methods=["GET"])
+@versioned("player")
 def get_player_stats(player_id):
     try:
         cursor = db.get_db().cursor()
@@ -1661,16 +2083,14 @@ def get_player_stats(player_id):
             return jsonify({"error": "Player not found"}), 404
         
         query = """
-        SELECT se.event_id, se.description, se.time_entered,
+        SELECT se.event_id, se.description, se.stat_type_id, se.points, se.time_entered,
                g.game_id, g.date_played, g.start_time, g.location,
                t1.name AS home_team, t2.name AS away_team,
                l.name AS league_name, s.name AS sport_name
         FROM StatEvent se
         JOIN Games g ON se.scored_during = g.game_id
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
+        JOIN Teams t1 ON g.home_team_id = t1.team_id
+        JOIN Teams t2 ON g.away_team_id = t2.team_id
         JOIN Leagues l ON g.league_played = l.league_id
         JOIN Sports s ON l.sport_played = s.sport_id
         WHERE se.performed_by = %s
@@ -1681,20 +2101,23 @@ def get_player_stats(player_id):
         stat_events = cursor.fetchall()
         
         agg_query = """
-        SELECT se.description, COUNT(*) AS count
-        FROM StatEvent se
-        WHERE se.performed_by = %s
-        GROUP BY se.description
-        ORDER BY count DESC
+        SELECT COALESCE(st.label, agg.description) AS description, agg.stat_type_id, st.code,
+               agg.count, agg.total_points
+        FROM (
+            SELECT se.stat_type_id, IF(se.stat_type_id IS NULL, se.description, NULL) AS description,
+                   COUNT(*) AS count, SUM(se.points) AS total_points
+            FROM StatEvent se
+            WHERE se.performed_by = %s
+            GROUP BY se.stat_type_id, IF(se.stat_type_id IS NULL, se.description, NULL)
+        ) agg
+        LEFT JOIN StatType st ON agg.stat_type_id = st.stat_type_id
+        ORDER BY agg.count DESC
         """
         
         cursor.execute(agg_query, (player_id,))
         aggregated_stats = cursor.fetchall()
         cursor.close()
         
-        stat_events = convert_datetime_for_json(stat_events)
-        aggregated_stats = convert_datetime_for_json(aggregated_stats)
-        
         result = {
             "player_id": player_id,
             "total_stat_events": len(stat_events),
@@ -1728,8 +2151,6 @@ def get_player_awards(player_id):
         awards = cursor.fetchall()
         cursor.close()
         
-        awards = convert_datetime_for_json(awards)
-        
         return jsonify(awards), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -1762,8 +2183,9 @@ def create_player_award(player_id):
             data.get("description")
         ))
         
-        db.get_db().commit()
         award_id = cursor.lastrowid
+        bump_versions(cursor, {("player", player_id)}, resolve=False)
+        db.get_db().commit()
         cursor.close()
         
         return jsonify({
@@ -1794,6 +2216,7 @@ def delete_player_award(player_id):
             return jsonify({"error": "Award not found for this player"}), 404
         
         cursor.execute("DELETE FROM Player_Awards WHERE award_id = %s", (data["award_id"],))
+        bump_versions(cursor, {("player", player_id)}, resolve=False)
         db.get_db().commit()
         cursor.close()
         
@@ -1802,43 +2225,58 @@ def delete_player_award(player_id):
         return jsonify({"error": str(e)}), 500
 
 
-@system_admin.route("/player-awards", methods=["GET"])
-def get_all_player_awards():
-    """Get all player awards with player names - efficient single query with filtering"""
-    try:
-        cursor = db.get_db().cursor()
-        
-        # Get filter parameters
-        player_search = request.args.get("player_search", "").strip()
-        award_type_search = request.args.get("award_type_search", "").strip()
-        year_filter = request.args.get("year")
-        
-        query = """
+PLAYER_AWARD_FIELDS = [
+    "award_id", "award_type", "year", "description",
+    "player_id", "first_name", "last_name", "email", "player_name",
+]
+PLAYER_AWARDS_KEYSET = Keyset(
+    SortKey("pa.year", "year", descending=True),
+    SortKey("p.last_name", "last_name"),
+    SortKey("p.first_name", "first_name"),
+    SortKey("pa.award_id", "award_id"),
+)
+
+
+def player_awards_list_query(args):
+    """Player awards query and params for the player/award type/year filters, without ORDER BY"""
+    query = """
         SELECT pa.award_id, pa.award_type, pa.year, pa.description,
                p.player_id, p.first_name, p.last_name, p.email
         FROM Player_Awards pa
         JOIN Players p ON pa.recipient = p.player_id
         WHERE 1=1
         """
+    params = []
+    
+    player_search = args.get("player_search", "").strip()
+    if player_search:
+        condition, search_params = search_condition(player_search)
+        query += f" AND {condition}"
+        params.extend(search_params)
+    
+    award_type_search = args.get("award_type_search", "").strip()
+    if award_type_search:
+        query += " AND LOWER(pa.award_type) LIKE %s"
+        params.append(f"%{award_type_search.lower()}%")
+    
+    year_filter = args.get("year")
+    if year_filter:
+        query += " AND pa.year = %s"
+        params.append(int(year_filter))
+    return query, params
+
+
+@system_admin.route("/player-awards", methods=["GET"])
+def get_all_player_awards():
+    """Get all player awards with player names - efficient single query with filtering"""
+    try:
+        cursor = db.get_db().cursor()
         
-        params = []
-        
-        if player_search:
-            query += " AND (LOWER(p.first_name) LIKE %s OR LOWER(p.last_name) LIKE %s OR LOWER(p.email) LIKE %s)"
-            search_pattern = f"%{player_search.lower()}%"
-            params.extend([search_pattern, search_pattern, search_pattern])
-        
-        if award_type_search:
-            query += " AND LOWER(pa.award_type) LIKE %s"
-            params.append(f"%{award_type_search.lower()}%")
-        
-        if year_filter:
-            query += " AND pa.year = %s"
-            params.append(int(year_filter))
-        
-        query += " ORDER BY pa.year DESC, p.last_name, p.first_name"
+        page = Page.from_args(request.args, PLAYER_AWARD_FIELDS)
+        query, params = player_awards_list_query(request.args)
+        query, params = page.paginate_sql(query, params, PLAYER_AWARDS_KEYSET)
         
-        cursor.execute(query, params if params else None)
+        cursor.execute(query, params)
         awards = cursor.fetchall()
         cursor.close()
         
@@ -1846,26 +2284,42 @@ def get_all_player_awards():
         for award in awards:
             award['player_name'] = f"{award['first_name']} {award['last_name']}"
         
-        awards = convert_datetime_for_json(awards)
-        
-        return jsonify(awards), 200
+        return jsonify(page.result(awards, PLAYER_AWARDS_KEYSET)), 200
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
-@system_admin.route("/champions", methods=["GET"])
-def get_all_champions():
-    """Get all champions with team and league info - efficient single query with filtering"""
+@system_admin.route("/player-awards/count", methods=["GET"])
+def count_player_awards():
     try:
         cursor = db.get_db().cursor()
         
-        # Get filter parameters
-        league_search = request.args.get("league_search", "").strip()
-        team_search = request.args.get("team_search", "").strip()
-        sport_search = request.args.get("sport_search", "").strip()
-        year_filter = request.args.get("year")
+        query, params = player_awards_list_query(request.args)
+        total = count_rows(cursor, query, params)
+        cursor.close()
         
-        query = """
+        return jsonify({"total": total}), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+CHAMPION_FIELDS = [
+    "champion_id", "winner", "league_id", "year", "winner_team_name",
+    "league_name", "semester", "league_year", "sport_name", "sport_id",
+]
+CHAMPIONS_KEYSET = Keyset(
+    SortKey("c.year", "year", descending=True),
+    SortKey("l.name", "league_name"),
+    SortKey("t.name", "winner_team_name"),
+    SortKey("c.champion_id", "champion_id"),
+)
+
+
+def champions_list_query(args):
+    """Champions query and params for the league/team/sport/year filters, without ORDER BY"""
+    query = """
         SELECT c.champion_id, c.winner, c.league_id, c.year,
                t.name AS winner_team_name,
                l.name AS league_name, l.semester, l.year AS league_year,
@@ -1876,34 +2330,61 @@ def get_all_champions():
         JOIN Sports s ON l.sport_played = s.sport_id
         WHERE 1=1
         """
+    params = []
+    
+    league_search = args.get("league_search", "").strip()
+    if league_search:
+        query += " AND LOWER(l.name) LIKE %s"
+        params.append(f"%{league_search.lower()}%")
+    
+    team_search = args.get("team_search", "").strip()
+    if team_search:
+        query += " AND LOWER(t.name) LIKE %s"
+        params.append(f"%{team_search.lower()}%")
+    
+    sport_search = args.get("sport_search", "").strip()
+    if sport_search:
+        query += " AND LOWER(s.name) LIKE %s"
+        params.append(f"%{sport_search.lower()}%")
+    
+    year_filter = args.get("year")
+    if year_filter:
+        query += " AND c.year = %s"
+        params.append(int(year_filter))
+    return query, params
+
+
+@system_admin.route("/champions", methods=["GET"])
+def get_all_champions():
+    """Get all champions with team and league info - efficient single query with filtering"""
+    try:
+        cursor = db.get_db().cursor()
         
-        params = []
-        
-        if league_search:
-            query += " AND LOWER(l.name) LIKE %s"
-            params.append(f"%{league_search.lower()}%")
-        
-        if team_search:
-            query += " AND LOWER(t.name) LIKE %s"
-            params.append(f"%{team_search.lower()}%")
-        
-        if sport_search:
-            query += " AND LOWER(s.name) LIKE %s"
-            params.append(f"%{sport_search.lower()}%")
-        
-        if year_filter:
-            query += " AND c.year = %s"
-            params.append(int(year_filter))
-        
-        query += " ORDER BY c.year DESC, l.name, t.name"
+        page = Page.from_args(request.args, CHAMPION_FIELDS)
+        query, params = champions_list_query(request.args)
+        query, params = page.paginate_sql(query, params, CHAMPIONS_KEYSET)
         
-        cursor.execute(query, params if params else None)
+        cursor.execute(query, params)
         champions = cursor.fetchall()
         cursor.close()
         
-        champions = convert_datetime_for_json(champions)
+        return jsonify(page.result(champions, CHAMPIONS_KEYSET)), 200
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/champions/count", methods=["GET"])
+def count_champions():
+    try:
+        cursor = db.get_db().cursor()
         
-        return jsonify(champions), 200
+        query, params = champions_list_query(request.args)
+        total = count_rows(cursor, query, params)
+        cursor.close()
+        
+        return jsonify({"total": total}), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
@@ -1929,99 +2410,143 @@ def get_leagues_without_champions():
         leagues = cursor.fetchall()
         cursor.close()
         
-        leagues = convert_datetime_for_json(leagues)
-        
         return jsonify(leagues), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
+GAME_FIELDS = [
+    "game_id", "date_played", "start_time", "location", "home_score", "away_score",
+    "league_played", "home_team", "home_team_id", "away_team", "away_team_id",
+    "league_name", "sport_name", "is_finalized", "has_both_teams",
+]
+GAMES_KEYSET = Keyset(
+    SortKey("g.date_played", "date_played", descending=True),
+    SortKey("g.start_time", "start_time", descending=True, nullable=True),
+    SortKey("g.game_id", "game_id", descending=True),
+)
+
+
 @system_admin.route("/games", methods=["GET"])
+@versioned()
 def get_all_games():
     try:
+        page = Page.from_args(request.args, GAME_FIELDS)
+        
+        # league_id, team_id, min_date and max_date filters
+        query = GameQuery().apply_args(request.args)
+        
+        # The full list is streamed rather than built in memory
+        if not page.paginated:
+            return stream_rows(*query.build(), transform=page.project_row)
+        
+        condition, params, order_by, fetch_limit = page.apply(GAMES_KEYSET)
+        if condition:
+            query.where(condition, *params)
+        query.order_by(*order_by).paginate(fetch_limit)
+        
         cursor = db.get_db().cursor()
+        games = query.fetch_all(cursor)
+        cursor.close()
         
-        league_filter = request.args.get("league_id")
-        min_date_filter = request.args.get("min_date")
-        max_date_filter = request.args.get("max_date")
-        team_filter = request.args.get("team_id")
+        return jsonify(page.result(games, GAMES_KEYSET)), 200
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/games/count", methods=["GET"])
+def count_games():
+    try:
+        cursor = db.get_db().cursor()
+        
+        query, params = GameQuery().apply_args(request.args).order_by().build()
+        total = count_rows(cursor, query, params)
+        cursor.close()
+        
+        return jsonify({"total": total}), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/exports/games", methods=["GET"])
+def export_games():
+    """Stream every game matching league_id / team_id / min_date / max_date (?format=json|ndjson)"""
+    try:
+        fmt = stream_format()
+        if fmt is None:
+            return jsonify({"error": "format must be json or ndjson"}), 400
+        
+        query, params = GameQuery().apply_args(request.args).order_by(*OLDEST_FIRST).build()
+        return stream_rows(query, params, fmt)
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/exports/stat-events", methods=["GET"])
+def export_stat_events():
+    """Stream stat events filtered by league_id / game_id / player_id / min_date / max_date (?format=json|ndjson)"""
+    try:
+        fmt = stream_format()
+        if fmt is None:
+            return jsonify({"error": "format must be json or ndjson"}), 400
         
         query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name
-        FROM Games g
-        LEFT JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        LEFT JOIN Teams t1 ON tg1.team_id = t1.team_id
-        LEFT JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        LEFT JOIN Teams t2 ON tg2.team_id = t2.team_id
+        SELECT se.event_id, se.scored_during AS game_id, g.date_played,
+               g.league_played, l.name AS league_name,
+               se.performed_by AS player_id, p.first_name, p.last_name,
+               se.stat_type_id, st.code AS stat_code, se.description,
+               se.points, se.time_entered
+        FROM StatEvent se
+        JOIN Games g ON se.scored_during = g.game_id
         JOIN Leagues l ON g.league_played = l.league_id
-        WHERE t1.team_id IS NOT NULL AND t2.team_id IS NOT NULL
+        JOIN Players p ON se.performed_by = p.player_id
+        LEFT JOIN StatType st ON se.stat_type_id = st.stat_type_id
+        WHERE 1=1
         """
         
         params = []
         
-        if league_filter:
+        if request.args.get("league_id"):
             query += " AND g.league_played = %s"
-            params.append(league_filter)
-        
-        if min_date_filter:
-            query += " AND g.date_played >= %s"
-            params.append(min_date_filter)
+            params.append(request.args.get("league_id"))
         
-        if max_date_filter:
-            query += " AND g.date_played <= %s"
-            params.append(max_date_filter)
+        if request.args.get("game_id"):
+            query += " AND se.scored_during = %s"
+            params.append(request.args.get("game_id"))
         
-        if team_filter:
-            query += " AND (tg1.team_id = %s OR tg2.team_id = %s)"
-            params.extend([team_filter, team_filter])
+        if request.args.get("player_id"):
+            query += " AND se.performed_by = %s"
+            params.append(request.args.get("player_id"))
         
-        query += " ORDER BY g.date_played DESC, g.start_time DESC"
+        if request.args.get("min_date"):
+            query += " AND g.date_played >= %s"
+            params.append(request.args.get("min_date"))
         
-        cursor.execute(query, params)
-        games = cursor.fetchall()
-        cursor.close()
+        if request.args.get("max_date"):
+            query += " AND g.date_played <= %s"
+            params.append(request.args.get("max_date"))
         
-        games = convert_datetime_for_json(games)
+        query += " ORDER BY g.date_played, se.scored_during, se.time_entered, se.event_id"
         
-        return jsonify(games), 200
+        return stream_rows(query, params, fmt)
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @system_admin.route("/games/<int:game_id>", methods=["GET"])
+@versioned("game")
 def get_game(game_id):
     try:
         cursor = db.get_db().cursor()
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location, 
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name, s.name AS sport_name
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE g.game_id = %s
-        """
-        
-        cursor.execute(query, (game_id,))
-        game = cursor.fetchone()
+        game = GameQuery().for_game(game_id).fetch_one(cursor)
         cursor.close()
         
         if not game:
             return jsonify({"error": "Game not found"}), 404
         
-        game = convert_datetime_for_json(game)
-        
         return jsonify(game), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -2042,6 +2567,15 @@ def create_game():
             cursor.close()
             return jsonify({"error": "League not found"}), 404
         
+        try:
+            conflicts = find_game_conflicts(cursor, data)
+        except ValueError as e:
+            cursor.close()
+            return jsonify({"error": str(e)}), 400
+        if conflicts and not data.get("allow_conflicts"):
+            cursor.close()
+            return jsonify({"error": conflict_error(conflicts), "conflicts": conflicts}), 409
+        
         insert_query = """
         INSERT INTO Games (league_played, date_played, start_time, location, home_score, away_score)
         VALUES (%s, %s, %s, %s, %s, %s)
@@ -2071,6 +2605,12 @@ def create_game():
                 VALUES (%s, %s, FALSE)
             """, (data["away_team_id"], game_id))
         
+        sync_game_teams(cursor, game_id)
+        bump_versions(cursor, game_entities({
+            "game_id": game_id, "league_played": data["league_played"],
+            "home_team_id": data.get("home_team_id"), "away_team_id": data.get("away_team_id"),
+        }), resolve=False)
+        
         db.get_db().commit()
         cursor.close()
         
@@ -2089,11 +2629,29 @@ def update_game(game_id):
         
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT game_id FROM Games WHERE game_id = %s", (game_id,))
-        if not cursor.fetchone():
+        cursor.execute("""
+            SELECT game_id, is_finalized, league_played, date_played, start_time, location, home_team_id, away_team_id
+            FROM Games WHERE game_id = %s
+        """, (game_id,))
+        game = cursor.fetchone()
+        if not game:
             cursor.close()
             return jsonify({"error": "Game not found"}), 404
         
+        # Moving the game can double-book its teams, location or stat keepers
+        schedule_fields = [field for field in ("date_played", "start_time", "location", "league_played") if field in data]
+        if schedule_fields and not data.get("allow_conflicts"):
+            moved = dict(game, keeper_ids=game_keeper_ids(cursor, game_id))
+            moved.update({field: data[field] for field in schedule_fields})
+            try:
+                conflicts = find_game_conflicts(cursor, moved, ignore_game_id=game_id)
+            except ValueError as e:
+                cursor.close()
+                return jsonify({"error": str(e)}), 400
+            if conflicts:
+                cursor.close()
+                return jsonify({"error": conflict_error(conflicts), "conflicts": conflicts}), 409
+        
         update_fields = []
         params = []
         
@@ -2134,7 +2692,16 @@ def update_game(game_id):
         """
         
         cursor.execute(update_query, params)
+        
+        # Editing a finalized result changes the league standings
+        result_fields = ("home_score", "away_score", "date_played", "start_time", "league_played")
+        if game["is_finalized"] and any(field in data for field in result_fields):
+            refresh_game_standings(cursor, game_id)
+        bump_versions(cursor, game_entities(game) | {("league", data.get("league_played"))}, resolve=False)
+        
         db.get_db().commit()
+        if "home_score" in data or "away_score" in data:
+            publish_game_changes(cursor, game_id)
         cursor.close()
         
         return jsonify({"message": "Game updated successfully"}), 200
@@ -2147,12 +2714,19 @@ def delete_game(game_id):
     try:
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT game_id FROM Games WHERE game_id = %s", (game_id,))
-        if not cursor.fetchone():
+        cursor.execute("""
+            SELECT game_id, is_finalized, league_played, home_team_id, away_team_id
+            FROM Games WHERE game_id = %s
+        """, (game_id,))
+        game = cursor.fetchone()
+        if not game:
             cursor.close()
             return jsonify({"error": "Game not found"}), 404
         
+        team_ids = get_game_team_ids(cursor, game_id) if game["is_finalized"] else []
+        bump_versions(cursor, game_entities(game), resolve=False)
         cursor.execute("DELETE FROM Games WHERE game_id = %s", (game_id,))
+        refresh_team_standings(cursor, team_ids)
         db.get_db().commit()
         cursor.close()
         
@@ -2183,8 +2757,6 @@ def get_game_teams(game_id):
         teams = cursor.fetchall()
         cursor.close()
         
-        teams = convert_datetime_for_json(teams)
-        
         return jsonify(teams), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -2200,8 +2772,12 @@ def assign_teams_to_game(game_id):
         
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT game_id FROM Games WHERE game_id = %s", (game_id,))
-        if not cursor.fetchone():
+        cursor.execute("""
+            SELECT game_id, is_finalized, league_played, home_team_id, away_team_id
+            FROM Games WHERE game_id = %s
+        """, (game_id,))
+        game = cursor.fetchone()
+        if not game:
             cursor.close()
             return jsonify({"error": "Game not found"}), 404
         
@@ -2216,6 +2792,13 @@ def assign_teams_to_game(game_id):
             VALUES (%s, %s, FALSE)
             ON DUPLICATE KEY UPDATE is_home_team = FALSE
         """, (data["away_team_id"], game_id))
+        sync_game_teams(cursor, game_id)
+        
+        if game["is_finalized"]:
+            refresh_game_standings(cursor, game_id)
+        
+        bump_versions(cursor, game_entities(game) | {("team", data["home_team_id"]),
+                                                 ("team", data["away_team_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -2232,11 +2815,18 @@ def update_game_teams(game_id):
         
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT game_id FROM Games WHERE game_id = %s", (game_id,))
-        if not cursor.fetchone():
+        cursor.execute("""
+            SELECT game_id, is_finalized, league_played, home_team_id, away_team_id
+            FROM Games WHERE game_id = %s
+        """, (game_id,))
+        game = cursor.fetchone()
+        if not game:
             cursor.close()
             return jsonify({"error": "Game not found"}), 404
         
+        # Teams swapped out of a finalized game lose its result too
+        previous_team_ids = get_game_team_ids(cursor, game_id) if game["is_finalized"] else []
+        
         if "home_team_id" in data:
             cursor.execute("""
                 UPDATE Teams_Games
@@ -2251,6 +2841,13 @@ def update_game_teams(game_id):
                 WHERE game_id = %s AND is_home_team = FALSE
             """, (data["away_team_id"], game_id))
         
+        sync_game_teams(cursor, game_id)
+        
+        if game["is_finalized"]:
+            refresh_team_standings(cursor, previous_team_ids + get_game_team_ids(cursor, game_id))
+        bump_versions(cursor, game_entities(game) | {("team", data.get("home_team_id")),
+                                                 ("team", data.get("away_team_id"))}, resolve=False)
+        
         db.get_db().commit()
         cursor.close()
         
@@ -2286,8 +2883,6 @@ def get_game_players(game_id):
         players = cursor.fetchall()
         cursor.close()
         
-        players = convert_datetime_for_json(players)
-        
         return jsonify(players), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -2325,6 +2920,7 @@ def add_player_to_game_lineup_admin(game_id):
             data.get("is_starter", False),
             data.get("position")
         ))
+        bump_versions(cursor, {("game", game_id), ("player", data["player_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -2377,6 +2973,7 @@ def update_game_player_status(game_id):
         """
         
         cursor.execute(update_query, params)
+        bump_versions(cursor, {("game", game_id), ("player", data["player_id"])}, resolve=False)
         db.get_db().commit()
         cursor.close()
         
@@ -2408,6 +3005,7 @@ def remove_player_from_game_lineup(game_id):
             DELETE FROM Players_Games 
             WHERE game_id = %s AND player_id = %s
         """, (game_id, data["player_id"]))
+        bump_versions(cursor, {("game", game_id), ("player", data["player_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -2440,8 +3038,6 @@ def get_game_stat_keepers(game_id):
         stat_keepers = cursor.fetchall()
         cursor.close()
         
-        stat_keepers = convert_datetime_for_json(stat_keepers)
-        
         return jsonify(stat_keepers), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -2457,8 +3053,9 @@ def assign_stat_keeper_to_game(game_id):
         
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT game_id FROM Games WHERE game_id = %s", (game_id,))
-        if not cursor.fetchone():
+        cursor.execute("SELECT game_id, league_played, date_played, start_time FROM Games WHERE game_id = %s", (game_id,))
+        game = cursor.fetchone()
+        if not game:
             cursor.close()
             return jsonify({"error": "Game not found"}), 404
         
@@ -2467,6 +3064,12 @@ def assign_stat_keeper_to_game(game_id):
             cursor.close()
             return jsonify({"error": "Stat keeper not found"}), 404
         
+        conflicts = find_game_conflicts(cursor, dict(game, keeper_ids=[data["keeper_id"]]),
+                                        ignore_game_id=game_id, kinds=("keeper",))
+        if conflicts and not data.get("allow_conflicts"):
+            cursor.close()
+            return jsonify({"error": conflict_error(conflicts), "conflicts": conflicts}), 409
+        
         insert_query = """
         INSERT INTO Games_Keepers (keeper_id, game_id, assignment_date)
         VALUES (%s, %s, CURDATE())
@@ -2474,6 +3077,7 @@ def assign_stat_keeper_to_game(game_id):
         """
         
         cursor.execute(insert_query, (data["keeper_id"], game_id))
+        bump_versions(cursor, {("game", game_id), ("keeper", data["keeper_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -2506,6 +3110,7 @@ def remove_stat_keeper_from_game(game_id):
             DELETE FROM Games_Keepers 
             WHERE game_id = %s AND keeper_id = %s
         """, (game_id, data["keeper_id"]))
+        bump_versions(cursor, {("game", game_id), ("keeper", data["keeper_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -2544,8 +3149,6 @@ def get_all_stat_keepers():
         stat_keepers = cursor.fetchall()
         cursor.close()
         
-        stat_keepers = convert_datetime_for_json(stat_keepers)
-        
         return jsonify(stat_keepers), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -2569,8 +3172,6 @@ def get_stat_keeper(keeper_id):
         if not stat_keeper_data:
             return jsonify({"error": "Stat keeper not found"}), 404
         
-        stat_keeper_data = convert_datetime_for_json(stat_keeper_data)
-        
         return jsonify(stat_keeper_data), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -2598,8 +3199,9 @@ def create_stat_keeper():
             data.get("total_games_tracked", 0)
         ))
         
-        db.get_db().commit()
         keeper_id = cursor.lastrowid
+        bump_versions(cursor, {("keeper", keeper_id)}, resolve=False)
+        db.get_db().commit()
         cursor.close()
         
         return jsonify({
@@ -2654,6 +3256,7 @@ def update_stat_keeper(keeper_id):
         """
         
         cursor.execute(update_query, params)
+        bump_versions(cursor, {("keeper", keeper_id)}, resolve=False)
         db.get_db().commit()
         cursor.close()
         
@@ -2672,6 +3275,7 @@ def delete_stat_keeper(keeper_id):
             cursor.close()
             return jsonify({"error": "Stat keeper not found"}), 404
         
+        bump_versions(cursor, {("keeper", keeper_id)}, resolve=False)
         cursor.execute("DELETE FROM Stat_Keepers WHERE keeper_id = %s", (keeper_id,))
         
         db.get_db().commit()
@@ -2692,37 +3296,82 @@ def get_stat_keeper_games(keeper_id):
             cursor.close()
             return jsonify({"error": "Stat keeper not found"}), 404
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location,
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name, s.name AS sport_name,
-               gk.assignment_date
-        FROM Games_Keepers gk
-        JOIN Games g ON gk.game_id = g.game_id
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE gk.keeper_id = %s
-        ORDER BY g.date_played DESC, g.start_time DESC
-        """
+        games = GameQuery().for_keeper(keeper_id).fetch_all(cursor)
+        cursor.close()
         
-        cursor.execute(query, (keeper_id,))
-        games = cursor.fetchall()
+        return jsonify(games), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/stat-keepers/assign", methods=["POST"])
+def auto_assign_stat_keepers():
+    """Give every selected game without a stat keeper one, balancing the keepers' loads.
+    
+    Body (all optional): game_ids, league_id, min_date and max_date select the
+    games (default: every game from today on), keeper_ids limits the keepers
+    (default: all of them) and dry_run returns the assignment without writing it.
+    """
+    try:
+        data = request.get_json() or {}
+        
+        try:
+            game_ids = [int(game_id) for game_id in data.get("game_ids") or []]
+            keeper_ids = [int(keeper_id) for keeper_id in data.get("keeper_ids") or []]
+            league_id = int(data["league_id"]) if data.get("league_id") else None
+            min_date = parse_date(data["min_date"], "min_date") if data.get("min_date") else None
+            max_date = parse_date(data["max_date"], "max_date") if data.get("max_date") else None
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        
+        cursor = db.get_db().cursor()
+        
+        loads = keeper_loads(cursor, keeper_ids)
+        if not loads:
+            cursor.close()
+            return jsonify({"error": "No stat keepers to assign"}), 400
+        
+        games = unassigned_games(cursor, game_ids, league_id, min_date, max_date)
+        if len(games) > MAX_CHECKED_GAMES:
+            cursor.close()
+            return jsonify({"error": f"At most {MAX_CHECKED_GAMES} games per request"}), 400
+        
+        assignments, unassigned = [], []
+        if games:
+            dates = [game["date_played"] for game in games]
+            index = ScheduleIndex.load(cursor, min(dates), max(dates))
+            assignments, unassigned = assign_keepers(games, loads, index)
+        
+        dry_run = bool(data.get("dry_run"))
+        if assignments and not dry_run:
+            insert_assignments(cursor, assignments)
+            bump_versions(cursor, {("game", assignment["game_id"]) for assignment in assignments}
+                          | {("keeper", assignment["keeper_id"]) for assignment in assignments}, resolve=False)
+            db.get_db().commit()
         cursor.close()
         
-        games = convert_datetime_for_json(games)
+        games_by_id = {game["game_id"]: game for game in games}
+        assigned_counts = {}
+        for assignment in assignments:
+            game = games_by_id[assignment["game_id"]]
+            assignment.update(date_played=game["date_played"], start_time=game["start_time"], location=game["location"])
+            assigned_counts[assignment["keeper_id"]] = assigned_counts.get(assignment["keeper_id"], 0) + 1
         
-        return jsonify(games), 200
+        return jsonify({
+            "message": f"{'Previewed' if dry_run else 'Assigned'} stat keepers for {len(assignments)} of {len(games)} games",
+            "dry_run": dry_run,
+            "assignments": assignments,
+            "unassigned_game_ids": unassigned,
+            "keeper_loads": [{"keeper_id": keeper_id, "load_before": load, "assigned": assigned_counts.get(keeper_id, 0),
+                              "load_after": load + assigned_counts.get(keeper_id, 0)}
+                             for keeper_id, load in sorted(loads.items())]
+        }), 200 if dry_run or not assignments else 201
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @system_admin.route("/analytics/dashboard", methods=["GET"])
+@versioned()
 def get_analytics_dashboard():
     try:
         cursor = db.get_db().cursor()
@@ -2825,12 +3474,6 @@ def get_analytics_dashboard():
         
         cursor.close()
         
-        # Convert to JSON format
-        popular_sports = convert_datetime_for_json(popular_sports)
-        busiest_days = convert_datetime_for_json(busiest_days)
-        active_teams = convert_datetime_for_json(active_teams)
-        active_players = convert_datetime_for_json(active_players)
-        
         result = {
             "overall_statistics": stats,
             "popular_sports": popular_sports,
@@ -2842,3 +3485,55 @@ def get_analytics_dashboard():
         return jsonify(result), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/analytics/db-pool", methods=["GET"])
+def get_db_pool_stats():
+    """Connection pool size, checkout and wait-time counters for this API process"""
+    stats = db.pool_stats()
+    if stats is None:
+        return jsonify({"message": "Connection pool has not been used yet"}), 200
+    return jsonify(stats), 200
+
+
+@system_admin.route("/schema/refresh", methods=["POST"])
+def refresh_schema_registry():
+    """Reload the cached table/column registry, e.g. after running
+    `python -m backend.migrations upgrade` against a live API"""
+    try:
+        tables = db.schema.refresh(db.get_db())
+        return jsonify({"message": "Schema registry refreshed", "tables": tables}), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@system_admin.route("/standings/rebuild", methods=["POST"])
+def rebuild_league_standings():
+    """Regenerate LeagueStandings from finalized games.
+    Pass ?league_id=<id> to rebuild a single league."""
+    try:
+        league_id = request.args.get("league_id", type=int)
+        
+        cursor = db.get_db().cursor()
+        
+        if league_id is not None:
+            cursor.execute("SELECT league_id FROM Leagues WHERE league_id = %s", (league_id,))
+            if not cursor.fetchone():
+                cursor.close()
+                return jsonify({"error": "League not found"}), 404
+        
+        result = rebuild_standings(cursor, league_id)
+        
+        # Every rebuilt team's record (and its league's standings) can have changed
+        if league_id is None:
+            cursor.execute("SELECT team_id FROM Teams")
+        else:
+            cursor.execute("SELECT team_id FROM Teams WHERE league_played = %s", (league_id,))
+        bump_versions(cursor, {("team", row["team_id"]) for row in cursor.fetchall()} | {("league", league_id)})
+        
+        db.get_db().commit()
+        cursor.close()
+        
+        return jsonify(result), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,298 @@
+#------------------------------------------------------------
+# Team performance analytics for the team captain routes.
+#
+# load_team_games() fetches every counted game of a team in one
+# query (Games by home_team_id / away_team_id + opponent), already
+# oriented from the team's point of view: points_for,
+# points_against, result ("W" / "L" / "T"), home or away and the
+# opponent. The summaries below are computed from that list in
+# Python, so the performance, home/away, head-to-head and time
+# series endpoints no longer re-join Games x Teams_Games once per
+# metric, and a caller that needs several of them (e.g. a team
+# dashboard) can share one fetch.
+#
+# A game counts once it is finalized (Games.is_finalized) with
+# both scores recorded and belongs to the team's league - the same
+# games LeagueStandings is built from (see backend/standings), so
+# the splits, head-to-head and time series add up to the record
+# the performance, summary and league comparison sections read
+# from the standings.
+#
+# team_dashboard() assembles the captain dashboard sections
+# (summary, league comparison, splits, opponents, ...) from one
+# team/standings lookup and one game fetch.
+#------------------------------------------------------------
+
+DASHBOARD_SECTIONS = [
+    "summary", "performance", "league_comparison", "home_away_splits",
+    "opponents", "head_to_head", "performance_over_time",
+]
+
+# Sections computed from load_team_games()
+_GAME_SECTIONS = {"home_away_splits", "head_to_head", "performance_over_time"}
+
+
+def load_team_games(cursor, team_id):
+    """Return the team's finalized games in its league, oldest first, from its own perspective"""
+    cursor.execute("""
+        SELECT g.game_id, g.date_played, g.start_time, g.location,
+               g.home_score, g.away_score,
+               g.home_team_id = %s AS is_home_team,
+               ot.team_id AS opponent_id, ot.name AS opponent_name
+        FROM Games g
+        JOIN Teams t ON t.team_id = %s AND g.league_played = t.league_played
+        LEFT JOIN Teams ot
+               ON ot.team_id = IF(g.home_team_id = %s, g.away_team_id, g.home_team_id)
+        WHERE (g.home_team_id = %s OR g.away_team_id = %s)
+          AND g.is_finalized = TRUE
+          AND g.home_score IS NOT NULL
+          AND g.away_score IS NOT NULL
+        ORDER BY g.date_played, g.start_time, g.game_id
+    """, (team_id, team_id, team_id, team_id, team_id))
+
+    games = []
+    for row in cursor.fetchall():
+        if row["is_home_team"]:
+            points_for, points_against = row["home_score"], row["away_score"]
+        else:
+            points_for, points_against = row["away_score"], row["home_score"]
+
+        if points_for > points_against:
+            result = "W"
+        elif points_for < points_against:
+            result = "L"
+        else:
+            result = "T"
+
+        games.append({
+            "game_id": row["game_id"],
+            "date_played": row["date_played"],
+            "start_time": row["start_time"],
+            "location": row["location"],
+            "is_home_team": bool(row["is_home_team"]),
+            "opponent_id": row["opponent_id"],
+            "opponent_name": row["opponent_name"],
+            "points_for": points_for,
+            "points_against": points_against,
+            "result": result,
+        })
+    return games
+
+
+def summarize_record(games):
+    """W/L/T and scoring averages over a list of games from load_team_games()"""
+    total = len(games)
+    wins = sum(1 for game in games if game["result"] == "W")
+    losses = sum(1 for game in games if game["result"] == "L")
+    points_for = sum(game["points_for"] for game in games)
+    points_against = sum(game["points_against"] for game in games)
+
+    return {
+        "games_played": total,
+        "wins": wins,
+        "losses": losses,
+        "ties": total - wins - losses,
+        "points_for": points_for,
+        "points_against": points_against,
+        "avg_points_scored": points_for / total if total else 0.0,
+        "avg_points_allowed": points_against / total if total else 0.0,
+    }
+
+
+def home_away_splits(games):
+    """One summary row per location type, Home first"""
+    splits = []
+    for location_type, is_home in (("Home", True), ("Away", False)):
+        record = summarize_record([game for game in games if game["is_home_team"] == is_home])
+        splits.append({
+            "location_type": location_type,
+            "total_games": record["games_played"],
+            "wins": record["wins"],
+            "losses": record["losses"],
+            "ties": record["ties"],
+            "avg_points_scored": record["avg_points_scored"] if record["games_played"] else None,
+            "avg_points_allowed": record["avg_points_allowed"] if record["games_played"] else None,
+        })
+    return splits
+
+
+def head_to_head(games):
+    """Per-opponent records keyed by opponent team_id"""
+    by_opponent = {}
+    for game in games:
+        if game["opponent_id"] is None:
+            continue
+        by_opponent.setdefault(game["opponent_id"], []).append(game)
+
+    opponents = {}
+    for opponent_id, opponent_games in by_opponent.items():
+        record = summarize_record(opponent_games)
+        opponents[opponent_id] = {
+            "opponent_id": opponent_id,
+            "opponent_name": opponent_games[0]["opponent_name"],
+            "total_games": record["games_played"],
+            "wins": record["wins"],
+            "losses": record["losses"],
+            "ties": record["ties"],
+            "avg_points_scored": record["avg_points_scored"],
+            "avg_points_allowed": record["avg_points_allowed"],
+        }
+    return opponents
+
+
+def performance_over_time(games):
+    """Game-by-game time series, oldest first"""
+    return [
+        {
+            "game_id": game["game_id"],
+            "date_played": game["date_played"],
+            "points_scored": game["points_for"],
+            "points_allowed": game["points_against"],
+            "result": game["result"],
+        }
+        for game in games
+    ]
+
+
+def load_team(cursor, team_id):
+    """The team, its league and its LeagueStandings record in one row (None if no such team)"""
+    cursor.execute("""
+        SELECT t.team_id, t.name, t.league_played, l.name AS league_name,
+               ls.games_played, ls.wins, ls.losses, ls.ties,
+               ls.points_for, ls.points_against, ls.win_percentage,
+               ls.streak, ls.standing_rank
+        FROM Teams t
+        LEFT JOIN Leagues l ON t.league_played = l.league_id
+        LEFT JOIN LeagueStandings ls ON ls.league_id = t.league_played AND ls.team_id = t.team_id
+        WHERE t.team_id = %s
+    """, (team_id,))
+    return cursor.fetchone()
+
+
+def team_performance(team):
+    """Record and scoring averages from a load_team() row"""
+    if team["games_played"] is None:
+        return {
+            "games_played": 0,
+            "wins": 0,
+            "losses": 0,
+            "ties": 0,
+            "avg_points_scored": 0
+        }
+
+    games_played = team["games_played"]
+    return {
+        "games_played": games_played,
+        "wins": team["wins"],
+        "losses": team["losses"],
+        "ties": team["ties"],
+        "points_for": team["points_for"],
+        "points_against": team["points_against"],
+        "win_percentage": float(team["win_percentage"]),
+        "streak": team["streak"],
+        "standing_rank": team["standing_rank"],
+        "avg_points_scored": team["points_for"] / games_played if games_played else 0.0,
+        "avg_points_allowed": team["points_against"] / games_played if games_played else 0.0,
+    }
+
+
+def team_summary(cursor, team):
+    """Captain summary card: record, standing and roster/stat counts"""
+    cursor.execute("""
+        SELECT (SELECT COUNT(DISTINCT tp.player_id)
+                FROM Teams_Players tp
+                WHERE tp.team_id = %s) AS total_players,
+               (SELECT COUNT(se.event_id)
+                FROM StatEvent se
+                JOIN Teams_Games tg ON se.scored_during = tg.game_id
+                JOIN Teams_Players tp ON se.performed_by = tp.player_id
+                WHERE tg.team_id = %s AND tp.team_id = %s) AS total_stat_events
+    """, (team["team_id"], team["team_id"], team["team_id"]))
+    counts = cursor.fetchone() or {}
+
+    summary = {
+        "name": team["name"],
+        "wins": team["wins"] or 0,
+        "losses": team["losses"] or 0,
+        "ties": team["ties"] or 0,
+        "games_played": team["games_played"] or 0,
+        "standing_rank": team["standing_rank"],
+        "streak": team["streak"],
+        "total_players": counts.get("total_players") or 0,
+        "total_stat_events": counts.get("total_stat_events") or 0
+    }
+    if team["league_name"] is not None:
+        summary["league_name"] = team["league_name"]
+    return summary
+
+
+def league_comparison(cursor, team):
+    """Team vs league-wide scoring averages from the materialized standings"""
+    cursor.execute("""
+        SELECT SUM(ls.points_for) AS league_points_for,
+               SUM(ls.points_against) AS league_points_against,
+               SUM(ls.games_played) AS league_games_played
+        FROM LeagueStandings ls
+        WHERE ls.league_id = %s
+    """, (team["league_played"],))
+    league = cursor.fetchone() or {}
+
+    def average(points, games):
+        return float(points) / float(games) if points and games else 0
+
+    return {
+        "team": {
+            "avg_points_scored": average(team["points_for"], team["games_played"]),
+            "avg_points_allowed": average(team["points_against"], team["games_played"])
+        },
+        "league": {
+            "avg_points_scored": average(league.get("league_points_for"), league.get("league_games_played")),
+            "avg_points_allowed": average(league.get("league_points_against"), league.get("league_games_played"))
+        }
+    }
+
+
+def load_opponents(cursor, team_id):
+    """Every team this team has been scheduled against, by name"""
+    cursor.execute("""
+        SELECT DISTINCT t2.team_id, t2.name
+        FROM Teams_Games tg1
+        JOIN Teams_Games tg2 ON tg1.game_id = tg2.game_id AND tg2.team_id != tg1.team_id
+        JOIN Teams t2 ON tg2.team_id = t2.team_id
+        WHERE tg1.team_id = %s
+        ORDER BY t2.name
+    """, (team_id,))
+    return cursor.fetchall()
+
+
+def team_dashboard(cursor, team_id, sections=None):
+    """Build the requested DASHBOARD_SECTIONS (all by default) for a team.
+
+    Returns None if the team does not exist. The team's counted games
+    are fetched at most once, and only if a section needs them.
+    """
+    sections = DASHBOARD_SECTIONS if sections is None else sections
+
+    team = load_team(cursor, team_id)
+    if not team:
+        return None
+
+    games = load_team_games(cursor, team_id) if _GAME_SECTIONS.intersection(sections) else []
+
+    dashboard = {"team_id": team_id}
+    for section in sections:
+        if section == "summary":
+            dashboard[section] = team_summary(cursor, team)
+        elif section == "performance":
+            dashboard[section] = team_performance(team)
+        elif section == "league_comparison":
+            dashboard[section] = league_comparison(cursor, team)
+        elif section == "home_away_splits":
+            dashboard[section] = home_away_splits(games)
+        elif section == "opponents":
+            dashboard[section] = load_opponents(cursor, team_id)
+        elif section == "head_to_head":
+            dashboard[section] = list(head_to_head(games).values())
+        elif section == "performance_over_time":
+            dashboard[section] = performance_over_time(games)
+    return dashboard
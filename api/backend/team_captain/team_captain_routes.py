@@ -1,106 +1,54 @@
 from flask import Blueprint, jsonify, request
+from backend.conflicts import conflict_error, find_game_conflicts, game_keeper_ids
 from backend.db_connection import db
+from backend.game_queries import OLDEST_FIRST, GameQuery
+from backend.game_teams import sync_game_teams
+from backend.live_feed import publish_game_changes
+from backend.scoring import apply_event_score, classify_stat_event, get_game_sport_id
+from backend.standings import get_game_team_ids, refresh_game_standings, refresh_team_standings
+from backend.stat_sync import SyncCursor, deleted_since, delta_condition, mark_changed, record_deleted
+from backend.team_analytics import (
+    DASHBOARD_SECTIONS, head_to_head, home_away_splits, league_comparison, load_opponents,
+    load_team, load_team_games, performance_over_time, team_dashboard, team_performance, team_summary,
+)
+from backend.versions import bump_versions, game_entities, versioned
 from mysql.connector import Error
-from datetime import datetime, timedelta, date, time
+from datetime import date
 
 team_captain = Blueprint("team_captain", __name__)
 
 
-def convert_datetime_for_json(data):
-    if isinstance(data, list):
-        for item in data:
-            convert_datetime_for_json(item)
-    elif isinstance(data, dict):
-        for key, value in data.items():
-            if value is None:
-                continue
-            elif isinstance(value, timedelta):
-                total_seconds = int(value.total_seconds())
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                seconds = total_seconds % 60
-                data[key] = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            elif isinstance(value, time):
-                data[key] = value.strftime('%H:%M:%S')
-            elif isinstance(value, date):
-                data[key] = value.isoformat()
-            elif isinstance(value, datetime):
-                data[key] = value.isoformat()
-    return data
-
-
 @team_captain.route("/teams/<int:team_id>/games", methods=["GET"])
+@versioned("team")
 def get_team_games(team_id):
     try:
         cursor = db.get_db().cursor()
         
         upcoming_only = request.args.get("upcoming_only", "false").lower() == "true"
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location, 
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        WHERE (tg1.team_id = %s OR tg2.team_id = %s)
-        """
-        
-        params = [team_id, team_id]
-        
+        query = GameQuery().for_team(team_id).upcoming(upcoming_only)
         if upcoming_only:
-            query += " AND g.date_played >= CURRENT_DATE()"
-            query += " ORDER BY g.date_played ASC, g.start_time ASC"
-        else:
-            query += " AND g.date_played < CURRENT_DATE()"
-            query += " ORDER BY g.date_played DESC, g.start_time DESC"
-        
-        cursor.execute(query, params)
-        games = cursor.fetchall()
+            query.order_by(*OLDEST_FIRST)
+        games = query.fetch_all(cursor)
         cursor.close()
         
-        games = convert_datetime_for_json(games)
-        
         return jsonify(games), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @team_captain.route("/games/<int:game_id>", methods=["GET"])
+@versioned("game")
 def get_game(game_id):
     try:
         cursor = db.get_db().cursor()
         
-        query = """
-        SELECT g.game_id, g.date_played, g.start_time, g.location, 
-               g.home_score, g.away_score, g.league_played,
-               t1.name AS home_team, t1.team_id AS home_team_id,
-               t2.name AS away_team, t2.team_id AS away_team_id,
-               l.name AS league_name, s.name AS sport_name
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.is_home_team = TRUE
-        JOIN Teams t1 ON tg1.team_id = t1.team_id
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.is_home_team = FALSE
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        JOIN Leagues l ON g.league_played = l.league_id
-        JOIN Sports s ON l.sport_played = s.sport_id
-        WHERE g.game_id = %s
-        """
-        
-        cursor.execute(query, (game_id,))
-        game = cursor.fetchone()
+        game = GameQuery().for_game(game_id).fetch_one(cursor)
         cursor.close()
         
         if not game:
             return jsonify({"error": "Game not found"}), 404
         
-        game = convert_datetime_for_json(game)
-        
         return jsonify(game), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -136,6 +84,15 @@ def create_game():
             cursor.close()
             return jsonify({"error": "Away team not found or not in specified league"}), 404
         
+        try:
+            conflicts = find_game_conflicts(cursor, data)
+        except ValueError as e:
+            cursor.close()
+            return jsonify({"error": str(e)}), 400
+        if conflicts and not data.get("allow_conflicts"):
+            cursor.close()
+            return jsonify({"error": conflict_error(conflicts), "conflicts": conflicts}), 409
+        
         insert_query = """
         INSERT INTO Games (league_played, date_played, start_time, location)
         VALUES (%s, %s, %s, %s)
@@ -161,6 +118,11 @@ def create_game():
             "INSERT INTO Teams_Games (team_id, game_id, is_home_team) VALUES (%s, %s, FALSE)",
             (data["away_team_id"], new_game_id)
         )
+        sync_game_teams(cursor, new_game_id)
+        bump_versions(cursor, game_entities({
+            "game_id": new_game_id, "league_played": data["league_played"],
+            "home_team_id": data["home_team_id"], "away_team_id": data["away_team_id"],
+        }), resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -180,7 +142,8 @@ def update_game(game_id):
         cursor = db.get_db().cursor()
         
         cursor.execute("SELECT * FROM Games WHERE game_id = %s", (game_id,))
-        if not cursor.fetchone():
+        game = cursor.fetchone()
+        if not game:
             return jsonify({"error": "Game not found"}), 404
         
         update_fields = []
@@ -195,11 +158,31 @@ def update_game(game_id):
         if not update_fields:
             return jsonify({"error": "No valid fields to update"}), 400
         
+        # Moving the game can double-book its teams, location or stat keepers
+        schedule_fields = [field for field in ("date_played", "start_time", "location") if field in data]
+        if schedule_fields and not data.get("allow_conflicts"):
+            moved = dict(game, keeper_ids=game_keeper_ids(cursor, game_id))
+            moved.update({field: data[field] for field in schedule_fields})
+            try:
+                conflicts = find_game_conflicts(cursor, moved, ignore_game_id=game_id)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            if conflicts:
+                return jsonify({"error": conflict_error(conflicts), "conflicts": conflicts}), 409
+        
         params.append(game_id)
         query = f"UPDATE Games SET {', '.join(update_fields)} WHERE game_id = %s"
         
         cursor.execute(query, params)
+        
+        # Editing a finalized result changes the league standings
+        if game.get("is_finalized") and any(field in data for field in allowed_fields if field != "location"):
+            refresh_game_standings(cursor, game_id)
+        bump_versions(cursor, game_entities(game), resolve=False)
+        
         db.get_db().commit()
+        if "home_score" in data or "away_score" in data:
+            publish_game_changes(cursor, game_id)
         cursor.close()
         
         return jsonify({"message": "Game updated successfully"}), 200
@@ -212,7 +195,10 @@ def delete_game(game_id):
     try:
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT game_id, date_played FROM Games WHERE game_id = %s", (game_id,))
+        cursor.execute("""
+            SELECT game_id, date_played, is_finalized, league_played, home_team_id, away_team_id
+            FROM Games WHERE game_id = %s
+        """, (game_id,))
         game = cursor.fetchone()
         
         if not game:
@@ -227,8 +213,11 @@ def delete_game(game_id):
         if game_date < today:
             cursor.close()
             return jsonify({"error": "Cannot delete past games"}), 400
+        team_ids = get_game_team_ids(cursor, game_id) if game["is_finalized"] else []
+        bump_versions(cursor, game_entities(game), resolve=False)
         cursor.execute("DELETE FROM Teams_Games WHERE game_id = %s", (game_id,))
         cursor.execute("DELETE FROM Games WHERE game_id = %s", (game_id,))
+        refresh_team_standings(cursor, team_ids)
         
         db.get_db().commit()
         cursor.close()
@@ -241,6 +230,7 @@ def delete_game(game_id):
 
 
 @team_captain.route("/games/<int:game_id>/teams/<int:team_id>/stats", methods=["GET"])
+@versioned("game", "team")
 def get_team_game_stats(game_id, team_id):
     try:
         cursor = db.get_db().cursor()
@@ -265,6 +255,15 @@ def get_team_game_stats(game_id, team_id):
         return jsonify({"error": str(e)}), 500
 
 
+# A stat event with the game it belongs to (for the score, standings and version bumps)
+STAT_EVENT_WITH_GAME_QUERY = """
+    SELECT se.*, g.game_id, g.league_played, g.home_team_id, g.away_team_id, g.is_finalized
+    FROM StatEvent se
+    JOIN Games g ON g.game_id = se.scored_during
+    WHERE se.event_id = %s
+"""
+
+
 @team_captain.route("/stats/<int:event_id>", methods=["PUT"])
 def update_stat_event(event_id):
     try:
@@ -272,21 +271,36 @@ def update_stat_event(event_id):
         
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT * FROM StatEvent WHERE event_id = %s", (event_id,))
-        if not cursor.fetchone():
+        cursor.execute(STAT_EVENT_WITH_GAME_QUERY, (event_id,))
+        old_event = cursor.fetchone()
+        if not old_event:
             return jsonify({"error": "Stat event not found"}), 404
         
         if "description" not in data:
             return jsonify({"error": "Missing required field: description"}), 400
         
+        game_id = old_event["scored_during"]
+        stat_type_id, description, points = classify_stat_event(
+            cursor, get_game_sport_id(cursor, game_id), data["description"]
+        )
+        
         update_query = """
         UPDATE StatEvent
-        SET description = %s
+        SET description = %s, stat_type_id = %s, points = %s
         WHERE event_id = %s
         """
-        cursor.execute(update_query, (data["description"], event_id))
+        cursor.execute(update_query, (description, stat_type_id, points, event_id))
+        mark_changed(cursor, game_id, [event_id])
+        
+        # Keep the game score (and a finalized game's standings) in line with the event's new point value
+        score_changed = apply_event_score(cursor, game_id, old_event["performed_by"], old_event["points"], sign=-1)
+        score_changed |= apply_event_score(cursor, game_id, old_event["performed_by"], points)
+        if score_changed and old_event["is_finalized"]:
+            refresh_game_standings(cursor, game_id)
+        bump_versions(cursor, game_entities(old_event) | {("player", old_event["performed_by"])}, resolve=False)
         
         db.get_db().commit()
+        publish_game_changes(cursor, game_id, updated=[event_id])
         cursor.close()
         
         return jsonify({"message": "Stat event updated successfully"}), 200
@@ -299,12 +313,19 @@ def delete_stat_event(event_id):
     try:
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT * FROM StatEvent WHERE event_id = %s", (event_id,))
-        if not cursor.fetchone():
+        cursor.execute(STAT_EVENT_WITH_GAME_QUERY, (event_id,))
+        old_event = cursor.fetchone()
+        if not old_event:
             return jsonify({"error": "Stat event not found"}), 404
         
         cursor.execute("DELETE FROM StatEvent WHERE event_id = %s", (event_id,))
+        record_deleted(cursor, old_event["scored_during"], [old_event])
+        if apply_event_score(cursor, old_event["scored_during"], old_event["performed_by"], old_event["points"], sign=-1) \
+                and old_event["is_finalized"]:
+            refresh_game_standings(cursor, old_event["scored_during"])
+        bump_versions(cursor, game_entities(old_event) | {("player", old_event["performed_by"])}, resolve=False)
         db.get_db().commit()
+        publish_game_changes(cursor, old_event["scored_during"], deleted=[event_id], score=old_event["points"] > 0)
         cursor.close()
         
         return jsonify({"message": "Stat event deleted successfully"}), 200
@@ -313,64 +334,18 @@ def delete_stat_event(event_id):
 
 
 @team_captain.route("/teams/<int:team_id>/performance", methods=["GET"])
+@versioned("team")
 def get_team_performance(team_id):
     try:
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT team_id FROM Teams WHERE team_id = %s", (team_id,))
-        if not cursor.fetchone():
-            cursor.close()
-            return jsonify({"error": "Team not found"}), 404
-        query = """
-        SELECT 
-            (SELECT COUNT(*) FROM Games g2
-             JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-             WHERE tg2.team_id = %s AND g2.date_played < CURRENT_DATE() 
-             AND g2.home_score IS NOT NULL AND g2.away_score IS NOT NULL
-             AND ((tg2.is_home_team = TRUE AND g2.home_score > g2.away_score) OR 
-                  (tg2.is_home_team = FALSE AND g2.away_score > g2.home_score))) AS wins,
-            (SELECT COUNT(*) FROM Games g2
-             JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-             WHERE tg2.team_id = %s AND g2.date_played < CURRENT_DATE() 
-             AND g2.home_score IS NOT NULL AND g2.away_score IS NOT NULL
-             AND ((tg2.is_home_team = TRUE AND g2.home_score < g2.away_score) OR 
-                  (tg2.is_home_team = FALSE AND g2.away_score < g2.home_score))) AS losses,
-            (SELECT COUNT(*) FROM Games g2
-             JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-             WHERE tg2.team_id = %s AND g2.date_played < CURRENT_DATE() 
-             AND g2.home_score IS NOT NULL AND g2.away_score IS NOT NULL
-             AND g2.home_score = g2.away_score) AS ties,
-            (SELECT AVG(points) FROM (
-                SELECT g2.home_score AS points FROM Games g2
-                JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                WHERE tg2.team_id = %s AND tg2.is_home_team = TRUE AND g2.date_played < CURRENT_DATE() 
-                AND g2.home_score IS NOT NULL AND g2.away_score IS NOT NULL
-                UNION ALL
-                SELECT g2.away_score AS points FROM Games g2
-                JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                WHERE tg2.team_id = %s AND tg2.is_home_team = FALSE AND g2.date_played < CURRENT_DATE() 
-                AND g2.home_score IS NOT NULL AND g2.away_score IS NOT NULL
-            ) AS combined_points) AS avg_points_scored
-        """
-        
-        cursor.execute(query, (team_id, team_id, team_id, team_id, team_id))
-        performance = cursor.fetchone()
+        team = load_team(cursor, team_id)
         cursor.close()
         
-        if not performance:
-            return jsonify({
-                "games_played": 0,
-                "wins": 0,
-                "losses": 0,
-                "ties": 0,
-                "avg_points_scored": 0
-            }), 200
-        
-        performance["wins"] = performance["wins"] or 0
-        performance["losses"] = performance["losses"] or 0
-        performance["ties"] = performance["ties"] or 0
-        performance["games_played"] = performance["wins"] + performance["losses"] + performance["ties"]
-        performance["avg_points_scored"] = float(performance["avg_points_scored"]) if performance["avg_points_scored"] else 0.0
+        if not team:
+            return jsonify({"error": "Team not found"}), 404
+        
+        performance = team_performance(team)
         
         return jsonify(performance), 200
     except Error as e:
@@ -378,49 +353,15 @@ def get_team_performance(team_id):
 
 
 @team_captain.route("/teams/<int:team_id>/performance-over-time", methods=["GET"])
+@versioned("team")
 def get_team_performance_over_time(team_id):
     try:
         cursor = db.get_db().cursor()
         
-        query = """
-        SELECT g.date_played,
-               (SELECT g2.home_score FROM Games g2
-                JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                WHERE tg2.game_id = g.game_id AND tg2.team_id = %s AND tg2.is_home_team = TRUE
-                UNION ALL
-                SELECT g2.away_score FROM Games g2
-                JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                WHERE tg2.game_id = g.game_id AND tg2.team_id = %s AND tg2.is_home_team = FALSE
-                LIMIT 1) AS points_scored,
-               (SELECT g2.away_score FROM Games g2
-                JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                WHERE tg2.game_id = g.game_id AND tg2.team_id = %s AND tg2.is_home_team = TRUE
-                UNION ALL
-                SELECT g2.home_score FROM Games g2
-                JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                WHERE tg2.game_id = g.game_id AND tg2.team_id = %s AND tg2.is_home_team = FALSE
-                LIMIT 1) AS points_allowed,
-               (SELECT 'W' FROM Teams_Games tg2 JOIN Games g2 ON tg2.game_id = g2.game_id
-                WHERE tg2.game_id = g.game_id AND tg2.team_id = %s 
-                AND ((tg2.is_home_team = TRUE AND g2.home_score > g2.away_score) OR 
-                     (tg2.is_home_team = FALSE AND g2.away_score > g2.home_score))
-                UNION ALL
-                SELECT 'L'
-                LIMIT 1) AS result
-        FROM Games g
-        JOIN Teams_Games tg ON g.game_id = tg.game_id
-        WHERE tg.team_id = %s 
-          AND g.date_played < CURRENT_DATE()
-          AND g.home_score IS NOT NULL 
-          AND g.away_score IS NOT NULL
-        ORDER BY g.date_played ASC
-        """
-        
-        cursor.execute(query, (team_id, team_id, team_id, team_id, team_id, team_id))
-        performance_data = cursor.fetchall()
+        games = load_team_games(cursor, team_id)
         cursor.close()
         
-        performance_data = convert_datetime_for_json(performance_data)
+        performance_data = performance_over_time(games)
         
         return jsonify(performance_data), 200
     except Error as e:
@@ -428,148 +369,66 @@ def get_team_performance_over_time(team_id):
 
 
 @team_captain.route("/teams/<int:team_id>/league-comparison", methods=["GET"])
+@versioned("team")
 def get_team_league_comparison(team_id):
     try:
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT league_played FROM Teams WHERE team_id = %s", (team_id,))
-        team = cursor.fetchone()
+        team = load_team(cursor, team_id)
         if not team:
+            cursor.close()
             return jsonify({"error": "Team not found"}), 404
         
-        league_id = team["league_played"]
-        
-        query = """
-        SELECT t.name AS team_name,
-               AVG(g.home_score) AS avg_home_score,
-               AVG(g.away_score) AS avg_away_score,
-               (SELECT AVG(home_score) FROM Games WHERE league_played = %s) AS league_avg_home_score,
-               (SELECT AVG(away_score) FROM Games WHERE league_played = %s) AS league_avg_away_score
-        FROM Teams t
-        JOIN Teams_Games tg ON t.team_id = tg.team_id
-        JOIN Games g ON tg.game_id = g.game_id
-        WHERE t.team_id = %s
-        GROUP BY t.team_id, t.name
-        """
-        cursor.execute(query, (league_id, league_id, team_id))
-        result = cursor.fetchone()
+        comparison = league_comparison(cursor, team)
         cursor.close()
         
-        if not result:
-            return jsonify({"error": "Team not found"}), 404
-        
-        team_avg_scored = 0
-        if result["avg_home_score"]:
-            team_avg_scored = float(result["avg_home_score"])
-        
-        team_avg_allowed = 0
-        if result["avg_away_score"]:
-            team_avg_allowed = float(result["avg_away_score"])
-        
-        league_avg_scored = 0
-        if result["league_avg_home_score"]:
-            league_avg_scored = float(result["league_avg_home_score"])
-        
-        league_avg_allowed = 0
-        if result["league_avg_away_score"]:
-            league_avg_allowed = float(result["league_avg_away_score"])
-        
-        comparison = {
-            "team": {
-                "avg_points_scored": team_avg_scored,
-                "avg_points_allowed": team_avg_allowed
-            },
-            "league": {
-                "avg_points_scored": league_avg_scored,
-                "avg_points_allowed": league_avg_allowed
-            }
-        }
-        
         return jsonify(comparison), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @team_captain.route("/teams/<int:team_id>/summary", methods=["GET"])
+@versioned("team")
 def get_team_summary(team_id):
     try:
         cursor = db.get_db().cursor()
         
-        cursor.execute("SELECT team_id, name FROM Teams WHERE team_id = %s", (team_id,))
-        team = cursor.fetchone()
+        team = load_team(cursor, team_id)
         if not team:
             cursor.close()
             return jsonify({"error": "Team not found"}), 404
         
-        cursor.execute("""
-            SELECT COUNT(DISTINCT player_id) AS total_players
-            FROM Teams_Players
-            WHERE team_id = %s
-        """, (team_id,))
-        players_result = cursor.fetchone()
-        total_players = players_result["total_players"] if players_result else 0
+        summary = team_summary(cursor, team)
+        cursor.close()
         
-        cursor.execute("""
-            SELECT 
-                (SELECT COUNT(*) FROM Games g2
-                 JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                 WHERE tg2.team_id = %s AND g2.date_played < CURRENT_DATE() 
-                 AND g2.home_score IS NOT NULL AND g2.away_score IS NOT NULL
-                 AND ((tg2.is_home_team = TRUE AND g2.home_score > g2.away_score) OR 
-                      (tg2.is_home_team = FALSE AND g2.away_score > g2.home_score))) AS wins,
-                (SELECT COUNT(*) FROM Games g2
-                 JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                 WHERE tg2.team_id = %s AND g2.date_played < CURRENT_DATE() 
-                 AND g2.home_score IS NOT NULL AND g2.away_score IS NOT NULL
-                 AND ((tg2.is_home_team = TRUE AND g2.home_score < g2.away_score) OR 
-                      (tg2.is_home_team = FALSE AND g2.away_score < g2.home_score))) AS losses,
-                (SELECT COUNT(*) FROM Games g2
-                 JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-                 WHERE tg2.team_id = %s AND g2.date_played < CURRENT_DATE() 
-                 AND g2.home_score IS NOT NULL AND g2.away_score IS NOT NULL
-                 AND g2.home_score = g2.away_score) AS ties
-        """, (team_id, team_id, team_id))
-        game_stats = cursor.fetchone()
-        
-        wins = game_stats["wins"] or 0 if game_stats else 0
-        losses = game_stats["losses"] or 0 if game_stats else 0
-        ties = game_stats["ties"] or 0 if game_stats else 0
-        games_played = wins + losses + ties
+        return jsonify(summary), 200
+    except Error as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@team_captain.route("/teams/<int:team_id>/dashboard", methods=["GET"])
+@versioned("team")
+def get_team_dashboard(team_id):
+    try:
+        sections = None
+        if request.args.get("sections"):
+            sections = [section.strip() for section in request.args["sections"].split(",") if section.strip()]
+            unknown = [section for section in sections if section not in DASHBOARD_SECTIONS]
+            if unknown:
+                return jsonify({
+                    "error": f"Unknown sections: {', '.join(unknown)}",
+                    "valid_sections": DASHBOARD_SECTIONS
+                }), 400
         
-        cursor.execute("""
-            SELECT COUNT(se.event_id) AS total_stat_events
-            FROM StatEvent se
-            JOIN Games g ON se.scored_during = g.game_id
-            JOIN Teams_Games tg ON g.game_id = tg.game_id
-            JOIN Teams_Players tp ON se.performed_by = tp.player_id
-            WHERE tg.team_id = %s AND tp.team_id = %s
-        """, (team_id, team_id))
-        stat_events_result = cursor.fetchone()
-        total_stat_events = stat_events_result["total_stat_events"] if stat_events_result else 0
+        cursor = db.get_db().cursor()
         
-        cursor.execute("""
-            SELECT l.name AS league_name
-            FROM Teams t
-            JOIN Leagues l ON t.league_played = l.league_id
-            WHERE t.team_id = %s
-        """, (team_id,))
-        league = cursor.fetchone()
+        dashboard = team_dashboard(cursor, team_id, sections)
         cursor.close()
         
-        summary = {
-            "name": team["name"],
-            "wins": wins,
-            "losses": losses,
-            "ties": ties,
-            "games_played": games_played,
-            "total_players": total_players,
-            "total_stat_events": total_stat_events
-        }
-        
-        if league:
-            summary["league_name"] = league["league_name"]
+        if dashboard is None:
+            return jsonify({"error": "Team not found"}), 404
         
-        return jsonify(summary), 200
+        return jsonify(dashboard), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
@@ -623,9 +482,10 @@ def create_reminder():
                 data.get("priority", "medium")
             ),
         )
+        new_reminder_id = cursor.lastrowid
+        bump_versions(cursor, {("team", data["team_id"])}, resolve=False)
         
         db.get_db().commit()
-        new_reminder_id = cursor.lastrowid
         cursor.close()
         
         return jsonify({"message": "Reminder created successfully", "reminder_id": new_reminder_id}), 201
@@ -643,45 +503,48 @@ def create_reminder():
         return jsonify({"error": f"Unexpected error: {error_msg}"}), 500
 
 
-@team_captain.route("/teams/<int:team_id>/reminders", methods=["GET"])
-def get_team_reminders(team_id):
-    try:
-        cursor = db.get_db().cursor()
-        
-        query = """
+TEAM_REMINDERS_QUERY = """
         SELECT r.reminder_id, r.message, r.time_sent, r.status, r.game_id, r.priority, 
                g.date_played, g.home_score, g.away_score,
-               (SELECT t.name FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = TRUE 
-                LIMIT 1) AS home_team,
-               (SELECT t.name FROM Teams_Games tg 
-                JOIN Teams t ON tg.team_id = t.team_id 
-                WHERE tg.game_id = g.game_id AND tg.is_home_team = FALSE 
-                LIMIT 1) AS away_team
+               home_t.name AS home_team, away_t.name AS away_team
         FROM Reminders r
         LEFT JOIN Games g ON r.game_id = g.game_id
+        LEFT JOIN Teams home_t ON g.home_team_id = home_t.team_id
+        LEFT JOIN Teams away_t ON g.away_team_id = away_t.team_id
         WHERE r.team_id = %s
         ORDER BY r.time_sent DESC
         """
+
+
+@team_captain.route("/teams/<int:team_id>/reminders", methods=["GET"])
+def get_team_reminders(team_id):
+    try:
+        cursor = db.get_db().cursor()
         
-        cursor.execute(query, (team_id,))
+        cursor.execute(TEAM_REMINDERS_QUERY, (team_id,))
         reminders = cursor.fetchall()
         cursor.close()
         
         if not reminders:
             return jsonify([]), 200
         
-        reminders = convert_datetime_for_json(reminders)
-        
         return jsonify(reminders), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @team_captain.route("/games/<int:game_id>/teams/<int:team_id>/stat-events", methods=["GET"])
+@versioned("game", "team")
 def get_game_stat_events(game_id, team_id):
+    """The team's stat events in a game; with ?since= only the changes, as {"seq",
+    "events", "deleted_event_ids"} (see stat_sync). since_event_id / since_time
+    return appended events only, never edits or deleted ids."""
     try:
+        try:
+            sync = SyncCursor.from_args(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
         cursor = db.get_db().cursor()
         
         cursor.execute("""
@@ -693,12 +556,14 @@ def get_game_stat_events(game_id, team_id):
             cursor.close()
             return jsonify({"error": "Team not found in this game"}), 404
         
-        query = """
-        SELECT se.event_id, se.performed_by, se.description, se.time_entered,
-               p.first_name, p.last_name
+        condition, sync_params, seq, reset = delta_condition(cursor, game_id, sync) if sync else (None, [], None, False)
+        
+        query = f"""
+        SELECT se.event_id, se.performed_by, se.description, se.stat_type_id, se.points,
+               se.time_entered, p.first_name, p.last_name
         FROM StatEvent se
         JOIN Players p ON se.performed_by = p.player_id
-        WHERE se.scored_during = %s 
+        WHERE se.scored_during = %s{f" AND {condition}" if condition else ""}
         AND (
             EXISTS (
                 SELECT 1 
@@ -718,55 +583,38 @@ def get_game_stat_events(game_id, team_id):
         ORDER BY se.time_entered ASC
         """
         
-        cursor.execute(query, (game_id, team_id, game_id, team_id))
+        cursor.execute(query, [game_id] + sync_params + [team_id, game_id, team_id])
         stat_events = cursor.fetchall()
-        cursor.close()
         
-        stat_events = convert_datetime_for_json(stat_events)
+        if sync is None:
+            cursor.close()
+            return jsonify(stat_events), 200
+        
+        # Tombstones are per game: ids of the other team's events are simply unknown to the client
+        deleted_event_ids = [] if reset else deleted_since(cursor, game_id, sync.since)
+        cursor.close()
         
-        return jsonify(stat_events), 200
+        return jsonify({
+            "game_id": game_id,
+            "seq": seq,
+            "reset": reset,
+            "events": stat_events,
+            "deleted_event_ids": deleted_event_ids
+        }), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @team_captain.route("/teams/<int:team_id>/home-away-splits", methods=["GET"])
+@versioned("team")
 def get_home_away_splits(team_id):
     try:
         cursor = db.get_db().cursor()
         
-        query = """
-        SELECT 
-            'Home' AS location_type,
-            COUNT(*) AS total_games,
-            (SELECT COUNT(*) FROM Games g2
-             JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-             WHERE tg2.team_id = %s AND tg2.is_home_team = TRUE AND g2.date_played < CURRENT_DATE()
-             AND g2.home_score > g2.away_score) AS wins,
-            AVG(g.home_score) AS avg_points_scored,
-            AVG(g.away_score) AS avg_points_allowed
-        FROM Games g
-        JOIN Teams_Games tg ON g.game_id = tg.game_id
-        WHERE tg.team_id = %s AND tg.is_home_team = TRUE AND g.date_played < CURRENT_DATE()
-        UNION ALL
-        SELECT 
-            'Away' AS location_type,
-            COUNT(*) AS total_games,
-            (SELECT COUNT(*) FROM Games g2
-             JOIN Teams_Games tg2 ON g2.game_id = tg2.game_id
-             WHERE tg2.team_id = %s AND tg2.is_home_team = FALSE AND g2.date_played < CURRENT_DATE()
-             AND g2.away_score > g2.home_score) AS wins,
-            AVG(g.away_score) AS avg_points_scored,
-            AVG(g.home_score) AS avg_points_allowed
-        FROM Games g
-        JOIN Teams_Games tg ON g.game_id = tg.game_id
-        WHERE tg.team_id = %s AND tg.is_home_team = FALSE AND g.date_played < CURRENT_DATE()
-        """
-        
-        cursor.execute(query, (team_id, team_id, team_id, team_id))
-        splits = cursor.fetchall()
+        games = load_team_games(cursor, team_id)
         cursor.close()
         
-        splits = convert_datetime_for_json(splits)
+        splits = home_away_splits(games)
         
         return jsonify(splits), 200
     except Error as e:
@@ -778,83 +626,26 @@ def get_opponent_stats(team_id, opponent_id):
     try:
         cursor = db.get_db().cursor()
         
-        query = """
-        SELECT 
-            COUNT(*) AS total_games,
-            (SELECT COUNT(*) FROM Games g2
-             JOIN Teams_Games tg1_2 ON g2.game_id = tg1_2.game_id AND tg1_2.team_id = %s
-             JOIN Teams_Games tg2_2 ON g2.game_id = tg2_2.game_id AND tg2_2.team_id = %s
-             WHERE g2.date_played < CURRENT_DATE()
-             AND ((tg1_2.is_home_team = TRUE AND g2.home_score > g2.away_score) OR 
-                  (tg1_2.is_home_team = FALSE AND g2.away_score > g2.home_score))) AS wins,
-            (SELECT COUNT(*) FROM Games g2
-             JOIN Teams_Games tg1_2 ON g2.game_id = tg1_2.game_id AND tg1_2.team_id = %s
-             JOIN Teams_Games tg2_2 ON g2.game_id = tg2_2.game_id AND tg2_2.team_id = %s
-             WHERE g2.date_played < CURRENT_DATE()
-             AND ((tg1_2.is_home_team = TRUE AND g2.home_score < g2.away_score) OR 
-                  (tg1_2.is_home_team = FALSE AND g2.away_score < g2.home_score))) AS losses,
-            (SELECT AVG(points) FROM (
-                SELECT g2.home_score AS points FROM Games g2
-                JOIN Teams_Games tg1_2 ON g2.game_id = tg1_2.game_id AND tg1_2.team_id = %s
-                JOIN Teams_Games tg2_2 ON g2.game_id = tg2_2.game_id AND tg2_2.team_id = %s
-                WHERE g2.date_played < CURRENT_DATE() AND tg1_2.is_home_team = TRUE
-                UNION ALL
-                SELECT g2.away_score AS points FROM Games g2
-                JOIN Teams_Games tg1_2 ON g2.game_id = tg1_2.game_id AND tg1_2.team_id = %s
-                JOIN Teams_Games tg2_2 ON g2.game_id = tg2_2.game_id AND tg2_2.team_id = %s
-                WHERE g2.date_played < CURRENT_DATE() AND tg1_2.is_home_team = FALSE
-            ) AS combined_points) AS avg_points_scored,
-            (SELECT AVG(points) FROM (
-                SELECT g2.away_score AS points FROM Games g2
-                JOIN Teams_Games tg1_2 ON g2.game_id = tg1_2.game_id AND tg1_2.team_id = %s
-                JOIN Teams_Games tg2_2 ON g2.game_id = tg2_2.game_id AND tg2_2.team_id = %s
-                WHERE g2.date_played < CURRENT_DATE() AND tg1_2.is_home_team = TRUE
-                UNION ALL
-                SELECT g2.home_score AS points FROM Games g2
-                JOIN Teams_Games tg1_2 ON g2.game_id = tg1_2.game_id AND tg1_2.team_id = %s
-                JOIN Teams_Games tg2_2 ON g2.game_id = tg2_2.game_id AND tg2_2.team_id = %s
-                WHERE g2.date_played < CURRENT_DATE() AND tg1_2.is_home_team = FALSE
-            ) AS combined_points) AS avg_points_allowed,
-            t2.name AS opponent_name
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.team_id = %s
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.team_id = %s
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        WHERE g.date_played < CURRENT_DATE()
-        GROUP BY t2.name
-        """
-        
-        cursor.execute(query, (team_id, opponent_id, team_id, opponent_id, team_id, opponent_id, team_id, opponent_id, team_id, opponent_id, team_id, opponent_id, team_id, opponent_id))
-        opponent_stats = cursor.fetchone()
+        games = load_team_games(cursor, team_id)
         cursor.close()
         
+        opponent_stats = head_to_head(games).get(opponent_id)
+        
         if not opponent_stats:
             return jsonify({"error": "No games found against this opponent"}), 404
         
-        opponent_stats = convert_datetime_for_json(opponent_stats)
-        
         return jsonify(opponent_stats), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
 
 
 @team_captain.route("/teams/<int:team_id>/opponents", methods=["GET"])
+@versioned("team")
 def get_opponents(team_id):
     try:
         cursor = db.get_db().cursor()
         
-        query = """
-        SELECT DISTINCT t2.team_id, t2.name
-        FROM Games g
-        JOIN Teams_Games tg1 ON g.game_id = tg1.game_id AND tg1.team_id = %s
-        JOIN Teams_Games tg2 ON g.game_id = tg2.game_id AND tg2.team_id != %s
-        JOIN Teams t2 ON tg2.team_id = t2.team_id
-        WHERE tg1.team_id = %s
-        ORDER BY t2.name
-        """
-        
-        cursor.execute(query, (team_id, team_id, team_id))
-        opponents = cursor.fetchall()
+        opponents = load_opponents(cursor, team_id)
         cursor.close()
         
         return jsonify(opponents), 200
@@ -890,8 +681,6 @@ def get_game_stat_keepers(game_id):
         stat_keepers = cursor.fetchall()
         cursor.close()
         
-        stat_keepers = convert_datetime_for_json(stat_keepers)
-        
         return jsonify(stat_keepers), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -906,8 +695,9 @@ def assign_stat_keeper_to_game(game_id):
             return jsonify({"error": "Missing required field: keeper_id"}), 400
         
         cursor = db.get_db().cursor()
-        cursor.execute("SELECT game_id FROM Games WHERE game_id = %s", (game_id,))
-        if not cursor.fetchone():
+        cursor.execute("SELECT game_id, league_played, date_played, start_time FROM Games WHERE game_id = %s", (game_id,))
+        game = cursor.fetchone()
+        if not game:
             cursor.close()
             return jsonify({"error": "Game not found"}), 404
         cursor.execute("SELECT keeper_id FROM Stat_Keepers WHERE keeper_id = %s", (data["keeper_id"],))
@@ -915,6 +705,12 @@ def assign_stat_keeper_to_game(game_id):
             cursor.close()
             return jsonify({"error": "Stat keeper not found"}), 404
         
+        conflicts = find_game_conflicts(cursor, dict(game, keeper_ids=[data["keeper_id"]]),
+                                        ignore_game_id=game_id, kinds=("keeper",))
+        if conflicts and not data.get("allow_conflicts"):
+            cursor.close()
+            return jsonify({"error": conflict_error(conflicts), "conflicts": conflicts}), 409
+        
         insert_query = """
         INSERT INTO Games_Keepers (keeper_id, game_id, assignment_date)
         VALUES (%s, %s, CURDATE())
@@ -922,6 +718,7 @@ def assign_stat_keeper_to_game(game_id):
         """
         
         cursor.execute(insert_query, (data["keeper_id"], game_id))
+        bump_versions(cursor, {("game", game_id), ("keeper", data["keeper_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -954,6 +751,7 @@ def remove_stat_keeper_from_game(game_id):
             DELETE FROM Games_Keepers 
             WHERE game_id = %s AND keeper_id = %s
         """, (game_id, data["keeper_id"]))
+        bump_versions(cursor, {("game", game_id), ("keeper", data["keeper_id"])}, resolve=False)
         
         db.get_db().commit()
         cursor.close()
@@ -978,8 +776,6 @@ def get_all_stat_keepers():
         stat_keepers = cursor.fetchall()
         cursor.close()
         
-        stat_keepers = convert_datetime_for_json(stat_keepers)
-        
         return jsonify(stat_keepers), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -1016,8 +812,6 @@ def get_all_leagues():
         leagues = cursor.fetchall()
         cursor.close()
         
-        leagues = convert_datetime_for_json(leagues)
-        
         return jsonify(leagues), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -1056,8 +850,6 @@ def get_league_teams(league_id):
         teams = cursor.fetchall()
         cursor.close()
         
-        teams = convert_datetime_for_json(teams)
-        
         return jsonify(teams), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
@@ -0,0 +1,201 @@
+#------------------------------------------------------------
+# Per-entity version counters, ETags and conditional GETs.
+#
+# EntityVersion holds one version per league, team, game,
+# player, sport and stat keeper. Write routes call
+# bump_versions() with the entities they changed, on their own
+# cursor and before their own commit, so the bump is part of
+# the write's transaction and a request that changes nothing
+# (a validation, a dry run) bumps nothing:
+#
+#   - a game also bumps its league and its home/away teams, a
+#     team its league, a player the teams they are on, and a
+#     sport (its rules and stat types label and score every
+#     stat) all of its leagues; routes that delete or move an
+#     entity bump it before the change, so the old league and
+#     teams are found
+#   - routes that already know those related entities (the stat
+#     event routes have the game's league and teams at hand)
+#     pass them with resolve=False and bump with one statement
+#
+# A version is max(version + 1, the current time in
+# microseconds), so versions only grow and the newest one is
+# the largest: GET routes listing everything (@versioned()
+# without arguments) use MAX(version), read from its index,
+# rather than a counter every write would have to update.
+#
+# GET routes decorated with @versioned("league") (or "team",
+# "game", "player") answer with an ETag derived from the URL
+# and the versions of the entities named by their URL ids and
+# of the entities those resolve to (a game's teams show their
+# names, ...), and with a bodiless 304 when the request's
+# If-None-Match still matches, before running any of the
+# route's queries.
+#------------------------------------------------------------
+import functools
+import hashlib
+import logging
+import time
+
+from flask import make_response, request
+
+from backend.db_connection import db
+
+logger = logging.getLogger(__name__)
+
+ENTITY_TYPES = ("league", "team", "game", "player")
+
+# URL view args naming the entity a @versioned route depends on
+VIEW_ARG_ENTITIES = {
+    "league_id": "league",
+    "team_id": "team",
+    "game_id": "game",
+    "player_id": "player",
+}
+
+
+def _ids(entities, entity_type):
+    return sorted({entity_id for kind, entity_id in entities if kind == entity_type and entity_id is not None})
+
+
+def resolve_entities(cursor, entities):
+    """Expand entities to the ones that depend on them (game -> league, teams; sport -> leagues; ...).
+
+    One query per entity type present, whatever the number of entities.
+    """
+    entities = {(entity_type, entity_id) for entity_type, entity_id in entities if entity_id is not None}
+
+    sport_ids = _ids(entities, "sport")
+    if sport_ids:
+        placeholders = ", ".join(["%s"] * len(sport_ids))
+        cursor.execute(f"SELECT league_id FROM Leagues WHERE sport_played IN ({placeholders})", sport_ids)
+        entities.update(("league", row["league_id"]) for row in cursor.fetchall())
+
+    game_ids = _ids(entities, "game")
+    if game_ids:
+        placeholders = ", ".join(["%s"] * len(game_ids))
+        cursor.execute(
+            f"SELECT league_played, home_team_id, away_team_id FROM Games WHERE game_id IN ({placeholders})",
+            game_ids,
+        )
+        for row in cursor.fetchall():
+            entities.add(("league", row["league_played"]))
+            entities.update(("team", team_id) for team_id in (row["home_team_id"], row["away_team_id"])
+                            if team_id is not None)
+
+    player_ids = _ids(entities, "player")
+    if player_ids:
+        placeholders = ", ".join(["%s"] * len(player_ids))
+        cursor.execute(f"SELECT team_id FROM Teams_Players WHERE player_id IN ({placeholders})", player_ids)
+        entities.update(("team", row["team_id"]) for row in cursor.fetchall())
+
+    # Teams (named or added above) also touch their leagues
+    team_ids = _ids(entities, "team")
+    if team_ids:
+        placeholders = ", ".join(["%s"] * len(team_ids))
+        cursor.execute(f"SELECT DISTINCT league_played FROM Teams WHERE team_id IN ({placeholders})", team_ids)
+        entities.update(("league", row["league_played"]) for row in cursor.fetchall())
+    return entities
+
+
+def game_entities(game):
+    """A Games row's game, league and home/away teams (for bump_versions with resolve=False)"""
+    return {("game", game["game_id"]), ("league", game["league_played"]),
+            ("team", game["home_team_id"]), ("team", game["away_team_id"])}
+
+
+def bump_versions(cursor, entities, resolve=True):
+    """Bump the versions of the given (type, id) entities and, with resolve, of what depends on them.
+
+    Call on the write's cursor before it commits. With resolve=False the
+    caller passes every dependent entity itself and the bump is a single
+    statement.
+    """
+    entities = resolve_entities(cursor, entities) if resolve else set(entities)
+    entities = sorted((entity_type, entity_id) for entity_type, entity_id in entities if entity_id is not None)
+    if not entities:
+        return
+    version = time.time_ns() // 1000
+    placeholders = ", ".join(["(%s, %s, %s)"] * len(entities))
+    # Sorted, so concurrent writes lock shared rows in the same order
+    cursor.execute(f"""
+        INSERT INTO EntityVersion (entity_type, entity_id, version)
+        VALUES {placeholders}
+        ON DUPLICATE KEY UPDATE version = GREATEST(version + 1, VALUES(version))
+    """, [value for entity in entities for value in entity + (version,)])
+
+
+def get_versions(cursor, entities):
+    """{(type, id): version} for the given entities (0 for never-bumped ones)"""
+    entities = sorted(set(entities))
+    versions = dict.fromkeys(entities, 0)
+    if not entities:
+        return versions
+    conditions = " OR ".join(["(entity_type = %s AND entity_id = %s)"] * len(entities))
+    cursor.execute(
+        f"SELECT entity_type, entity_id, version FROM EntityVersion WHERE {conditions}",
+        [value for entity in entities for value in entity],
+    )
+    for row in cursor.fetchall():
+        versions[(row["entity_type"], row["entity_id"])] = row["version"]
+    return versions
+
+
+def latest_version(cursor):
+    """The newest version of any entity (0 before the first write)"""
+    cursor.execute("SELECT MAX(version) AS version FROM EntityVersion")
+    row = cursor.fetchone()
+    return (row and row["version"]) or 0
+
+
+def compute_etag(entities):
+    """Strong ETag for the current URL at the current versions of entities and what they resolve to
+    (no entities: at the newest version of any entity)"""
+    cursor = db.get_db().cursor()
+    if entities:
+        versions = get_versions(cursor, resolve_entities(cursor, entities))
+    else:
+        versions = {("latest", 0): latest_version(cursor)}
+    cursor.close()
+
+    key = request.full_path + "|" + ";".join(
+        f"{entity_type}:{entity_id}:{version}" for (entity_type, entity_id), version in sorted(versions.items())
+    )
+    return hashlib.sha1(key.encode()).hexdigest()[:24]
+
+
+def versioned(*entity_types):
+    """Add an ETag to a GET route's 200 responses and answer If-None-Match with 304.
+
+    entity_types name the URL ids the response depends on, e.g.
+    @versioned("league") for /leagues/<league_id>/standings. Without
+    any, the response depends on every entity (the newest version).
+    """
+    for entity_type in entity_types:
+        if entity_type not in ENTITY_TYPES:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+    arg_for_type = {entity_type: arg for arg, entity_type in VIEW_ARG_ENTITIES.items()}
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            entities = {(entity_type, int(kwargs[arg_for_type[entity_type]])) for entity_type in entity_types}
+
+            try:
+                etag = compute_etag(entities)
+            except Exception as e:
+                # Never let the version lookup break the route itself
+                logger.warning(f"Could not compute ETag for {request.path}: {e}")
+                return view(*args, **kwargs)
+
+            if request.if_none_match.contains(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+        return wrapper
+    return decorator
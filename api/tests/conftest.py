@@ -0,0 +1,145 @@
+import os
+import sys
+
+# Tests import the API's modules as the app does (from backend.x import ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+# Tests marked as needing MySQL run against a scratch database on the
+# server named by TEST_MYSQL_HOST (DB_PORT, DB_USER and
+# MYSQL_ROOT_PASSWORD as in api/.env), e.g. the compose db on port 3200:
+#
+#   TEST_MYSQL_HOST=127.0.0.1 DB_PORT=3200 DB_USER=root MYSQL_ROOT_PASSWORD=... pytest api/tests
+TEST_DATABASE = "imleagues_test"
+
+
+@pytest.fixture
+def mysql_cursor():
+    host = os.getenv("TEST_MYSQL_HOST")
+    if not host:
+        pytest.skip("TEST_MYSQL_HOST is not set")
+    pymysql = pytest.importorskip("pymysql")
+
+    connection = pymysql.connect(
+        host=host,
+        port=int(os.getenv("DB_PORT", "3306")),
+        user=os.getenv("DB_USER", "root"),
+        password=os.getenv("MYSQL_ROOT_PASSWORD", ""),
+        cursorclass=pymysql.cursors.DictCursor,
+        autocommit=True,
+    )
+    cursor = connection.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS {TEST_DATABASE}")
+    cursor.execute(f"CREATE DATABASE {TEST_DATABASE}")
+    cursor.execute(f"USE {TEST_DATABASE}")
+    try:
+        yield cursor
+    finally:
+        cursor.execute(f"DROP DATABASE IF EXISTS {TEST_DATABASE}")
+        cursor.close()
+        connection.close()
+
+
+class FakeCursor:
+    """A pymysql DictCursor stand-in that records every statement.
+
+    Statements are kept whitespace-collapsed in .statements as (sql, params).
+    on(fragment, result) answers every statement containing fragment (the
+    first match in registration order wins) with the rows in result, or with
+    result(params) when it is callable; a callable can keep its own state and
+    set cursor.lastrowid. Statements no fragment matches return no rows.
+    """
+
+    def __init__(self):
+        self.statements = []
+        self.lastrowid = None
+        self.rowcount = 0
+        self._handlers = []
+        self._rows = []
+
+    def on(self, fragment, result):
+        self._handlers.append((fragment, result))
+        return self
+
+    def execute(self, sql, params=None):
+        sql = " ".join(sql.split())
+        self.statements.append((sql, params))
+        rows = []
+        for fragment, result in self._handlers:
+            if fragment in sql:
+                rows = result(params) if callable(result) else result
+                break
+        self._rows = [dict(row) for row in rows or []]
+        self.rowcount = len(self._rows)
+
+    def executemany(self, sql, rows):
+        for params in rows:
+            self.execute(sql, params)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def close(self):
+        pass
+
+    def sql(self, fragment=""):
+        """The statements containing fragment, in order"""
+        return [sql for sql, _ in self.statements if fragment in sql]
+
+    def params(self, fragment):
+        """The params of the statements containing fragment, in order"""
+        return [params for sql, params in self.statements if fragment in sql]
+
+
+class FakeConnection:
+    """A connection handing out one FakeCursor and counting commits and rollbacks"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def fake_cursor():
+    return FakeCursor()
+
+
+@pytest.fixture
+def fake_connection(fake_cursor):
+    return FakeConnection(fake_cursor)
+
+
+@pytest.fixture
+def fake_db(monkeypatch, fake_connection):
+    """Points backend.db_connection.db at fake_connection.
+
+    The schema registry reports the current schema (the tables and columns
+    the routes probe for); tests of older databases patch db.schema.has_column.
+    """
+    pytest.importorskip("flask")
+    pytest.importorskip("flaskext.mysql")
+    from backend.db_connection import db
+
+    monkeypatch.setattr(db, "get_db", lambda: fake_connection)
+    monkeypatch.setattr(db.schema, "_tables", {
+        "statevent": frozenset({"event_id", "performed_by", "scored_during", "description", "stat_type_id",
+                                "points", "time_entered", "client_event_id", "change_seq"}),
+        "stateventtombstone": frozenset({"event_id", "game_id", "performed_by", "change_seq", "deleted_at"}),
+        "games": frozenset({"game_id", "home_team_id", "away_team_id", "stat_seq", "schedule_key"}),
+    })
+    return fake_connection
+
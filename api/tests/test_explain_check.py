@@ -0,0 +1,45 @@
+from backend.migrations.explain_check import check_hot_queries
+
+QUERY = {
+    "name": "team roster",
+    "alias": "tp",
+    "indexes": ("idx_teams_players_team_role",),
+    "sql": "SELECT tp.player_id FROM Teams_Players tp WHERE tp.team_id = %s",
+    "params": (1,),
+}
+
+
+def plan_row(key=None, possible_keys=None, access="ref", table="tp"):
+    return {"table": table, "type": access, "key": key, "possible_keys": possible_keys, "rows": 10}
+
+
+def test_expected_index_passes(fake_cursor, fake_connection):
+    fake_cursor.on("EXPLAIN", [plan_row("idx_teams_players_team_role", "PRIMARY,idx_teams_players_team_role")])
+    assert check_hot_queries(fake_connection, strict=True, queries=[QUERY]) == []
+    assert fake_cursor.statements == [("EXPLAIN " + QUERY["sql"], (1,))]
+
+
+def test_another_index_fails_even_outside_strict_mode(fake_cursor, fake_connection):
+    # possible_keys is not empty, but the index the query is meant to use is gone
+    fake_cursor.on("EXPLAIN", [plan_row("team_id", "team_id")])
+    failures = check_hot_queries(fake_connection, queries=[QUERY])
+    assert [failure["query"] for failure in failures] == ["team roster"]
+    assert "idx_teams_players_team_role" in failures[0]["reason"]
+
+
+def test_full_scan_with_usable_index_fails_only_in_strict_mode(fake_cursor, fake_connection):
+    fake_cursor.on("EXPLAIN", [plan_row(None, "team_id,idx_teams_players_team_role", access="ALL")])
+    assert check_hot_queries(fake_connection, queries=[QUERY]) == []
+    assert len(check_hot_queries(fake_connection, strict=True, queries=[QUERY])) == 1
+
+
+def test_index_merge_key_matches_either_index(fake_cursor, fake_connection):
+    query = dict(QUERY, alias="g", indexes=("idx_games_home_team", "idx_games_away_team"))
+    fake_cursor.on("EXPLAIN", [plan_row("idx_games_home_team,idx_games_away_team", table="g", access="index_merge")])
+    assert check_hot_queries(fake_connection, strict=True, queries=[query]) == []
+
+
+def test_guarded_table_missing_from_plan_fails(fake_cursor, fake_connection):
+    fake_cursor.on("EXPLAIN", [plan_row("PRIMARY", "PRIMARY", table="p")])
+    failures = check_hot_queries(fake_connection, queries=[QUERY])
+    assert failures[0]["reason"] == "table tp not in plan"
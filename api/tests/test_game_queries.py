@@ -0,0 +1,90 @@
+import sqlite3
+from datetime import date
+
+from backend.game_queries import OLDEST_FIRST, GameQuery
+
+
+def test_build_selects_is_finalized():
+    sql, params = GameQuery().for_league(3).build()
+    assert "COALESCE(g.is_finalized, FALSE) AS is_finalized" in sql
+    assert "g.league_played = %s" in sql
+    assert params == [3]
+
+
+def test_finalized_games_count_as_past():
+    upcoming, _ = GameQuery().upcoming(True, finalized_is_past=True).order_by(*OLDEST_FIRST).build()
+    assert "g.date_played >= CURDATE()" in upcoming
+    assert "COALESCE(g.is_finalized, FALSE) = FALSE" in upcoming
+
+    past, _ = GameQuery().upcoming(False, finalized_is_past=True).build()
+    assert "(g.date_played < CURDATE() OR COALESCE(g.is_finalized, FALSE) = TRUE)" in past
+
+
+def _league_db():
+    """One league in SQLite: games 1-2 have both teams, game 3 has no away team yet"""
+    connection = sqlite3.connect(":memory:")
+    connection.row_factory = sqlite3.Row
+    connection.create_function("CURDATE", 0, lambda: date.today().isoformat())
+    connection.executescript("""
+        CREATE TABLE Sports (sport_id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE Leagues (league_id INTEGER PRIMARY KEY, name TEXT, sport_played INTEGER);
+        CREATE TABLE Teams (team_id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE Games (game_id INTEGER PRIMARY KEY, date_played TEXT, start_time TEXT, location TEXT,
+                            home_score INTEGER, away_score INTEGER, league_played INTEGER,
+                            home_team_id INTEGER, away_team_id INTEGER, is_finalized BOOLEAN);
+        CREATE TABLE Players_Games (player_id INTEGER, game_id INTEGER, is_starter BOOLEAN, position TEXT);
+        INSERT INTO Sports VALUES (1, 'Soccer');
+        INSERT INTO Leagues VALUES (1, 'Coed A', 1), (2, 'Coed B', 1);
+        INSERT INTO Teams VALUES (1, 'Hawks'), (2, 'Owls');
+        INSERT INTO Games VALUES
+            (1, '2025-03-01', '18:00:00', 'Field 1', 2, 1, 1, 1, 2, TRUE),
+            (2, '2025-03-08', '18:00:00', 'Field 1', NULL, NULL, 1, 2, 1, NULL),
+            (3, '2025-03-15', '18:00:00', 'Field 2', NULL, NULL, 1, 1, NULL, NULL);
+        INSERT INTO Players_Games VALUES (7, 1, TRUE, 'GK'), (7, 3, FALSE, 'GK');
+    """)
+    return connection
+
+
+def _fetch(connection, query):
+    sql, params = query.build()
+    return [dict(row) for row in connection.execute(sql.replace("%s", "?"), params)]
+
+
+def test_games_missing_a_team_are_listed():
+    rows = _fetch(_league_db(), GameQuery().for_league(1).order_by(*OLDEST_FIRST))
+
+    assert [row["game_id"] for row in rows] == [1, 2, 3]
+    assert [row["has_both_teams"] for row in rows] == [1, 1, 0]
+    assert (rows[2]["home_team"], rows[2]["away_team"]) == ("Hawks", None)
+    assert (rows[0]["league_name"], rows[0]["sport_name"], rows[0]["is_finalized"]) == ("Coed A", "Soccer", 1)
+
+
+def test_team_and_player_games_keep_games_missing_a_team():
+    connection = _league_db()
+
+    team_games = _fetch(connection, GameQuery().for_team(1))
+    assert [row["game_id"] for row in team_games] == [3, 2, 1]
+
+    player_games = _fetch(connection, GameQuery().for_player(7))
+    assert [(row["game_id"], row["position"]) for row in player_games] == [(3, "GK"), (1, "GK")]
+
+
+def test_apply_args_filters_without_paginating():
+    connection = _league_db()
+    args = {"min_date": "2025-03-02", "team_id": "1", "limit": "1", "offset": "1"}
+
+    rows = _fetch(connection, GameQuery().apply_args(args).order_by(*OLDEST_FIRST))
+    assert [row["game_id"] for row in rows] == [2, 3]
+
+    assert _fetch(connection, GameQuery().apply_args({"league_id": "2"})) == []
+
+
+def test_paginate_is_opt_in():
+    connection = _league_db()
+
+    sql, params = GameQuery().build()
+    assert "LIMIT" not in sql
+    assert len(_fetch(connection, GameQuery())) == 3
+
+    rows = _fetch(connection, GameQuery().order_by(*OLDEST_FIRST).paginate(1, 1))
+    assert [row["game_id"] for row in rows] == [2]
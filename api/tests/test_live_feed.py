@@ -0,0 +1,66 @@
+import pytest
+
+# backend.live_feed serializes messages with the app's JSON provider
+pytest.importorskip("flask")
+
+from backend.live_feed import FEED_RETENTION, SWEEP_INTERVAL, LiveFeedHub, sse_stream
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_reads_do_not_create_feeds():
+    hub = LiveFeedHub()
+    assert hub.last_id(99) == 0
+    assert hub.can_resume(99, 0)
+    assert not hub.can_resume(99, 5)
+    assert hub._feeds == {}
+
+
+def test_idle_unwatched_feed_is_dropped_after_retention():
+    clock = Clock()
+    hub = LiveFeedHub(clock=clock)
+    hub.publish(1, "score", {"home_score": 1})
+
+    clock.now += FEED_RETENTION
+    hub.publish(2, "score", {"home_score": 0})
+    assert set(hub._feeds) == {1, 2}
+
+    clock.now += max(SWEEP_INTERVAL, 1)
+    hub.publish(2, "score", {"home_score": 1})
+    assert set(hub._feeds) == {2}
+    # A client resuming from the dropped feed gets a reset
+    assert hub.wait(1, 1, timeout=0) == ([], False)
+
+
+def test_watched_feed_is_kept():
+    clock = Clock()
+    hub = LiveFeedHub(clock=clock)
+    message = hub.publish(1, "score", {"home_score": 1})
+    hub.subscribe(1)
+
+    clock.now += FEED_RETENTION + SWEEP_INTERVAL + 1
+    hub.publish(2, "score", {"home_score": 0})
+    assert 1 in hub._feeds
+    assert hub.wait(1, 0, timeout=0) == ([message], True)
+
+    hub.unsubscribe(1)
+    clock.now += FEED_RETENTION + SWEEP_INTERVAL + 1
+    hub.publish(2, "score", {"home_score": 1})
+    assert 1 not in hub._feeds
+
+
+def test_stream_subscribes_until_closed(monkeypatch):
+    hub = LiveFeedHub()
+    monkeypatch.setattr("backend.live_feed.hub", hub)
+    stream = sse_stream(1, 0, snapshot={"score": None}, keepalive=0)
+
+    assert next(stream).startswith("id: 0\nevent: snapshot")
+    assert hub._feeds[1].subscribers == 1
+    stream.close()
+    assert hub._feeds[1].subscribers == 0
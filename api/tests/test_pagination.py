@@ -0,0 +1,90 @@
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from backend.pagination import Keyset, Page, PaginationError, SortKey, decode_cursor, encode_cursor
+
+# The keyset of GET /system-admin/games
+GAMES_KEYSET = Keyset(
+    SortKey("g.date_played", "date_played", descending=True),
+    SortKey("g.start_time", "start_time", descending=True, nullable=True),
+    SortKey("g.game_id", "game_id", descending=True),
+)
+
+START_TIMES = ["00:01:00", "00:09:00", "09:00:00", "09:30:00", None, "10:00:00", "18:30:00", "21:00:00"]
+
+
+def _games_db():
+    """Games in SQLite, which like MySQL renders TIME values zero-padded"""
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE Games (game_id INTEGER PRIMARY KEY, date_played TEXT, start_time TEXT)")
+    game_id = 1
+    for played in ("2025-03-01", "2025-03-02"):
+        for start_time in START_TIMES:
+            connection.execute("INSERT INTO Games VALUES (?, ?, ?)", (game_id, played, start_time))
+            game_id += 1
+    return connection
+
+
+def _fetch_page(connection, page):
+    query, params = page.paginate_sql("SELECT game_id, date_played, start_time FROM Games g WHERE 1 = 1", [], GAMES_KEYSET)
+    rows = connection.execute(query.replace("%s", "?"), params).fetchall()
+    # pymysql returns DATE as date and TIME as timedelta
+    return [
+        {
+            "game_id": game_id,
+            "date_played": date.fromisoformat(played),
+            "start_time": None if start_time is None else timedelta(
+                hours=int(start_time[:2]), minutes=int(start_time[3:5]), seconds=int(start_time[6:])
+            ),
+        }
+        for game_id, played, start_time in rows
+    ]
+
+
+def test_time_cursor_is_zero_padded():
+    assert decode_cursor(encode_cursor([timedelta(hours=9)])) == ["09:00:00"]
+    assert decode_cursor(encode_cursor([timedelta(minutes=1)])) == ["00:01:00"]
+    assert decode_cursor(encode_cursor([date(2025, 3, 1)])) == ["2025-03-01"]
+
+
+def test_pages_across_games_before_and_after_ten():
+    connection = _games_db()
+    expected = [row["game_id"] for row in _fetch_page(connection, Page())]
+
+    for limit in (1, 2, 3, 5):
+        seen = []
+        after = None
+        # A cursor that sorts wrong repeats rows, possibly forever
+        for _ in range(len(expected) + 1):
+            page = Page(limit=limit, after=decode_cursor(after) if after else None)
+            body = page.result(_fetch_page(connection, page), GAMES_KEYSET)
+            seen += [row["game_id"] for row in body["items"]]
+            after = body["next_after"]
+            if after is None:
+                break
+        assert seen == expected, f"limit={limit}"
+
+
+def test_nullable_key_compares_the_raw_column():
+    query, params = Page(limit=2, after=["2025-03-02", "09:00:00", 11]).paginate_sql(
+        "SELECT game_id FROM Games g WHERE 1 = 1", [], GAMES_KEYSET
+    )
+    assert "COALESCE" not in query
+    assert "g.start_time < %s OR g.start_time IS NULL" in query
+    assert "ORDER BY g.date_played DESC, (g.start_time IS NULL) ASC, g.start_time DESC, g.game_id DESC" in query
+    assert params == ["2025-03-02", "2025-03-02", "09:00:00", "09:00:00", 11]
+
+
+def test_games_without_a_start_time_come_last_on_their_date():
+    rows = _fetch_page(_games_db(), Page())
+    for played in (date(2025, 3, 1), date(2025, 3, 2)):
+        times = [row["start_time"] for row in rows if row["date_played"] == played]
+        assert times[-1] is None
+        assert times[:-1] == sorted(times[:-1], reverse=True)
+
+
+def test_null_in_a_not_null_key_is_rejected():
+    with pytest.raises(PaginationError):
+        GAMES_KEYSET.after(["2025-03-02", "09:00:00", None])
@@ -0,0 +1,62 @@
+import importlib
+
+import pytest
+
+from backend.migrations import create_ngram_fulltext_index
+
+player_search_migration = importlib.import_module("backend.migrations.versions.0007_player_search")
+
+
+def _recording_cursor(cursor, index_exists=False):
+    """The Players.search_text index exists only if index_exists"""
+    return (cursor.on("INFORMATION_SCHEMA.STATISTICS", [{"1": 1}] if index_exists else [])
+            .on("innodb_ft_enable_stopword AS enabled", [{"enabled": 1}]))
+
+
+def _sql(cursor):
+    return [sql for sql in cursor.sql() if "INFORMATION_SCHEMA" not in sql]
+
+
+def test_fulltext_index_is_built_without_stopwords(fake_cursor):
+    cursor = _recording_cursor(fake_cursor)
+    assert create_ngram_fulltext_index(cursor, "Players", "ft_players_search", ["search_text"])
+
+    statements = _sql(cursor)
+    create = next(i for i, sql in enumerate(statements) if sql.startswith("CREATE FULLTEXT INDEX"))
+    assert statements[create - 1] == "SET SESSION innodb_ft_enable_stopword = OFF"
+    assert statements[create + 1] == "SET SESSION innodb_ft_enable_stopword = %s"
+    assert cursor.statements[-1][1] == ("ON",)
+
+
+def test_rebuild_drops_an_index_built_with_stopwords(fake_cursor):
+    cursor = _recording_cursor(fake_cursor, index_exists=True)
+    assert not create_ngram_fulltext_index(cursor, "Players", "ft_players_search", ["search_text"])
+    assert create_ngram_fulltext_index(cursor, "Players", "ft_players_search", ["search_text"], rebuild=True)
+    assert "DROP INDEX ft_players_search ON Players" in _sql(cursor)
+
+
+@pytest.mark.parametrize("term", ["maria", "smith", "ia", "mi", "r"])
+def test_search_finds_names_made_of_stopword_ngrams(mysql_cursor, term, monkeypatch):
+    pytest.importorskip("flask")
+    from backend import player_search
+
+    mysql_cursor.execute("""
+        CREATE TABLE Players (
+            player_id INT AUTO_INCREMENT PRIMARY KEY,
+            first_name VARCHAR(50) NOT NULL,
+            last_name VARCHAR(50) NOT NULL,
+            email VARCHAR(100) NOT NULL,
+            phone_number VARCHAR(15)
+        )
+    """)
+    # The server's own stopword setting is left alone: the migration must cope with the default
+    player_search_migration.upgrade(mysql_cursor)
+    mysql_cursor.execute(
+        "INSERT INTO Players (first_name, last_name, email) VALUES ('Maria', 'Smith', 'msmith@example.edu'), "
+        "('Tom', 'Lee', 'tlee@example.edu')"
+    )
+
+    monkeypatch.setattr(player_search, "has_search_index", lambda: True)
+    condition, params = player_search.search_condition(term)
+    mysql_cursor.execute(f"SELECT p.first_name FROM Players p WHERE {condition}", params)
+    assert [row["first_name"] for row in mysql_cursor.fetchall()] == ["Maria"]
@@ -0,0 +1,154 @@
+import threading
+import time
+
+import pytest
+
+# backend.db_connection (imported with pool) needs flask and flaskext.mysql
+pytest.importorskip("pymysql")
+pytest.importorskip("flask")
+pytest.importorskip("flaskext.mysql")
+
+from backend.db_connection.pool import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    def __init__(self, number):
+        self.number = number
+        self.open = True
+        self.healthy = True
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        if not self.healthy:
+            raise ConnectionError("server has gone away")
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.open = False
+
+
+class FakeFactory:
+    """Stands in for PooledMySQL.connect, numbering the connections it opens"""
+
+    def __init__(self):
+        self.connections = []
+
+    def __call__(self):
+        connection = FakeConnection(len(self.connections) + 1)
+        self.connections.append(connection)
+        return connection
+
+
+def test_fill_opens_min_size_connections():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, min_size=2, max_size=4)
+    pool.fill()
+
+    stats = pool.stats()
+    assert len(factory.connections) == 2
+    assert (stats["size"], stats["idle"], stats["in_use"]) == (2, 2, 0)
+
+
+def test_exhausted_pool_times_out():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, min_size=0, max_size=2, timeout=0.05)
+    first, second = pool.acquire(), pool.acquire()
+
+    started = time.monotonic()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    assert time.monotonic() - started >= 0.05
+
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert (stats["size"], stats["in_use"]) == (2, 2)
+    assert len(factory.connections) == 2
+    assert first is not second
+
+
+def test_waiter_gets_a_connection_released_by_another_thread():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, min_size=0, max_size=1, timeout=5)
+    held = pool.acquire()
+
+    releaser = threading.Timer(0.05, pool.release, args=(held,))
+    releaser.start()
+    try:
+        assert pool.acquire() is held
+    finally:
+        releaser.join()
+
+    stats = pool.stats()
+    assert stats["waits"] == 1
+    assert stats["wait_time_max"] > 0
+    assert len(factory.connections) == 1
+
+
+def test_release_rolls_back_and_returns_the_connection():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, min_size=0, max_size=2)
+    connection = pool.acquire()
+    pool.release(connection)
+
+    assert connection.rollbacks == 1
+    assert connection.open
+    assert (pool.stats()["idle"], pool.stats()["in_use"]) == (1, 0)
+    # Reused, not reopened
+    assert pool.acquire() is connection
+    assert len(factory.connections) == 1
+
+
+def test_release_discards_a_connection_that_cannot_roll_back():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, min_size=0, max_size=2)
+    connection = pool.acquire()
+
+    def broken_rollback():
+        raise ConnectionError("lost connection")
+    connection.rollback = broken_rollback
+    pool.release(connection)
+
+    stats = pool.stats()
+    assert not connection.open
+    assert (stats["size"], stats["idle"], stats["connections_closed"]) == (0, 0, 1)
+
+
+def test_connection_failing_its_health_check_is_dropped():
+    factory = FakeFactory()
+    pool = ConnectionPool(factory, min_size=1, max_size=1, health_check_after=0)
+    pool.fill()
+    stale = factory.connections[0]
+    stale.healthy = False
+
+    connection = pool.acquire()
+
+    assert connection is not stale
+    assert not stale.open
+    stats = pool.stats()
+    assert stats["health_check_failures"] == 1
+    assert stats["connections_closed"] == 1
+    assert (stats["size"], stats["in_use"]) == (1, 1)
+
+
+def test_connections_are_returned_on_app_context_teardown():
+    import flask
+    from backend.db_connection import PooledMySQL
+
+    app = flask.Flask(__name__)
+    db = PooledMySQL()
+    db.init_app(app)
+    factory = FakeFactory()
+    db._pool = ConnectionPool(factory, min_size=0, max_size=1, timeout=0.05)
+
+    for _ in range(3):
+        with app.app_context():
+            connection = db.get_db()
+            assert db.get_db() is connection
+            assert db.pool_stats()["in_use"] == 1
+
+    stats = db.pool_stats()
+    assert len(factory.connections) == 1
+    assert factory.connections[0].rollbacks == 3
+    assert (stats["in_use"], stats["idle"]) == (0, 1)
@@ -0,0 +1,77 @@
+import itertools
+from datetime import date
+
+from backend.schedule import assign_slots, insert_schedule, round_robin, team_balance
+
+
+def _gap_cursor(cursor, games=()):
+    """Assigns Games ids with gaps, as MySQL may under innodb_autoinc_lock_mode = 2;
+    cursor.games holds the Games rows"""
+    cursor.games = list(games)
+    ids = itertools.count(100, 3)
+
+    def insert_games(params, width):
+        values = [params[i:i + width] for i in range(0, len(params), width)]
+        new_ids = [next(ids) for _ in values]
+        cursor.lastrowid = new_ids[0]
+        for game_id, (league_id, played, start_time, location, *key) in zip(new_ids, values):
+            cursor.games.append({"game_id": game_id, "league_played": league_id, "date_played": played,
+                                 "start_time": start_time, "location": location,
+                                 "schedule_key": key[0] if key else None})
+
+    return (cursor
+            .on("INSERT INTO Games (league_played, date_played, start_time, location, schedule_key)",
+                lambda params: insert_games(params, 5))
+            .on("INSERT INTO Games ", lambda params: insert_games(params, 4))
+            .on("SELECT game_id, schedule_key FROM Games WHERE schedule_key IN",
+                lambda keys: [game for game in cursor.games if game["schedule_key"] in keys]))
+
+
+def _season():
+    rounds = round_robin([1, 2, 3, 4, 5])
+    return assign_slots(rounds, date(2025, 9, 1), date(2025, 12, 1), ["09:00:00", "18:00:00"], ["Court 1", "Court 2"])
+
+
+def _assert_teams_match(cursor, games, game_ids):
+    games_by_id = dict(zip(game_ids, games))
+    (params,) = cursor.params("INSERT INTO Teams_Games")
+    teams_games = [tuple(params[i:i + 3]) for i in range(0, len(params), 3)]
+    assert len(teams_games) == 2 * len(games)
+    for team_id, game_id, is_home in teams_games:
+        game = games_by_id[game_id]
+        assert team_id == (game["home_team_id"] if is_home else game["away_team_id"])
+
+
+def test_round_robin_is_balanced():
+    for count in range(2, 12):
+        rounds = round_robin(range(1, count + 1))
+        pairs = [frozenset(pair) for round_ in rounds for pair in round_["games"]]
+        assert len(pairs) == len(set(pairs)) == count * (count - 1) // 2
+        for counts in team_balance([{"home_team_id": home, "away_team_id": away}
+                                    for round_ in rounds for home, away in round_["games"]]).values():
+            assert abs(counts["home"] - counts["away"]) <= 1
+
+
+def test_insert_schedule_maps_teams_to_non_consecutive_game_ids(fake_cursor):
+    games = _season()
+    # A game already booked in the league's first slot must not be mistaken for a new one
+    booked = {"game_id": 5000, "league_played": 7, "date_played": games[0]["date_played"],
+              "start_time": games[0]["start_time"], "location": games[0]["location"], "schedule_key": None}
+    cursor = _gap_cursor(fake_cursor, [booked])
+
+    game_ids = insert_schedule(cursor, 7, games)
+
+    assert game_ids == [game["game_id"] for game in cursor.games[1:]]
+    assert 5000 not in game_ids
+    _assert_teams_match(cursor, games, game_ids)
+
+
+def test_insert_schedule_without_schedule_key_inserts_one_by_one(fake_cursor):
+    games = _season()
+    cursor = _gap_cursor(fake_cursor)
+
+    game_ids = insert_schedule(cursor, 7, games, keyed=False)
+
+    assert game_ids == [game["game_id"] for game in cursor.games]
+    assert all(game["schedule_key"] is None for game in cursor.games)
+    _assert_teams_match(cursor, games, game_ids)
@@ -0,0 +1,90 @@
+from backend.scoring import (DEFAULT_SCORING_RULES, ScoringMatcher, apply_event_score, apply_score_totals,
+                             compile_scoring_rules, recalculate_game_score)
+
+# Game 1: player 1 is on the home team, player 2 on the away team, player 3 on neither
+SIDES = {1: True, 2: False}
+
+
+def test_earlier_rule_wins_wherever_it_matches():
+    matcher = ScoringMatcher(DEFAULT_SCORING_RULES["basketball"])
+
+    # "point" appears before "3-point", but the 3-point rule comes first
+    assert matcher.points_for("point guard hits a 3-point shot") == 3
+    assert matcher.points_for("two point jumper") == 2
+    assert matcher.points_for("free throw") == 1
+    assert matcher.points_for("rebound") == 0
+    assert matcher.points_for(None) == 0
+
+
+def test_rule_without_points_scores_the_number_it_matched():
+    matcher = compile_scoring_rules('[{"keywords": ["goal"], "points": 1}, {"pattern": "\\\\d+\\\\s*point"}]')
+
+    assert matcher.points_for("2 goals, then 5 points") == 1
+    assert matcher.points_for("scored 12 points\nin a row") == 12
+    assert matcher.points_for("no score") == 0
+
+
+def test_anchored_patterns_only_match_at_the_start():
+    matcher = ScoringMatcher([{"pattern": "^ace", "points": 2}, {"keywords": ["kill"], "points": 1}])
+
+    assert matcher.points_for("Ace serve") == 2
+    assert matcher.points_for("kill after an ace") == 1
+
+
+def _scoring_game(cursor, events):
+    """Game 1's score in cursor.game, kept by the score UPDATEs; events are its StatEvent rows"""
+    cursor.game = {"home_score": 0, "away_score": 0, "home_team_id": 10, "away_team_id": 20}
+
+    def add(*columns):
+        def update(params):
+            for column, points in zip(columns, params):
+                cursor.game[column] += points
+        return update
+
+    return (cursor
+            .on("SET home_score = COALESCE(home_score, 0) + %s, away_score", add("home_score", "away_score"))
+            .on("SET home_score = COALESCE(home_score, 0) + %s", add("home_score"))
+            .on("SET away_score = COALESCE(away_score, 0) + %s", add("away_score"))
+            .on("SELECT tg.is_home_team FROM Teams_Players tp",
+                lambda params: [{"is_home_team": SIDES[params[0]]}] if params[0] in SIDES else [])
+            .on("FROM Games WHERE game_id", lambda params: [cursor.game])
+            .on("SELECT tp.player_id, tg.is_home_team",
+                lambda params: [{"player_id": player_id, "is_home_team": side} for player_id, side in SIDES.items()])
+            .on("FROM StatEvent se WHERE se.scored_during", lambda params: [e for e in events if e["points"] > 0]))
+
+
+def test_score_deltas_match_a_full_recalculation(fake_cursor):
+    events = []
+    cursor = _scoring_game(fake_cursor, events)
+
+    # A single event, then a batch of two
+    events.append({"event_id": 1, "performed_by": 1, "points": 3})
+    assert apply_event_score(cursor, 1, 1, 3)
+    events += [{"event_id": 2, "performed_by": 1, "points": 2}, {"event_id": 3, "performed_by": 2, "points": 1}]
+    assert apply_score_totals(cursor, 1, 2, 1)
+    assert (cursor.game["home_score"], cursor.game["away_score"]) == (5, 1)
+
+    # Editing event 1 down to 2 points takes the old points off and adds the new ones
+    events[0]["points"] = 2
+    assert apply_event_score(cursor, 1, 1, 3, sign=-1)
+    assert apply_event_score(cursor, 1, 1, 2)
+
+    # Deleting event 3 takes its point back off the away side
+    del events[2]
+    assert apply_event_score(cursor, 1, 2, 1, sign=-1)
+
+    assert (cursor.game["home_score"], cursor.game["away_score"]) == (4, 0)
+    result = recalculate_game_score(cursor, 1, apply=False)
+    assert result["in_sync"]
+    assert (result["home_score"], result["away_score"]) == (4, 0)
+
+
+def test_events_that_score_nothing_leave_the_score_alone(fake_cursor):
+    cursor = _scoring_game(fake_cursor, [])
+
+    assert not apply_event_score(cursor, 1, 1, 0)
+    assert not apply_event_score(cursor, 1, 3, 2)  # player 3 plays for neither team
+    assert not apply_score_totals(cursor, 1, 0, 0)
+
+    assert cursor.sql("UPDATE Games") == []
+    assert (cursor.game["home_score"], cursor.game["away_score"]) == (0, 0)
@@ -0,0 +1,79 @@
+import importlib
+
+from backend.standings import rebuild_standings, refresh_game_standings
+
+league_standings_migration = importlib.import_module("backend.migrations.versions.0004_league_standings")
+
+
+def _standings_cursor(cursor):
+    """Teams 1 and 2 in league 1 (seeded 5-3 and 4-4); team 1 has one finalized 3-1 home win"""
+    return (cursor
+            .on("SELECT team_id, league_played FROM Teams", [{"team_id": 1, "league_played": 1},
+                                                            {"team_id": 2, "league_played": 1}])
+            .on("FROM Teams t JOIN Teams_Games tg", [{"team_id": 1, "league_id": 1, "date_played": "2026-01-10",
+                                                      "home_score": 3, "away_score": 1, "is_home_team": 1}])
+            .on("FROM LeagueStandings ls WHERE ls.league_id", [
+                {"team_id": 1, "win_percentage": 100.0, "wins": 1, "losses": 0, "point_differential": 2},
+                {"team_id": 2, "win_percentage": 0.0, "wins": 0, "losses": 0, "point_differential": 0},
+            ]))
+
+
+def test_rebuild_mirrors_every_team(fake_cursor):
+    cursor = _standings_cursor(fake_cursor)
+    rebuild_standings(cursor)
+    assert cursor.params("UPDATE Teams") == [(1, 0, 1), (0, 0, 2)]
+
+
+def test_rebuild_can_keep_records_of_teams_without_finalized_games(fake_cursor):
+    cursor = _standings_cursor(fake_cursor)
+    summary = rebuild_standings(cursor, keep_unplayed_records=True)
+    assert cursor.params("UPDATE Teams") == [(1, 0, 1)]
+    assert summary == {"leagues": 1, "teams": 2, "team_games_counted": 1}
+
+
+def test_migration_keeps_seeded_team_records(monkeypatch, fake_cursor):
+    calls = []
+    monkeypatch.setattr(league_standings_migration, "add_column", lambda *args: None)
+    monkeypatch.setattr(league_standings_migration, "rebuild_standings",
+                        lambda cursor, **kwargs: calls.append(kwargs))
+    league_standings_migration.upgrade(_standings_cursor(fake_cursor))
+    assert calls == [{"keep_unplayed_records": True}]
+
+
+def test_refreshing_a_game_rewrites_and_reranks_its_teams(fake_cursor):
+    # Game 7: team 1 (which beat team 3 on 2026-01-03) lost 1-4 at home to team 2
+    standings = {}
+
+    def write_standings(params):
+        standings[params[1]] = dict(zip(["games_played", "wins", "losses", "ties", "points_for", "points_against",
+                                         "win_percentage", "streak", "last_game_date"], params[2:]))
+
+    cursor = (fake_cursor
+              .on("SELECT team_id FROM Teams_Games WHERE game_id", [{"team_id": 1}, {"team_id": 2}])
+              .on("SELECT DISTINCT league_id FROM LeagueStandings", [{"league_id": 1}])
+              .on("SELECT team_id, league_played FROM Teams", [{"team_id": 1, "league_played": 1},
+                                                              {"team_id": 2, "league_played": 1}])
+              .on("FROM Teams t JOIN Teams_Games tg", [
+                  {"team_id": 1, "league_id": 1, "date_played": "2026-01-03",
+                   "home_score": 2, "away_score": 0, "is_home_team": 1},
+                  {"team_id": 1, "league_id": 1, "date_played": "2026-01-10",
+                   "home_score": 1, "away_score": 4, "is_home_team": 1},
+                  {"team_id": 2, "league_id": 1, "date_played": "2026-01-10",
+                   "home_score": 1, "away_score": 4, "is_home_team": 0},
+              ])
+              .on("INSERT INTO LeagueStandings", write_standings)
+              .on("FROM LeagueStandings ls WHERE ls.league_id", lambda params: [
+                  {"team_id": team_id, "win_percentage": record["win_percentage"], "wins": record["wins"],
+                   "losses": record["losses"],
+                   "point_differential": record["points_for"] - record["points_against"]}
+                  for team_id, record in standings.items()
+              ]))
+
+    refresh_game_standings(cursor, 7)
+
+    assert cursor.params("DELETE FROM LeagueStandings") == [[1, 2]]
+    assert standings[1]["wins"] == 1 and standings[1]["losses"] == 1 and standings[1]["streak"] == "L1"
+    assert (standings[1]["points_for"], standings[1]["points_against"]) == (3, 4)
+    assert (standings[2]["wins"], standings[2]["losses"], standings[2]["win_percentage"]) == (1, 0, 100.0)
+    assert cursor.params("UPDATE Teams") == [(1, 1, 1), (1, 0, 2)]
+    assert cursor.params("SET standing_rank") == [(1, 1, 2), (2, 1, 1)]
@@ -0,0 +1,200 @@
+import itertools
+
+import pytest
+
+# The blueprint needs flask, flaskext.mysql and pymysql; the database is fake_db
+pytest.importorskip("pymysql")
+pytest.importorskip("flask")
+pytest.importorskip("flaskext.mysql")
+
+from flask import Flask
+
+from backend.scoring import invalidate_scoring_rules
+from backend.stat_keeper.stat_keeper_routes import stat_keeper
+
+STAT_TYPES = [
+    {"stat_type_id": 11, "sport_id": 1, "code": "two_pointer", "label": "2 Pointer", "points": 2},
+    {"stat_type_id": 12, "sport_id": 1, "code": "three_pointer", "label": "3 Pointer", "points": 3},
+    {"stat_type_id": 13, "sport_id": 1, "code": "rebound", "label": "Rebound", "points": 0},
+]
+
+# Player 1 plays for the home team (10), player 2 for the away team (20)
+SIDES = {1: True, 2: False}
+
+
+class Game:
+    """Basketball game 5 kept in memory behind the fake cursor: its Games row,
+    StatEvent rows (by event_id) and StatEventTombstone rows"""
+
+    def __init__(self, cursor, is_finalized=False):
+        self.row = {"game_id": 5, "league_played": 1, "home_team_id": 10, "away_team_id": 20,
+                    "is_finalized": is_finalized, "sport_id": 1,
+                    "home_score": 0, "away_score": 0, "stat_seq": 0}
+        self.events = {}
+        self.tombstones = []
+        self._ids = itertools.count(100)
+
+        (cursor
+         .on("FROM StatEvent se JOIN Games g ON g.game_id = se.scored_during", self._event_with_game)
+         .on("FROM Games g JOIN Leagues l", [self.row])
+         .on("SELECT tg.is_home_team FROM Teams_Players tp",
+             lambda params: [{"is_home_team": int(SIDES[params[0]])}] if params[0] in SIDES else [])
+         .on("FROM Teams_Players tp JOIN Teams_Games tg", self._sides)
+         .on("SELECT event_id, client_event_id FROM StatEvent", self._recorded)
+         .on("FROM StatType WHERE sport_id", STAT_TYPES)
+         .on("FROM Sports s WHERE s.sport_id", [{"sport_name": "Basketball", "scoring_rules": None}])
+         .on("INSERT INTO StatEvent (", self._insert_events)
+         .on("DELETE FROM StatEvent WHERE event_id", self._delete_event)
+         .on("UPDATE Games SET stat_seq = stat_seq + 1", self._next_seq)
+         .on("SELECT stat_seq FROM Games", lambda params: [{"stat_seq": self.row["stat_seq"]}])
+         .on("UPDATE StatEvent SET change_seq", self._stamp)
+         .on("INSERT INTO StatEventTombstone", self._tombstone)
+         .on("SELECT event_id FROM StatEventTombstone", self._deleted_since)
+         .on("SET home_score = COALESCE(home_score, 0) + %s, away_score", self._add_totals)
+         .on("SET home_score = COALESCE(home_score, 0) + %s", lambda params: self._add_totals([params[0], 0]))
+         .on("SET away_score = COALESCE(away_score, 0) + %s", lambda params: self._add_totals([0, params[0]]))
+         .on("SELECT game_id FROM Games WHERE game_id", [{"game_id": 5}])
+         .on("SELECT team_id FROM Teams_Games WHERE game_id", [{"team_id": 10}, {"team_id": 20}])
+         .on("JOIN Players p ON se.performed_by = p.player_id", self._stat_events))
+
+    def _sides(self, params):
+        return [{"player_id": player_id, "is_home_team": int(side)}
+                for player_id, side in SIDES.items() if player_id in params[1:]]
+
+    def _recorded(self, params):
+        return [event for event in self.events.values() if event["client_event_id"] in params[1:]]
+
+    def _insert_events(self, params):
+        for i in range(0, len(params), 7):
+            event_id = next(self._ids)
+            player_id, game_id, description, stat_type_id, points, _, client_event_id = params[i:i + 7]
+            self.events[event_id] = {"event_id": event_id, "performed_by": player_id, "scored_during": game_id,
+                                     "description": description, "stat_type_id": stat_type_id,
+                                     "points": points, "client_event_id": client_event_id, "change_seq": 0}
+
+    def _event_with_game(self, params):
+        event = self.events.get(params[0])
+        return [dict(self.row, **event)] if event else []
+
+    def _delete_event(self, params):
+        self.events.pop(params[0], None)
+
+    def _next_seq(self, params):
+        self.row["stat_seq"] += 1
+
+    def _stamp(self, params):
+        for event_id in params[1:]:
+            self.events[event_id]["change_seq"] = params[0]
+
+    def _tombstone(self, params):
+        self.tombstones.append(dict(zip(["event_id", "game_id", "performed_by", "change_seq"], params)))
+
+    def _deleted_since(self, params):
+        return [tombstone for tombstone in self.tombstones if tombstone["change_seq"] > params[1]]
+
+    def _add_totals(self, params):
+        self.row["home_score"] += params[0]
+        self.row["away_score"] += params[1]
+
+    def _stat_events(self, params):
+        since = params[2] if len(params) > 2 else 0
+        return [{"event_id": event["event_id"], "performed_by": event["performed_by"], "points": event["points"]}
+                for event in self.events.values() if event["change_seq"] > since]
+
+    @property
+    def score(self):
+        return self.row["home_score"], self.row["away_score"]
+
+
+@pytest.fixture
+def client(fake_db):
+    invalidate_scoring_rules()
+    app = Flask(__name__)
+    app.register_blueprint(stat_keeper, url_prefix="/stat-keeper")
+    yield app.test_client()
+    invalidate_scoring_rules()
+
+
+BATCH = [
+    {"performed_by": 1, "stat_type": "two_pointer", "client_event_id": "tablet-1"},
+    {"performed_by": 2, "description": "3 Pointer", "client_event_id": "tablet-2"},
+    # The same event again within the batch
+    {"performed_by": 1, "stat_type": "two_pointer", "client_event_id": "tablet-1"},
+]
+
+
+def test_resent_batch_is_not_recorded_twice(client, fake_cursor, fake_db):
+    game = Game(fake_cursor)
+
+    first = client.post("/stat-keeper/games/5/stat-events/batch", json=BATCH)
+    assert first.status_code == 201
+    assert (first.json["created"], first.json["duplicates"]) == (2, 1)
+    event_ids = [result["event_id"] for result in first.json["results"]]
+    assert event_ids[2] == event_ids[0]
+    assert game.score == (2, 3)
+
+    # The keeper never saw the answer and sends the batch again
+    second = client.post("/stat-keeper/games/5/stat-events/batch", json=BATCH)
+    assert second.status_code == 201
+    assert (second.json["created"], second.json["duplicates"]) == (0, 3)
+    assert [result["event_id"] for result in second.json["results"]] == event_ids
+
+    assert len(game.events) == 2
+    assert len(fake_cursor.sql("INSERT INTO StatEvent (")) == 1
+    assert game.score == (2, 3)
+    assert fake_db.commits == 1
+
+
+def test_unkeyed_batch_events_are_read_back_by_a_generated_key(client, fake_cursor):
+    game = Game(fake_cursor)
+
+    response = client.post("/stat-keeper/games/5/stat-events/batch", json=[
+        {"performed_by": 1, "description": "Rebound"},
+        {"performed_by": 1, "description": "Rebound"},
+    ])
+
+    assert response.json["created"] == 2
+    keys = [event["client_event_id"] for event in game.events.values()]
+    assert len(set(keys)) == 2 and all(key.startswith("batch-") for key in keys)
+    assert sorted(result["event_id"] for result in response.json["results"]) == sorted(game.events)
+
+
+def test_deleted_events_reach_delta_sync_as_tombstones(client, fake_cursor):
+    game = Game(fake_cursor)
+    created = client.post("/stat-keeper/games/5/stat-events/batch", json=BATCH[:2]).json
+    kept_id, deleted_id = [result["event_id"] for result in created["results"]]
+
+    full = client.get("/stat-keeper/games/5/stat-events?since=0").json
+    assert full["seq"] == 1
+    assert sorted(event["event_id"] for event in full["events"]) == [kept_id, deleted_id]
+    assert full["deleted_event_ids"] == []
+
+    assert client.delete(f"/stat-keeper/games/5/stat-events/{deleted_id}").status_code == 200
+    assert game.tombstones == [{"event_id": deleted_id, "game_id": 5, "performed_by": 2, "change_seq": 2}]
+    assert game.score == (2, 0)
+
+    delta = client.get("/stat-keeper/games/5/stat-events?since=1").json
+    assert (delta["seq"], delta["reset"]) == (2, False)
+    assert delta["events"] == []
+    assert delta["deleted_event_ids"] == [deleted_id]
+
+    # A client already at seq 2 has nothing to fetch
+    assert client.get("/stat-keeper/games/5/stat-events?since=2").json["deleted_event_ids"] == []
+
+
+@pytest.mark.parametrize("is_finalized, stat_type, refreshed", [
+    (True, "two_pointer", True),
+    (True, "rebound", False),
+    (False, "two_pointer", False),
+])
+def test_deleting_an_event_refreshes_standings_only_when_a_final_score_changes(
+        client, fake_cursor, is_finalized, stat_type, refreshed):
+    Game(fake_cursor, is_finalized=is_finalized)
+    created = client.post("/stat-keeper/games/5/stat-events/batch",
+                          json=[{"performed_by": 1, "stat_type": stat_type}]).json
+    event_id = created["results"][0]["event_id"]
+    written = len(fake_cursor.statements)
+
+    assert client.delete(f"/stat-keeper/games/5/stat-events/{event_id}").status_code == 200
+    deleted = [sql for sql, _ in fake_cursor.statements[written:]]
+    assert any(sql.startswith("DELETE FROM LeagueStandings") for sql in deleted) == refreshed
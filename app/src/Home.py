@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 # import the main streamlit library as well
 # as SideBarLinks function from src/modules folder
 import streamlit as st
-import requests
+from modules import api_client
 from modules.nav import SideBarLinks
 
 # streamlit supports reguarl and wide layout (how the controls
@@ -52,7 +52,7 @@ team_captains = []
 
 try:
     # Fetch Stat Keepers
-    stat_keepers_response = requests.get(f"{SYSTEM_ADMIN_API}/stat-keepers", timeout=5)
+    stat_keepers_response = api_client.get(f"{SYSTEM_ADMIN_API}/stat-keepers", ttl=api_client.REFERENCE_TTL, timeout=5)
     if stat_keepers_response.status_code == 200:
         stat_keepers = stat_keepers_response.json()
     else:
@@ -63,7 +63,7 @@ except Exception as e:
 
 try:
     # Fetch Players
-    players_response = requests.get(f"{PLAYER_API}/players", timeout=5)
+    players_response = api_client.get(f"{PLAYER_API}/players", ttl=api_client.REFERENCE_TTL, timeout=5)
     if players_response.status_code == 200:
         players = players_response.json()
     else:
@@ -74,47 +74,30 @@ except Exception as e:
 
 try:
     # Fetch Team Captains (players with role='captain' in Teams_Players)
-    # We'll fetch all teams and their players, then filter for captains
-    teams_response = requests.get(f"{SYSTEM_ADMIN_API}/teams", timeout=5)
-    if teams_response.status_code == 200:
-        teams = teams_response.json()
+    # in one request for every team
+    captains_response = api_client.get(
+        f"{SYSTEM_ADMIN_API}/rosters",
+        params={"role": "captain"},
+        ttl=api_client.REFERENCE_TTL,
+        timeout=5
+    )
+    if captains_response.status_code == 200:
         captains_set = set()  # Use set to avoid duplicates
         
-        for team in teams:
-            team_id = team.get('team_id')
-            if team_id:
-                try:
-                    team_players_response = requests.get(
-                        f"{SYSTEM_ADMIN_API}/teams/{team_id}/players", 
-                        timeout=5
-                    )
-                    if team_players_response.status_code == 200:
-                        team_players = team_players_response.json()
-                        for tp in team_players:
-                            if tp.get('role', '').lower() == 'captain':
-                                # Add player info if not already added
-                                player_id = tp.get('player_id')
-                                if player_id and player_id not in captains_set:
-                                    captains_set.add(player_id)
-                                    # Find full player info
-                                    player_info = next(
-                                        (p for p in players if p.get('player_id') == player_id),
-                                        None
-                                    )
-                                    if player_info:
-                                        team_captains.append({
-                                            'player_id': player_id,
-                                            'first_name': player_info.get('first_name'),
-                                            'last_name': player_info.get('last_name'),
-                                            'email': player_info.get('email'),
-                                            'team_id': team_id,
-                                            'team_name': team.get('name')
-                                        })
-                except Exception as e:
-                    logger.warning(f"Error fetching players for team {team_id}: {str(e)}")
-                    continue
+        for captain in captains_response.json():
+            player_id = captain.get('player_id')
+            if player_id and player_id not in captains_set:
+                captains_set.add(player_id)
+                team_captains.append({
+                    'player_id': player_id,
+                    'first_name': captain.get('first_name'),
+                    'last_name': captain.get('last_name'),
+                    'email': captain.get('email'),
+                    'team_id': captain.get('team_id'),
+                    'team_name': captain.get('team_name')
+                })
     else:
-        logger.warning(f"Failed to fetch teams: {teams_response.status_code}")
+        logger.warning(f"Failed to fetch team captains: {captains_response.status_code}")
 except Exception as e:
     logger.error(f"Error fetching team captains: {str(e)}")
     st.warning("Unable to load team captains. Using default options.")
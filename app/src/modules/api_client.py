@@ -0,0 +1,177 @@
+# Shared HTTP client for the pages' calls to the REST API.
+
+# Streamlit reruns the whole page script on every widget interaction, so
+# the same lists (sports, leagues, teams, ...) would otherwise be refetched
+# over a brand new connection on every click. This module keeps one pooled
+# requests.Session per app process, retries idempotent requests on
+# transient failures, applies a default timeout and caches successful GET
+# responses for a short TTL. Any POST / PUT / DELETE made through it
+# invalidates the cache, so a page always sees its own writes.
+#
+# Responses that carry an ETag are kept after they expire (or are
+# invalidated): the next GET revalidates them with If-None-Match, and a
+# 304 from the API (nothing it depends on changed) reuses the cached body
+# without the API running its queries or sending the body again.
+#
+# Usage mirrors requests:
+#
+#   from modules import api_client
+#   response = api_client.get(f"{API_BASE}/sports", ttl=api_client.REFERENCE_TTL)
+#   if response.status_code == 200:
+#       sports = response.json()
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (3.05, 15)
+
+# Seconds a successful GET response is reused. REFERENCE_TTL is meant for
+# slow-changing lists such as sports and leagues; pass ttl=0 to always hit
+# the API (e.g. live game data), which still revalidates by ETag.
+DEFAULT_TTL = 15
+REFERENCE_TTL = 300
+
+MAX_CACHE_ENTRIES = 512
+
+_session = None
+_session_lock = threading.Lock()
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class CachedResponse:
+    """The parts of requests.Response the pages use, safe to share between reruns"""
+
+    def __init__(self, response):
+        self.status_code = response.status_code
+        self.ok = response.ok
+        self.url = response.url
+        self.headers = dict(response.headers)
+        self.text = response.text
+        self.etag = response.headers.get("ETag")
+
+    def json(self):
+        # Parse on every call so a page mutating the result cannot change the cached copy
+        return json.loads(self.text)
+
+
+def get_session():
+    """The process-wide pooled session, created on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _cache_key(url, params):
+    if not params:
+        return url, ()
+    return url, tuple(sorted((str(key), str(value)) for key, value in dict(params).items()))
+
+
+def invalidate(url_prefix=None):
+    """Expire cached GET responses, all of them or those whose URL starts with url_prefix.
+
+    Entries with an ETag are kept for revalidation; the others are dropped.
+    """
+    with _cache_lock:
+        for key in [key for key in _cache if url_prefix is None or key[0].startswith(url_prefix)]:
+            cached = _cache[key][1]
+            if cached.etag:
+                _cache[key] = (0, cached)
+            else:
+                del _cache[key]
+
+
+def _store(key, expires_at, cached):
+    with _cache_lock:
+        _cache[key] = (expires_at, cached)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def get(url, params=None, ttl=DEFAULT_TTL, timeout=DEFAULT_TIMEOUT, **kwargs):
+    """GET url, reusing a cached 200 response younger than ttl seconds.
+
+    An older cached response with an ETag is revalidated with If-None-Match
+    and reused when the API answers 304.
+    """
+    key = _cache_key(url, params)
+    now = time.monotonic()
+
+    with _cache_lock:
+        entry = _cache.get(key)
+    stale = None
+    if entry is not None:
+        expires_at, cached = entry
+        if ttl and expires_at > now:
+            with _cache_lock:
+                if key in _cache:
+                    _cache.move_to_end(key)
+            return cached
+        if cached.etag:
+            stale = cached
+
+    if stale is not None:
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["If-None-Match"] = stale.etag
+        kwargs["headers"] = headers
+
+    response = get_session().get(url, params=params, timeout=timeout, **kwargs)
+    if stale is not None and response.status_code == 304:
+        _store(key, now + ttl, stale)
+        return stale
+    if response.status_code != 200:
+        return response
+    if not ttl and not response.headers.get("ETag"):
+        with _cache_lock:
+            _cache.pop(key, None)
+        return response
+
+    cached = CachedResponse(response)
+    _store(key, now + ttl, cached)
+    return cached
+
+
+def _write(method, url, timeout=DEFAULT_TIMEOUT, **kwargs):
+    try:
+        return get_session().request(method, url, timeout=timeout, **kwargs)
+    finally:
+        # Any write may change data behind several cached endpoints;
+        # ETagged entries are revalidated, the rest refetched
+        invalidate()
+
+
+def post(url, **kwargs):
+    return _write("POST", url, **kwargs)
+
+
+def put(url, **kwargs):
+    return _write("PUT", url, **kwargs)
+
+
+def delete(url, **kwargs):
+    return _write("DELETE", url, **kwargs)
@@ -0,0 +1,155 @@
+# Client-side buffer for the Live Stat Entry page.
+
+# A stat button press only appends the entry to a per-game queue in
+# st.session_state, so the keeper gets feedback immediately instead of
+# waiting for a POST and a full refetch. flush() sends the queue to the
+# batch endpoint (POST /stat-keeper/games/<id>/stat-events/batch); the
+# page calls it from a fragment that reruns on a short timer.
+#
+# Every entry carries a client_event_id (its idempotency key), so a batch
+# whose response was lost (gym Wi-Fi drop, timeout) can simply be sent
+# again: entries the API already recorded come back as "duplicate" rather
+# than being counted twice. Failed flushes back off exponentially and keep
+# the entries queued; entries the API rejects (e.g. a player not on either
+# team) are moved aside with the API's error so the page can show them.
+#
+# Usage:
+#
+#   from modules import stat_buffer
+#   stat_buffer.enqueue(game_id, player_id, "2 points scored")
+#   confirmed = stat_buffer.flush(API_BASE, game_id)
+
+import time
+import uuid
+from datetime import datetime
+
+import requests
+import streamlit as st
+
+from modules import api_client
+
+# Seconds between timed flushes of the queue
+FLUSH_INTERVAL = 2
+
+# Entries sent per batch request
+BATCH_SIZE = 50
+
+# Backoff after a failed flush: 2, 4, 8, ... seconds, at most MAX_BACKOFF
+MAX_BACKOFF = 30
+
+# Confirmed entries kept for display
+MAX_CONFIRMED = 20
+
+
+def _buffer(game_id):
+    buffers = st.session_state.setdefault("stat_buffer", {})
+    return buffers.setdefault(game_id, {
+        "pending": [],
+        "rejected": [],
+        "confirmed": [],
+        "failures": 0,
+        "retry_at": 0,
+        "last_error": None,
+    })
+
+
+def enqueue(game_id, performed_by, description):
+    """Queue a stat entry for the game and return it"""
+    entry = {
+        "client_event_id": uuid.uuid4().hex,
+        "performed_by": performed_by,
+        "description": description,
+        "time_entered": datetime.now().isoformat(timespec="seconds"),
+    }
+    _buffer(game_id)["pending"].append(entry)
+    return entry
+
+
+def pending(game_id):
+    """Entries not yet confirmed by the API, oldest first"""
+    return list(_buffer(game_id)["pending"])
+
+
+def rejected(game_id):
+    """Entries the API refused, each with its "error" """
+    return list(_buffer(game_id)["rejected"])
+
+
+def confirmed(game_id):
+    """The most recently confirmed entries, each with its "event_id" """
+    return list(_buffer(game_id)["confirmed"])
+
+
+def last_error(game_id):
+    """The error of the last failed flush, or None once a flush succeeds"""
+    return _buffer(game_id)["last_error"]
+
+
+def retry_in(game_id):
+    """Seconds until the next flush attempt after a failure (0 if not backing off)"""
+    return max(0, _buffer(game_id)["retry_at"] - time.monotonic())
+
+
+def discard(game_id, client_event_id):
+    """Drop a pending or rejected entry"""
+    buffer = _buffer(game_id)
+    for key in ("pending", "rejected"):
+        buffer[key] = [entry for entry in buffer[key] if entry["client_event_id"] != client_event_id]
+
+
+def _failed(buffer, error):
+    buffer["failures"] += 1
+    buffer["last_error"] = error
+    buffer["retry_at"] = time.monotonic() + min(MAX_BACKOFF, 2 ** buffer["failures"])
+
+
+def flush(api_base, game_id, force=False):
+    """Send queued entries in batches; returns how many the API confirmed.
+
+    Skipped while backing off from a failed flush unless force is True.
+    """
+    buffer = _buffer(game_id)
+    if not buffer["pending"] or (not force and time.monotonic() < buffer["retry_at"]):
+        return 0
+
+    confirmed_count = 0
+    while buffer["pending"]:
+        batch = buffer["pending"][:BATCH_SIZE]
+        try:
+            response = api_client.post(f"{api_base}/games/{game_id}/stat-events/batch", json=batch)
+        except requests.RequestException as e:
+            _failed(buffer, f"API unreachable: {e}")
+            break
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            body = {}
+        results = body.get("results")
+        error = body.get("error", f"HTTP {response.status_code}")
+
+        if response.status_code >= 500 or response.status_code == 409 or (results is None and response.status_code < 400):
+            # Transient: keep the batch queued and resend it later
+            _failed(buffer, error)
+            break
+
+        if results is None:
+            # The API refused the whole batch (e.g. the game no longer exists)
+            results = [{"status": "error", "error": error} for _ in batch]
+
+        for entry, result in zip(batch, results):
+            if result.get("status") in ("created", "duplicate"):
+                buffer["confirmed"].append(dict(entry, event_id=result.get("event_id")))
+                confirmed_count += 1
+            else:
+                buffer["rejected"].append(dict(entry, error=result.get("error", "Unknown error")))
+        del buffer["pending"][:len(batch)]
+        del buffer["confirmed"][:-MAX_CONFIRMED]
+
+        buffer["failures"] = 0
+        buffer["retry_at"] = 0
+        buffer["last_error"] = None
+
+    return confirmed_count
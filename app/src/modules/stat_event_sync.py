@@ -0,0 +1,55 @@
+# Local copies of stat event lists, kept current with delta sync.
+
+# The stat keeper pages show a game's full stat event list and used to
+# refetch all of it on every rerun. get_stat_events() instead keeps the
+# list in st.session_state together with the game's change sequence
+# number (seq) and asks the API only for what changed since then
+# (?since=<seq>): new and edited events replace their local copy and
+# deleted event ids are dropped. The first call per list sends since=0,
+# which returns the whole list.
+#
+# Usage:
+#
+#   from modules import stat_event_sync
+#   stat_events = stat_event_sync.get_stat_events(f"{API_BASE}/games/{game_id}/stat-events")
+
+import streamlit as st
+
+from modules import api_client
+
+
+def _sort_key(event):
+    return str(event.get("time_entered") or ""), event["event_id"]
+
+
+def get_stat_events(url):
+    """The stat events at url, oldest first, brought up to date with one delta request.
+
+    If the API cannot be reached the last local copy is returned (an empty
+    list before the first successful sync).
+    """
+    copies = st.session_state.setdefault("stat_event_copies", {})
+    copy = copies.get(url)
+    since = copy["seq"] if copy and copy["seq"] is not None else 0
+
+    try:
+        response = api_client.get(url, params={"since": since}, ttl=0)
+    except Exception:
+        response = None
+    if response is None or response.status_code != 200:
+        return sorted(copy["events"].values(), key=_sort_key) if copy else []
+
+    delta = response.json()
+    if isinstance(delta, list):
+        # An API without delta sync answers with the whole list
+        copies[url] = {"seq": None, "events": {event["event_id"]: event for event in delta}}
+        return sorted(delta, key=_sort_key)
+
+    events = {} if copy is None or delta.get("reset") or not since else dict(copy["events"])
+    for event in delta.get("events", []):
+        events[event["event_id"]] = event
+    for event_id in delta.get("deleted_event_ids", []):
+        events.pop(event_id, None)
+
+    copies[url] = {"seq": delta.get("seq"), "events": events}
+    return sorted(events.values(), key=_sort_key)
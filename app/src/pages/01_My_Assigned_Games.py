@@ -1,6 +1,6 @@
 import streamlit as st
-import requests
 from datetime import datetime
+from modules import api_client, stat_event_sync
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -18,8 +18,8 @@ today = datetime.now().date()
 
 # Fetch assigned games with filtering done at API/database level
 try:
-    upcoming_response = requests.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=true")
-    past_response = requests.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=false")
+    upcoming_response = api_client.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=true")
+    past_response = api_client.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=false")
     
     if upcoming_response.status_code == 200:
         try:
@@ -193,15 +193,8 @@ with tab2:
                         st.warning("⚠️ Not finalized")
                     
                     # Get stat count
-                    try:
-                        stats_response = requests.get(f"{API_BASE}/games/{game['game_id']}/stat-events")
-                        if stats_response.status_code == 200:
-                            stat_count = len(stats_response.json())
-                            st.write(f"**{stat_count}** stat events")
-                        else:
-                            st.write("**0** stat events")
-                    except:
-                        st.write("**0** stat events")
+                    stat_count = len(stat_event_sync.get_stat_events(f"{API_BASE}/games/{game['game_id']}/stat-events"))
+                    st.write(f"**{stat_count}** stat events")
                 
                 with col3:
                     col_view, col_finalize = st.columns(2)
@@ -1,13 +1,13 @@
 import streamlit as st
-import requests
 from datetime import datetime
+from modules import api_client, stat_buffer, stat_event_sync
 from modules.nav import SideBarLinks
 
 SideBarLinks()
 st.set_page_config(layout='wide')
 
 st.title("Live Stat Entry")
-st.write("Quickly log player statistics in real-time during games.")
+st.write("Quickly log player statistics in real-time during games. Stats are queued and synced in the background, so entry keeps working through connection drops.")
 
 # Stat keeper ID - using default for now (could be stored in session_state)
 STAT_KEEPER_ID = 1
@@ -64,14 +64,14 @@ def update_game_score(api_base, game_id, player_id, points, game_data, players_l
             "home_score": new_home_score,
             "away_score": new_away_score
         }
-        response = requests.put(f"{api_base}/games/{game_id}", json=update_data)
+        response = api_client.put(f"{api_base}/games/{game_id}", json=update_data)
         return response.status_code == 200
     except:
         return False
 
 # Fetch assigned games with filtering done at API/database level
 try:
-    games_response = requests.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=true")
+    games_response = api_client.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=true")
     if games_response.status_code == 200:
         all_games = games_response.json()
         # Filter out games without teams assigned (can't track stats without teams)
@@ -137,9 +137,8 @@ game_id = selected_game_option['game_id']
 
 # Fetch game details
 try:
-    game_response = requests.get(f"{API_BASE}/games/{game_id}")
-    players_response = requests.get(f"{API_BASE}/games/{game_id}/players")
-    stats_response = requests.get(f"{API_BASE}/games/{game_id}/stat-events")
+    game_response = api_client.get(f"{API_BASE}/games/{game_id}", ttl=0)
+    players_response = api_client.get(f"{API_BASE}/games/{game_id}/players", ttl=0)
     
     if game_response.status_code == 200:
         game = game_response.json()
@@ -152,10 +151,8 @@ try:
     else:
         players = []
     
-    if stats_response.status_code == 200:
-        stat_events = stats_response.json()
-    else:
-        stat_events = []
+    # Only the changes since the last rerun are fetched
+    stat_events = stat_event_sync.get_stat_events(f"{API_BASE}/games/{game_id}/stat-events")
 except Exception as e:
     st.error(f"Error loading game data: {str(e)}")
     st.stop()
@@ -166,12 +163,21 @@ away_team_id = game.get('away_team_id')
 home_players = [p for p in players if home_team_id and p.get('team_id') == home_team_id]
 away_players = [p for p in players if away_team_id and p.get('team_id') == away_team_id]
 
+# Points of queued stats that the API has not confirmed yet
+queued_stats = stat_buffer.pending(game_id)
+home_player_ids = {p['player_id'] for p in home_players}
+away_player_ids = {p['player_id'] for p in away_players}
+pending_home_points = sum(get_points_for_stat(e['description']) for e in queued_stats if e['performed_by'] in home_player_ids)
+pending_away_points = sum(get_points_for_stat(e['description']) for e in queued_stats if e['performed_by'] in away_player_ids)
+
 # Display game header with live score
 col1, col2, col3 = st.columns([2, 1, 2])
 with col1:
     home_team_name = game.get('home_team') or 'TBD'
     st.subheader(f"{home_team_name}")
     st.metric("Score", game.get('home_score', 0))
+    if pending_home_points:
+        st.caption(f"⏳ +{pending_home_points} pending")
 with col2:
     st.write("")
     st.write("**VS**")
@@ -182,6 +188,8 @@ with col3:
     away_team_name = game.get('away_team') or 'TBD'
     st.subheader(f"{away_team_name}")
     st.metric("Score", game.get('away_score', 0))
+    if pending_away_points:
+        st.caption(f"⏳ +{pending_away_points} pending")
 
 st.divider()
 
@@ -232,8 +240,8 @@ with col_left:
     if not players and home_team_id and away_team_id:
         try:
             player_api_base = "http://web-api:4000/player"
-            home_team_players_response = requests.get(f"{player_api_base}/teams/{home_team_id}/players")
-            away_team_players_response = requests.get(f"{player_api_base}/teams/{away_team_id}/players")
+            home_team_players_response = api_client.get(f"{player_api_base}/teams/{home_team_id}/players")
+            away_team_players_response = api_client.get(f"{player_api_base}/teams/{away_team_id}/players")
             
             home_team_players = home_team_players_response.json() if home_team_players_response.status_code == 200 else []
             away_team_players = away_team_players_response.json() if away_team_players_response.status_code == 200 else []
@@ -293,31 +301,12 @@ with col_left:
                     use_container_width=True,
                     type="primary"
                 ):
-                    try:
-                        # First, record the stat event
-                        stat_data = {
-                            "performed_by": selected_player_id,
-                            "description": description
-                        }
-                        response = requests.post(
-                            f"{API_BASE}/games/{game_id}/stat-events",
-                            json=stat_data
-                        )
-                        if response.status_code == 201:
-                            # If it's a scoring stat, also update the game score
-                            if points > 0:
-                                score_updated = update_game_score(API_BASE, game_id, selected_player_id, points, game, all_players_list)
-                                if score_updated:
-                                    st.success(f"✅ {label} recorded! (+{points} points)")
-                                else:
-                                    st.warning(f"✅ {label} recorded, but score update failed")
-                            else:
-                                st.success(f"✅ {label} recorded!")
-                            st.rerun()
-                        else:
-                            st.error(f"Error: {response.json().get('error', 'Unknown error')}")
-                    except Exception as e:
-                        st.error(f"Error: {str(e)}")
+                    # Queue the stat; the sync panel sends it (and the API updates the score)
+                    stat_buffer.enqueue(game_id, selected_player_id, description)
+                    if points > 0:
+                        st.toast(f"⏳ {label} queued (+{points} points)")
+                    else:
+                        st.toast(f"⏳ {label} queued")
         
         st.divider()
         
@@ -330,27 +319,46 @@ with col_left:
             with col_submit:
                 if st.form_submit_button("Add Stat", type="primary"):
                     if custom_description:
-                        try:
-                            stat_data = {
-                                "performed_by": selected_player_id,
-                                "description": custom_description
-                            }
-                            response = requests.post(
-                                f"{API_BASE}/games/{game_id}/stat-events",
-                                json=stat_data
-                            )
-                            if response.status_code == 201:
-                                st.success("Stat added successfully!")
-                                st.rerun()
-                            else:
-                                st.error(f"Error: {response.json().get('error', 'Unknown error')}")
-                        except Exception as e:
-                            st.error(f"Error: {str(e)}")
+                        stat_buffer.enqueue(game_id, selected_player_id, custom_description)
+                        st.success("Stat queued!")
                     else:
                         st.warning("Please enter a stat description")
     
     st.divider()
     
+    # Queued stats not confirmed by the API yet (including any just added), and stats it refused
+    queued_stats = stat_buffer.pending(game_id)
+    rejected_stats = stat_buffer.rejected(game_id)
+    if queued_stats or rejected_stats:
+        st.subheader("Not Yet Recorded")
+        for entry in reversed(queued_stats):
+            player_name = next(
+                (f"{p['first_name']} {p['last_name']}" for p in all_players_list if p['player_id'] == entry['performed_by']),
+                "Unknown Player"
+            )
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.write(f"⏳ **{player_name}**: {entry['description']}")
+                st.caption(f"Pending since {entry['time_entered']}")
+            with col2:
+                if st.button("✖️ Discard", key=f"discard_{entry['client_event_id']}"):
+                    stat_buffer.discard(game_id, entry['client_event_id'])
+                    st.rerun()
+        for entry in reversed(rejected_stats):
+            player_name = next(
+                (f"{p['first_name']} {p['last_name']}" for p in all_players_list if p['player_id'] == entry['performed_by']),
+                "Unknown Player"
+            )
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.write(f"⚠️ **{player_name}**: {entry['description']}")
+                st.caption(f"Not recorded: {entry['error']}")
+            with col2:
+                if st.button("✖️ Dismiss", key=f"discard_{entry['client_event_id']}"):
+                    stat_buffer.discard(game_id, entry['client_event_id'])
+                    st.rerun()
+        st.divider()
+    
     # Recent stats with undo/delete
     st.subheader("Recent Stats (Last 10)")
     if stat_events:
@@ -376,7 +384,7 @@ with col_left:
                         # Check if this was a scoring stat - we need to subtract points
                         points = get_points_for_stat(event['description'])
                         
-                        delete_response = requests.delete(
+                        delete_response = api_client.delete(
                             f"{API_BASE}/games/{game_id}/stat-events/{event['event_id']}"
                         )
                         if delete_response.status_code == 200:
@@ -422,7 +430,7 @@ with col_left:
                                 update_data = {"description": new_description}
                                 if selected_player_id:
                                     update_data["performed_by"] = selected_player_id
-                                update_response = requests.put(
+                                update_response = api_client.put(
                                     f"{API_BASE}/games/{game_id}/stat-events/{event['event_id']}",
                                     json=update_data
                                 )
@@ -444,11 +452,30 @@ with col_left:
         st.info("No stats recorded yet. Start logging stats above!")
 
 with col_right:
+    @st.fragment(run_every=stat_buffer.FLUSH_INTERVAL)
+    def sync_status():
+        """Flush queued stats on a timer and show what is still waiting"""
+        if stat_buffer.flush(API_BASE, game_id):
+            # New stats are recorded: refresh the score, recent stats and summary
+            st.rerun()
+        waiting = stat_buffer.pending(game_id)
+        if not waiting:
+            st.caption("✅ All stats synced")
+        elif stat_buffer.last_error(game_id):
+            st.warning(
+                f"⏳ {len(waiting)} stat(s) waiting to sync, retrying in {stat_buffer.retry_in(game_id):.0f}s "
+                f"({stat_buffer.last_error(game_id)})"
+            )
+        else:
+            st.info(f"⏳ {len(waiting)} stat(s) syncing...")
+    
+    sync_status()
+    
     st.subheader("Live Summary")
     
     # Use the API summary endpoint for team totals and top performers
     try:
-        summary_response = requests.get(f"{API_BASE}/games/{game_id}/summary")
+        summary_response = api_client.get(f"{API_BASE}/games/{game_id}/summary", ttl=0)
         if summary_response.status_code == 200:
             summary = summary_response.json()
             team_totals = summary.get('team_totals', {})
@@ -502,6 +529,7 @@ with col_right:
     
     # Auto-refresh option
     if st.button("🔄 Refresh Stats", use_container_width=True):
+        stat_buffer.flush(API_BASE, game_id, force=True)
         st.rerun()
     
     st.divider()
@@ -509,5 +537,9 @@ with col_right:
     # Proceed to finalization button
     st.write("**Done entering stats?**")
     if st.button("Proceed to Finalization →", type="primary", use_container_width=True):
-        st.session_state['selected_game_id'] = game_id
-        st.switch_page('pages/03_Game_Finalization.py')
\ No newline at end of file
+        stat_buffer.flush(API_BASE, game_id, force=True)
+        if stat_buffer.pending(game_id):
+            st.error("Some stats have not synced yet. Check the connection and try again.")
+        else:
+            st.session_state['selected_game_id'] = game_id
+            st.switch_page('pages/03_Game_Finalization.py')
\ No newline at end of file
@@ -1,7 +1,7 @@
 import streamlit as st
-import requests
 import time
 from datetime import datetime
+from modules import api_client, stat_event_sync
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -20,8 +20,8 @@ selected_game_id_from_state = st.session_state.get('selected_game_id')
 # Fetch assigned games from both upcoming and past endpoints
 try:
     # Get both upcoming and past games from API
-    upcoming_response = requests.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=true")
-    past_response = requests.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=false")
+    upcoming_response = api_client.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=true")
+    past_response = api_client.get(f"{API_BASE}/stat-keepers/{STAT_KEEPER_ID}/games?upcoming_only=false")
     
     all_games = []
     if upcoming_response.status_code == 200:
@@ -100,9 +100,8 @@ game_id = selected_game_option['game_id']
 
 # Fetch game summary
 try:
-    summary_response = requests.get(f"{API_BASE}/games/{game_id}/summary")
-    players_response = requests.get(f"{API_BASE}/games/{game_id}/players")
-    stats_response = requests.get(f"{API_BASE}/games/{game_id}/stat-events")
+    summary_response = api_client.get(f"{API_BASE}/games/{game_id}/summary", ttl=0)
+    players_response = api_client.get(f"{API_BASE}/games/{game_id}/players", ttl=0)
     
     if summary_response.status_code == 200:
         summary = summary_response.json()
@@ -119,10 +118,7 @@ try:
     else:
         players = []
     
-    if stats_response.status_code == 200:
-        stat_events = stats_response.json()
-    else:
-        stat_events = []
+    stat_events = stat_event_sync.get_stat_events(f"{API_BASE}/games/{game_id}/stat-events")
 except Exception as e:
     st.error(f"Error loading game data: {str(e)}")
     st.stop()
@@ -189,7 +185,7 @@ with st.form("update_score_form"):
                 "home_score": new_home_score,
                 "away_score": new_away_score
             }
-            response = requests.put(f"{API_BASE}/games/{game_id}", json=update_data)
+            response = api_client.put(f"{API_BASE}/games/{game_id}", json=update_data)
             if response.status_code == 200:
                 st.success("Scores updated successfully!")
                 st.rerun()
@@ -323,7 +319,7 @@ with col_finalize:
                 "away_score": new_away_score if 'new_away_score' in locals() else current_away_score,
                 "is_finalized": True  # Mark game as finalized
             }
-            response = requests.put(f"{API_BASE}/games/{game_id}", json=final_data)
+            response = api_client.put(f"{API_BASE}/games/{game_id}", json=final_data)
             if response.status_code == 200:
                 # Mark as finalizing in session state and show celebration
                 st.session_state[game_finalizing_key] = True
@@ -1,7 +1,7 @@
 import streamlit as st
-import requests
 import pandas as pd
 from datetime import datetime
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -17,8 +17,8 @@ ADMIN_API_BASE = "http://web-api:4000/system-admin"
 
 # Fetch player stats and analytics
 try:
-    stats_response = requests.get(f"{API_BASE}/players/{PLAYER_ID}/stats")
-    analytics_response = requests.get(f"{API_BASE}/analytics/players/{PLAYER_ID}")
+    stats_response = api_client.get(f"{API_BASE}/players/{PLAYER_ID}/stats")
+    analytics_response = api_client.get(f"{API_BASE}/analytics/players/{PLAYER_ID}")
     
     if stats_response.status_code == 200:
         stats_data = stats_response.json()
@@ -142,7 +142,7 @@ with tab4:
     
     # Get player's teams to find leagues
     try:
-        teams_response = requests.get(f"{API_BASE}/players/{PLAYER_ID}/teams")
+        teams_response = api_client.get(f"{API_BASE}/players/{PLAYER_ID}/teams")
         if teams_response.status_code == 200:
             player_teams = teams_response.json()
         else:
@@ -164,7 +164,7 @@ with tab4:
         
         # Fetch all leagues from system admin API to get correct sport mapping
         try:
-            all_leagues_response = requests.get(f"{ADMIN_API_BASE}/leagues")
+            all_leagues_response = api_client.get(f"{ADMIN_API_BASE}/leagues", ttl=api_client.REFERENCE_TTL)
             if all_leagues_response.status_code == 200:
                 all_leagues_data = all_leagues_response.json()
                 # Create a mapping of league_id to league info
@@ -217,7 +217,7 @@ with tab4:
             
             if selected_league_id:
                 try:
-                    standings_response = requests.get(f"{API_BASE}/leagues/{selected_league_id}/standings")
+                    standings_response = api_client.get(f"{API_BASE}/leagues/{selected_league_id}/standings")
                     if standings_response.status_code == 200:
                         standings = standings_response.json()
                         
@@ -1,6 +1,6 @@
 import streamlit as st
-import requests
 from datetime import datetime
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -15,8 +15,8 @@ API_BASE = "http://web-api:4000/player"
 
 # Fetch player games
 try:
-    upcoming_response = requests.get(f"{API_BASE}/players/{PLAYER_ID}/games?upcoming_only=true")
-    past_response = requests.get(f"{API_BASE}/players/{PLAYER_ID}/games?upcoming_only=false")
+    upcoming_response = api_client.get(f"{API_BASE}/players/{PLAYER_ID}/games?upcoming_only=true")
+    past_response = api_client.get(f"{API_BASE}/players/{PLAYER_ID}/games?upcoming_only=false")
     
     if upcoming_response.status_code == 200:
         upcoming_games = upcoming_response.json()
@@ -82,7 +82,7 @@ with tab1:
                 # Game details expandable
                 if st.session_state.get(f"viewing_game_{game['game_id']}", False):
                     try:
-                        game_response = requests.get(f"{API_BASE}/games/{game['game_id']}")
+                        game_response = api_client.get(f"{API_BASE}/games/{game['game_id']}")
                         if game_response.status_code == 200:
                             game_details = game_response.json()
                             
@@ -147,7 +147,7 @@ with tab2:
                 # Game details expandable
                 if st.session_state.get(f"viewing_past_game_{game['game_id']}", False):
                     try:
-                        game_response = requests.get(f"{API_BASE}/games/{game['game_id']}")
+                        game_response = api_client.get(f"{API_BASE}/games/{game['game_id']}")
                         if game_response.status_code == 200:
                             game_details = game_response.json()
                             
@@ -1,7 +1,7 @@
 import streamlit as st
-import requests
 import pandas as pd
 from datetime import datetime
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -17,7 +17,7 @@ ADMIN_API_BASE = "http://web-api:4000/system-admin"
 
 # Get player's teams to find their leagues
 try:
-    teams_response = requests.get(f"{API_BASE}/players/{PLAYER_ID}/teams")
+    teams_response = api_client.get(f"{API_BASE}/players/{PLAYER_ID}/teams")
     if teams_response.status_code == 200:
         player_teams = teams_response.json()
     else:
@@ -28,7 +28,7 @@ except Exception as e:
 
 # Get all leagues (using system admin endpoint)
 try:
-    leagues_response = requests.get(f"{ADMIN_API_BASE}/leagues")
+    leagues_response = api_client.get(f"{ADMIN_API_BASE}/leagues", ttl=api_client.REFERENCE_TTL)
     if leagues_response.status_code == 200:
         all_leagues = leagues_response.json()
     else:
@@ -39,7 +39,7 @@ except Exception as e:
 
 # Get all sports (using system admin endpoint)
 try:
-    sports_response = requests.get(f"{ADMIN_API_BASE}/sports")
+    sports_response = api_client.get(f"{ADMIN_API_BASE}/sports", ttl=api_client.REFERENCE_TTL)
     if sports_response.status_code == 200:
         all_sports = sports_response.json()
     else:
@@ -80,7 +80,7 @@ if all_leagues:
         if selected_league_id:
             try:
                 # Get teams in selected league
-                teams_response = requests.get(f"{API_BASE}/leagues/{selected_league_id}/teams")
+                teams_response = api_client.get(f"{API_BASE}/leagues/{selected_league_id}/teams")
                 if teams_response.status_code == 200:
                     league_teams = teams_response.json()
                     
@@ -120,8 +120,8 @@ if all_leagues:
                             # Show team details inline if viewing
                             if st.session_state.get(f"viewing_team_{team['team_id']}", False):
                                 try:
-                                    team_details_response = requests.get(f"{API_BASE}/teams/{team['team_id']}")
-                                    team_players_response = requests.get(f"{API_BASE}/teams/{team['team_id']}/players")
+                                    team_details_response = api_client.get(f"{API_BASE}/teams/{team['team_id']}")
+                                    team_players_response = api_client.get(f"{API_BASE}/teams/{team['team_id']}/players")
                                     
                                     if team_details_response.status_code == 200 and team_players_response.status_code == 200:
                                         team_details = team_details_response.json()
@@ -203,8 +203,8 @@ if all_sports:
                     if st.session_state.get(f"viewing_league_{selected_league_id}", False):
                         try:
                             # Get league teams and games
-                            league_teams_response = requests.get(f"{API_BASE}/leagues/{selected_league_id}/teams")
-                            league_games_response = requests.get(f"{API_BASE}/leagues/{selected_league_id}/games")
+                            league_teams_response = api_client.get(f"{API_BASE}/leagues/{selected_league_id}/teams")
+                            league_games_response = api_client.get(f"{API_BASE}/leagues/{selected_league_id}/games")
                             
                             if league_teams_response.status_code == 200 and league_games_response.status_code == 200:
                                 league_teams = league_teams_response.json()
@@ -1,6 +1,6 @@
 import streamlit as st
-import requests
 import pandas as pd
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -14,36 +14,29 @@ TEAM_ID = st.session_state.get('team_id', 1)
 API_BASE = "http://web-api:4000/team-captain"
 
 try:
-    summary_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/summary")
-    comparison_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/league-comparison")
-    splits_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/home-away-splits")
-    opponents_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/opponents")
-    
-    if summary_response.status_code == 200:
-        summary = summary_response.json()
-    else:
-        summary = None
-    
-    if comparison_response.status_code == 200:
-        comparison = comparison_response.json()
-    else:
-        comparison = None
+    # One round trip for every section of this page
+    dashboard_response = api_client.get(
+        f"{API_BASE}/teams/{TEAM_ID}/dashboard",
+        params={"sections": "summary,league_comparison,home_away_splits,opponents,head_to_head"}
+    )
     
-    if splits_response.status_code == 200:
-        splits = splits_response.json()
+    if dashboard_response.status_code == 200:
+        dashboard = dashboard_response.json()
     else:
-        splits = []
+        dashboard = {}
     
-    if opponents_response.status_code == 200:
-        opponents = opponents_response.json()
-    else:
-        opponents = []
+    summary = dashboard.get("summary")
+    comparison = dashboard.get("league_comparison")
+    splits = dashboard.get("home_away_splits", [])
+    opponents = dashboard.get("opponents", [])
+    head_to_head = {h["opponent_id"]: h for h in dashboard.get("head_to_head", [])}
 except Exception as e:
     st.error(f"Error fetching data: {str(e)}")
     summary = None
     comparison = None
     splits = []
     opponents = []
+    head_to_head = {}
 
 if summary:
     st.subheader(f"Team Summary: {summary.get('name', 'Unknown Team')}")
@@ -232,9 +225,8 @@ if opponents:
     
     if selected_opponent:
         try:
-            opponent_stats_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/opponent/{selected_opponent['team_id']}")
-            if opponent_stats_response.status_code == 200:
-                opponent_stats = opponent_stats_response.json()
+            opponent_stats = head_to_head.get(selected_opponent['team_id'])
+            if opponent_stats:
                 
                 col1, col2, col3, col4 = st.columns(4)
                 
@@ -1,7 +1,7 @@
 import streamlit as st
-import requests
 import time as time_module
 from datetime import datetime, date, time
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -15,8 +15,8 @@ TEAM_ID = st.session_state.get('team_id', 1)
 API_BASE = "http://web-api:4000/team-captain"
 
 try:
-    upcoming_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/games?upcoming_only=true")
-    past_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/games?upcoming_only=false")
+    upcoming_response = api_client.get(f"{API_BASE}/teams/{TEAM_ID}/games?upcoming_only=true")
+    past_response = api_client.get(f"{API_BASE}/teams/{TEAM_ID}/games?upcoming_only=false")
     
     if upcoming_response.status_code == 200:
         upcoming_games = upcoming_response.json()
@@ -72,7 +72,7 @@ with tab1:
                     with col_confirm:
                         if st.button(f"Confirm Delete", key=f"confirm_delete_{game['game_id']}_{idx}", type="primary"):
                             try:
-                                response = requests.delete(f"{API_BASE}/games/{game['game_id']}")
+                                response = api_client.delete(f"{API_BASE}/games/{game['game_id']}")
                                 if response.status_code == 200:
                                     st.success("Game deleted successfully!")
                                     st.session_state[f"confirming_delete_{game['game_id']}"] = False
@@ -93,12 +93,12 @@ with tab1:
                 if st.session_state.get(f"editing_game_{game['game_id']}", False):
                     st.write("**Stat Keepers:**")
                     try:
-                        assigned_response = requests.get(f"{API_BASE}/games/{game['game_id']}/stat-keepers")
+                        assigned_response = api_client.get(f"{API_BASE}/games/{game['game_id']}/stat-keepers")
                         assigned_keepers = assigned_response.json() if assigned_response.status_code == 200 else []
                     except:
                         assigned_keepers = []
                     try:
-                        all_keepers_response = requests.get(f"{API_BASE}/stat-keepers")
+                        all_keepers_response = api_client.get(f"{API_BASE}/stat-keepers")
                         all_keepers = all_keepers_response.json() if all_keepers_response.status_code == 200 else []
                     except:
                         all_keepers = []
@@ -112,7 +112,7 @@ with tab1:
                             with col_remove:
                                 if st.button("Remove", key=f"remove_keeper_edit_{game['game_id']}_{keeper['keeper_id']}_{idx}"):
                                     try:
-                                        remove_response = requests.delete(
+                                        remove_response = api_client.delete(
                                             f"{API_BASE}/games/{game['game_id']}/stat-keepers",
                                             json={"keeper_id": keeper['keeper_id']}
                                         )
@@ -138,7 +138,7 @@ with tab1:
                                 st.markdown('<div style="height: 1.5rem;"></div>', unsafe_allow_html=True)
                                 if selected_keeper_display and st.button("Assign", key=f"assign_keeper_btn_{game['game_id']}_{idx}", use_container_width=True):
                                     try:
-                                        assign_response = requests.post(
+                                        assign_response = api_client.post(
                                             f"{API_BASE}/games/{game['game_id']}/stat-keepers",
                                             json={"keeper_id": selected_keeper_display}
                                         )
@@ -165,7 +165,7 @@ with tab1:
                                         "start_time": str(new_time),
                                         "location": new_location
                                     }
-                                    response = requests.put(f"{API_BASE}/games/{game['game_id']}", json=update_data)
+                                    response = api_client.put(f"{API_BASE}/games/{game['game_id']}", json=update_data)
                                     if response.status_code == 200:
                                         st.success("Game updated successfully!")
                                         st.session_state[f"editing_game_{game['game_id']}"] = False
@@ -205,7 +205,7 @@ with tab2:
                 
                 if st.session_state.get(f"viewing_stats_{game['game_id']}", False):
                     try:
-                        stats_response = requests.get(f"{API_BASE}/games/{game['game_id']}/teams/{TEAM_ID}/stat-events")
+                        stats_response = api_client.get(f"{API_BASE}/games/{game['game_id']}/teams/{TEAM_ID}/stat-events")
                         if stats_response.status_code == 200:
                             stat_events = stats_response.json()
                             if stat_events:
@@ -228,7 +228,7 @@ with tab3:
     with st.form("schedule_game_form"):
         try:
             # Fetch leagues from API (filtered by team using SQL)
-            leagues_response = requests.get(f"{API_BASE}/leagues?team_id={TEAM_ID}")
+            leagues_response = api_client.get(f"{API_BASE}/leagues?team_id={TEAM_ID}")
             if leagues_response.status_code == 200:
                 leagues = leagues_response.json()
             else:
@@ -252,12 +252,12 @@ with tab3:
                 try:
                     league_id = selected_league['league_id']
                     # Use SQL filtering to exclude current team and get teams in league
-                    teams_response = requests.get(f"{API_BASE}/leagues/{league_id}/teams?exclude_team_id={TEAM_ID}")
+                    teams_response = api_client.get(f"{API_BASE}/leagues/{league_id}/teams?exclude_team_id={TEAM_ID}")
                     if teams_response.status_code == 200:
                         opponent_teams = teams_response.json()
                         
                         # Verify captain's team is in this league (safety check, should always pass since leagues are pre-filtered)
-                        captain_team_check = requests.get(f"{API_BASE}/leagues/{league_id}/teams")
+                        captain_team_check = api_client.get(f"{API_BASE}/leagues/{league_id}/teams")
                         if captain_team_check.status_code == 200:
                             all_teams_in_league = captain_team_check.json()
                             captain_team_in_league = any(t.get("team_id") == TEAM_ID for t in all_teams_in_league)
@@ -293,7 +293,7 @@ with tab3:
             st.divider()
             st.write("**Assign Stat Keeper (Optional):**")
             try:
-                keepers_response = requests.get(f"{API_BASE}/stat-keepers")
+                keepers_response = api_client.get(f"{API_BASE}/stat-keepers")
                 all_keepers = keepers_response.json() if keepers_response.status_code == 200 else []
             except:
                 all_keepers = []
@@ -333,13 +333,13 @@ with tab3:
                             "away_team_id": opponent["team_id"] if is_home == "Home" else TEAM_ID
                         }
                         
-                        response = requests.post(f"{API_BASE}/games", json=game_data)
+                        response = api_client.post(f"{API_BASE}/games", json=game_data)
                         if response.status_code == 201:
                             game_result = response.json()
                             new_game_id = game_result.get("game_id")
                             if selected_keeper_id and new_game_id:
                                 try:
-                                    keeper_response = requests.post(
+                                    keeper_response = api_client.post(
                                         f"{API_BASE}/games/{new_game_id}/stat-keepers",
                                         json={"keeper_id": selected_keeper_id}
                                     )
@@ -361,6 +361,10 @@ with tab3:
                             except:
                                 error_msg = f'HTTP {response.status_code}: {response.text[:200]}'
                             st.error(f"Error scheduling game: {error_msg}")
+                            if response.status_code == 409:
+                                for conflict in response.json().get("conflicts", []):
+                                    st.write(f"- {conflict['resource'].title()} {conflict['resource_id']} is already booked "
+                                             f"{conflict['start']} to {conflict['end']}")
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
         except Exception as e:
@@ -373,7 +377,7 @@ with tab4:
     # Get team info for dropdown - fetch from API to ensure valid team IDs
     try:
         # Try to get team info from the summary endpoint to validate team exists
-        team_summary_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/summary")
+        team_summary_response = api_client.get(f"{API_BASE}/teams/{TEAM_ID}/summary")
         if team_summary_response.status_code == 200:
             team_summary = team_summary_response.json()
             teams = [{"team_id": TEAM_ID, "name": team_summary.get("name", "My Team")}]
@@ -381,7 +385,7 @@ with tab4:
             # Fallback: try to get teams from system admin API
             try:
                 admin_api_base = "http://web-api:4000/system-admin"
-                admin_teams_response = requests.get(f"{admin_api_base}/teams")
+                admin_teams_response = api_client.get(f"{admin_api_base}/teams")
                 if admin_teams_response.status_code == 200:
                     admin_teams = admin_teams_response.json()
                     teams = [{"team_id": t["team_id"], "name": t["name"]} for t in admin_teams[:5]]  # Limit to first 5
@@ -402,7 +406,7 @@ with tab4:
         selected_team_id = TEAM_ID
     
     try:
-        upcoming_response = requests.get(f"{API_BASE}/teams/{selected_team_id}/games?upcoming_only=true")
+        upcoming_response = api_client.get(f"{API_BASE}/teams/{selected_team_id}/games?upcoming_only=true")
         if upcoming_response.status_code == 200:
             upcoming_games = upcoming_response.json()
         else:
@@ -439,7 +443,7 @@ with tab4:
                 if game_id_for_reminder:
                     reminder_data["game_id"] = game_id_for_reminder
                 
-                response = requests.post(f"{API_BASE}/reminders", json=reminder_data)
+                response = api_client.post(f"{API_BASE}/reminders", json=reminder_data)
                 if response.status_code == 201:
                     st.success("✅ Reminder sent successfully! The team will receive this notification to prompt stat entry via our POST /reminders route.")
                     st.rerun()
@@ -455,7 +459,7 @@ with tab4:
     st.divider()
     st.write("**Recent Reminders:**")
     try:
-        reminders_response = requests.get(f"{API_BASE}/teams/{selected_team_id}/reminders")
+        reminders_response = api_client.get(f"{API_BASE}/teams/{selected_team_id}/reminders")
         if reminders_response.status_code == 200:
             reminders = reminders_response.json()
             if reminders:
@@ -1,6 +1,6 @@
 import streamlit as st
-import requests
 import pandas as pd
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -14,18 +14,18 @@ TEAM_ID = st.session_state.get('team_id', 1)
 API_BASE = "http://web-api:4000/team-captain"
 
 try:
-    performance_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/performance")
-    performance_over_time_response = requests.get(f"{API_BASE}/teams/{TEAM_ID}/performance-over-time")
+    dashboard_response = api_client.get(
+        f"{API_BASE}/teams/{TEAM_ID}/dashboard",
+        params={"sections": "performance,performance_over_time"}
+    )
     
-    if performance_response.status_code == 200:
-        performance = performance_response.json()
+    if dashboard_response.status_code == 200:
+        dashboard = dashboard_response.json()
     else:
-        performance = None
+        dashboard = {}
     
-    if performance_over_time_response.status_code == 200:
-        performance_over_time = performance_over_time_response.json()
-    else:
-        performance_over_time = []
+    performance = dashboard.get("performance")
+    performance_over_time = dashboard.get("performance_over_time", [])
 except Exception as e:
     st.error(f"Error fetching performance data: {str(e)}")
     performance = None
@@ -1,7 +1,7 @@
 import streamlit as st
-import requests
 import pandas as pd
 from datetime import datetime, timedelta
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -12,6 +12,43 @@ st.write("View, filter, and update all system data including sports, leagues, te
 
 API_BASE = "http://web-api:4000/system-admin"
 
+# Rows per page for the paginated players and games tables
+PAGE_SIZE = 100
+
+# Results shown by the player search pickers
+PLAYER_SEARCH_LIMIT = 20
+
+# Game day choices for the season schedule generator
+SCHEDULE_WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+def page_after_token(table_key, filters):
+    """after token of the page shown for a paginated table (back to page 1 when its filters change)"""
+    state_key = f"{table_key}_page_tokens"
+    if st.session_state.get(f"{table_key}_page_filters") != filters:
+        st.session_state[f"{table_key}_page_filters"] = filters
+        st.session_state[state_key] = [None]
+    return st.session_state[state_key][-1]
+
+
+def page_navigation(table_key, next_after, total=None):
+    """Previous / Next buttons under a paginated table"""
+    tokens = st.session_state[f"{table_key}_page_tokens"]
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("◀ Previous", key=f"{table_key}_prev_page", disabled=len(tokens) == 1):
+            tokens.pop()
+            st.rerun()
+    with col_info:
+        info = f"Page {len(tokens)}"
+        if total is not None:
+            info += f" of {max(1, -(-total // PAGE_SIZE))} ({total} total)"
+        st.caption(info)
+    with col_next:
+        if st.button("Next ▶", key=f"{table_key}_next_page", disabled=not next_after):
+            tokens.append(next_after)
+            st.rerun()
+
 # Create tabs for different entity types
 tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["🏀 Sports", "🏆 Leagues", "👥 Teams", "🏃 Players", "🎮 Games", "📊 Stat Keepers"])
 
@@ -28,7 +65,7 @@ with tab1:
     
     try:
         # Fetch all sports
-        sports_response = requests.get(f"{API_BASE}/sports")
+        sports_response = api_client.get(f"{API_BASE}/sports", ttl=api_client.REFERENCE_TTL)
         if sports_response.status_code == 200:
             sports = sports_response.json()
             
@@ -64,7 +101,7 @@ with tab1:
                             if new_description:
                                 update_data["description"] = new_description
                             
-                            update_response = requests.put(f"{API_BASE}/sports/{selected_sport_id}", json=update_data)
+                            update_response = api_client.put(f"{API_BASE}/sports/{selected_sport_id}", json=update_data)
                             
                             # Clear flag immediately
                             if update_key in st.session_state:
@@ -84,7 +121,7 @@ with tab1:
                 
                 if st.button("🗑️ Delete Sport", key="delete_sport_button", type="secondary"):
                     try:
-                        delete_response = requests.delete(f"{API_BASE}/sports/{selected_delete_sport_id}")
+                        delete_response = api_client.delete(f"{API_BASE}/sports/{selected_delete_sport_id}")
                         if delete_response.status_code == 200:
                             st.success("Sport deleted successfully!")
                             st.rerun()  # Need explicit rerun for button clicks (not forms)
@@ -112,7 +149,7 @@ with tab1:
                         if new_sport_description:
                             create_data["description"] = new_sport_description
                         
-                        create_response = requests.post(f"{API_BASE}/sports", json=create_data)
+                        create_response = api_client.post(f"{API_BASE}/sports", json=create_data)
                         if create_response.status_code == 201:
                             st.success("Sport created successfully!")
                             # Form will auto-rerun, no need to call st.rerun()
@@ -144,7 +181,7 @@ with tab2:
     
     try:
         # Fetch sports for filtering dropdown
-        sports_response = requests.get(f"{API_BASE}/sports")
+        sports_response = api_client.get(f"{API_BASE}/sports", ttl=api_client.REFERENCE_TTL)
         sports = sports_response.json() if sports_response.status_code == 200 else []
         sport_map = {s['sport_id']: s['name'] for s in sports}
         
@@ -182,7 +219,7 @@ with tab2:
         league_params["max_year"] = max_year_filter
         
         # Fetch leagues with filters applied via SQL
-        leagues_response = requests.get(f"{API_BASE}/leagues", params=league_params)
+        leagues_response = api_client.get(f"{API_BASE}/leagues", params=league_params)
         if leagues_response.status_code == 200:
             leagues = leagues_response.json()
             
@@ -248,7 +285,7 @@ with tab2:
                                     "league_end": new_end.isoformat()
                                 }
                                 
-                                update_response = requests.put(f"{API_BASE}/leagues/{selected_league_id}", json=update_data)
+                                update_response = api_client.put(f"{API_BASE}/leagues/{selected_league_id}", json=update_data)
                                 
                                 # Clear flag immediately
                                 if update_key in st.session_state:
@@ -287,7 +324,7 @@ with tab2:
                                     "league_end": new_league_end.isoformat()
                                 }
                                 
-                                create_response = requests.post(f"{API_BASE}/leagues", json=create_data)
+                                create_response = api_client.post(f"{API_BASE}/leagues", json=create_data)
                                 if create_response.status_code == 201:
                                     st.success("League created successfully!")
                                 else:
@@ -304,7 +341,7 @@ with tab2:
                     
                     if st.button("🗑️ Delete League", key="delete_league_button", type="secondary"):
                         try:
-                            delete_response = requests.delete(f"{API_BASE}/leagues/{selected_delete_league_id}")
+                            delete_response = api_client.delete(f"{API_BASE}/leagues/{selected_delete_league_id}")
                             if delete_response.status_code == 200:
                                 st.success("League deleted successfully!")
                                 st.rerun()  # Need explicit rerun for button clicks (not forms)
@@ -338,7 +375,7 @@ with tab3:
     
     try:
         # Fetch leagues for filtering dropdown
-        leagues_response = requests.get(f"{API_BASE}/leagues")
+        leagues_response = api_client.get(f"{API_BASE}/leagues", ttl=api_client.REFERENCE_TTL)
         leagues = leagues_response.json() if leagues_response.status_code == 200 else []
         league_map = {l['league_id']: f"{l['name']} ({l.get('year', 'N/A')}) (ID: {l['league_id']})" for l in leagues}
         
@@ -360,7 +397,7 @@ with tab3:
             team_params["name_search"] = search_filter
         
         # Fetch teams with filters applied via SQL
-        teams_response = requests.get(f"{API_BASE}/teams", params=team_params)
+        teams_response = api_client.get(f"{API_BASE}/teams", params=team_params)
         if teams_response.status_code == 200:
             teams = teams_response.json()
             
@@ -421,7 +458,7 @@ with tab3:
                                     "founded_date": new_founded.isoformat()
                                 }
                                 
-                                update_response = requests.put(f"{API_BASE}/teams/{selected_team_id}", json=update_data)
+                                update_response = api_client.put(f"{API_BASE}/teams/{selected_team_id}", json=update_data)
                                 
                                 # Clear flag immediately
                                 if update_key in st.session_state:
@@ -456,7 +493,7 @@ with tab3:
                                     "founded_date": new_team_founded.isoformat()
                                 }
                                 
-                                create_response = requests.post(f"{API_BASE}/teams", json=create_data)
+                                create_response = api_client.post(f"{API_BASE}/teams", json=create_data)
                                 if create_response.status_code == 201:
                                     st.success("Team created successfully!")
                                 else:
@@ -473,7 +510,7 @@ with tab3:
                     
                     if st.button("🗑️ Delete Team", key="delete_team_button", type="secondary"):
                         try:
-                            delete_response = requests.delete(f"{API_BASE}/teams/{selected_delete_team_id}")
+                            delete_response = api_client.delete(f"{API_BASE}/teams/{selected_delete_team_id}")
                             if delete_response.status_code == 200:
                                 st.success("Team deleted successfully!")
                                 st.rerun()  # Need explicit rerun for button clicks (not forms)
@@ -510,14 +547,19 @@ with tab4:
         search_filter = st.text_input("Search by Name or Email", key="player_search_filter")
         
         # Build API request with search parameter
-        player_params = {}
+        player_filters = {}
         if search_filter:
-            player_params["search"] = search_filter
+            player_filters["search"] = search_filter
         
-        # Fetch players with search filter applied via SQL
-        players_response = requests.get(f"{API_BASE}/players", params=player_params)
+        # Fetch one page of players with search filter applied via SQL
+        player_params = dict(player_filters, limit=PAGE_SIZE)
+        player_after = page_after_token("players", player_filters)
+        if player_after:
+            player_params["after"] = player_after
+        players_response = api_client.get(f"{API_BASE}/players", params=player_params)
         if players_response.status_code == 200:
-            players = players_response.json()
+            players_page = players_response.json()
+            players = players_page["items"]
             
             if players:
                 # Display players (already filtered by backend)
@@ -528,30 +570,21 @@ with tab4:
                     df = pd.DataFrame(filtered_players)
                     st.dataframe(df, use_container_width=True, hide_index=True)
                     
+                    count_response = api_client.get(f"{API_BASE}/players/count", params=player_filters)
+                    total_players = count_response.json()["total"] if count_response.status_code == 200 else None
+                    page_navigation("players", players_page["next_after"], total_players)
+                    
                     # Edit player section
                     st.divider()
                     st.subheader("Edit Player")
                     edit_search = st.text_input("Search Player to Edit (by name, email, or ID)", key="edit_player_search")
                     
-                    # Fetch players with edit search filter applied via SQL
-                    edit_player_params = {}
-                    if edit_search:
-                        edit_player_params["search"] = edit_search
-                    
-                    edit_players_response = requests.get(f"{API_BASE}/players", params=edit_player_params)
+                    # Ranked player search (name, email or exact ID), best matches first
                     edit_filtered_players = []
-                    if edit_players_response.status_code == 200:
-                        edit_filtered_players = edit_players_response.json()
-                        # Also check if search matches player_id exactly
-                        if edit_search and edit_search.isdigit():
-                            all_players_response = requests.get(f"{API_BASE}/players")
-                            if all_players_response.status_code == 200:
-                                all_players = all_players_response.json()
-                                matching_id = [p for p in all_players if p.get('player_id') == int(edit_search)]
-                                # Add ID matches if not already in filtered list
-                                for p in matching_id:
-                                    if p not in edit_filtered_players:
-                                        edit_filtered_players.append(p)
+                    if edit_search:
+                        edit_players_response = api_client.get(f"{API_BASE}/players/search", params={"q": edit_search, "limit": PLAYER_SEARCH_LIMIT})
+                        if edit_players_response.status_code == 200:
+                            edit_filtered_players = edit_players_response.json()
                     
                     if edit_filtered_players and edit_search:
                         # Show matching players as selectable options
@@ -599,7 +632,7 @@ with tab4:
                                         if new_phone:
                                             update_data["phone_number"] = new_phone
                                         
-                                        update_response = requests.put(f"{API_BASE}/players/{selected_player_id}", json=update_data)
+                                        update_response = api_client.put(f"{API_BASE}/players/{selected_player_id}", json=update_data)
                                         
                                         # Clear flag immediately
                                         if update_key in st.session_state:
@@ -645,7 +678,7 @@ with tab4:
                                         if new_player_phone:
                                             create_data["phone_number"] = new_player_phone
                                         
-                                        create_response = requests.post(f"{API_BASE}/players", json=create_data)
+                                        create_response = api_client.post(f"{API_BASE}/players", json=create_data)
                                         if create_response.status_code == 201:
                                             st.success("Player created successfully!")
                                         else:
@@ -664,25 +697,12 @@ with tab4:
                     st.subheader("Delete Player")
                     delete_search = st.text_input("Search Player to Delete (by name, email, or ID)", key="delete_player_search")
                     
-                    # Fetch players with delete search filter applied via SQL
-                    delete_player_params = {}
-                    if delete_search:
-                        delete_player_params["search"] = delete_search
-                    
-                    delete_players_response = requests.get(f"{API_BASE}/players", params=delete_player_params)
+                    # Ranked player search (name, email or exact ID), best matches first
                     delete_filtered_players = []
-                    if delete_players_response.status_code == 200:
-                        delete_filtered_players = delete_players_response.json()
-                        # Also check if search matches player_id exactly
-                        if delete_search and delete_search.isdigit():
-                            all_players_response = requests.get(f"{API_BASE}/players")
-                            if all_players_response.status_code == 200:
-                                all_players = all_players_response.json()
-                                matching_id = [p for p in all_players if p.get('player_id') == int(delete_search)]
-                                # Add ID matches if not already in filtered list
-                                for p in matching_id:
-                                    if p not in delete_filtered_players:
-                                        delete_filtered_players.append(p)
+                    if delete_search:
+                        delete_players_response = api_client.get(f"{API_BASE}/players/search", params={"q": delete_search, "limit": PLAYER_SEARCH_LIMIT})
+                        if delete_players_response.status_code == 200:
+                            delete_filtered_players = delete_players_response.json()
                     
                     if delete_filtered_players and delete_search:
                         # Show matching players as selectable options
@@ -692,7 +712,7 @@ with tab4:
                         
                         if st.button("🗑️ Delete Player", key="delete_player_button", type="secondary"):
                             try:
-                                delete_response = requests.delete(f"{API_BASE}/players/{selected_delete_player_id}")
+                                delete_response = api_client.delete(f"{API_BASE}/players/{selected_delete_player_id}")
                                 if delete_response.status_code == 200:
                                     st.success("Player deleted successfully!")
                                     st.rerun()  # Need explicit rerun for button clicks (not forms)
@@ -730,7 +750,7 @@ with tab5:
     
     try:
         # Fetch leagues for filtering dropdown
-        leagues_response = requests.get(f"{API_BASE}/leagues")
+        leagues_response = api_client.get(f"{API_BASE}/leagues", ttl=api_client.REFERENCE_TTL)
         leagues = leagues_response.json() if leagues_response.status_code == 200 else []
         league_map = {l['league_id']: f"{l['name']} ({l.get('year', 'N/A')}) (ID: {l['league_id']})" for l in leagues}
         
@@ -747,18 +767,23 @@ with tab5:
             max_date_filter = st.date_input("Max Date", value=None, key="game_max_date_filter")
         
         # Build API request with filter parameters
-        game_params = {}
+        game_filters = {}
         if league_filter != "All":
-            game_params["league_id"] = league_display_to_id.get(league_filter)
+            game_filters["league_id"] = league_display_to_id.get(league_filter)
         if min_date_filter:
-            game_params["min_date"] = min_date_filter.isoformat()
+            game_filters["min_date"] = min_date_filter.isoformat()
         if max_date_filter:
-            game_params["max_date"] = max_date_filter.isoformat()
+            game_filters["max_date"] = max_date_filter.isoformat()
         
-        # Fetch games with filters applied via SQL
-        games_response = requests.get(f"{API_BASE}/games", params=game_params)
+        # Fetch one page of games with filters applied via SQL
+        game_params = dict(game_filters, limit=PAGE_SIZE)
+        game_after = page_after_token("games", game_filters)
+        if game_after:
+            game_params["after"] = game_after
+        games_response = api_client.get(f"{API_BASE}/games", params=game_params)
         if games_response.status_code == 200:
-            games = games_response.json()
+            games_page = games_response.json()
+            games = games_page["items"]
             
             if games:
                 # Display games (already filtered by SQL to only include games with both teams)
@@ -776,6 +801,10 @@ with tab5:
                     df = df[cols]
                 st.dataframe(df, use_container_width=True, hide_index=True)
                 
+                count_response = api_client.get(f"{API_BASE}/games/count", params=game_filters)
+                total_games = count_response.json()["total"] if count_response.status_code == 200 else None
+                page_navigation("games", games_page["next_after"], total_games)
+                
                 # Edit game section
                 st.divider()
                 st.subheader("Edit Game")
@@ -816,7 +845,7 @@ with tab5:
                                     "away_score": int(new_away_score) if new_away_score else None
                                 }
                                 
-                                update_response = requests.put(f"{API_BASE}/games/{selected_game_id}", json=update_data)
+                                update_response = api_client.put(f"{API_BASE}/games/{selected_game_id}", json=update_data)
                                 
                                 # Clear flag immediately
                                 if update_key in st.session_state:
@@ -834,7 +863,7 @@ with tab5:
             st.subheader("Add New Game")
             
             # Fetch all teams for team selection
-            teams_response = requests.get(f"{API_BASE}/teams")
+            teams_response = api_client.get(f"{API_BASE}/teams")
             all_teams = teams_response.json() if teams_response.status_code == 200 else []
             team_map = {t['team_id']: f"{t['name']} (ID: {t['team_id']})" for t in all_teams}
             
@@ -873,7 +902,7 @@ with tab5:
                                 "away_score": int(new_game_away_score) if new_game_away_score else None
                             }
                             
-                            create_response = requests.post(f"{API_BASE}/games", json=create_data)
+                            create_response = api_client.post(f"{API_BASE}/games", json=create_data)
                             if create_response.status_code == 201:
                                 st.success("Game created successfully!")
                                 # Form will auto-rerun, no need to call st.rerun()
@@ -885,6 +914,73 @@ with tab5:
                                 st.error(f"Error: {error_msg}")
                         except Exception as e:
                             st.error(f"Error: {str(e)}")
+            
+            # Generate a whole round-robin season in one request
+            st.divider()
+            st.subheader("Generate Season Schedule")
+            st.write("Create a balanced round-robin schedule for every team in a league in one step.")
+            
+            with st.form("generate_schedule"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    schedule_league = st.selectbox("League *", options=[l['league_id'] for l in leagues],
+                                                   format_func=lambda x: league_map.get(x, f"Unknown (ID: {x})"),
+                                                   key="schedule_league")
+                    schedule_start = st.date_input("Start Date *", value=datetime.now().date(), key="schedule_start")
+                    schedule_end = st.date_input("End Date *", value=datetime.now().date() + timedelta(weeks=12), key="schedule_end")
+                    schedule_days = st.multiselect("Game Days", options=SCHEDULE_WEEKDAYS, default=["Mon", "Wed"],
+                                                   help="Leave empty to use every day", key="schedule_days")
+                with col2:
+                    schedule_slots = st.text_input("Time Slots *", value="18:00, 19:00, 20:00",
+                                                   help="Comma-separated start times (HH:MM)", key="schedule_slots")
+                    schedule_venues = st.text_input("Venues *", value="Marino Center Court 1, Marino Center Court 2",
+                                                    help="Comma-separated locations", key="schedule_venues")
+                    schedule_double = st.checkbox("Double round robin (home and away)", key="schedule_double")
+                    schedule_allow_conflicts = st.checkbox("Create even with scheduling conflicts", key="schedule_allow_conflicts",
+                                                           help="Teams, venues or stat keepers already booked at overlapping times")
+                
+                col_preview, col_create = st.columns(2)
+                with col_preview:
+                    preview_schedule = st.form_submit_button("Preview Schedule")
+                with col_create:
+                    create_schedule = st.form_submit_button("Create Schedule", type="primary")
+                
+                if preview_schedule or create_schedule:
+                    schedule_data = {
+                        "start_date": schedule_start.isoformat(),
+                        "end_date": schedule_end.isoformat(),
+                        "game_days": schedule_days,
+                        "time_slots": [slot.strip() for slot in schedule_slots.split(",") if slot.strip()],
+                        "venues": [venue.strip() for venue in schedule_venues.split(",") if venue.strip()],
+                        "double_round_robin": schedule_double,
+                        "dry_run": bool(preview_schedule),
+                        "allow_conflicts": schedule_allow_conflicts
+                    }
+                    try:
+                        schedule_response = api_client.post(f"{API_BASE}/leagues/{schedule_league}/schedule", json=schedule_data)
+                        if schedule_response.status_code in (200, 201):
+                            schedule = schedule_response.json()
+                            if schedule["dry_run"]:
+                                st.info(schedule["message"])
+                            else:
+                                st.success(schedule["message"])
+                            schedule_df = pd.DataFrame(schedule["games"])
+                            team_names = {t['team_id']: t['name'] for t in all_teams}
+                            schedule_df["home_team"] = schedule_df["home_team_id"].map(team_names)
+                            schedule_df["away_team"] = schedule_df["away_team_id"].map(team_names)
+                            cols = ['round', 'date_played', 'start_time', 'location', 'home_team', 'away_team', 'game_id']
+                            st.dataframe(schedule_df[[c for c in cols if c in schedule_df.columns]],
+                                         use_container_width=True, hide_index=True)
+                            if schedule.get("conflicts"):
+                                st.warning(f"{len(schedule['conflicts'])} scheduling conflict(s)")
+                                st.dataframe(pd.DataFrame(schedule["conflicts"]), use_container_width=True, hide_index=True)
+                        else:
+                            schedule_error = schedule_response.json()
+                            st.error(f"Error: {schedule_error.get('error', 'Unknown error')}")
+                            if schedule_error.get("conflicts"):
+                                st.dataframe(pd.DataFrame(schedule_error["conflicts"]), use_container_width=True, hide_index=True)
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
             if games:
                 st.divider()
                 st.subheader("Assign Stat Keepers to Games")
@@ -892,12 +988,12 @@ with tab5:
                 selected_assign_game_display = st.selectbox("Select Game", options=list(assign_game_options.keys()), key="assign_keeper_game_select")
                 selected_assign_game_id = assign_game_options[selected_assign_game_display]
                 try:
-                    assigned_keepers_response = requests.get(f"{API_BASE}/games/{selected_assign_game_id}/stat-keepers")
+                    assigned_keepers_response = api_client.get(f"{API_BASE}/games/{selected_assign_game_id}/stat-keepers")
                     assigned_keepers = assigned_keepers_response.json() if assigned_keepers_response.status_code == 200 else []
                 except:
                     assigned_keepers = []
                 try:
-                    all_keepers_response = requests.get(f"{API_BASE}/stat-keepers")
+                    all_keepers_response = api_client.get(f"{API_BASE}/stat-keepers")
                     all_keepers = all_keepers_response.json() if all_keepers_response.status_code == 200 else []
                 except:
                     all_keepers = []
@@ -914,7 +1010,7 @@ with tab5:
                             with col_remove:
                                 if st.button("Remove", key=f"remove_keeper_{selected_assign_game_id}_{keeper['keeper_id']}"):
                                     try:
-                                        remove_response = requests.delete(
+                                        remove_response = api_client.delete(
                                             f"{API_BASE}/games/{selected_assign_game_id}/stat-keepers",
                                             json={"keeper_id": keeper['keeper_id']}
                                         )
@@ -941,7 +1037,7 @@ with tab5:
                             
                             if st.button("Assign Stat Keeper", key=f"assign_keeper_button_{selected_assign_game_id}"):
                                 try:
-                                    assign_response = requests.post(
+                                    assign_response = api_client.post(
                                         f"{API_BASE}/games/{selected_assign_game_id}/stat-keepers",
                                         json={"keeper_id": selected_keeper_id}
                                     )
@@ -957,6 +1053,52 @@ with tab5:
                     else:
                         st.warning("No stat keepers available.")
             
+            # Assign stat keepers to a whole season of unassigned games at once
+            st.divider()
+            st.subheader("Auto-Assign Stat Keepers")
+            st.write("Give every upcoming game without a stat keeper one, spreading games evenly and never double-booking a keeper.")
+            
+            with st.form("auto_assign_keepers"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    auto_assign_league = st.selectbox("League", options=[None] + [l['league_id'] for l in leagues],
+                                                      format_func=lambda x: "All leagues" if x is None else league_map.get(x, f"Unknown (ID: {x})"),
+                                                      key="auto_assign_league")
+                with col2:
+                    auto_assign_start = st.date_input("From", value=datetime.now().date(), key="auto_assign_start")
+                    auto_assign_end = st.date_input("To", value=datetime.now().date() + timedelta(weeks=12), key="auto_assign_end")
+                
+                col_preview, col_assign = st.columns(2)
+                with col_preview:
+                    preview_assignment = st.form_submit_button("Preview Assignment")
+                with col_assign:
+                    run_assignment = st.form_submit_button("Assign Stat Keepers", type="primary")
+                
+                if preview_assignment or run_assignment:
+                    assignment_data = {
+                        "league_id": auto_assign_league,
+                        "min_date": auto_assign_start.isoformat(),
+                        "max_date": auto_assign_end.isoformat(),
+                        "dry_run": bool(preview_assignment)
+                    }
+                    try:
+                        assignment_response = api_client.post(f"{API_BASE}/stat-keepers/assign", json=assignment_data)
+                        if assignment_response.status_code in (200, 201):
+                            assignment = assignment_response.json()
+                            if assignment["dry_run"]:
+                                st.info(assignment["message"])
+                            else:
+                                st.success(assignment["message"])
+                            if assignment["unassigned_game_ids"]:
+                                st.warning(f"No stat keeper is free for games: {', '.join(str(g) for g in assignment['unassigned_game_ids'])}")
+                            if assignment["assignments"]:
+                                st.dataframe(pd.DataFrame(assignment["assignments"]), use_container_width=True, hide_index=True)
+                                st.dataframe(pd.DataFrame(assignment["keeper_loads"]), use_container_width=True, hide_index=True)
+                        else:
+                            st.error(f"Error: {assignment_response.json().get('error', 'Unknown error')}")
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
+            
             # Delete game section (only show if there are games to delete)
             if games:
                 st.divider()
@@ -967,7 +1109,7 @@ with tab5:
                 
                 if st.button("🗑️ Delete Game", key="delete_game_button", type="secondary"):
                     try:
-                        delete_response = requests.delete(f"{API_BASE}/games/{selected_delete_game_id}")
+                        delete_response = api_client.delete(f"{API_BASE}/games/{selected_delete_game_id}")
                         if delete_response.status_code == 200:
                             st.success("Game deleted successfully!")
                             st.rerun()  # Need explicit rerun for button clicks (not forms)
@@ -1000,7 +1142,7 @@ with tab6:
         keeper_params = {}
         if search_filter:
             keeper_params["search"] = search_filter
-        keepers_response = requests.get(f"{API_BASE}/stat-keepers", params=keeper_params)
+        keepers_response = api_client.get(f"{API_BASE}/stat-keepers", params=keeper_params)
         if keepers_response.status_code == 200:
             stat_keepers = keepers_response.json()
             
@@ -1017,12 +1159,12 @@ with tab6:
                     if edit_search:
                         edit_keeper_params["search"] = edit_search
                     
-                    edit_keepers_response = requests.get(f"{API_BASE}/stat-keepers", params=edit_keeper_params)
+                    edit_keepers_response = api_client.get(f"{API_BASE}/stat-keepers", params=edit_keeper_params)
                     edit_filtered_keepers = []
                     if edit_keepers_response.status_code == 200:
                         edit_filtered_keepers = edit_keepers_response.json()
                         if edit_search and edit_search.isdigit():
-                            all_keepers_response = requests.get(f"{API_BASE}/stat-keepers")
+                            all_keepers_response = api_client.get(f"{API_BASE}/stat-keepers")
                             if all_keepers_response.status_code == 200:
                                 all_keepers = all_keepers_response.json()
                                 matching_id = [k for k in all_keepers if k.get('keeper_id') == int(edit_search)]
@@ -1067,7 +1209,7 @@ with tab6:
                                         "total_games_tracked": int(new_total_games)
                                     }
                                     
-                                    update_response = requests.put(f"{API_BASE}/stat-keepers/{selected_keeper_id}", json=update_data)
+                                    update_response = api_client.put(f"{API_BASE}/stat-keepers/{selected_keeper_id}", json=update_data)
                                     
                                     if update_key in st.session_state:
                                         del st.session_state[update_key]
@@ -1105,7 +1247,7 @@ with tab6:
                                         "total_games_tracked": int(new_keeper_games)
                                     }
                                     
-                                    create_response = requests.post(f"{API_BASE}/stat-keepers", json=create_data)
+                                    create_response = api_client.post(f"{API_BASE}/stat-keepers", json=create_data)
                                     if create_response.status_code == 201:
                                         st.success("Stat keeper created successfully!")
                                     else:
@@ -1126,12 +1268,12 @@ with tab6:
                     if delete_search:
                         delete_keeper_params["search"] = delete_search
                     
-                    delete_keepers_response = requests.get(f"{API_BASE}/stat-keepers", params=delete_keeper_params)
+                    delete_keepers_response = api_client.get(f"{API_BASE}/stat-keepers", params=delete_keeper_params)
                     delete_filtered_keepers = []
                     if delete_keepers_response.status_code == 200:
                         delete_filtered_keepers = delete_keepers_response.json()
                         if delete_search and delete_search.isdigit():
-                            all_keepers_response = requests.get(f"{API_BASE}/stat-keepers")
+                            all_keepers_response = api_client.get(f"{API_BASE}/stat-keepers")
                             if all_keepers_response.status_code == 200:
                                 all_keepers = all_keepers_response.json()
                                 matching_id = [k for k in all_keepers if k.get('keeper_id') == int(delete_search)]
@@ -1146,7 +1288,7 @@ with tab6:
                         
                         if st.button("🗑️ Delete Stat Keeper", key="delete_keeper_button", type="secondary"):
                             try:
-                                delete_response = requests.delete(f"{API_BASE}/stat-keepers/{selected_delete_keeper_id}")
+                                delete_response = api_client.delete(f"{API_BASE}/stat-keepers/{selected_delete_keeper_id}")
                                 if delete_response.status_code == 200:
                                     st.success("Stat keeper deleted successfully!")
                                     st.rerun()
@@ -1170,13 +1312,13 @@ with tab6:
                     selected_assign_keeper_id = assign_keeper_options[selected_assign_keeper_display]
                     
                     try:
-                        assigned_games_response = requests.get(f"{API_BASE}/stat-keepers/{selected_assign_keeper_id}/games")
+                        assigned_games_response = api_client.get(f"{API_BASE}/stat-keepers/{selected_assign_keeper_id}/games")
                         assigned_games = assigned_games_response.json() if assigned_games_response.status_code == 200 else []
                     except:
                         assigned_games = []
                     
                     try:
-                        games_response = requests.get(f"{API_BASE}/games")
+                        games_response = api_client.get(f"{API_BASE}/games", params={"fields": "game_id,date_played,home_team,away_team"})
                         all_games = games_response.json() if games_response.status_code == 200 else []
                     except:
                         all_games = []
@@ -1194,7 +1336,7 @@ with tab6:
                                 with col_remove:
                                     if st.button("Remove", key=f"remove_game_{selected_assign_keeper_id}_{game['game_id']}_{idx}"):
                                         try:
-                                            remove_response = requests.delete(
+                                            remove_response = api_client.delete(
                                                 f"{API_BASE}/games/{game['game_id']}/stat-keepers",
                                                 json={"keeper_id": selected_assign_keeper_id}
                                             )
@@ -1221,7 +1363,7 @@ with tab6:
                                 
                                 if st.button("Assign Game", key=f"assign_game_button_{selected_assign_keeper_id}"):
                                     try:
-                                        assign_response = requests.post(
+                                        assign_response = api_client.post(
                                             f"{API_BASE}/games/{selected_game_id}/stat-keepers",
                                             json={"keeper_id": selected_assign_keeper_id}
                                         )
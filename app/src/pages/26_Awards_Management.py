@@ -1,8 +1,8 @@
 import streamlit as st
-import requests
 import pandas as pd
 import time
 from datetime import datetime
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -13,6 +13,9 @@ st.write("Assign badges, awards, and champions to players, teams, and leagues.")
 
 API_BASE = "http://web-api:4000/system-admin"
 
+# Players listed by the award recipient picker
+PLAYER_PICKER_LIMIT = 50
+
 # Add CSS for fade-out animation (only once)
 if "fade_css_added" not in st.session_state:
     st.markdown("""
@@ -55,22 +58,23 @@ with tab1:
         # Search filter (applied at API/database level)
         search_filter = st.text_input("Search Players", key="award_player_search")
         
-        # Build API request with search parameter
-        player_params = {}
+        # Ranked player search when a term is typed, otherwise the first
+        # players by last_name, first_name (like Data Management page)
         if search_filter:
-            player_params["search"] = search_filter
-        
-        # Fetch players with search filter applied via SQL
-        players_response = requests.get(f"{API_BASE}/players", params=player_params)
+            players_response = api_client.get(f"{API_BASE}/players/search", params={"q": search_filter, "limit": PLAYER_PICKER_LIMIT})
+        else:
+            players_response = api_client.get(f"{API_BASE}/players", params={
+                "limit": PLAYER_PICKER_LIMIT,
+                "fields": "player_id,first_name,last_name,email",
+            })
         if players_response.status_code == 200:
             players = players_response.json()
+            if not search_filter:
+                players = players["items"]
             
             if players:
-                # Sort players by last_name, first_name (like Data Management page)
-                sorted_players = sorted(players, key=lambda x: (x.get('last_name', '').lower(), x.get('first_name', '').lower()))
-                
-                # Players already filtered by backend
-                filtered_players = sorted_players
+                # Players already filtered and ordered by backend
+                filtered_players = players
                 
                 # Select player
                 player_options = {f"{p['last_name']}, {p['first_name']} ({p['email']}) (ID: {p['player_id']})": p['player_id'] for p in filtered_players}
@@ -78,7 +82,7 @@ with tab1:
                 selected_player_id = player_options[selected_player_display]
                 
                 # Get player's existing awards
-                existing_awards_response = requests.get(f"{API_BASE}/players/{selected_player_id}/awards")
+                existing_awards_response = api_client.get(f"{API_BASE}/players/{selected_player_id}/awards")
                 existing_awards = []
                 if existing_awards_response.status_code == 200:
                     existing_awards = existing_awards_response.json()
@@ -99,7 +103,7 @@ with tab1:
                     award_to_delete = st.selectbox("Select Award to Remove", options=list(award_options.keys()))
                     
                     if st.button("Delete Award", type="secondary"):
-                        delete_response = requests.delete(f"{API_BASE}/players/{selected_player_id}/awards", 
+                        delete_response = api_client.delete(f"{API_BASE}/players/{selected_player_id}/awards", 
                                                         json={"award_id": award_options[award_to_delete]})
                         if delete_response.status_code == 200:
                             show_success_fade("Award removed successfully!")
@@ -125,7 +129,7 @@ with tab1:
                             if award_description:
                                 award_data["description"] = award_description
                             
-                            create_response = requests.post(f"{API_BASE}/players/{selected_player_id}/awards", json=award_data)
+                            create_response = api_client.post(f"{API_BASE}/players/{selected_player_id}/awards", json=award_data)
                             if create_response.status_code == 201:
                                 show_success_fade("Award assigned successfully!")
                             else:
@@ -152,12 +156,12 @@ with tab2:
     
     try:
         # Fetch all leagues
-        leagues_response = requests.get(f"{API_BASE}/leagues")
+        leagues_response = api_client.get(f"{API_BASE}/leagues", ttl=api_client.REFERENCE_TTL)
         if leagues_response.status_code == 200:
             leagues = leagues_response.json()
             
             # Fetch sports for display
-            sports_response = requests.get(f"{API_BASE}/sports")
+            sports_response = api_client.get(f"{API_BASE}/sports", ttl=api_client.REFERENCE_TTL)
             sports = sports_response.json() if sports_response.status_code == 200 else []
             sport_map = {s['sport_id']: s['name'] for s in sports}
             
@@ -182,7 +186,7 @@ with tab2:
                 selected_league_id = league_options[selected_league_display]
                 
                 # Get league's existing champions
-                existing_champions_response = requests.get(f"{API_BASE}/leagues/{selected_league_id}/champions")
+                existing_champions_response = api_client.get(f"{API_BASE}/leagues/{selected_league_id}/champions")
                 existing_champions = []
                 if existing_champions_response.status_code == 200:
                     existing_champions = existing_champions_response.json()
@@ -202,7 +206,7 @@ with tab2:
                     champion_to_delete = st.selectbox("Select Champion to Remove", options=list(champion_options.keys()))
                     
                     if st.button("🗑️ Delete Champion", type="secondary"):
-                        delete_response = requests.delete(f"{API_BASE}/leagues/{selected_league_id}/champions", 
+                        delete_response = api_client.delete(f"{API_BASE}/leagues/{selected_league_id}/champions", 
                                                         json={"champion_id": champion_options[champion_to_delete]})
                         if delete_response.status_code == 200:
                             show_success_fade("Champion removed successfully!")
@@ -216,7 +220,7 @@ with tab2:
                     st.info("This league has no recorded champions yet.")
                 
                 # Get teams in this league
-                teams_response = requests.get(f"{API_BASE}/leagues/{selected_league_id}/teams")
+                teams_response = api_client.get(f"{API_BASE}/leagues/{selected_league_id}/teams")
                 teams = []
                 if teams_response.status_code == 200:
                     teams = teams_response.json()
@@ -239,7 +243,7 @@ with tab2:
                                 "year": int(champion_year)
                             }
                             
-                            create_response = requests.post(f"{API_BASE}/leagues/{selected_league_id}/champions", json=champion_data)
+                            create_response = api_client.post(f"{API_BASE}/leagues/{selected_league_id}/champions", json=champion_data)
                             if create_response.status_code == 201:
                                 show_success_fade("Champion recorded successfully!")
                             else:
@@ -287,7 +291,7 @@ with tab3:
             award_params["year"] = int(award_year_filter)
         
         # Fetch player awards with filters applied via SQL
-        awards_response = requests.get(f"{API_BASE}/player-awards", params=award_params)
+        awards_response = api_client.get(f"{API_BASE}/player-awards", params=award_params)
         all_player_awards = awards_response.json() if awards_response.status_code == 200 else []
         
         if all_player_awards:
@@ -329,7 +333,7 @@ with tab3:
             champion_params["year"] = int(champion_year_filter)
         
         # Fetch champions with filters applied via SQL
-        champions_response = requests.get(f"{API_BASE}/champions", params=champion_params)
+        champions_response = api_client.get(f"{API_BASE}/champions", params=champion_params)
         all_champions = champions_response.json() if champions_response.status_code == 200 else []
         
         if all_champions:
@@ -1,9 +1,9 @@
 import streamlit as st
-import requests
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+from modules import api_client
 from modules.nav import SideBarLinks
 
 SideBarLinks()
@@ -30,7 +30,7 @@ with tab1:
     
     try:
         # Fetch analytics dashboard data
-        analytics_response = requests.get(f"{API_BASE}/analytics/dashboard")
+        analytics_response = api_client.get(f"{API_BASE}/analytics/dashboard")
         if analytics_response.status_code == 200:
             analytics_data = analytics_response.json()
             
@@ -191,7 +191,7 @@ with tab2:
     
     try:
         # Fetch all sports
-        sports_response = requests.get(f"{API_BASE}/sports")
+        sports_response = api_client.get(f"{API_BASE}/sports", ttl=api_client.REFERENCE_TTL)
         if sports_response.status_code == 200:
             sports = sports_response.json()
             
@@ -202,7 +202,7 @@ with tab2:
                 selected_sport_id = sport_options[selected_sport_display]
                 
                 # Get existing rules for this sport
-                rules_response = requests.get(f"{API_BASE}/sports/{selected_sport_id}/rules")
+                rules_response = api_client.get(f"{API_BASE}/sports/{selected_sport_id}/rules")
                 existing_rules = []
                 if rules_response.status_code == 200:
                     existing_rules = rules_response.json()
@@ -240,7 +240,7 @@ with tab2:
                             "description": description
                         }
                         
-                        create_response = requests.post(f"{API_BASE}/sports/{selected_sport_id}/rules", json=rules_data)
+                        create_response = api_client.post(f"{API_BASE}/sports/{selected_sport_id}/rules", json=rules_data)
                         if create_response.status_code == 201:
                             st.success("Rules added successfully!")
                             st.rerun()
@@ -287,7 +287,7 @@ with tab2:
                                 "description": description
                             }
                             
-                            update_response = requests.put(f"{API_BASE}/sports/{selected_sport_id}/rules", json=rules_data)
+                            update_response = api_client.put(f"{API_BASE}/sports/{selected_sport_id}/rules", json=rules_data)
                             if update_response.status_code == 200:
                                 st.success("Rules updated successfully!")
                                 st.rerun()
@@ -307,7 +307,7 @@ with tab2:
                     rule_to_delete_id = rule_delete_options[rule_to_delete_display]
                     
                     if st.button("🗑️ Delete Rules", type="secondary", key="delete_rules_button"):
-                        delete_response = requests.delete(f"{API_BASE}/sports/{selected_sport_id}/rules", 
+                        delete_response = api_client.delete(f"{API_BASE}/sports/{selected_sport_id}/rules", 
                                                         json={"rules_id": rule_to_delete_id})
                         if delete_response.status_code == 200:
                             st.success("Rules deleted successfully!")
@@ -41,6 +41,9 @@ CREATE TABLE IF NOT EXISTS Rules (
     season_length INT,
     game_length INT,
     description TEXT,
+    -- JSON list of scoring rules, e.g. [{"keywords": ["goal"], "points": 1}]
+    -- NULL means the sport uses the API's built-in scoring rules
+    scoring_rules TEXT,
     FOREIGN KEY (sports_id) REFERENCES Sports(sport_id)
         ON DELETE CASCADE
         ON UPDATE CASCADE
@@ -65,7 +68,9 @@ CREATE TABLE IF NOT EXISTS Players (
     phone_number VARCHAR(15) UNIQUE,
     first_name VARCHAR(50) NOT NULL,
     last_name VARCHAR(50) NOT NULL,
-    email VARCHAR(100) UNIQUE NOT NULL
+    email VARCHAR(100) UNIQUE NOT NULL,
+    -- normalized "first last email" for player search
+    search_text VARCHAR(210) GENERATED ALWAYS AS (LOWER(CONCAT_WS(' ', first_name, last_name, email))) STORED
 );
 
 -- Stat_Keepers table
@@ -88,7 +93,35 @@ CREATE TABLE IF NOT EXISTS Games (
     home_score INT DEFAULT 0,
     away_score INT DEFAULT 0,
     is_finalized BOOLEAN DEFAULT FALSE,
+    -- home/away team, mirrored from Teams_Games for game listings
+    home_team_id INT,
+    away_team_id INT,
+    -- last stat event change sequence number (delta sync, see api/backend/stat_sync)
+    stat_seq INT NOT NULL DEFAULT 0,
+    -- row key of the generated schedule that inserted the game (api/backend/schedule)
+    schedule_key VARCHAR(64),
+    INDEX idx_games_home_team (home_team_id, date_played),
+    INDEX idx_games_away_team (away_team_id, date_played),
     FOREIGN KEY (league_played) REFERENCES Leagues(league_id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (home_team_id) REFERENCES Teams(team_id)
+        ON DELETE SET NULL
+        ON UPDATE CASCADE,
+    FOREIGN KEY (away_team_id) REFERENCES Teams(team_id)
+        ON DELETE SET NULL
+        ON UPDATE CASCADE
+);
+
+-- StatType table (catalog of the stats that can be recorded for a sport)
+CREATE TABLE IF NOT EXISTS StatType (
+    stat_type_id INT AUTO_INCREMENT PRIMARY KEY,
+    sport_id INT NOT NULL,
+    code VARCHAR(50) NOT NULL,
+    label VARCHAR(100) NOT NULL,
+    points INT NOT NULL DEFAULT 0,
+    UNIQUE (sport_id, code),
+    FOREIGN KEY (sport_id) REFERENCES Sports(sport_id)
         ON DELETE CASCADE
         ON UPDATE CASCADE
 );
@@ -99,12 +132,23 @@ CREATE TABLE IF NOT EXISTS StatEvent (
     performed_by INT NOT NULL,
     scored_during INT NOT NULL,
     description TEXT,
+    -- NULL for free-text events that do not match any StatType
+    stat_type_id INT,
+    -- points the event is worth, materialized when the event is written
+    points INT NOT NULL DEFAULT 0,
     time_entered DATETIME DEFAULT CURRENT_TIMESTAMP,
+    -- idempotency key sent by buffered (offline) stat entry, unique per game
+    client_event_id VARCHAR(64),
+    -- Games.stat_seq value of the event's last change
+    change_seq INT NOT NULL DEFAULT 0,
     FOREIGN KEY (performed_by) REFERENCES Players(player_id)
         ON DELETE CASCADE
         ON UPDATE CASCADE,
     FOREIGN KEY (scored_during) REFERENCES Games(game_id)
         ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (stat_type_id) REFERENCES StatType(stat_type_id)
+        ON DELETE SET NULL
         ON UPDATE CASCADE
 );
 
@@ -151,6 +195,57 @@ CREATE TABLE IF NOT EXISTS Champions (
         ON UPDATE CASCADE
 );
 
+-- LeagueStandings table (materialized from finalized Games by the API,
+-- see api/backend/standings; rebuilt with `python -m backend.standings rebuild`)
+CREATE TABLE IF NOT EXISTS LeagueStandings (
+    league_id INT NOT NULL,
+    team_id INT NOT NULL,
+    games_played INT NOT NULL DEFAULT 0,
+    wins INT NOT NULL DEFAULT 0,
+    losses INT NOT NULL DEFAULT 0,
+    ties INT NOT NULL DEFAULT 0,
+    points_for INT NOT NULL DEFAULT 0,
+    points_against INT NOT NULL DEFAULT 0,
+    win_percentage DECIMAL(5,2) NOT NULL DEFAULT 0,
+    -- current run of results, e.g. 'W3', 'L1', 'T1'
+    streak VARCHAR(10),
+    last_game_date DATE,
+    standing_rank INT,
+    PRIMARY KEY (league_id, team_id),
+    INDEX idx_standings_league_rank (league_id, standing_rank),
+    FOREIGN KEY (league_id) REFERENCES Leagues(league_id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (team_id) REFERENCES Teams(team_id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+-- EntityVersion table (per league/team/game/player/sport/keeper versions
+-- behind the API's ETags, see api/backend/versions; MAX(version) is the
+-- newest write)
+CREATE TABLE IF NOT EXISTS EntityVersion (
+    entity_type VARCHAR(20) NOT NULL,
+    entity_id INT NOT NULL,
+    version BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (entity_type, entity_id),
+    INDEX idx_entity_version_version (version)
+);
+
+-- StatEventTombstone table (deleted stat events, so delta sync clients
+-- can drop them; change_seq is the game's stat_seq at deletion)
+CREATE TABLE IF NOT EXISTS StatEventTombstone (
+    event_id INT PRIMARY KEY,
+    game_id INT NOT NULL,
+    performed_by INT,
+    change_seq INT NOT NULL,
+    deleted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_tombstone_game_seq (game_id, change_seq),
+    FOREIGN KEY (game_id) REFERENCES Games(game_id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
 -- ============================================================
 -- BRIDGE TABLES (for M:N relationships)
 -- ============================================================
@@ -211,3 +306,34 @@ CREATE TABLE IF NOT EXISTS Games_Keepers (
         ON DELETE CASCADE
         ON UPDATE CASCADE
 );
+
+-- ============================================================
+-- SECONDARY INDEXES
+-- (kept in sync with api/backend/migrations/versions/0003_index_pack.py,
+--  0006_list_sort_indexes.py, 0007_player_search.py,
+--  0009_stat_event_client_ids.py, 0010_stat_event_sync.py and
+--  0013_game_schedule_keys.py)
+-- ============================================================
+
+CREATE INDEX idx_statevent_game_time ON StatEvent (scored_during, time_entered);
+CREATE INDEX idx_statevent_player_type ON StatEvent (performed_by, stat_type_id, points);
+CREATE INDEX idx_statevent_player_game ON StatEvent (performed_by, scored_during);
+CREATE INDEX idx_games_league_date ON Games (league_played, date_played, start_time);
+CREATE INDEX idx_games_date ON Games (date_played, start_time);
+CREATE INDEX idx_teams_games_game_side ON Teams_Games (game_id, is_home_team, team_id);
+CREATE INDEX idx_teams_league_record ON Teams (league_played, wins, losses);
+CREATE INDEX idx_teams_players_team_role ON Teams_Players (team_id, role, player_id);
+CREATE INDEX idx_games_keepers_game ON Games_Keepers (game_id, keeper_id);
+CREATE INDEX idx_players_games_game ON Players_Games (game_id, player_id);
+CREATE INDEX idx_reminders_team_time ON Reminders (team_id, time_sent);
+CREATE INDEX idx_leagues_sport_year ON Leagues (sport_played, year);
+CREATE INDEX idx_players_name ON Players (last_name, first_name, player_id);
+CREATE INDEX idx_teams_name ON Teams (name, team_id);
+CREATE INDEX idx_players_search_prefix ON Players (search_text);
+-- without the stopword list, whose entries would knock most ngrams of names out of the index
+SET SESSION innodb_ft_enable_stopword = OFF;
+CREATE FULLTEXT INDEX ft_players_search ON Players (search_text) WITH PARSER ngram;
+SET SESSION innodb_ft_enable_stopword = ON;
+CREATE UNIQUE INDEX uq_statevent_client_event ON StatEvent (scored_during, client_event_id);
+CREATE INDEX idx_statevent_game_seq ON StatEvent (scored_during, change_seq);
+CREATE UNIQUE INDEX uq_games_schedule_key ON Games (schedule_key);
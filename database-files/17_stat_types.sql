@@ -0,0 +1,46 @@
+USE im_league_tracker;
+
+-- Insert StatTypes (the quick-stat catalog for each sport)
+-- Points match the API's built-in scoring rules for each sport. Sports are
+-- looked up by name, so the catalog does not depend on their sport_id values.
+INSERT INTO StatType (sport_id, code, label, points)
+SELECT s.sport_id, c.code, c.label, c.points
+FROM (
+    -- Basketball
+    SELECT 'Basketball' AS sport, 'two_pointer' AS code, '2 Pointer' AS label, 2 AS points
+    UNION ALL SELECT 'Basketball', 'three_pointer', '3 Pointer', 3
+    UNION ALL SELECT 'Basketball', 'free_throw', 'Free Throw', 1
+    UNION ALL SELECT 'Basketball', 'rebound', 'Rebound', 0
+    UNION ALL SELECT 'Basketball', 'assist', 'Assist', 0
+    UNION ALL SELECT 'Basketball', 'steal', 'Steal', 0
+    UNION ALL SELECT 'Basketball', 'block', 'Block', 0
+    UNION ALL SELECT 'Basketball', 'turnover', 'Turnover', 0
+    UNION ALL SELECT 'Basketball', 'foul', 'Foul', 0
+    -- Soccer
+    UNION ALL SELECT 'Soccer', 'goal', 'Goal', 1
+    UNION ALL SELECT 'Soccer', 'assist', 'Assist', 0
+    UNION ALL SELECT 'Soccer', 'save', 'Save', 0
+    UNION ALL SELECT 'Soccer', 'yellow_card', 'Yellow Card', 0
+    UNION ALL SELECT 'Soccer', 'red_card', 'Red Card', 0
+    UNION ALL SELECT 'Soccer', 'corner_kick', 'Corner Kick', 0
+    UNION ALL SELECT 'Soccer', 'offside', 'Offside', 0
+    -- Volleyball
+    UNION ALL SELECT 'Volleyball', 'point', 'Point', 1
+    UNION ALL SELECT 'Volleyball', 'kill', 'Kill', 0
+    UNION ALL SELECT 'Volleyball', 'block', 'Block', 0
+    UNION ALL SELECT 'Volleyball', 'dig', 'Dig', 0
+    UNION ALL SELECT 'Volleyball', 'assist', 'Assist', 0
+) c
+JOIN Sports s ON s.name = c.sport;
+
+-- Link the sample StatEvents to their StatType and materialize their points.
+-- Existing databases are backfilled through POST /system-admin/stat-events/backfill,
+-- which also scores free-text descriptions with the sport's scoring rules.
+UPDATE StatEvent se
+JOIN Games g ON se.scored_during = g.game_id
+JOIN Leagues l ON g.league_played = l.league_id
+JOIN StatType st ON st.sport_id = l.sport_played
+    AND LOWER(TRIM(se.description)) = LOWER(st.label)
+SET se.stat_type_id = st.stat_type_id,
+    se.points = st.points
+WHERE se.stat_type_id IS NULL;
@@ -0,0 +1,8 @@
+USE im_league_tracker;
+
+-- Sample games played before November 2025 are final results.
+-- LeagueStandings is built from finalized games by the API's
+-- 0004_league_standings migration on first startup.
+UPDATE Games
+SET is_finalized = TRUE
+WHERE date_played < '2025-11-01';
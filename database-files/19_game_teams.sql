@@ -0,0 +1,9 @@
+USE im_league_tracker;
+
+-- Games.home_team_id / away_team_id mirror the home and away
+-- rows of Teams_Games (the API keeps them in sync on writes).
+UPDATE Games g
+LEFT JOIN Teams_Games home_tg ON home_tg.game_id = g.game_id AND home_tg.is_home_team = TRUE
+LEFT JOIN Teams_Games away_tg ON away_tg.game_id = g.game_id AND away_tg.is_home_team = FALSE
+SET g.home_team_id = home_tg.team_id,
+    g.away_team_id = away_tg.team_id;